@@ -8,16 +8,29 @@ import warnings
 from nitypes.waveform import AnalogWaveform, DigitalWaveform
 from typing import Any, Generic, TypeVar
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 
 import google.protobuf.message
 import grpc
 import numpy
+import numpy.typing
 
 from . import errors as errors
 from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
+from nidaqmx._error_messages import (
+    ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE,
+    UNABLE_TO_LOCATE_ERROR_RESOURCES_MESSAGE,
+    get_error_message,
+)
+from nidaqmx._grpc_packed_arrays import (
+    PackedArrayRequest,
+    PackedArrayStub,
+    create_response_deserializer,
+)
 from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
 from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+from nidaqmx._stubs import data_moniker_pb2 as data_moniker_types
+from nidaqmx._stubs import data_moniker_pb2_grpc as data_moniker_grpc
 from ni.protobuf.types.waveform_conversion import (
     digital_waveform_from_protobuf,
     digital_waveform_to_protobuf,
@@ -25,19 +38,14 @@ from ni.protobuf.types.waveform_conversion import (
     float64_analog_waveform_to_protobuf
 )
 from nidaqmx.constants import WaveformAttributeMode
-from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.types import DriverVersion
 from nidaqmx._grpc_time import convert_time_to_timestamp, convert_timestamp_to_time
+from nidaqmx._waveform_read_context import WaveformReadContext
 from nidaqmx._waveform_utils import get_num_samps_per_chan
 from session_pb2 import Session
 
 _logger = logging.getLogger(__name__)
 
-_UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE = (
-    "Error code could not be found. Reinstalling the driver might fix the issue. "
-    "Otherwise, contact National Instruments technical support."
-)
-
 
 TEventResponse = TypeVar("TEventResponse", bound=google.protobuf.message.Message)
 
@@ -95,50 +103,79 @@ class GrpcStubInterpreter(BaseInterpreter):
     __slots__ = [
         '_grpc_options',
         '_client',
+        '_moniker_client',
+        '_aio_client',
         '_driver_version',
+        '_packed_arrays',
+        '__weakref__',
     ]
 
     def __init__(self, grpc_options):
         self._grpc_options = grpc_options
-        self._client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel)
-        try:
-            major_version = self.get_system_info_attribute_uint32(0x1272)
-            minor_version = self.get_system_info_attribute_uint32(0x1923)
-            update_version = self.get_system_info_attribute_uint32(0x2f22)
-        except Exception:
-            major_version = 0
-            minor_version = 0
-            update_version = 0
-        self._driver_version = DriverVersion(major_version, minor_version, update_version)
+        self._packed_arrays = grpc_options.packed_arrays
+        self._client: nidaqmx_grpc.NiDAQmxStub
+        self._aio_client: nidaqmx_grpc.NiDAQmxStub | None
+        if self._packed_arrays:
+            self._client = PackedArrayStub(grpc_options.grpc_channel)
+        else:
+            self._client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel)
+        self._moniker_client = data_moniker_grpc.DataMonikerStub(grpc_options.grpc_channel)
+        if grpc_options.grpc_aio_channel is None:
+            self._aio_client = None
+        elif self._packed_arrays:
+            self._aio_client = PackedArrayStub(grpc_options.grpc_aio_channel)
+        else:
+            self._aio_client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_aio_channel)
+        self._driver_version = None
 
     def _invoke(self, func, request, metadata=None):
+        batch = getattr(_rpc_batches, 'batch', None)
         try:
+            if batch is not None and batch.interpreter is self:
+                response = batch.invoke(func, request, metadata)
+                if response is not None:
+                    return response
             response = func(request, metadata=metadata)
         except grpc.RpcError as rpc_error:
             self._handle_rpc_error(rpc_error)
         return response
 
+    async def _invoke_async(self, func, request):
+        try:
+            response = await func(request)
+        except grpc.RpcError as rpc_error:
+            self._handle_rpc_error(rpc_error)
+        return response
+
+    def _create_packed_array_request(self, request, **arrays):
+        if self._packed_arrays:
+            return PackedArrayRequest(request, arrays)
+        for name, array in arrays.items():
+            getattr(request, name).extend(array.flat)
+        return request
+
     def _handle_rpc_error(self, rpc_error):
         error_message = rpc_error.details()
         error_code = None
         samps_per_chan_read = None
         samps_per_chan_written = None
-        for entry in rpc_error.trailing_metadata() or []:
-            if entry.key == 'ni-error':
+        # Unpack the entries because grpc.aio errors return (key, value) tuples.
+        for key, value in rpc_error.trailing_metadata() or []:
+            if key == 'ni-error':
                 try:
-                    error_code = int(typing.cast(str, entry.value))
+                    error_code = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nError status: {entry.value}'
-            elif entry.key == "ni-samps-per-chan-read":
+                    error_message += f'\nError status: {value}'
+            elif key == "ni-samps-per-chan-read":
                 try:
-                    samps_per_chan_read = int(typing.cast(str, entry.value))
+                    samps_per_chan_read = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nSamples per channel read: {entry.value}'
-            elif entry.key == "ni-samps-per-chan-written":
+                    error_message += f'\nSamples per channel read: {value}'
+            elif key == "ni-samps-per-chan-written":
                 try:
-                    samps_per_chan_written = int(typing.cast(str, entry.value))
+                    samps_per_chan_written = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nSamples per channel written: {entry.value}'
+                    error_message += f'\nSamples per channel written: {value}'
         grpc_error = rpc_error.code()
         if grpc_error == grpc.StatusCode.UNAVAILABLE:
             error_message = 'Failed to connect to server'
@@ -153,10 +190,7 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def _check_for_error_from_response(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if error_code != 0:
-            # This is an optimization for the partial read operation.
-            error_message = _ERROR_MESSAGES.get(error_code, None)
-            if not error_message:
-                error_message = self.get_error_string(error_code)
+            error_message = get_error_message(error_code, self.get_error_string)
             self._raise_error(error_code, error_message, samps_per_chan_written=samps_per_chan_written, samps_per_chan_read=samps_per_chan_read)
 
     def _raise_error(self, error_code, error_message, samps_per_chan_written=None, samps_per_chan_read=None):
@@ -169,7 +203,7 @@ class GrpcStubInterpreter(BaseInterpreter):
                 raise errors.DaqError(error_message, error_code) from None
         elif error_code > 0:
             if not error_message:
-                error_message = self.get_error_string(error_code)
+                error_message = get_error_message(error_code, self.get_error_string)
             warnings.warn(errors.DaqWarning(error_message, error_code))
 
     def _check_for_event_registration_error(self, event_stream):
@@ -190,6 +224,16 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     @property
     def driver_version(self):
+        # The driver version is queried on first use and memoized. If the server is unavailable,
+        # report version 0.0.0 and query it again next time.
+        if self._driver_version is None:
+            try:
+                major_version = self.get_system_info_attribute_uint32(0x1272)
+                minor_version = self.get_system_info_attribute_uint32(0x1923)
+                update_version = self.get_system_info_attribute_uint32(0x2f22)
+            except Exception:
+                return DriverVersion(0, 0, 0)
+            self._driver_version = DriverVersion(major_version, minor_version, update_version)
         return self._driver_version
 
     def add_cdaq_sync_connection(self, port_list):
@@ -3381,6 +3425,12 @@ class GrpcStubInterpreter(BaseInterpreter):
             self._client.UnreserveNetworkDevice,
             grpc_types.UnreserveNetworkDeviceRequest(device_name=device_name))
 
+    def wait_for_next_sample_clock(self, task, timeout):
+        response = self._invoke(
+            self._client.WaitForNextSampleClock,
+            grpc_types.WaitForNextSampleClockRequest(task=task, timeout=timeout))
+        return response.is_late
+
     def wait_for_valid_timestamp(self, task, timestamp_event, timeout):
         response = self._invoke(
             self._client.WaitForValidTimestamp,
@@ -3400,10 +3450,12 @@ class GrpcStubInterpreter(BaseInterpreter):
         _validate_array_dtype(write_array, numpy.float64)
         response = self._invoke(
             self._client.WriteAnalogF64,
-            grpc_types.WriteAnalogF64Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+            self._create_packed_array_request(
+                grpc_types.WriteAnalogF64Request(
+                    task=task, num_samps_per_chan=num_samps_per_chan,
+                    auto_start=auto_start, timeout=timeout,
+                    data_layout_raw=data_layout),
+                write_array=write_array))
         return response.samps_per_chan_written
 
     def write_analog_scalar_f64(self, task, auto_start, timeout, value):
@@ -3468,11 +3520,12 @@ class GrpcStubInterpreter(BaseInterpreter):
         _validate_array_dtype(duty_cycle, numpy.float64)
         response = self._invoke(
             self._client.WriteCtrFreq,
-            grpc_types.WriteCtrFreqRequest(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, frequency=frequency.flat,
-                duty_cycle=duty_cycle.flat))
+            self._create_packed_array_request(
+                grpc_types.WriteCtrFreqRequest(
+                    task=task, num_samps_per_chan=num_samps_per_chan,
+                    auto_start=auto_start, timeout=timeout,
+                    data_layout_raw=data_layout),
+                frequency=frequency, duty_cycle=duty_cycle))
         return response.num_samps_per_chan_written
 
     def write_ctr_freq_scalar(
@@ -3512,11 +3565,12 @@ class GrpcStubInterpreter(BaseInterpreter):
         _validate_array_dtype(low_time, numpy.float64)
         response = self._invoke(
             self._client.WriteCtrTime,
-            grpc_types.WriteCtrTimeRequest(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, high_time=high_time.flat,
-                low_time=low_time.flat))
+            self._create_packed_array_request(
+                grpc_types.WriteCtrTimeRequest(
+                    task=task, num_samps_per_chan=num_samps_per_chan,
+                    auto_start=auto_start, timeout=timeout,
+                    data_layout_raw=data_layout),
+                high_time=high_time, low_time=low_time))
         return response.num_samps_per_chan_written
 
     def write_ctr_time_scalar(
@@ -3626,11 +3680,11 @@ class GrpcStubInterpreter(BaseInterpreter):
             response = self._client.GetErrorString(
                 grpc_types.GetErrorStringRequest(error_code=error_code))
             if not response.error_string:
-                return _UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE
+                return UNABLE_TO_LOCATE_ERROR_RESOURCES_MESSAGE
             return response.error_string
         except grpc.RpcError:
             _logger.exception('Failed to get error string for error code %d.', error_code)
-            return 'Failed to retrieve error description.'
+            return ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE
 
     def read_id_pin_memory(self, device_name, id_pin_name):
         response = self._invoke(
@@ -3657,14 +3711,16 @@ class GrpcStubInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: AnalogWaveform[numpy.float64],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         return self.read_analog_waveforms(
             task_handle,
             number_of_samples_per_channel,
             timeout,
             [waveform],
-            waveform_attribute_mode
+            waveform_attribute_mode,
+            read_context,
         )
 
     def read_analog_waveforms(
@@ -3673,8 +3729,10 @@ class GrpcStubInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveforms: Sequence[AnalogWaveform[numpy.float64]],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
+        # The server allocates the timing and attribute data, so read_context is not used.
         assert isinstance(task_handle, Session)
         response = self._invoke(
             self._client.ReadAnalogWaveforms,
@@ -3706,7 +3764,8 @@ class GrpcStubInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: DigitalWaveform[Any],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         return self.read_digital_waveforms(
             task_handle,
@@ -3715,7 +3774,8 @@ class GrpcStubInterpreter(BaseInterpreter):
             waveform.signal_count,  # number_of_signals_per_sample
             timeout,
             [waveform],
-            waveform_attribute_mode
+            waveform_attribute_mode,
+            read_context,
         )
 
     def read_digital_waveforms(
@@ -3727,7 +3787,9 @@ class GrpcStubInterpreter(BaseInterpreter):
         timeout: float,
         waveforms: Sequence[DigitalWaveform[Any]],
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
+        # The server allocates the timing and attribute data, so read_context is not used.
         assert isinstance(task_handle, Session)
         response = self._invoke(
             self._client.ReadDigitalWaveforms,
@@ -3763,6 +3825,7 @@ class GrpcStubInterpreter(BaseInterpreter):
         number_of_signals_per_sample: int,
         timeout: float,
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> Sequence[DigitalWaveform[numpy.uint8]]:
         assert isinstance(task_handle, Session)
         response = self._invoke(
@@ -3779,6 +3842,169 @@ class GrpcStubInterpreter(BaseInterpreter):
         self._check_for_error_from_response(response.status, samps_per_chan_read=response.samps_per_chan_read)
         return waveforms
 
+    async def read_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+        read_array: numpy.typing.NDArray[numpy.float64],
+    ) -> tuple[numpy.typing.NDArray[numpy.float64], int]:
+        if self._aio_client is None:
+            return await super().read_analog_f64_async(
+                task, num_samps_per_chan, timeout, fill_mode, read_array)
+        assert isinstance(task, Session)
+        _validate_array_dtype(read_array, numpy.float64)
+        response = await self._invoke_async(
+            self._aio_client.ReadAnalogF64,
+            grpc_types.ReadAnalogF64Request(
+                task=task, num_samps_per_chan=num_samps_per_chan,
+                timeout=timeout, fill_mode_raw=fill_mode,
+                array_size_in_samps=read_array.size))
+        _assign_numpy_array(read_array, response.read_array)
+        self._check_for_error_from_response(response.status, samps_per_chan_read=response.samps_per_chan_read)
+        return read_array, response.samps_per_chan_read
+
+    async def write_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        auto_start: bool,
+        timeout: float,
+        data_layout: int,
+        write_array: numpy.typing.NDArray[numpy.float64],
+    ) -> int:
+        if self._aio_client is None:
+            return await super().write_analog_f64_async(
+                task, num_samps_per_chan, auto_start, timeout, data_layout, write_array)
+        assert isinstance(task, Session)
+        _validate_array_dtype(write_array, numpy.float64)
+        response = await self._invoke_async(
+            self._aio_client.WriteAnalogF64,
+            self._create_packed_array_request(
+                grpc_types.WriteAnalogF64Request(
+                    task=task, num_samps_per_chan=num_samps_per_chan,
+                    auto_start=auto_start, timeout=timeout,
+                    data_layout_raw=data_layout),
+                write_array=write_array))
+        return response.samps_per_chan_written
+
+    async def wait_until_task_done_async(self, task: object, time_to_wait: float) -> None:
+        if self._aio_client is None:
+            return await super().wait_until_task_done_async(task, time_to_wait)
+        assert isinstance(task, Session)
+        await self._invoke_async(
+            self._aio_client.WaitUntilTaskDone,
+            grpc_types.WaitUntilTaskDoneRequest(task=task, time_to_wait=time_to_wait))
+
+    def call_batch(self, calls: Sequence[tuple[str, tuple[Any, ...]]]) -> list[Any]:
+        # Set and reset calls must reach the server in order, because setting one attribute can
+        # change or reset another, so they run one at a time. Each run of consecutive get calls is
+        # pipelined.
+        results: list[Any] = []
+        start = 0
+        while start < len(calls):
+            name, args = calls[start]
+            if not name.startswith("get_"):
+                results.append(getattr(self, name)(*args))
+                start += 1
+                continue
+            end = start + 1
+            while end < len(calls) and calls[end][0].startswith("get_"):
+                end += 1
+            results.extend(self._call_pipelined(calls[start:end]))
+            start = end
+        return results
+
+    def _call_pipelined(self, calls: Sequence[tuple[str, tuple[Any, ...]]]) -> list[Any]:
+        # Start the RPC of every call before waiting for any of the responses, so that the calls
+        # take about one round trip instead of one round trip per call. Each method runs twice:
+        # the first run starts its RPC and stops, and the second run processes the response.
+        batch = _RpcBatch(self, len(calls))
+        _rpc_batches.batch = batch
+        try:
+            for name, args in calls:
+                batch.next_call()
+                try:
+                    getattr(self, name)(*args)
+                except _RpcStarted:
+                    pass
+            batch.start_replay()
+            results = []
+            for name, args in calls:
+                batch.next_call()
+                results.append(getattr(self, name)(*args))
+        finally:
+            _rpc_batches.batch = None
+        return results
+
+    def read_analog_f64_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.float64], int]]:
+        assert isinstance(task_handle, Session)
+        response = self._invoke(
+            self._client.BeginReadAnalogF64,
+            grpc_types.BeginReadAnalogF64Request(
+                task=task_handle,
+                num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout,
+                fill_mode_raw=fill_mode,
+                array_size_in_samps=array_size_in_samps,
+            ))
+        self._check_for_error_from_response(response.status)
+        return self._read_moniker_stream(
+            response.moniker, _deserialize_moniker_read_analog_f64, numpy.float64, array_size_in_samps)
+
+    def read_binary_i16_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.int16], int]]:
+        assert isinstance(task_handle, Session)
+        response = self._invoke(
+            self._client.BeginReadBinaryI16,
+            grpc_types.BeginReadBinaryI16Request(
+                task=task_handle,
+                num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout,
+                fill_mode_raw=fill_mode,
+                array_size_in_samps=array_size_in_samps,
+            ))
+        self._check_for_error_from_response(response.status)
+        return self._read_moniker_stream(
+            response.moniker, grpc_types.MonikerReadBinaryI16Response.FromString, numpy.int16,
+            array_size_in_samps)
+
+    def _read_moniker_stream(self, moniker, deserialize, dtype, array_size_in_samps):
+        # The server reads the next block only after the previous one is sent, and gRPC flow
+        # control stops it from sending more than the client has room to receive, so a consumer
+        # that falls behind slows down the server instead of buffering blocks without bound.
+        moniker_stream = self._moniker_client.StreamRead(
+            data_moniker_types.MonikerList(read_monikers=[moniker]))
+        try:
+            for moniker_response in moniker_stream:
+                response = deserialize(moniker_response.data.values[0].value)
+                self._check_for_error_from_response(
+                    response.status, samps_per_chan_read=response.samps_per_chan_read)
+                read_array = numpy.asarray(response.read_array, dtype=dtype)
+                if read_array.size < array_size_in_samps:
+                    padded_array = numpy.zeros(array_size_in_samps, dtype=dtype)
+                    padded_array[:read_array.size] = read_array
+                    read_array = padded_array
+                yield read_array, response.samps_per_chan_read
+        except grpc.RpcError as rpc_error:
+            self._handle_rpc_error(rpc_error)
+        finally:
+            moniker_stream.cancel()
+
     def write_analog_waveform(
         self,
         task_handle: object,
@@ -3845,6 +4071,49 @@ class GrpcStubInterpreter(BaseInterpreter):
         self._check_for_error_from_response(response.status, samps_per_chan_written=response.samps_per_chan_written)
         return response.samps_per_chan_written
 
+_deserialize_moniker_read_analog_f64 = create_response_deserializer(
+    grpc_types.MonikerReadAnalogF64Response, ("read_array",))
+
+class _RpcStarted(BaseException):
+    """Stops a method after it starts the RPC of a batched call."""
+
+
+class _RpcBatch:
+    """Tracks the RPCs that GrpcStubInterpreter.call_batch() pipelined."""
+    __slots__ = ['interpreter', '_futures', '_index', '_replaying']
+
+    def __init__(self, interpreter: GrpcStubInterpreter, call_count: int) -> None:
+        self.interpreter = interpreter
+        self._futures: list[grpc.Future | None] = [None] * call_count
+        self._index = -1
+        self._replaying = False
+
+    def next_call(self) -> None:
+        self._index += 1
+
+    def start_replay(self) -> None:
+        self._index = -1
+        self._replaying = True
+
+    def invoke(self, func, request, metadata):
+        """Start the RPC of the current call, or get its response.
+
+        Returns None if the current call already got the response of its batched RPC, so that
+        later RPCs of the same call run one at a time.
+        """
+        if not self._replaying:
+            self._futures[self._index] = func.future(request, metadata=metadata)
+            raise _RpcStarted()
+        future = self._futures[self._index]
+        if future is None:
+            return None
+        self._futures[self._index] = None
+        return future.result()
+
+
+_rpc_batches = threading.local()
+
+
 def _assign_numpy_array(numpy_array, grpc_array):
     """
     Assigns grpc array to numpy array maintaining the original shape.
@@ -3871,7 +4140,3 @@ def _is_cancelled(ex: Exception) -> bool:
         (isinstance(ex, grpc.RpcError) and ex.code() == grpc.StatusCode.CANCELLED)
         or (isinstance(ex, errors.RpcError) and ex.rpc_code == grpc.StatusCode.CANCELLED)
     )
-
-_ERROR_MESSAGES = {
-    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE: 'Some or all of the samples requested have not yet been acquired.\n\nTo wait for the samples to become available use a longer read timeout or read later in your program. To make the samples available sooner, increase the sample rate. If your task uses a start trigger, make sure that your start trigger is configured correctly. It is also possible that you configured the task for external timing, and no clock was supplied. If this is the case, supply an external clock.'
-}
@@ -0,0 +1,465 @@
+"""An interpreter that records the calls made to another interpreter.
+
+nidaqmx.utils._select_interpreter() wraps interpreters with this class while nidaqmx.instrumentation
+is enabled. Each wrapper method calls the method of the same name on the wrapped interpreter and
+records its duration, the bytes of sample data that it transferred, and any errors or warnings
+that it reported. The wrapper methods of the DAQmx APIs are generated in
+nidaqmx._instrumented_interpreter_base. Disabling instrumentation turns the wrapper methods into
+plain forwarding calls.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from typing import Any
+
+import numpy
+from nitypes.waveform import AnalogWaveform, DigitalWaveform
+
+from nidaqmx import instrumentation
+from nidaqmx._base_interpreter import BaseInterpreter
+from nidaqmx._instrumented_interpreter_base import InstrumentedInterpreterBase
+from nidaqmx._waveform_read_context import WaveformReadContext
+from nidaqmx.constants import WaveformAttributeMode
+
+
+class InstrumentedInterpreter(InstrumentedInterpreterBase):
+    """Records the calls that objects make to another interpreter."""
+
+    __slots__ = ("_interpreter",)
+
+    def __init__(self, interpreter: BaseInterpreter) -> None:
+        """Initialize a new InstrumentedInterpreter.
+
+        Args:
+            interpreter: Specifies the interpreter to record the calls to.
+        """
+        self._interpreter = interpreter
+
+    @property
+    def interpreter(self) -> BaseInterpreter:
+        """The interpreter that this interpreter records the calls to."""
+        return self._interpreter
+
+    @property
+    def driver_version(self):
+        """The driver version of the interpreter that this interpreter records the calls to."""
+        return self._interpreter.driver_version
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward members that are specific to the wrapped interpreter, such as check_for_error."""
+        if name == "_interpreter":
+            raise AttributeError(name)
+        return getattr(self._interpreter, name)
+
+    def _call(
+        self, function_name: str, task: object, function: Callable[..., Any], *args: Any
+    ) -> Any:
+        if not instrumentation._enabled:
+            return function(*args)
+        call = _start_call(function_name, task, args)
+        try:
+            result = function(*args)
+        except Exception as error:
+            call.complete(error)
+            raise
+        call.complete()
+        return result
+
+    async def _call_async(
+        self,
+        function_name: str,
+        task: object,
+        function: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> Any:
+        if not instrumentation._enabled:
+            return await function(*args)
+        call = _start_call(function_name, task, args)
+        try:
+            result = await function(*args)
+        except Exception as error:
+            call.complete(error)
+            raise
+        call.complete()
+        return result
+
+    def _call_stream(
+        self, function_name: str, task: object, function: Callable[..., Iterator[Any]], *args: Any
+    ) -> Iterator[Any]:
+        if not instrumentation._enabled:
+            return function(*args)
+        call = _start_call(function_name, task, args)
+        try:
+            blocks = function(*args)
+        except Exception as error:
+            call.complete(error)
+            raise
+        call.complete()
+        return _instrument_blocks(function_name, call._task_key, blocks)
+
+    def hash_task_handle(self, task_handle):
+        """Hashes a task handle of the interpreter that this interpreter records the calls to."""
+        return self._call("hash_task_handle", None, self._interpreter.hash_task_handle, task_handle)
+
+    async def read_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+        read_array: numpy.typing.NDArray[numpy.float64],
+    ) -> tuple[numpy.typing.NDArray[numpy.float64], int]:
+        """Reads analog samples asynchronously and records the call."""
+        return await self._call_async(
+            "read_analog_f64_async",
+            task,
+            self._interpreter.read_analog_f64_async,
+            task,
+            num_samps_per_chan,
+            timeout,
+            fill_mode,
+            read_array,
+        )
+
+    async def write_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        auto_start: bool,
+        timeout: float,
+        data_layout: int,
+        write_array: numpy.typing.NDArray[numpy.float64],
+    ) -> int:
+        """Writes analog samples asynchronously and records the call."""
+        return await self._call_async(
+            "write_analog_f64_async",
+            task,
+            self._interpreter.write_analog_f64_async,
+            task,
+            num_samps_per_chan,
+            auto_start,
+            timeout,
+            data_layout,
+            write_array,
+        )
+
+    async def wait_until_task_done_async(self, task: object, time_to_wait: float) -> None:
+        """Waits until a task is done asynchronously and records the call."""
+        await self._call_async(
+            "wait_until_task_done_async",
+            task,
+            self._interpreter.wait_until_task_done_async,
+            task,
+            time_to_wait,
+        )
+
+    def call_batch(self, calls: Sequence[tuple[str, tuple[Any, ...]]]) -> list[Any]:
+        """Calls several methods of the wrapped interpreter and records the batch as one call."""
+        return self._call("call_batch", None, self._interpreter.call_batch, calls)
+
+    def read_analog_waveform(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveform: AnalogWaveform[numpy.float64],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads analog samples into a waveform and records the call."""
+        return self._call(
+            "read_analog_waveform",
+            task_handle,
+            self._interpreter.read_analog_waveform,
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveform,
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_analog_waveforms(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveforms: Sequence[AnalogWaveform[numpy.float64]],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads analog samples into waveforms and records the call."""
+        return self._call(
+            "read_analog_waveforms",
+            task_handle,
+            self._interpreter.read_analog_waveforms,
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_digital_waveform(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveform: DigitalWaveform[Any],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads digital samples into a waveform and records the call."""
+        return self._call(
+            "read_digital_waveform",
+            task_handle,
+            self._interpreter.read_digital_waveform,
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveform,
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_digital_waveforms(
+        self,
+        task_handle: object,
+        channel_count: int,
+        number_of_samples_per_channel: int,
+        number_of_signals_per_sample: int,
+        timeout: float,
+        waveforms: Sequence[DigitalWaveform[Any]],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads digital samples into waveforms and records the call."""
+        return self._call(
+            "read_digital_waveforms",
+            task_handle,
+            self._interpreter.read_digital_waveforms,
+            task_handle,
+            channel_count,
+            number_of_samples_per_channel,
+            number_of_signals_per_sample,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_new_digital_waveforms(
+        self,
+        task_handle: object,
+        channel_count: int,
+        number_of_samples_per_channel: int,
+        number_of_signals_per_sample: int,
+        timeout: float,
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> Sequence[DigitalWaveform[numpy.uint8]]:
+        """Reads digital samples into new waveforms and records the call."""
+        return self._call(
+            "read_new_digital_waveforms",
+            task_handle,
+            self._interpreter.read_new_digital_waveforms,
+            task_handle,
+            channel_count,
+            number_of_samples_per_channel,
+            number_of_signals_per_sample,
+            timeout,
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_analog_f64_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.float64], int]]:
+        """Reads blocks of analog samples and records getting each block."""
+        return self._call_stream(
+            "read_analog_f64_stream",
+            task_handle,
+            self._interpreter.read_analog_f64_stream,
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            fill_mode,
+            array_size_in_samps,
+        )
+
+    def read_binary_i16_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.int16], int]]:
+        """Reads blocks of unscaled samples and records getting each block."""
+        return self._call_stream(
+            "read_binary_i16_stream",
+            task_handle,
+            self._interpreter.read_binary_i16_stream,
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            fill_mode,
+            array_size_in_samps,
+        )
+
+    def write_analog_waveform(
+        self,
+        task_handle: object,
+        waveform: AnalogWaveform[Any],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes an analog waveform and records the call."""
+        return self._call(
+            "write_analog_waveform",
+            task_handle,
+            self._interpreter.write_analog_waveform,
+            task_handle,
+            waveform,
+            auto_start,
+            timeout,
+        )
+
+    def write_analog_waveforms(
+        self,
+        task_handle: object,
+        waveforms: Sequence[AnalogWaveform[Any]],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes analog waveforms and records the call."""
+        return self._call(
+            "write_analog_waveforms",
+            task_handle,
+            self._interpreter.write_analog_waveforms,
+            task_handle,
+            waveforms,
+            auto_start,
+            timeout,
+        )
+
+    def write_digital_waveform(
+        self,
+        task_handle: object,
+        waveform: DigitalWaveform[Any],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes a digital waveform and records the call."""
+        return self._call(
+            "write_digital_waveform",
+            task_handle,
+            self._interpreter.write_digital_waveform,
+            task_handle,
+            waveform,
+            auto_start,
+            timeout,
+        )
+
+    def write_digital_waveforms(
+        self,
+        task_handle: object,
+        waveform: Sequence[DigitalWaveform[Any]],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes digital waveforms and records the call."""
+        return self._call(
+            "write_digital_waveforms",
+            task_handle,
+            self._interpreter.write_digital_waveforms,
+            task_handle,
+            waveform,
+            auto_start,
+            timeout,
+        )
+
+
+def _get_nbytes(value: object) -> int:
+    if isinstance(value, numpy.ndarray):
+        return value.nbytes
+    if isinstance(value, AnalogWaveform):
+        return value.raw_data.nbytes
+    if isinstance(value, DigitalWaveform):
+        return value.data.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_get_nbytes(item) for item in value)
+    return 0
+
+
+class _Call:
+    """Measures one call and records it when it completes."""
+
+    __slots__ = (
+        "_function_name",
+        "_task_key",
+        "_bytes",
+        "_start_time_ns",
+        "_start_ns",
+        "_warnings",
+    )
+
+    def __init__(self, function_name: str, task_key: object, bytes_transferred: int) -> None:
+        self._function_name = function_name
+        self._task_key = task_key
+        self._bytes = bytes_transferred
+        self._warnings = instrumentation._get_warning_count()
+        self._start_time_ns = time.time_ns()
+        self._start_ns = time.perf_counter_ns()
+
+    def complete(self, error: Exception | None = None, bytes_transferred: int = 0) -> None:
+        duration_ns = time.perf_counter_ns() - self._start_ns
+        instrumentation._record(
+            instrumentation.InterpreterCallRecord(
+                self._function_name,
+                self._task_key,
+                self._start_time_ns,
+                duration_ns,
+                self._bytes + bytes_transferred,
+                error,
+                instrumentation._get_warning_count() - self._warnings,
+            )
+        )
+
+
+def _start_call(function_name: str, task: object, args: tuple[Any, ...]) -> _Call:
+    task_key = None if task is None else instrumentation._get_task_key(task)
+    bytes_transferred = 0
+    if function_name.startswith(("read_", "write_")):
+        bytes_transferred = sum(_get_nbytes(arg) for arg in args)
+    return _Call(function_name, task_key, bytes_transferred)
+
+
+def _instrument_blocks(
+    name: str, task_key: object, blocks: Iterator[tuple[numpy.typing.NDArray, int]]
+) -> Iterator[tuple[numpy.typing.NDArray, int]]:
+    """Record getting each block from a stream as a call to the function that began the stream."""
+    try:
+        while True:
+            call = _Call(name, task_key, 0)
+            try:
+                block = next(blocks)
+            except StopIteration:
+                return
+            except Exception as error:
+                call.complete(error)
+                raise
+            call.complete(bytes_transferred=_get_nbytes(block[0]))
+            yield block
+    finally:
+        close = getattr(blocks, "close", None)
+        if close is not None:
+            close()
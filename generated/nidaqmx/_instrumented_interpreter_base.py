@@ -0,0 +1,2602 @@
+# Do not edit this file; it was automatically generated.
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable
+from typing import Any
+
+from nidaqmx._base_interpreter import BaseInterpreter
+
+
+class InstrumentedInterpreterBase(BaseInterpreter):
+    """
+    Forwards the DAQmx APIs to another interpreter through the _call method.
+    """
+    __slots__ = ()
+
+    _interpreter: BaseInterpreter
+
+    @abc.abstractmethod
+    def _call(
+        self, function_name: str, task: object, function: Callable[..., Any], *args: Any
+    ) -> Any:
+        raise NotImplementedError
+
+    def add_cdaq_sync_connection(self, port_list):
+        return self._call(
+            "add_cdaq_sync_connection", None,
+            self._interpreter.add_cdaq_sync_connection, port_list)
+
+    def add_global_chans_to_task(self, task, channel_names):
+        return self._call(
+            "add_global_chans_to_task", task,
+            self._interpreter.add_global_chans_to_task, task, channel_names)
+
+    def add_network_device(
+            self, ip_address, device_name, attempt_reservation, timeout):
+        return self._call(
+            "add_network_device", None, self._interpreter.add_network_device,
+            ip_address, device_name, attempt_reservation, timeout)
+
+    def are_configured_cdaq_sync_ports_disconnected(
+            self, chassis_devices_ports, timeout):
+        return self._call(
+            "are_configured_cdaq_sync_ports_disconnected", None,
+            self._interpreter.are_configured_cdaq_sync_ports_disconnected,
+            chassis_devices_ports, timeout)
+
+    def auto_configure_cdaq_sync_connections(
+            self, chassis_devices_ports, timeout):
+        return self._call(
+            "auto_configure_cdaq_sync_connections", None,
+            self._interpreter.auto_configure_cdaq_sync_connections,
+            chassis_devices_ports, timeout)
+
+    def calculate_reverse_poly_coeff(
+            self, forward_coeffs, min_val_x, max_val_x, num_points_to_compute,
+            reverse_poly_order):
+        return self._call(
+            "calculate_reverse_poly_coeff", None,
+            self._interpreter.calculate_reverse_poly_coeff, forward_coeffs,
+            min_val_x, max_val_x, num_points_to_compute, reverse_poly_order)
+
+    def cfg_anlg_edge_ref_trig(
+            self, task, trigger_source, pretrigger_samples, trigger_slope,
+            trigger_level):
+        return self._call(
+            "cfg_anlg_edge_ref_trig", task,
+            self._interpreter.cfg_anlg_edge_ref_trig, task, trigger_source,
+            pretrigger_samples, trigger_slope, trigger_level)
+
+    def cfg_anlg_edge_start_trig(
+            self, task, trigger_source, trigger_slope, trigger_level):
+        return self._call(
+            "cfg_anlg_edge_start_trig", task,
+            self._interpreter.cfg_anlg_edge_start_trig, task, trigger_source,
+            trigger_slope, trigger_level)
+
+    def cfg_anlg_multi_edge_ref_trig(
+            self, task, trigger_sources, pretrigger_samples,
+            trigger_slope_array, trigger_level_array):
+        return self._call(
+            "cfg_anlg_multi_edge_ref_trig", task,
+            self._interpreter.cfg_anlg_multi_edge_ref_trig, task,
+            trigger_sources, pretrigger_samples, trigger_slope_array,
+            trigger_level_array)
+
+    def cfg_anlg_multi_edge_start_trig(
+            self, task, trigger_sources, trigger_slope_array,
+            trigger_level_array):
+        return self._call(
+            "cfg_anlg_multi_edge_start_trig", task,
+            self._interpreter.cfg_anlg_multi_edge_start_trig, task,
+            trigger_sources, trigger_slope_array, trigger_level_array)
+
+    def cfg_anlg_window_ref_trig(
+            self, task, trigger_source, window_top, window_bottom,
+            pretrigger_samples, trigger_when):
+        return self._call(
+            "cfg_anlg_window_ref_trig", task,
+            self._interpreter.cfg_anlg_window_ref_trig, task, trigger_source,
+            window_top, window_bottom, pretrigger_samples, trigger_when)
+
+    def cfg_anlg_window_start_trig(
+            self, task, window_top, window_bottom, trigger_source,
+            trigger_when):
+        return self._call(
+            "cfg_anlg_window_start_trig", task,
+            self._interpreter.cfg_anlg_window_start_trig, task, window_top,
+            window_bottom, trigger_source, trigger_when)
+
+    def cfg_burst_handshaking_timing_export_clock(
+            self, task, sample_clk_rate, sample_clk_outp_term, sample_mode,
+            samps_per_chan, sample_clk_pulse_polarity, pause_when,
+            ready_event_active_level):
+        return self._call(
+            "cfg_burst_handshaking_timing_export_clock", task,
+            self._interpreter.cfg_burst_handshaking_timing_export_clock, task,
+            sample_clk_rate, sample_clk_outp_term, sample_mode,
+            samps_per_chan, sample_clk_pulse_polarity, pause_when,
+            ready_event_active_level)
+
+    def cfg_burst_handshaking_timing_import_clock(
+            self, task, sample_clk_rate, sample_clk_src, sample_mode,
+            samps_per_chan, sample_clk_active_edge, pause_when,
+            ready_event_active_level):
+        return self._call(
+            "cfg_burst_handshaking_timing_import_clock", task,
+            self._interpreter.cfg_burst_handshaking_timing_import_clock, task,
+            sample_clk_rate, sample_clk_src, sample_mode, samps_per_chan,
+            sample_clk_active_edge, pause_when, ready_event_active_level)
+
+    def cfg_change_detection_timing(
+            self, task, rising_edge_chan, falling_edge_chan, sample_mode,
+            samps_per_chan):
+        return self._call(
+            "cfg_change_detection_timing", task,
+            self._interpreter.cfg_change_detection_timing, task,
+            rising_edge_chan, falling_edge_chan, sample_mode, samps_per_chan)
+
+    def cfg_dig_edge_ref_trig(
+            self, task, trigger_source, pretrigger_samples, trigger_edge):
+        return self._call(
+            "cfg_dig_edge_ref_trig", task,
+            self._interpreter.cfg_dig_edge_ref_trig, task, trigger_source,
+            pretrigger_samples, trigger_edge)
+
+    def cfg_dig_edge_start_trig(self, task, trigger_source, trigger_edge):
+        return self._call(
+            "cfg_dig_edge_start_trig", task,
+            self._interpreter.cfg_dig_edge_start_trig, task, trigger_source,
+            trigger_edge)
+
+    def cfg_dig_pattern_ref_trig(
+            self, task, trigger_source, trigger_pattern, pretrigger_samples,
+            trigger_when):
+        return self._call(
+            "cfg_dig_pattern_ref_trig", task,
+            self._interpreter.cfg_dig_pattern_ref_trig, task, trigger_source,
+            trigger_pattern, pretrigger_samples, trigger_when)
+
+    def cfg_dig_pattern_start_trig(
+            self, task, trigger_source, trigger_pattern, trigger_when):
+        return self._call(
+            "cfg_dig_pattern_start_trig", task,
+            self._interpreter.cfg_dig_pattern_start_trig, task,
+            trigger_source, trigger_pattern, trigger_when)
+
+    def cfg_handshaking_timing(self, task, sample_mode, samps_per_chan):
+        return self._call(
+            "cfg_handshaking_timing", task,
+            self._interpreter.cfg_handshaking_timing, task, sample_mode,
+            samps_per_chan)
+
+    def cfg_implicit_timing(self, task, sample_mode, samps_per_chan):
+        return self._call(
+            "cfg_implicit_timing", task,
+            self._interpreter.cfg_implicit_timing, task, sample_mode,
+            samps_per_chan)
+
+    def cfg_pipelined_samp_clk_timing(
+            self, task, rate, source, active_edge, sample_mode,
+            samps_per_chan):
+        return self._call(
+            "cfg_pipelined_samp_clk_timing", task,
+            self._interpreter.cfg_pipelined_samp_clk_timing, task, rate,
+            source, active_edge, sample_mode, samps_per_chan)
+
+    def cfg_samp_clk_timing(
+            self, task, rate, source, active_edge, sample_mode,
+            samps_per_chan):
+        return self._call(
+            "cfg_samp_clk_timing", task,
+            self._interpreter.cfg_samp_clk_timing, task, rate, source,
+            active_edge, sample_mode, samps_per_chan)
+
+    def cfg_time_start_trig(self, task, when, timescale):
+        return self._call(
+            "cfg_time_start_trig", task,
+            self._interpreter.cfg_time_start_trig, task, when, timescale)
+
+    def cfg_watchdog_ao_expir_states(
+            self, task, channel_names, expir_state_array, output_type_array):
+        return self._call(
+            "cfg_watchdog_ao_expir_states", task,
+            self._interpreter.cfg_watchdog_ao_expir_states, task,
+            channel_names, expir_state_array, output_type_array)
+
+    def cfg_watchdog_co_expir_states(
+            self, task, channel_names, expir_state_array):
+        return self._call(
+            "cfg_watchdog_co_expir_states", task,
+            self._interpreter.cfg_watchdog_co_expir_states, task,
+            channel_names, expir_state_array)
+
+    def cfg_watchdog_do_expir_states(
+            self, task, channel_names, expir_state_array):
+        return self._call(
+            "cfg_watchdog_do_expir_states", task,
+            self._interpreter.cfg_watchdog_do_expir_states, task,
+            channel_names, expir_state_array)
+
+    def clear_task(self, task):
+        return self._call("clear_task", task, self._interpreter.clear_task, task)
+
+    def clear_teds(self, physical_channel):
+        return self._call("clear_teds", None, self._interpreter.clear_teds, physical_channel)
+
+    def configure_logging(
+            self, task, file_path, logging_mode, group_name, operation):
+        return self._call(
+            "configure_logging", task, self._interpreter.configure_logging,
+            task, file_path, logging_mode, group_name, operation)
+
+    def configure_teds(self, physical_channel, file_path):
+        return self._call(
+            "configure_teds", None, self._interpreter.configure_teds,
+            physical_channel, file_path)
+
+    def connect_terms(
+            self, source_terminal, destination_terminal, signal_modifiers):
+        return self._call(
+            "connect_terms", None, self._interpreter.connect_terms,
+            source_terminal, destination_terminal, signal_modifiers)
+
+    def control_watchdog_task(self, task, action):
+        return self._call(
+            "control_watchdog_task", task,
+            self._interpreter.control_watchdog_task, task, action)
+
+    def create_ai_accel4_wire_dc_voltage_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, sensitivity,
+            sensitivity_units, voltage_excit_source, voltage_excit_val,
+            use_excit_for_scaling, custom_scale_name):
+        return self._call(
+            "create_ai_accel4_wire_dc_voltage_chan", task,
+            self._interpreter.create_ai_accel4_wire_dc_voltage_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, sensitivity, sensitivity_units,
+            voltage_excit_source, voltage_excit_val, use_excit_for_scaling,
+            custom_scale_name)
+
+    def create_ai_accel_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, sensitivity,
+            sensitivity_units, current_excit_source, current_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_ai_accel_chan", task,
+            self._interpreter.create_ai_accel_chan, task, physical_channel,
+            name_to_assign_to_channel, terminal_config, min_val, max_val,
+            units, sensitivity, sensitivity_units, current_excit_source,
+            current_excit_val, custom_scale_name)
+
+    def create_ai_accel_charge_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, sensitivity,
+            sensitivity_units, custom_scale_name):
+        return self._call(
+            "create_ai_accel_charge_chan", task,
+            self._interpreter.create_ai_accel_charge_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, sensitivity, sensitivity_units,
+            custom_scale_name)
+
+    def create_ai_bridge_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, custom_scale_name):
+        return self._call(
+            "create_ai_bridge_chan", task,
+            self._interpreter.create_ai_bridge_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units, bridge_config,
+            voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, custom_scale_name)
+
+    def create_ai_calculated_power_chan(
+            self, task, voltage_physical_channel, current_physical_channel,
+            name_to_assign_to_channel, terminal_config, voltage_min_val,
+            voltage_max_val, current_min_val, current_max_val, units,
+            shunt_resistor_loc, ext_shunt_resistor_val, custom_scale_name):
+        return self._call(
+            "create_ai_calculated_power_chan", task,
+            self._interpreter.create_ai_calculated_power_chan, task,
+            voltage_physical_channel, current_physical_channel,
+            name_to_assign_to_channel, terminal_config, voltage_min_val,
+            voltage_max_val, current_min_val, current_max_val, units,
+            shunt_resistor_loc, ext_shunt_resistor_val, custom_scale_name)
+
+    def create_ai_charge_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, custom_scale_name):
+        return self._call(
+            "create_ai_charge_chan", task,
+            self._interpreter.create_ai_charge_chan, task, physical_channel,
+            name_to_assign_to_channel, terminal_config, min_val, max_val,
+            units, custom_scale_name)
+
+    def create_ai_current_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, shunt_resistor_loc,
+            ext_shunt_resistor_val, custom_scale_name):
+        return self._call(
+            "create_ai_current_chan", task,
+            self._interpreter.create_ai_current_chan, task, physical_channel,
+            name_to_assign_to_channel, terminal_config, min_val, max_val,
+            units, shunt_resistor_loc, ext_shunt_resistor_val,
+            custom_scale_name)
+
+    def create_ai_current_rms_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, shunt_resistor_loc,
+            ext_shunt_resistor_val, custom_scale_name):
+        return self._call(
+            "create_ai_current_rms_chan", task,
+            self._interpreter.create_ai_current_rms_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, shunt_resistor_loc,
+            ext_shunt_resistor_val, custom_scale_name)
+
+    def create_ai_force_bridge_polynomial_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, forward_coeffs,
+            reverse_coeffs, electrical_units, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_force_bridge_polynomial_chan", task,
+            self._interpreter.create_ai_force_bridge_polynomial_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, forward_coeffs, reverse_coeffs,
+            electrical_units, physical_units, custom_scale_name)
+
+    def create_ai_force_bridge_table_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, electrical_vals,
+            electrical_units, physical_vals, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_force_bridge_table_chan", task,
+            self._interpreter.create_ai_force_bridge_table_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, electrical_vals, electrical_units,
+            physical_vals, physical_units, custom_scale_name)
+
+    def create_ai_force_bridge_two_point_lin_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance,
+            first_electrical_val, second_electrical_val, electrical_units,
+            first_physical_val, second_physical_val, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_force_bridge_two_point_lin_chan", task,
+            self._interpreter.create_ai_force_bridge_two_point_lin_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, first_electrical_val,
+            second_electrical_val, electrical_units, first_physical_val,
+            second_physical_val, physical_units, custom_scale_name)
+
+    def create_ai_force_iepe_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, sensitivity,
+            sensitivity_units, current_excit_source, current_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_ai_force_iepe_chan", task,
+            self._interpreter.create_ai_force_iepe_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, sensitivity, sensitivity_units,
+            current_excit_source, current_excit_val, custom_scale_name)
+
+    def create_ai_freq_voltage_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, threshold_level, hysteresis, custom_scale_name):
+        return self._call(
+            "create_ai_freq_voltage_chan", task,
+            self._interpreter.create_ai_freq_voltage_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, threshold_level, hysteresis, custom_scale_name)
+
+    def create_ai_microphone_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, units, mic_sensitivity, max_snd_press_level,
+            current_excit_source, current_excit_val, custom_scale_name):
+        return self._call(
+            "create_ai_microphone_chan", task,
+            self._interpreter.create_ai_microphone_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            units, mic_sensitivity, max_snd_press_level, current_excit_source,
+            current_excit_val, custom_scale_name)
+
+    def create_ai_pos_eddy_curr_prox_probe_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, sensitivity, sensitivity_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_pos_eddy_curr_prox_probe_chan", task,
+            self._interpreter.create_ai_pos_eddy_curr_prox_probe_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, sensitivity, sensitivity_units, custom_scale_name)
+
+    def create_ai_pos_lvdt_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, sensitivity, sensitivity_units,
+            voltage_excit_source, voltage_excit_val, voltage_excit_freq,
+            ac_excit_wire_mode, custom_scale_name):
+        return self._call(
+            "create_ai_pos_lvdt_chan", task,
+            self._interpreter.create_ai_pos_lvdt_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units, sensitivity,
+            sensitivity_units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name)
+
+    def create_ai_pos_rvdt_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, sensitivity, sensitivity_units,
+            voltage_excit_source, voltage_excit_val, voltage_excit_freq,
+            ac_excit_wire_mode, custom_scale_name):
+        return self._call(
+            "create_ai_pos_rvdt_chan", task,
+            self._interpreter.create_ai_pos_rvdt_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units, sensitivity,
+            sensitivity_units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name)
+
+    def create_ai_power_chan(
+            self, task, physical_channel, voltage_setpoint, current_setpoint,
+            output_enable, name_to_assign_to_channel):
+        return self._call(
+            "create_ai_power_chan", task,
+            self._interpreter.create_ai_power_chan, task, physical_channel,
+            voltage_setpoint, current_setpoint, output_enable,
+            name_to_assign_to_channel)
+
+    def create_ai_pressure_bridge_polynomial_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, forward_coeffs,
+            reverse_coeffs, electrical_units, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_pressure_bridge_polynomial_chan", task,
+            self._interpreter.create_ai_pressure_bridge_polynomial_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, forward_coeffs, reverse_coeffs,
+            electrical_units, physical_units, custom_scale_name)
+
+    def create_ai_pressure_bridge_table_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, electrical_vals,
+            electrical_units, physical_vals, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_pressure_bridge_table_chan", task,
+            self._interpreter.create_ai_pressure_bridge_table_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, electrical_vals, electrical_units,
+            physical_vals, physical_units, custom_scale_name)
+
+    def create_ai_pressure_bridge_two_point_lin_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance,
+            first_electrical_val, second_electrical_val, electrical_units,
+            first_physical_val, second_physical_val, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_pressure_bridge_two_point_lin_chan", task,
+            self._interpreter.create_ai_pressure_bridge_two_point_lin_chan,
+            task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance,
+            first_electrical_val, second_electrical_val, electrical_units,
+            first_physical_val, second_physical_val, physical_units,
+            custom_scale_name)
+
+    def create_ai_resistance_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, current_excit_source,
+            current_excit_val, custom_scale_name):
+        return self._call(
+            "create_ai_resistance_chan", task,
+            self._interpreter.create_ai_resistance_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, current_excit_source, current_excit_val,
+            custom_scale_name)
+
+    def create_ai_rosette_strain_gage_chan(
+            self, task, physical_channel, rosette_type, gage_orientation,
+            rosette_meas_types, name_to_assign_to_channel, min_val, max_val,
+            strain_config, voltage_excit_source, voltage_excit_val,
+            gage_factor, nominal_gage_resistance, poisson_ratio,
+            lead_wire_resistance):
+        return self._call(
+            "create_ai_rosette_strain_gage_chan", task,
+            self._interpreter.create_ai_rosette_strain_gage_chan, task,
+            physical_channel, rosette_type, gage_orientation,
+            rosette_meas_types, name_to_assign_to_channel, min_val, max_val,
+            strain_config, voltage_excit_source, voltage_excit_val,
+            gage_factor, nominal_gage_resistance, poisson_ratio,
+            lead_wire_resistance)
+
+    def create_ai_strain_gage_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, strain_config, voltage_excit_source,
+            voltage_excit_val, gage_factor, initial_bridge_voltage,
+            nominal_gage_resistance, poisson_ratio, lead_wire_resistance,
+            custom_scale_name):
+        return self._call(
+            "create_ai_strain_gage_chan", task,
+            self._interpreter.create_ai_strain_gage_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, strain_config, voltage_excit_source, voltage_excit_val,
+            gage_factor, initial_bridge_voltage, nominal_gage_resistance,
+            poisson_ratio, lead_wire_resistance, custom_scale_name)
+
+    def create_ai_temp_built_in_sensor_chan(
+            self, task, physical_channel, name_to_assign_to_channel, units):
+        return self._call(
+            "create_ai_temp_built_in_sensor_chan", task,
+            self._interpreter.create_ai_temp_built_in_sensor_chan, task,
+            physical_channel, name_to_assign_to_channel, units)
+
+    def create_ai_thrmcpl_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, thermocouple_type, cjc_source, cjc_val,
+            cjc_channel):
+        return self._call(
+            "create_ai_thrmcpl_chan", task,
+            self._interpreter.create_ai_thrmcpl_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units,
+            thermocouple_type, cjc_source, cjc_val, cjc_channel)
+
+    def create_ai_thrmstr_chan_iex(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, current_excit_source,
+            current_excit_val, a, b, c):
+        return self._call(
+            "create_ai_thrmstr_chan_iex", task,
+            self._interpreter.create_ai_thrmstr_chan_iex, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, current_excit_source, current_excit_val,
+            a, b, c)
+
+    def create_ai_thrmstr_chan_vex(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, voltage_excit_source,
+            voltage_excit_val, a, b, c, r_1):
+        return self._call(
+            "create_ai_thrmstr_chan_vex", task,
+            self._interpreter.create_ai_thrmstr_chan_vex, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, voltage_excit_source, voltage_excit_val,
+            a, b, c, r_1)
+
+    def create_ai_torque_bridge_polynomial_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, forward_coeffs,
+            reverse_coeffs, electrical_units, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_torque_bridge_polynomial_chan", task,
+            self._interpreter.create_ai_torque_bridge_polynomial_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, forward_coeffs, reverse_coeffs,
+            electrical_units, physical_units, custom_scale_name)
+
+    def create_ai_torque_bridge_table_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance, electrical_vals,
+            electrical_units, physical_vals, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_torque_bridge_table_chan", task,
+            self._interpreter.create_ai_torque_bridge_table_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, bridge_config, voltage_excit_source, voltage_excit_val,
+            nominal_bridge_resistance, electrical_vals, electrical_units,
+            physical_vals, physical_units, custom_scale_name)
+
+    def create_ai_torque_bridge_two_point_lin_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance,
+            first_electrical_val, second_electrical_val, electrical_units,
+            first_physical_val, second_physical_val, physical_units,
+            custom_scale_name):
+        return self._call(
+            "create_ai_torque_bridge_two_point_lin_chan", task,
+            self._interpreter.create_ai_torque_bridge_two_point_lin_chan,
+            task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, nominal_bridge_resistance,
+            first_electrical_val, second_electrical_val, electrical_units,
+            first_physical_val, second_physical_val, physical_units,
+            custom_scale_name)
+
+    def create_ai_velocity_iepe_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, sensitivity,
+            sensitivity_units, current_excit_source, current_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_ai_velocity_iepe_chan", task,
+            self._interpreter.create_ai_velocity_iepe_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, sensitivity, sensitivity_units,
+            current_excit_source, current_excit_val, custom_scale_name)
+
+    def create_ai_voltage_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, custom_scale_name):
+        return self._call(
+            "create_ai_voltage_chan", task,
+            self._interpreter.create_ai_voltage_chan, task, physical_channel,
+            name_to_assign_to_channel, terminal_config, min_val, max_val,
+            units, custom_scale_name)
+
+    def create_ai_voltage_chan_with_excit(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, bridge_config,
+            voltage_excit_source, voltage_excit_val, use_excit_for_scaling,
+            custom_scale_name):
+        return self._call(
+            "create_ai_voltage_chan_with_excit", task,
+            self._interpreter.create_ai_voltage_chan_with_excit, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, bridge_config, voltage_excit_source,
+            voltage_excit_val, use_excit_for_scaling, custom_scale_name)
+
+    def create_ai_voltage_rms_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, custom_scale_name):
+        return self._call(
+            "create_ai_voltage_rms_chan", task,
+            self._interpreter.create_ai_voltage_rms_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, custom_scale_name)
+
+    def create_airtd_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, rtd_type, resistance_config, current_excit_source,
+            current_excit_val, r_0):
+        return self._call(
+            "create_airtd_chan", task, self._interpreter.create_airtd_chan,
+            task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, rtd_type, resistance_config, current_excit_source,
+            current_excit_val, r_0)
+
+    def create_ao_current_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, custom_scale_name):
+        return self._call(
+            "create_ao_current_chan", task,
+            self._interpreter.create_ao_current_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units,
+            custom_scale_name)
+
+    def create_ao_func_gen_chan(
+            self, task, physical_channel, name_to_assign_to_channel, type,
+            freq, amplitude, offset):
+        return self._call(
+            "create_ao_func_gen_chan", task,
+            self._interpreter.create_ao_func_gen_chan, task, physical_channel,
+            name_to_assign_to_channel, type, freq, amplitude, offset)
+
+    def create_ao_voltage_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, custom_scale_name):
+        return self._call(
+            "create_ao_voltage_chan", task,
+            self._interpreter.create_ao_voltage_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units,
+            custom_scale_name)
+
+    def create_ci_ang_encoder_chan(
+            self, task, counter, name_to_assign_to_channel, decoding_type,
+            zidx_enable, zidx_val, zidx_phase, units, pulses_per_rev,
+            initial_angle, custom_scale_name):
+        return self._call(
+            "create_ci_ang_encoder_chan", task,
+            self._interpreter.create_ci_ang_encoder_chan, task, counter,
+            name_to_assign_to_channel, decoding_type, zidx_enable, zidx_val,
+            zidx_phase, units, pulses_per_rev, initial_angle,
+            custom_scale_name)
+
+    def create_ci_ang_velocity_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            decoding_type, units, pulses_per_rev, custom_scale_name):
+        return self._call(
+            "create_ci_ang_velocity_chan", task,
+            self._interpreter.create_ci_ang_velocity_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, decoding_type, units,
+            pulses_per_rev, custom_scale_name)
+
+    def create_ci_count_edges_chan(
+            self, task, counter, name_to_assign_to_channel, edge,
+            initial_count, count_direction):
+        return self._call(
+            "create_ci_count_edges_chan", task,
+            self._interpreter.create_ci_count_edges_chan, task, counter,
+            name_to_assign_to_channel, edge, initial_count, count_direction)
+
+    def create_ci_duty_cycle_chan(
+            self, task, counter, name_to_assign_to_channel, min_freq,
+            max_freq, edge, custom_scale_name):
+        return self._call(
+            "create_ci_duty_cycle_chan", task,
+            self._interpreter.create_ci_duty_cycle_chan, task, counter,
+            name_to_assign_to_channel, min_freq, max_freq, edge,
+            custom_scale_name)
+
+    def create_ci_freq_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units, edge, meas_method, meas_time, divisor, custom_scale_name):
+        return self._call(
+            "create_ci_freq_chan", task,
+            self._interpreter.create_ci_freq_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units, edge,
+            meas_method, meas_time, divisor, custom_scale_name)
+
+    def create_ci_lin_encoder_chan(
+            self, task, counter, name_to_assign_to_channel, decoding_type,
+            zidx_enable, zidx_val, zidx_phase, units, dist_per_pulse,
+            initial_pos, custom_scale_name):
+        return self._call(
+            "create_ci_lin_encoder_chan", task,
+            self._interpreter.create_ci_lin_encoder_chan, task, counter,
+            name_to_assign_to_channel, decoding_type, zidx_enable, zidx_val,
+            zidx_phase, units, dist_per_pulse, initial_pos, custom_scale_name)
+
+    def create_ci_lin_velocity_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            decoding_type, units, dist_per_pulse, custom_scale_name):
+        return self._call(
+            "create_ci_lin_velocity_chan", task,
+            self._interpreter.create_ci_lin_velocity_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, decoding_type, units,
+            dist_per_pulse, custom_scale_name)
+
+    def create_ci_period_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units, edge, meas_method, meas_time, divisor, custom_scale_name):
+        return self._call(
+            "create_ci_period_chan", task,
+            self._interpreter.create_ci_period_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units, edge,
+            meas_method, meas_time, divisor, custom_scale_name)
+
+    def create_ci_pulse_chan_freq(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units):
+        return self._call(
+            "create_ci_pulse_chan_freq", task,
+            self._interpreter.create_ci_pulse_chan_freq, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units)
+
+    def create_ci_pulse_chan_ticks(
+            self, task, counter, name_to_assign_to_channel, source_terminal,
+            min_val, max_val):
+        return self._call(
+            "create_ci_pulse_chan_ticks", task,
+            self._interpreter.create_ci_pulse_chan_ticks, task, counter,
+            name_to_assign_to_channel, source_terminal, min_val, max_val)
+
+    def create_ci_pulse_chan_time(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units):
+        return self._call(
+            "create_ci_pulse_chan_time", task,
+            self._interpreter.create_ci_pulse_chan_time, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units)
+
+    def create_ci_pulse_width_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units, starting_edge, custom_scale_name):
+        return self._call(
+            "create_ci_pulse_width_chan", task,
+            self._interpreter.create_ci_pulse_width_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units, starting_edge,
+            custom_scale_name)
+
+    def create_ci_semi_period_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units, custom_scale_name):
+        return self._call(
+            "create_ci_semi_period_chan", task,
+            self._interpreter.create_ci_semi_period_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units,
+            custom_scale_name)
+
+    def create_ci_two_edge_sep_chan(
+            self, task, counter, name_to_assign_to_channel, min_val, max_val,
+            units, first_edge, second_edge, custom_scale_name):
+        return self._call(
+            "create_ci_two_edge_sep_chan", task,
+            self._interpreter.create_ci_two_edge_sep_chan, task, counter,
+            name_to_assign_to_channel, min_val, max_val, units, first_edge,
+            second_edge, custom_scale_name)
+
+    def create_cigps_timestamp_chan(
+            self, task, counter, name_to_assign_to_channel, units,
+            sync_method, custom_scale_name):
+        return self._call(
+            "create_cigps_timestamp_chan", task,
+            self._interpreter.create_cigps_timestamp_chan, task, counter,
+            name_to_assign_to_channel, units, sync_method, custom_scale_name)
+
+    def create_co_pulse_chan_freq(
+            self, task, counter, name_to_assign_to_channel, units, idle_state,
+            initial_delay, freq, duty_cycle):
+        return self._call(
+            "create_co_pulse_chan_freq", task,
+            self._interpreter.create_co_pulse_chan_freq, task, counter,
+            name_to_assign_to_channel, units, idle_state, initial_delay, freq,
+            duty_cycle)
+
+    def create_co_pulse_chan_ticks(
+            self, task, counter, source_terminal, name_to_assign_to_channel,
+            idle_state, initial_delay, low_ticks, high_ticks):
+        return self._call(
+            "create_co_pulse_chan_ticks", task,
+            self._interpreter.create_co_pulse_chan_ticks, task, counter,
+            source_terminal, name_to_assign_to_channel, idle_state,
+            initial_delay, low_ticks, high_ticks)
+
+    def create_co_pulse_chan_time(
+            self, task, counter, name_to_assign_to_channel, units, idle_state,
+            initial_delay, low_time, high_time):
+        return self._call(
+            "create_co_pulse_chan_time", task,
+            self._interpreter.create_co_pulse_chan_time, task, counter,
+            name_to_assign_to_channel, units, idle_state, initial_delay,
+            low_time, high_time)
+
+    def create_di_chan(
+            self, task, lines, name_to_assign_to_lines, line_grouping):
+        return self._call(
+            "create_di_chan", task, self._interpreter.create_di_chan, task,
+            lines, name_to_assign_to_lines, line_grouping)
+
+    def create_do_chan(
+            self, task, lines, name_to_assign_to_lines, line_grouping):
+        return self._call(
+            "create_do_chan", task, self._interpreter.create_do_chan, task,
+            lines, name_to_assign_to_lines, line_grouping)
+
+    def create_lin_scale(
+            self, name, slope, y_intercept, pre_scaled_units, scaled_units):
+        return self._call(
+            "create_lin_scale", None, self._interpreter.create_lin_scale,
+            name, slope, y_intercept, pre_scaled_units, scaled_units)
+
+    def create_map_scale(
+            self, name, prescaled_min, prescaled_max, scaled_min, scaled_max,
+            pre_scaled_units, scaled_units):
+        return self._call(
+            "create_map_scale", None, self._interpreter.create_map_scale,
+            name, prescaled_min, prescaled_max, scaled_min, scaled_max,
+            pre_scaled_units, scaled_units)
+
+    def create_polynomial_scale(
+            self, name, forward_coeffs, reverse_coeffs, pre_scaled_units,
+            scaled_units):
+        return self._call(
+            "create_polynomial_scale", None,
+            self._interpreter.create_polynomial_scale, name, forward_coeffs,
+            reverse_coeffs, pre_scaled_units, scaled_units)
+
+    def create_table_scale(
+            self, name, prescaled_vals, scaled_vals, pre_scaled_units,
+            scaled_units):
+        return self._call(
+            "create_table_scale", None, self._interpreter.create_table_scale,
+            name, prescaled_vals, scaled_vals, pre_scaled_units, scaled_units)
+
+    def create_task(self, session_name):
+        return self._call("create_task", None, self._interpreter.create_task, session_name)
+
+    def create_tedsai_accel_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, current_excit_source,
+            current_excit_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_accel_chan", task,
+            self._interpreter.create_tedsai_accel_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, current_excit_source, current_excit_val,
+            custom_scale_name)
+
+    def create_tedsai_bridge_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_tedsai_bridge_chan", task,
+            self._interpreter.create_tedsai_bridge_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val, custom_scale_name)
+
+    def create_tedsai_current_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, shunt_resistor_loc,
+            ext_shunt_resistor_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_current_chan", task,
+            self._interpreter.create_tedsai_current_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, shunt_resistor_loc,
+            ext_shunt_resistor_val, custom_scale_name)
+
+    def create_tedsai_force_bridge_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_tedsai_force_bridge_chan", task,
+            self._interpreter.create_tedsai_force_bridge_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val, custom_scale_name)
+
+    def create_tedsai_force_iepe_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, current_excit_source,
+            current_excit_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_force_iepe_chan", task,
+            self._interpreter.create_tedsai_force_iepe_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, current_excit_source, current_excit_val,
+            custom_scale_name)
+
+    def create_tedsai_microphone_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, units, max_snd_press_level, current_excit_source,
+            current_excit_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_microphone_chan", task,
+            self._interpreter.create_tedsai_microphone_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            units, max_snd_press_level, current_excit_source,
+            current_excit_val, custom_scale_name)
+
+    def create_tedsai_pos_lvdt_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
+        return self._call(
+            "create_tedsai_pos_lvdt_chan", task,
+            self._interpreter.create_tedsai_pos_lvdt_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name)
+
+    def create_tedsai_pos_rvdt_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
+        return self._call(
+            "create_tedsai_pos_rvdt_chan", task,
+            self._interpreter.create_tedsai_pos_rvdt_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val,
+            voltage_excit_freq, ac_excit_wire_mode, custom_scale_name)
+
+    def create_tedsai_pressure_bridge_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_tedsai_pressure_bridge_chan", task,
+            self._interpreter.create_tedsai_pressure_bridge_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val, custom_scale_name)
+
+    def create_tedsai_resistance_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, current_excit_source,
+            current_excit_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_resistance_chan", task,
+            self._interpreter.create_tedsai_resistance_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, current_excit_source, current_excit_val,
+            custom_scale_name)
+
+    def create_tedsai_strain_gage_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            initial_bridge_voltage, lead_wire_resistance, custom_scale_name):
+        return self._call(
+            "create_tedsai_strain_gage_chan", task,
+            self._interpreter.create_tedsai_strain_gage_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val,
+            initial_bridge_voltage, lead_wire_resistance, custom_scale_name)
+
+    def create_tedsai_thrmcpl_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, cjc_source, cjc_val, cjc_channel):
+        return self._call(
+            "create_tedsai_thrmcpl_chan", task,
+            self._interpreter.create_tedsai_thrmcpl_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, cjc_source, cjc_val, cjc_channel)
+
+    def create_tedsai_thrmstr_chan_iex(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, current_excit_source,
+            current_excit_val):
+        return self._call(
+            "create_tedsai_thrmstr_chan_iex", task,
+            self._interpreter.create_tedsai_thrmstr_chan_iex, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, current_excit_source, current_excit_val)
+
+    def create_tedsai_thrmstr_chan_vex(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, voltage_excit_source,
+            voltage_excit_val, r_1):
+        return self._call(
+            "create_tedsai_thrmstr_chan_vex", task,
+            self._interpreter.create_tedsai_thrmstr_chan_vex, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, resistance_config, voltage_excit_source, voltage_excit_val,
+            r_1)
+
+    def create_tedsai_torque_bridge_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, voltage_excit_source, voltage_excit_val,
+            custom_scale_name):
+        return self._call(
+            "create_tedsai_torque_bridge_chan", task,
+            self._interpreter.create_tedsai_torque_bridge_chan, task,
+            physical_channel, name_to_assign_to_channel, min_val, max_val,
+            units, voltage_excit_source, voltage_excit_val, custom_scale_name)
+
+    def create_tedsai_voltage_chan(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, custom_scale_name):
+        return self._call(
+            "create_tedsai_voltage_chan", task,
+            self._interpreter.create_tedsai_voltage_chan, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, custom_scale_name)
+
+    def create_tedsai_voltage_chan_with_excit(
+            self, task, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, voltage_excit_source,
+            voltage_excit_val, custom_scale_name):
+        return self._call(
+            "create_tedsai_voltage_chan_with_excit", task,
+            self._interpreter.create_tedsai_voltage_chan_with_excit, task,
+            physical_channel, name_to_assign_to_channel, terminal_config,
+            min_val, max_val, units, voltage_excit_source, voltage_excit_val,
+            custom_scale_name)
+
+    def create_tedsairtd_chan(
+            self, task, physical_channel, name_to_assign_to_channel, min_val,
+            max_val, units, resistance_config, current_excit_source,
+            current_excit_val):
+        return self._call(
+            "create_tedsairtd_chan", task,
+            self._interpreter.create_tedsairtd_chan, task, physical_channel,
+            name_to_assign_to_channel, min_val, max_val, units,
+            resistance_config, current_excit_source, current_excit_val)
+
+    def create_watchdog_timer_task_ex(
+            self, device_name, session_name, timeout):
+        return self._call(
+            "create_watchdog_timer_task_ex", None,
+            self._interpreter.create_watchdog_timer_task_ex, device_name,
+            session_name, timeout)
+
+    def delete_network_device(self, device_name):
+        return self._call(
+            "delete_network_device", None,
+            self._interpreter.delete_network_device, device_name)
+
+    def delete_saved_global_chan(self, channel_name):
+        return self._call(
+            "delete_saved_global_chan", None,
+            self._interpreter.delete_saved_global_chan, channel_name)
+
+    def delete_saved_scale(self, scale_name):
+        return self._call(
+            "delete_saved_scale", None, self._interpreter.delete_saved_scale,
+            scale_name)
+
+    def delete_saved_task(self, task_name):
+        return self._call(
+            "delete_saved_task", None, self._interpreter.delete_saved_task,
+            task_name)
+
+    def device_supports_cal(self, device_name):
+        return self._call(
+            "device_supports_cal", None,
+            self._interpreter.device_supports_cal, device_name)
+
+    def disable_ref_trig(self, task):
+        return self._call("disable_ref_trig", task, self._interpreter.disable_ref_trig, task)
+
+    def disable_start_trig(self, task):
+        return self._call(
+            "disable_start_trig", task, self._interpreter.disable_start_trig,
+            task)
+
+    def disconnect_terms(self, source_terminal, destination_terminal):
+        return self._call(
+            "disconnect_terms", None, self._interpreter.disconnect_terms,
+            source_terminal, destination_terminal)
+
+    def export_signal(self, task, signal_id, output_terminal):
+        return self._call(
+            "export_signal", task, self._interpreter.export_signal, task,
+            signal_id, output_terminal)
+
+    def get_analog_power_up_states_with_output_type(
+            self, channel_names, array_size):
+        return self._call(
+            "get_analog_power_up_states_with_output_type", None,
+            self._interpreter.get_analog_power_up_states_with_output_type,
+            channel_names, array_size)
+
+    def get_auto_configured_cdaq_sync_connections(self):
+        return self._call(
+            "get_auto_configured_cdaq_sync_connections", None,
+            self._interpreter.get_auto_configured_cdaq_sync_connections)
+
+    def get_buffer_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_buffer_attribute_uint32", task,
+            self._interpreter.get_buffer_attribute_uint32, task, attribute)
+
+    def get_cal_info_attribute_bool(self, device_name, attribute):
+        return self._call(
+            "get_cal_info_attribute_bool", None,
+            self._interpreter.get_cal_info_attribute_bool, device_name,
+            attribute)
+
+    def get_cal_info_attribute_double(self, device_name, attribute):
+        return self._call(
+            "get_cal_info_attribute_double", None,
+            self._interpreter.get_cal_info_attribute_double, device_name,
+            attribute)
+
+    def get_cal_info_attribute_string(self, device_name, attribute):
+        return self._call(
+            "get_cal_info_attribute_string", None,
+            self._interpreter.get_cal_info_attribute_string, device_name,
+            attribute)
+
+    def get_cal_info_attribute_uint32(self, device_name, attribute):
+        return self._call(
+            "get_cal_info_attribute_uint32", None,
+            self._interpreter.get_cal_info_attribute_uint32, device_name,
+            attribute)
+
+    def get_chan_attribute_bool(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_bool", task,
+            self._interpreter.get_chan_attribute_bool, task, channel,
+            attribute)
+
+    def get_chan_attribute_double(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_double", task,
+            self._interpreter.get_chan_attribute_double, task, channel,
+            attribute)
+
+    def get_chan_attribute_double_array(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_double_array", task,
+            self._interpreter.get_chan_attribute_double_array, task, channel,
+            attribute)
+
+    def get_chan_attribute_int32(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_int32", task,
+            self._interpreter.get_chan_attribute_int32, task, channel,
+            attribute)
+
+    def get_chan_attribute_string(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_string", task,
+            self._interpreter.get_chan_attribute_string, task, channel,
+            attribute)
+
+    def get_chan_attribute_uint32(self, task, channel, attribute):
+        return self._call(
+            "get_chan_attribute_uint32", task,
+            self._interpreter.get_chan_attribute_uint32, task, channel,
+            attribute)
+
+    def get_device_attribute_bool(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_bool", None,
+            self._interpreter.get_device_attribute_bool, device_name,
+            attribute)
+
+    def get_device_attribute_double(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_double", None,
+            self._interpreter.get_device_attribute_double, device_name,
+            attribute)
+
+    def get_device_attribute_double_array(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_double_array", None,
+            self._interpreter.get_device_attribute_double_array, device_name,
+            attribute)
+
+    def get_device_attribute_int32(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_int32", None,
+            self._interpreter.get_device_attribute_int32, device_name,
+            attribute)
+
+    def get_device_attribute_int32_array(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_int32_array", None,
+            self._interpreter.get_device_attribute_int32_array, device_name,
+            attribute)
+
+    def get_device_attribute_string(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_string", None,
+            self._interpreter.get_device_attribute_string, device_name,
+            attribute)
+
+    def get_device_attribute_uint32(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_uint32", None,
+            self._interpreter.get_device_attribute_uint32, device_name,
+            attribute)
+
+    def get_device_attribute_uint32_array(self, device_name, attribute):
+        return self._call(
+            "get_device_attribute_uint32_array", None,
+            self._interpreter.get_device_attribute_uint32_array, device_name,
+            attribute)
+
+    def get_digital_logic_family_power_up_state(self, device_name):
+        return self._call(
+            "get_digital_logic_family_power_up_state", None,
+            self._interpreter.get_digital_logic_family_power_up_state,
+            device_name)
+
+    def get_digital_power_up_states(self, device_name, channel_name):
+        return self._call(
+            "get_digital_power_up_states", None,
+            self._interpreter.get_digital_power_up_states, device_name,
+            channel_name)
+
+    def get_digital_pull_up_pull_down_states(self, device_name, channel_name):
+        return self._call(
+            "get_digital_pull_up_pull_down_states", None,
+            self._interpreter.get_digital_pull_up_pull_down_states,
+            device_name, channel_name)
+
+    def get_disconnected_cdaq_sync_ports(self):
+        return self._call(
+            "get_disconnected_cdaq_sync_ports", None,
+            self._interpreter.get_disconnected_cdaq_sync_ports)
+
+    def get_error_string(self, error_code):
+        return self._call(
+            "get_error_string", None, self._interpreter.get_error_string,
+            error_code)
+
+    def get_exported_signal_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_exported_signal_attribute_bool", task,
+            self._interpreter.get_exported_signal_attribute_bool, task,
+            attribute)
+
+    def get_exported_signal_attribute_double(self, task, attribute):
+        return self._call(
+            "get_exported_signal_attribute_double", task,
+            self._interpreter.get_exported_signal_attribute_double, task,
+            attribute)
+
+    def get_exported_signal_attribute_int32(self, task, attribute):
+        return self._call(
+            "get_exported_signal_attribute_int32", task,
+            self._interpreter.get_exported_signal_attribute_int32, task,
+            attribute)
+
+    def get_exported_signal_attribute_string(self, task, attribute):
+        return self._call(
+            "get_exported_signal_attribute_string", task,
+            self._interpreter.get_exported_signal_attribute_string, task,
+            attribute)
+
+    def get_exported_signal_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_exported_signal_attribute_uint32", task,
+            self._interpreter.get_exported_signal_attribute_uint32, task,
+            attribute)
+
+    def get_ext_cal_last_date_and_time(self, device_name):
+        return self._call(
+            "get_ext_cal_last_date_and_time", None,
+            self._interpreter.get_ext_cal_last_date_and_time, device_name)
+
+    def get_persisted_chan_attribute_bool(self, channel, attribute):
+        return self._call(
+            "get_persisted_chan_attribute_bool", None,
+            self._interpreter.get_persisted_chan_attribute_bool, channel,
+            attribute)
+
+    def get_persisted_chan_attribute_string(self, channel, attribute):
+        return self._call(
+            "get_persisted_chan_attribute_string", None,
+            self._interpreter.get_persisted_chan_attribute_string, channel,
+            attribute)
+
+    def get_persisted_scale_attribute_bool(self, scale_name, attribute):
+        return self._call(
+            "get_persisted_scale_attribute_bool", None,
+            self._interpreter.get_persisted_scale_attribute_bool, scale_name,
+            attribute)
+
+    def get_persisted_scale_attribute_string(self, scale_name, attribute):
+        return self._call(
+            "get_persisted_scale_attribute_string", None,
+            self._interpreter.get_persisted_scale_attribute_string,
+            scale_name, attribute)
+
+    def get_persisted_task_attribute_bool(self, task_name, attribute):
+        return self._call(
+            "get_persisted_task_attribute_bool", None,
+            self._interpreter.get_persisted_task_attribute_bool, task_name,
+            attribute)
+
+    def get_persisted_task_attribute_string(self, task_name, attribute):
+        return self._call(
+            "get_persisted_task_attribute_string", None,
+            self._interpreter.get_persisted_task_attribute_string, task_name,
+            attribute)
+
+    def get_physical_chan_attribute_bool(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_bool", None,
+            self._interpreter.get_physical_chan_attribute_bool,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_bytes(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_bytes", None,
+            self._interpreter.get_physical_chan_attribute_bytes,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_double(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_double", None,
+            self._interpreter.get_physical_chan_attribute_double,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_double_array(
+            self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_double_array", None,
+            self._interpreter.get_physical_chan_attribute_double_array,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_int32(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_int32", None,
+            self._interpreter.get_physical_chan_attribute_int32,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_int32_array(
+            self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_int32_array", None,
+            self._interpreter.get_physical_chan_attribute_int32_array,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_string(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_string", None,
+            self._interpreter.get_physical_chan_attribute_string,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_uint32(self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_uint32", None,
+            self._interpreter.get_physical_chan_attribute_uint32,
+            physical_channel, attribute)
+
+    def get_physical_chan_attribute_uint32_array(
+            self, physical_channel, attribute):
+        return self._call(
+            "get_physical_chan_attribute_uint32_array", None,
+            self._interpreter.get_physical_chan_attribute_uint32_array,
+            physical_channel, attribute)
+
+    def get_read_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_read_attribute_bool", task,
+            self._interpreter.get_read_attribute_bool, task, attribute)
+
+    def get_read_attribute_double(self, task, attribute):
+        return self._call(
+            "get_read_attribute_double", task,
+            self._interpreter.get_read_attribute_double, task, attribute)
+
+    def get_read_attribute_int32(self, task, attribute):
+        return self._call(
+            "get_read_attribute_int32", task,
+            self._interpreter.get_read_attribute_int32, task, attribute)
+
+    def get_read_attribute_string(self, task, attribute, size_hint=0):
+        return self._call(
+            "get_read_attribute_string", task,
+            self._interpreter.get_read_attribute_string, task, attribute,
+            size_hint)
+
+    def get_read_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_read_attribute_uint32", task,
+            self._interpreter.get_read_attribute_uint32, task, attribute)
+
+    def get_read_attribute_uint64(self, task, attribute):
+        return self._call(
+            "get_read_attribute_uint64", task,
+            self._interpreter.get_read_attribute_uint64, task, attribute)
+
+    def get_scale_attribute_double(self, scale_name, attribute):
+        return self._call(
+            "get_scale_attribute_double", None,
+            self._interpreter.get_scale_attribute_double, scale_name,
+            attribute)
+
+    def get_scale_attribute_double_array(self, scale_name, attribute):
+        return self._call(
+            "get_scale_attribute_double_array", None,
+            self._interpreter.get_scale_attribute_double_array, scale_name,
+            attribute)
+
+    def get_scale_attribute_int32(self, scale_name, attribute):
+        return self._call(
+            "get_scale_attribute_int32", None,
+            self._interpreter.get_scale_attribute_int32, scale_name,
+            attribute)
+
+    def get_scale_attribute_string(self, scale_name, attribute):
+        return self._call(
+            "get_scale_attribute_string", None,
+            self._interpreter.get_scale_attribute_string, scale_name,
+            attribute)
+
+    def get_self_cal_last_date_and_time(self, device_name):
+        return self._call(
+            "get_self_cal_last_date_and_time", None,
+            self._interpreter.get_self_cal_last_date_and_time, device_name)
+
+    def get_system_info_attribute_string(self, attribute):
+        return self._call(
+            "get_system_info_attribute_string", None,
+            self._interpreter.get_system_info_attribute_string, attribute)
+
+    def get_system_info_attribute_uint32(self, attribute):
+        return self._call(
+            "get_system_info_attribute_uint32", None,
+            self._interpreter.get_system_info_attribute_uint32, attribute)
+
+    def get_task_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_task_attribute_bool", task,
+            self._interpreter.get_task_attribute_bool, task, attribute)
+
+    def get_task_attribute_string(self, task, attribute):
+        return self._call(
+            "get_task_attribute_string", task,
+            self._interpreter.get_task_attribute_string, task, attribute)
+
+    def get_task_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_task_attribute_uint32", task,
+            self._interpreter.get_task_attribute_uint32, task, attribute)
+
+    def get_timing_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_bool", task,
+            self._interpreter.get_timing_attribute_bool, task, attribute)
+
+    def get_timing_attribute_double(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_double", task,
+            self._interpreter.get_timing_attribute_double, task, attribute)
+
+    def get_timing_attribute_ex_bool(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_bool", task,
+            self._interpreter.get_timing_attribute_ex_bool, task,
+            device_names, attribute)
+
+    def get_timing_attribute_ex_double(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_double", task,
+            self._interpreter.get_timing_attribute_ex_double, task,
+            device_names, attribute)
+
+    def get_timing_attribute_ex_int32(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_int32", task,
+            self._interpreter.get_timing_attribute_ex_int32, task,
+            device_names, attribute)
+
+    def get_timing_attribute_ex_string(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_string", task,
+            self._interpreter.get_timing_attribute_ex_string, task,
+            device_names, attribute)
+
+    def get_timing_attribute_ex_uint32(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_uint32", task,
+            self._interpreter.get_timing_attribute_ex_uint32, task,
+            device_names, attribute)
+
+    def get_timing_attribute_ex_uint64(self, task, device_names, attribute):
+        return self._call(
+            "get_timing_attribute_ex_uint64", task,
+            self._interpreter.get_timing_attribute_ex_uint64, task,
+            device_names, attribute)
+
+    def get_timing_attribute_int32(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_int32", task,
+            self._interpreter.get_timing_attribute_int32, task, attribute)
+
+    def get_timing_attribute_string(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_string", task,
+            self._interpreter.get_timing_attribute_string, task, attribute)
+
+    def get_timing_attribute_timestamp(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_timestamp", task,
+            self._interpreter.get_timing_attribute_timestamp, task, attribute)
+
+    def get_timing_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_uint32", task,
+            self._interpreter.get_timing_attribute_uint32, task, attribute)
+
+    def get_timing_attribute_uint64(self, task, attribute):
+        return self._call(
+            "get_timing_attribute_uint64", task,
+            self._interpreter.get_timing_attribute_uint64, task, attribute)
+
+    def get_trig_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_bool", task,
+            self._interpreter.get_trig_attribute_bool, task, attribute)
+
+    def get_trig_attribute_double(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_double", task,
+            self._interpreter.get_trig_attribute_double, task, attribute)
+
+    def get_trig_attribute_double_array(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_double_array", task,
+            self._interpreter.get_trig_attribute_double_array, task,
+            attribute)
+
+    def get_trig_attribute_int32(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_int32", task,
+            self._interpreter.get_trig_attribute_int32, task, attribute)
+
+    def get_trig_attribute_int32_array(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_int32_array", task,
+            self._interpreter.get_trig_attribute_int32_array, task, attribute)
+
+    def get_trig_attribute_string(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_string", task,
+            self._interpreter.get_trig_attribute_string, task, attribute)
+
+    def get_trig_attribute_timestamp(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_timestamp", task,
+            self._interpreter.get_trig_attribute_timestamp, task, attribute)
+
+    def get_trig_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_trig_attribute_uint32", task,
+            self._interpreter.get_trig_attribute_uint32, task, attribute)
+
+    def get_watchdog_attribute_bool(self, task, lines, attribute):
+        return self._call(
+            "get_watchdog_attribute_bool", task,
+            self._interpreter.get_watchdog_attribute_bool, task, lines,
+            attribute)
+
+    def get_watchdog_attribute_double(self, task, lines, attribute):
+        return self._call(
+            "get_watchdog_attribute_double", task,
+            self._interpreter.get_watchdog_attribute_double, task, lines,
+            attribute)
+
+    def get_watchdog_attribute_int32(self, task, lines, attribute):
+        return self._call(
+            "get_watchdog_attribute_int32", task,
+            self._interpreter.get_watchdog_attribute_int32, task, lines,
+            attribute)
+
+    def get_watchdog_attribute_string(self, task, lines, attribute):
+        return self._call(
+            "get_watchdog_attribute_string", task,
+            self._interpreter.get_watchdog_attribute_string, task, lines,
+            attribute)
+
+    def get_write_attribute_bool(self, task, attribute):
+        return self._call(
+            "get_write_attribute_bool", task,
+            self._interpreter.get_write_attribute_bool, task, attribute)
+
+    def get_write_attribute_double(self, task, attribute):
+        return self._call(
+            "get_write_attribute_double", task,
+            self._interpreter.get_write_attribute_double, task, attribute)
+
+    def get_write_attribute_int32(self, task, attribute):
+        return self._call(
+            "get_write_attribute_int32", task,
+            self._interpreter.get_write_attribute_int32, task, attribute)
+
+    def get_write_attribute_string(self, task, attribute, size_hint=0):
+        return self._call(
+            "get_write_attribute_string", task,
+            self._interpreter.get_write_attribute_string, task, attribute,
+            size_hint)
+
+    def get_write_attribute_uint32(self, task, attribute):
+        return self._call(
+            "get_write_attribute_uint32", task,
+            self._interpreter.get_write_attribute_uint32, task, attribute)
+
+    def get_write_attribute_uint64(self, task, attribute):
+        return self._call(
+            "get_write_attribute_uint64", task,
+            self._interpreter.get_write_attribute_uint64, task, attribute)
+
+    def internal_get_last_created_chan(self):
+        return self._call(
+            "internal_get_last_created_chan", None,
+            self._interpreter.internal_get_last_created_chan)
+
+    def is_task_done(self, task):
+        return self._call("is_task_done", task, self._interpreter.is_task_done, task)
+
+    def load_task(self, session_name):
+        return self._call("load_task", None, self._interpreter.load_task, session_name)
+
+    def perform_bridge_offset_nulling_cal_ex(
+            self, task, channel, skip_unsupported_channels):
+        return self._call(
+            "perform_bridge_offset_nulling_cal_ex", task,
+            self._interpreter.perform_bridge_offset_nulling_cal_ex, task,
+            channel, skip_unsupported_channels)
+
+    def perform_bridge_shunt_cal_ex(
+            self, task, channel, shunt_resistor_value,
+            shunt_resistor_location, shunt_resistor_select,
+            shunt_resistor_source, bridge_resistance,
+            skip_unsupported_channels):
+        return self._call(
+            "perform_bridge_shunt_cal_ex", task,
+            self._interpreter.perform_bridge_shunt_cal_ex, task, channel,
+            shunt_resistor_value, shunt_resistor_location,
+            shunt_resistor_select, shunt_resistor_source, bridge_resistance,
+            skip_unsupported_channels)
+
+    def perform_strain_shunt_cal_ex(
+            self, task, channel, shunt_resistor_value,
+            shunt_resistor_location, shunt_resistor_select,
+            shunt_resistor_source, skip_unsupported_channels):
+        return self._call(
+            "perform_strain_shunt_cal_ex", task,
+            self._interpreter.perform_strain_shunt_cal_ex, task, channel,
+            shunt_resistor_value, shunt_resistor_location,
+            shunt_resistor_select, shunt_resistor_source,
+            skip_unsupported_channels)
+
+    def perform_thrmcpl_lead_offset_nulling_cal(
+            self, task, channel, skip_unsupported_channels):
+        return self._call(
+            "perform_thrmcpl_lead_offset_nulling_cal", task,
+            self._interpreter.perform_thrmcpl_lead_offset_nulling_cal, task,
+            channel, skip_unsupported_channels)
+
+    def read_analog_f64(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_analog_f64", task, self._interpreter.read_analog_f64, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_analog_scalar_f64(self, task, timeout):
+        return self._call(
+            "read_analog_scalar_f64", task,
+            self._interpreter.read_analog_scalar_f64, task, timeout)
+
+    def read_binary_i16(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_binary_i16", task, self._interpreter.read_binary_i16, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_binary_i32(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_binary_i32", task, self._interpreter.read_binary_i32, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_binary_u16(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_binary_u16", task, self._interpreter.read_binary_u16, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_binary_u32(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_binary_u32", task, self._interpreter.read_binary_u32, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_counter_f64(self, task, num_samps_per_chan, timeout, read_array):
+        return self._call(
+            "read_counter_f64", task, self._interpreter.read_counter_f64,
+            task, num_samps_per_chan, timeout, read_array)
+
+    def read_counter_f64_ex(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_counter_f64_ex", task,
+            self._interpreter.read_counter_f64_ex, task, num_samps_per_chan,
+            timeout, fill_mode, read_array)
+
+    def read_counter_scalar_f64(self, task, timeout):
+        return self._call(
+            "read_counter_scalar_f64", task,
+            self._interpreter.read_counter_scalar_f64, task, timeout)
+
+    def read_counter_scalar_u32(self, task, timeout):
+        return self._call(
+            "read_counter_scalar_u32", task,
+            self._interpreter.read_counter_scalar_u32, task, timeout)
+
+    def read_counter_u32(self, task, num_samps_per_chan, timeout, read_array):
+        return self._call(
+            "read_counter_u32", task, self._interpreter.read_counter_u32,
+            task, num_samps_per_chan, timeout, read_array)
+
+    def read_counter_u32_ex(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_counter_u32_ex", task,
+            self._interpreter.read_counter_u32_ex, task, num_samps_per_chan,
+            timeout, fill_mode, read_array)
+
+    def read_ctr_freq(
+            self, task, num_samps_per_chan, timeout, interleaved,
+            read_array_frequency, read_array_duty_cycle):
+        return self._call(
+            "read_ctr_freq", task, self._interpreter.read_ctr_freq, task,
+            num_samps_per_chan, timeout, interleaved, read_array_frequency,
+            read_array_duty_cycle)
+
+    def read_ctr_freq_scalar(self, task, timeout):
+        return self._call(
+            "read_ctr_freq_scalar", task,
+            self._interpreter.read_ctr_freq_scalar, task, timeout)
+
+    def read_ctr_ticks(
+            self, task, num_samps_per_chan, timeout, interleaved,
+            read_array_high_ticks, read_array_low_ticks):
+        return self._call(
+            "read_ctr_ticks", task, self._interpreter.read_ctr_ticks, task,
+            num_samps_per_chan, timeout, interleaved, read_array_high_ticks,
+            read_array_low_ticks)
+
+    def read_ctr_ticks_scalar(self, task, timeout):
+        return self._call(
+            "read_ctr_ticks_scalar", task,
+            self._interpreter.read_ctr_ticks_scalar, task, timeout)
+
+    def read_ctr_time(
+            self, task, num_samps_per_chan, timeout, interleaved,
+            read_array_high_time, read_array_low_time):
+        return self._call(
+            "read_ctr_time", task, self._interpreter.read_ctr_time, task,
+            num_samps_per_chan, timeout, interleaved, read_array_high_time,
+            read_array_low_time)
+
+    def read_ctr_time_scalar(self, task, timeout):
+        return self._call(
+            "read_ctr_time_scalar", task,
+            self._interpreter.read_ctr_time_scalar, task, timeout)
+
+    def read_digital_lines(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_digital_lines", task, self._interpreter.read_digital_lines,
+            task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_digital_scalar_u32(self, task, timeout):
+        return self._call(
+            "read_digital_scalar_u32", task,
+            self._interpreter.read_digital_scalar_u32, task, timeout)
+
+    def read_digital_u16(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_digital_u16", task, self._interpreter.read_digital_u16,
+            task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_digital_u32(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_digital_u32", task, self._interpreter.read_digital_u32,
+            task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_digital_u8(
+            self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        return self._call(
+            "read_digital_u8", task, self._interpreter.read_digital_u8, task,
+            num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_id_pin_memory(self, device_name, id_pin_name):
+        return self._call(
+            "read_id_pin_memory", None, self._interpreter.read_id_pin_memory,
+            device_name, id_pin_name)
+
+    def read_power_binary_i16(
+            self, task, num_samps_per_chan, timeout, fill_mode,
+            read_array_voltage, read_array_current):
+        return self._call(
+            "read_power_binary_i16", task,
+            self._interpreter.read_power_binary_i16, task, num_samps_per_chan,
+            timeout, fill_mode, read_array_voltage, read_array_current)
+
+    def read_power_f64(
+            self, task, num_samps_per_chan, timeout, fill_mode,
+            read_array_voltage, read_array_current):
+        return self._call(
+            "read_power_f64", task, self._interpreter.read_power_f64, task,
+            num_samps_per_chan, timeout, fill_mode, read_array_voltage,
+            read_array_current)
+
+    def read_power_scalar_f64(self, task, timeout):
+        return self._call(
+            "read_power_scalar_f64", task,
+            self._interpreter.read_power_scalar_f64, task, timeout)
+
+    def read_raw(self, task, num_samps_per_chan, timeout, read_array):
+        return self._call(
+            "read_raw", task, self._interpreter.read_raw, task,
+            num_samps_per_chan, timeout, read_array)
+
+    def register_done_event(
+            self, task, options, callback_function, callback_data):
+        return self._call(
+            "register_done_event", task,
+            self._interpreter.register_done_event, task, options,
+            callback_function, callback_data)
+
+    def register_every_n_samples_event(
+            self, task, every_n_samples_event_type, n_samples, options,
+            callback_function, callback_data):
+        return self._call(
+            "register_every_n_samples_event", task,
+            self._interpreter.register_every_n_samples_event, task,
+            every_n_samples_event_type, n_samples, options, callback_function,
+            callback_data)
+
+    def register_signal_event(
+            self, task, signal_id, options, callback_function, callback_data):
+        return self._call(
+            "register_signal_event", task,
+            self._interpreter.register_signal_event, task, signal_id, options,
+            callback_function, callback_data)
+
+    def remove_cdaq_sync_connection(self, port_list):
+        return self._call(
+            "remove_cdaq_sync_connection", None,
+            self._interpreter.remove_cdaq_sync_connection, port_list)
+
+    def reserve_network_device(self, device_name, override_reservation):
+        return self._call(
+            "reserve_network_device", None,
+            self._interpreter.reserve_network_device, device_name,
+            override_reservation)
+
+    def reset_buffer_attribute(self, task, attribute):
+        return self._call(
+            "reset_buffer_attribute", task,
+            self._interpreter.reset_buffer_attribute, task, attribute)
+
+    def reset_chan_attribute(self, task, channel, attribute):
+        return self._call(
+            "reset_chan_attribute", task,
+            self._interpreter.reset_chan_attribute, task, channel, attribute)
+
+    def reset_device(self, device_name):
+        return self._call("reset_device", None, self._interpreter.reset_device, device_name)
+
+    def reset_exported_signal_attribute(self, task, attribute):
+        return self._call(
+            "reset_exported_signal_attribute", task,
+            self._interpreter.reset_exported_signal_attribute, task,
+            attribute)
+
+    def reset_read_attribute(self, task, attribute):
+        return self._call(
+            "reset_read_attribute", task,
+            self._interpreter.reset_read_attribute, task, attribute)
+
+    def reset_timing_attribute(self, task, attribute):
+        return self._call(
+            "reset_timing_attribute", task,
+            self._interpreter.reset_timing_attribute, task, attribute)
+
+    def reset_timing_attribute_ex(self, task, device_names, attribute):
+        return self._call(
+            "reset_timing_attribute_ex", task,
+            self._interpreter.reset_timing_attribute_ex, task, device_names,
+            attribute)
+
+    def reset_trig_attribute(self, task, attribute):
+        return self._call(
+            "reset_trig_attribute", task,
+            self._interpreter.reset_trig_attribute, task, attribute)
+
+    def reset_watchdog_attribute(self, task, lines, attribute):
+        return self._call(
+            "reset_watchdog_attribute", task,
+            self._interpreter.reset_watchdog_attribute, task, lines,
+            attribute)
+
+    def reset_write_attribute(self, task, attribute):
+        return self._call(
+            "reset_write_attribute", task,
+            self._interpreter.reset_write_attribute, task, attribute)
+
+    def restore_last_ext_cal_const(self, device_name):
+        return self._call(
+            "restore_last_ext_cal_const", None,
+            self._interpreter.restore_last_ext_cal_const, device_name)
+
+    def save_global_chan(self, task, channel_name, save_as, author, options):
+        return self._call(
+            "save_global_chan", task, self._interpreter.save_global_chan,
+            task, channel_name, save_as, author, options)
+
+    def save_scale(self, scale_name, save_as, author, options):
+        return self._call(
+            "save_scale", None, self._interpreter.save_scale, scale_name,
+            save_as, author, options)
+
+    def save_task(self, task, save_as, author, options):
+        return self._call(
+            "save_task", task, self._interpreter.save_task, task, save_as,
+            author, options)
+
+    def self_cal(self, device_name):
+        return self._call("self_cal", None, self._interpreter.self_cal, device_name)
+
+    def self_test_device(self, device_name):
+        return self._call(
+            "self_test_device", None, self._interpreter.self_test_device,
+            device_name)
+
+    def set_analog_power_up_states(
+            self, device_name, channel_names, state, channel_type):
+        return self._call(
+            "set_analog_power_up_states", None,
+            self._interpreter.set_analog_power_up_states, device_name,
+            channel_names, state, channel_type)
+
+    def set_analog_power_up_states_with_output_type(
+            self, channel_names, state_array, channel_type_array):
+        return self._call(
+            "set_analog_power_up_states_with_output_type", None,
+            self._interpreter.set_analog_power_up_states_with_output_type,
+            channel_names, state_array, channel_type_array)
+
+    def set_buffer_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_buffer_attribute_uint32", task,
+            self._interpreter.set_buffer_attribute_uint32, task, attribute,
+            value)
+
+    def set_cal_info_attribute_bool(self, device_name, attribute, value):
+        return self._call(
+            "set_cal_info_attribute_bool", None,
+            self._interpreter.set_cal_info_attribute_bool, device_name,
+            attribute, value)
+
+    def set_cal_info_attribute_double(self, device_name, attribute, value):
+        return self._call(
+            "set_cal_info_attribute_double", None,
+            self._interpreter.set_cal_info_attribute_double, device_name,
+            attribute, value)
+
+    def set_cal_info_attribute_string(self, device_name, attribute, value):
+        return self._call(
+            "set_cal_info_attribute_string", None,
+            self._interpreter.set_cal_info_attribute_string, device_name,
+            attribute, value)
+
+    def set_cal_info_attribute_uint32(self, device_name, attribute, value):
+        return self._call(
+            "set_cal_info_attribute_uint32", None,
+            self._interpreter.set_cal_info_attribute_uint32, device_name,
+            attribute, value)
+
+    def set_chan_attribute_bool(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_bool", task,
+            self._interpreter.set_chan_attribute_bool, task, channel,
+            attribute, value)
+
+    def set_chan_attribute_double(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_double", task,
+            self._interpreter.set_chan_attribute_double, task, channel,
+            attribute, value)
+
+    def set_chan_attribute_double_array(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_double_array", task,
+            self._interpreter.set_chan_attribute_double_array, task, channel,
+            attribute, value)
+
+    def set_chan_attribute_int32(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_int32", task,
+            self._interpreter.set_chan_attribute_int32, task, channel,
+            attribute, value)
+
+    def set_chan_attribute_string(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_string", task,
+            self._interpreter.set_chan_attribute_string, task, channel,
+            attribute, value)
+
+    def set_chan_attribute_uint32(self, task, channel, attribute, value):
+        return self._call(
+            "set_chan_attribute_uint32", task,
+            self._interpreter.set_chan_attribute_uint32, task, channel,
+            attribute, value)
+
+    def set_digital_logic_family_power_up_state(
+            self, device_name, logic_family):
+        return self._call(
+            "set_digital_logic_family_power_up_state", None,
+            self._interpreter.set_digital_logic_family_power_up_state,
+            device_name, logic_family)
+
+    def set_digital_power_up_states(self, device_name, channel_names, state):
+        return self._call(
+            "set_digital_power_up_states", None,
+            self._interpreter.set_digital_power_up_states, device_name,
+            channel_names, state)
+
+    def set_digital_pull_up_pull_down_states(
+            self, device_name, channel_names, state):
+        return self._call(
+            "set_digital_pull_up_pull_down_states", None,
+            self._interpreter.set_digital_pull_up_pull_down_states,
+            device_name, channel_names, state)
+
+    def set_exported_signal_attribute_bool(self, task, attribute, value):
+        return self._call(
+            "set_exported_signal_attribute_bool", task,
+            self._interpreter.set_exported_signal_attribute_bool, task,
+            attribute, value)
+
+    def set_exported_signal_attribute_double(self, task, attribute, value):
+        return self._call(
+            "set_exported_signal_attribute_double", task,
+            self._interpreter.set_exported_signal_attribute_double, task,
+            attribute, value)
+
+    def set_exported_signal_attribute_int32(self, task, attribute, value):
+        return self._call(
+            "set_exported_signal_attribute_int32", task,
+            self._interpreter.set_exported_signal_attribute_int32, task,
+            attribute, value)
+
+    def set_exported_signal_attribute_string(self, task, attribute, value):
+        return self._call(
+            "set_exported_signal_attribute_string", task,
+            self._interpreter.set_exported_signal_attribute_string, task,
+            attribute, value)
+
+    def set_exported_signal_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_exported_signal_attribute_uint32", task,
+            self._interpreter.set_exported_signal_attribute_uint32, task,
+            attribute, value)
+
+    def set_read_attribute_bool(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_bool", task,
+            self._interpreter.set_read_attribute_bool, task, attribute, value)
+
+    def set_read_attribute_double(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_double", task,
+            self._interpreter.set_read_attribute_double, task, attribute,
+            value)
+
+    def set_read_attribute_int32(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_int32", task,
+            self._interpreter.set_read_attribute_int32, task, attribute,
+            value)
+
+    def set_read_attribute_string(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_string", task,
+            self._interpreter.set_read_attribute_string, task, attribute,
+            value)
+
+    def set_read_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_uint32", task,
+            self._interpreter.set_read_attribute_uint32, task, attribute,
+            value)
+
+    def set_read_attribute_uint64(self, task, attribute, value):
+        return self._call(
+            "set_read_attribute_uint64", task,
+            self._interpreter.set_read_attribute_uint64, task, attribute,
+            value)
+
+    def set_runtime_environment(
+            self, environment, environment_version, reserved_1, reserved_2):
+        return self._call(
+            "set_runtime_environment", None,
+            self._interpreter.set_runtime_environment, environment,
+            environment_version, reserved_1, reserved_2)
+
+    def set_scale_attribute_double(self, scale_name, attribute, value):
+        return self._call(
+            "set_scale_attribute_double", None,
+            self._interpreter.set_scale_attribute_double, scale_name,
+            attribute, value)
+
+    def set_scale_attribute_double_array(self, scale_name, attribute, value):
+        return self._call(
+            "set_scale_attribute_double_array", None,
+            self._interpreter.set_scale_attribute_double_array, scale_name,
+            attribute, value)
+
+    def set_scale_attribute_int32(self, scale_name, attribute, value):
+        return self._call(
+            "set_scale_attribute_int32", None,
+            self._interpreter.set_scale_attribute_int32, scale_name,
+            attribute, value)
+
+    def set_scale_attribute_string(self, scale_name, attribute, value):
+        return self._call(
+            "set_scale_attribute_string", None,
+            self._interpreter.set_scale_attribute_string, scale_name,
+            attribute, value)
+
+    def set_timing_attribute_bool(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_bool", task,
+            self._interpreter.set_timing_attribute_bool, task, attribute,
+            value)
+
+    def set_timing_attribute_double(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_double", task,
+            self._interpreter.set_timing_attribute_double, task, attribute,
+            value)
+
+    def set_timing_attribute_ex_bool(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_bool", task,
+            self._interpreter.set_timing_attribute_ex_bool, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_ex_double(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_double", task,
+            self._interpreter.set_timing_attribute_ex_double, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_ex_int32(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_int32", task,
+            self._interpreter.set_timing_attribute_ex_int32, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_ex_string(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_string", task,
+            self._interpreter.set_timing_attribute_ex_string, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_ex_uint32(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_uint32", task,
+            self._interpreter.set_timing_attribute_ex_uint32, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_ex_uint64(
+            self, task, device_names, attribute, value):
+        return self._call(
+            "set_timing_attribute_ex_uint64", task,
+            self._interpreter.set_timing_attribute_ex_uint64, task,
+            device_names, attribute, value)
+
+    def set_timing_attribute_int32(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_int32", task,
+            self._interpreter.set_timing_attribute_int32, task, attribute,
+            value)
+
+    def set_timing_attribute_string(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_string", task,
+            self._interpreter.set_timing_attribute_string, task, attribute,
+            value)
+
+    def set_timing_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_uint32", task,
+            self._interpreter.set_timing_attribute_uint32, task, attribute,
+            value)
+
+    def set_timing_attribute_uint64(self, task, attribute, value):
+        return self._call(
+            "set_timing_attribute_uint64", task,
+            self._interpreter.set_timing_attribute_uint64, task, attribute,
+            value)
+
+    def set_trig_attribute_bool(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_bool", task,
+            self._interpreter.set_trig_attribute_bool, task, attribute, value)
+
+    def set_trig_attribute_double(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_double", task,
+            self._interpreter.set_trig_attribute_double, task, attribute,
+            value)
+
+    def set_trig_attribute_double_array(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_double_array", task,
+            self._interpreter.set_trig_attribute_double_array, task,
+            attribute, value)
+
+    def set_trig_attribute_int32(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_int32", task,
+            self._interpreter.set_trig_attribute_int32, task, attribute,
+            value)
+
+    def set_trig_attribute_int32_array(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_int32_array", task,
+            self._interpreter.set_trig_attribute_int32_array, task, attribute,
+            value)
+
+    def set_trig_attribute_string(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_string", task,
+            self._interpreter.set_trig_attribute_string, task, attribute,
+            value)
+
+    def set_trig_attribute_timestamp(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_timestamp", task,
+            self._interpreter.set_trig_attribute_timestamp, task, attribute,
+            value)
+
+    def set_trig_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_trig_attribute_uint32", task,
+            self._interpreter.set_trig_attribute_uint32, task, attribute,
+            value)
+
+    def set_watchdog_attribute_bool(self, task, lines, attribute, value):
+        return self._call(
+            "set_watchdog_attribute_bool", task,
+            self._interpreter.set_watchdog_attribute_bool, task, lines,
+            attribute, value)
+
+    def set_watchdog_attribute_double(self, task, lines, attribute, value):
+        return self._call(
+            "set_watchdog_attribute_double", task,
+            self._interpreter.set_watchdog_attribute_double, task, lines,
+            attribute, value)
+
+    def set_watchdog_attribute_int32(self, task, lines, attribute, value):
+        return self._call(
+            "set_watchdog_attribute_int32", task,
+            self._interpreter.set_watchdog_attribute_int32, task, lines,
+            attribute, value)
+
+    def set_watchdog_attribute_string(self, task, lines, attribute, value):
+        return self._call(
+            "set_watchdog_attribute_string", task,
+            self._interpreter.set_watchdog_attribute_string, task, lines,
+            attribute, value)
+
+    def set_write_attribute_bool(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_bool", task,
+            self._interpreter.set_write_attribute_bool, task, attribute,
+            value)
+
+    def set_write_attribute_double(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_double", task,
+            self._interpreter.set_write_attribute_double, task, attribute,
+            value)
+
+    def set_write_attribute_int32(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_int32", task,
+            self._interpreter.set_write_attribute_int32, task, attribute,
+            value)
+
+    def set_write_attribute_string(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_string", task,
+            self._interpreter.set_write_attribute_string, task, attribute,
+            value)
+
+    def set_write_attribute_uint32(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_uint32", task,
+            self._interpreter.set_write_attribute_uint32, task, attribute,
+            value)
+
+    def set_write_attribute_uint64(self, task, attribute, value):
+        return self._call(
+            "set_write_attribute_uint64", task,
+            self._interpreter.set_write_attribute_uint64, task, attribute,
+            value)
+
+    def start_new_file(self, task, file_path):
+        return self._call(
+            "start_new_file", task, self._interpreter.start_new_file, task,
+            file_path)
+
+    def start_task(self, task):
+        return self._call("start_task", task, self._interpreter.start_task, task)
+
+    def stop_task(self, task):
+        return self._call("stop_task", task, self._interpreter.stop_task, task)
+
+    def task_control(self, task, action):
+        return self._call("task_control", task, self._interpreter.task_control, task, action)
+
+    def tristate_output_term(self, output_terminal):
+        return self._call(
+            "tristate_output_term", None,
+            self._interpreter.tristate_output_term, output_terminal)
+
+    def unregister_done_event(self, task):
+        return self._call(
+            "unregister_done_event", task,
+            self._interpreter.unregister_done_event, task)
+
+    def unregister_every_n_samples_event(
+            self, task, every_n_samples_event_type):
+        return self._call(
+            "unregister_every_n_samples_event", task,
+            self._interpreter.unregister_every_n_samples_event, task,
+            every_n_samples_event_type)
+
+    def unregister_signal_event(self, task, signal_id):
+        return self._call(
+            "unregister_signal_event", task,
+            self._interpreter.unregister_signal_event, task, signal_id)
+
+    def unreserve_network_device(self, device_name):
+        return self._call(
+            "unreserve_network_device", None,
+            self._interpreter.unreserve_network_device, device_name)
+
+    def wait_for_next_sample_clock(self, task, timeout):
+        return self._call(
+            "wait_for_next_sample_clock", task,
+            self._interpreter.wait_for_next_sample_clock, task, timeout)
+
+    def wait_for_valid_timestamp(self, task, timestamp_event, timeout):
+        return self._call(
+            "wait_for_valid_timestamp", task,
+            self._interpreter.wait_for_valid_timestamp, task, timestamp_event,
+            timeout)
+
+    def wait_until_task_done(self, task, time_to_wait):
+        return self._call(
+            "wait_until_task_done", task,
+            self._interpreter.wait_until_task_done, task, time_to_wait)
+
+    def write_analog_f64(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_analog_f64", task, self._interpreter.write_analog_f64,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_analog_scalar_f64(self, task, auto_start, timeout, value):
+        return self._call(
+            "write_analog_scalar_f64", task,
+            self._interpreter.write_analog_scalar_f64, task, auto_start,
+            timeout, value)
+
+    def write_binary_i16(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_binary_i16", task, self._interpreter.write_binary_i16,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_binary_i32(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_binary_i32", task, self._interpreter.write_binary_i32,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_binary_u16(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_binary_u16", task, self._interpreter.write_binary_u16,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_binary_u32(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_binary_u32", task, self._interpreter.write_binary_u32,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_ctr_freq(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            frequency, duty_cycle):
+        return self._call(
+            "write_ctr_freq", task, self._interpreter.write_ctr_freq, task,
+            num_samps_per_chan, auto_start, timeout, data_layout, frequency,
+            duty_cycle)
+
+    def write_ctr_freq_scalar(
+            self, task, auto_start, timeout, frequency, duty_cycle):
+        return self._call(
+            "write_ctr_freq_scalar", task,
+            self._interpreter.write_ctr_freq_scalar, task, auto_start,
+            timeout, frequency, duty_cycle)
+
+    def write_ctr_ticks(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            high_ticks, low_ticks):
+        return self._call(
+            "write_ctr_ticks", task, self._interpreter.write_ctr_ticks, task,
+            num_samps_per_chan, auto_start, timeout, data_layout, high_ticks,
+            low_ticks)
+
+    def write_ctr_ticks_scalar(
+            self, task, auto_start, timeout, high_ticks, low_ticks):
+        return self._call(
+            "write_ctr_ticks_scalar", task,
+            self._interpreter.write_ctr_ticks_scalar, task, auto_start,
+            timeout, high_ticks, low_ticks)
+
+    def write_ctr_time(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            high_time, low_time):
+        return self._call(
+            "write_ctr_time", task, self._interpreter.write_ctr_time, task,
+            num_samps_per_chan, auto_start, timeout, data_layout, high_time,
+            low_time)
+
+    def write_ctr_time_scalar(
+            self, task, auto_start, timeout, high_time, low_time):
+        return self._call(
+            "write_ctr_time_scalar", task,
+            self._interpreter.write_ctr_time_scalar, task, auto_start,
+            timeout, high_time, low_time)
+
+    def write_digital_lines(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_digital_lines", task,
+            self._interpreter.write_digital_lines, task, num_samps_per_chan,
+            auto_start, timeout, data_layout, write_array)
+
+    def write_digital_scalar_u32(self, task, auto_start, timeout, value):
+        return self._call(
+            "write_digital_scalar_u32", task,
+            self._interpreter.write_digital_scalar_u32, task, auto_start,
+            timeout, value)
+
+    def write_digital_u16(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_digital_u16", task, self._interpreter.write_digital_u16,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_digital_u32(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_digital_u32", task, self._interpreter.write_digital_u32,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_digital_u8(
+            self, task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array):
+        return self._call(
+            "write_digital_u8", task, self._interpreter.write_digital_u8,
+            task, num_samps_per_chan, auto_start, timeout, data_layout,
+            write_array)
+
+    def write_id_pin_memory(self, device_name, id_pin_name, data, format_code):
+        return self._call(
+            "write_id_pin_memory", None,
+            self._interpreter.write_id_pin_memory, device_name, id_pin_name,
+            data, format_code)
+
+    def write_raw(self, task, num_samps, auto_start, timeout, write_array):
+        return self._call(
+            "write_raw", task, self._interpreter.write_raw, task, num_samps,
+            auto_start, timeout, write_array)
+
+    def write_to_teds_from_array(
+            self, physical_channel, bit_stream, basic_teds_options):
+        return self._call(
+            "write_to_teds_from_array", None,
+            self._interpreter.write_to_teds_from_array, physical_channel,
+            bit_stream, basic_teds_options)
+
+    def write_to_teds_from_file(
+            self, physical_channel, file_path, basic_teds_options):
+        return self._call(
+            "write_to_teds_from_file", None,
+            self._interpreter.write_to_teds_from_file, physical_channel,
+            file_path, basic_teds_options)
+
@@ -0,0 +1,107 @@
+"""Process-wide pool of shared NI-DAQmx interpreters.
+
+Interpreters do not hold per-task state, so tasks, systems, scales, and watchdogs can share them.
+Sharing avoids repeating interpreter setup (such as loading the driver version or creating a gRPC
+stub) every time one of these objects is constructed.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+from decouple import config
+
+from nidaqmx.grpc_session_options import GrpcSessionOptions
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._library_interpreter import LibraryInterpreter
+    from nidaqmx._simulated_interpreter import SimulatedInterpreter
+
+
+_lock = threading.Lock()
+_library_interpreter: LibraryInterpreter | None = None
+_simulated_interpreter: SimulatedInterpreter | None = None
+# gRPC interpreters are held weakly so that the pool does not keep gRPC channels alive after the
+# last task, system, etc. that uses them is garbage collected. Each interpreter holds a reference
+# to its channel, so a channel id cannot be reused while its entry is still in the pool.
+_grpc_interpreters: weakref.WeakValueDictionary[
+    tuple[int, str, int, bool, int], GrpcStubInterpreter
+] = weakref.WeakValueDictionary()
+
+
+def get_library_interpreter() -> LibraryInterpreter:
+    """Gets the library interpreter shared by this process."""
+    global _library_interpreter
+    interpreter = _library_interpreter
+    if interpreter is None:
+        with _lock:
+            if _library_interpreter is None:
+                from nidaqmx._library_interpreter import LibraryInterpreter
+
+                _library_interpreter = LibraryInterpreter()
+            interpreter = _library_interpreter
+    return interpreter
+
+
+def get_simulated_interpreter() -> SimulatedInterpreter:
+    """Gets the simulated interpreter shared by this process."""
+    global _simulated_interpreter
+    interpreter = _simulated_interpreter
+    if interpreter is None:
+        with _lock:
+            if _simulated_interpreter is None:
+                from nidaqmx._simulated_interpreter import SimulatedInterpreter
+
+                _simulated_interpreter = SimulatedInterpreter()
+            interpreter = _simulated_interpreter
+    return interpreter
+
+
+def get_default_interpreter() -> LibraryInterpreter | SimulatedInterpreter:
+    """Gets the interpreter for objects that are not constructed with gRPC options.
+
+    This is the library interpreter, unless the NIDAQMX_SIMULATED_INTERPRETER environment variable
+    is set to true, in which case it is the simulated interpreter.
+    """
+    if config("NIDAQMX_SIMULATED_INTERPRETER", default=False, cast=bool):
+        return get_simulated_interpreter()
+    return get_library_interpreter()
+
+
+def get_grpc_interpreter(grpc_options: GrpcSessionOptions) -> GrpcStubInterpreter:
+    """Gets the gRPC interpreter shared by all sessions that use the same channel and options.
+
+    The session name is not part of the key because the interpreter does not use it. Callers pass
+    the session name to methods such as create_task.
+    """
+    key = (
+        id(grpc_options.grpc_channel),
+        grpc_options.api_key,
+        int(grpc_options.initialization_behavior),
+        grpc_options.packed_arrays,
+        id(grpc_options.grpc_aio_channel),
+    )
+    with _lock:
+        interpreter = _grpc_interpreters.get(key)
+        if interpreter is None:
+            from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+
+            interpreter = GrpcStubInterpreter(grpc_options)
+            _grpc_interpreters[key] = interpreter
+    return interpreter
+
+
+def clear() -> None:
+    """Removes all interpreters from the pool.
+
+    Objects that already hold an interpreter keep using it. Objects constructed afterward get a new
+    interpreter.
+    """
+    global _library_interpreter, _simulated_interpreter
+    with _lock:
+        _library_interpreter = None
+        _simulated_interpreter = None
+        _grpc_interpreters.clear()
@@ -15,12 +15,14 @@ from typing import Any, TYPE_CHECKING
 from collections.abc import Callable, Sequence
 
 from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
+from nidaqmx._error_messages import ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE, get_error_message
 from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, TaskHandle
 from nidaqmx.constants import FillMode, WaveformAttributeMode
 from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
 from nidaqmx.errors import DaqError, DaqFunctionNotSupportedError, DaqReadError, DaqWarning, DaqWriteError
 from nidaqmx.types import DriverVersion
 from nidaqmx._lib_time import AbsoluteTime
+from nidaqmx._waveform_read_context import WaveformReadContext
 from nidaqmx._waveform_utils import get_num_samps_per_chan
 from nitypes.waveform.typing import ExtendedPropertyValue
 from nitypes.waveform import AnalogWaveform, DigitalWaveform, SampleIntervalMode, Timing, ExtendedPropertyDictionary
@@ -30,6 +32,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 _was_runtime_environment_set = None
+# Set when the C functions are bound, so the generated methods skip the argtypes check.
+_c_functions_bound = False
 
 _INT64_WFM_SEC_PER_TICK = 100e-9
 _T0_EPOCH = ht_datetime(1, 1, 1, tzinfo=timezone.utc)
@@ -94,19 +98,28 @@ class LibraryInterpreter(BaseInterpreter):
             finally:
                 _was_runtime_environment_set = True
 
-        major_version = self.get_system_info_attribute_uint32(0x1272)
-        minor_version = self.get_system_info_attribute_uint32(0x1923)
-        update_version = self.get_system_info_attribute_uint32(0x2f22)
-        self._driver_version = DriverVersion(major_version, minor_version, update_version)
+        global _c_functions_bound
+        if lib_importer.bind_c_functions and not _c_functions_bound:
+            lib_importer.bind_functions(_get_bindable_c_functions())
+            _c_functions_bound = True
+
+        self._driver_version = None
 
     @property
     def driver_version(self):
+        # The driver version is queried on first use and memoized. Concurrent first calls may
+        # both query it, but they get the same value.
+        if self._driver_version is None:
+            major_version = self.get_system_info_attribute_uint32(0x1272)
+            minor_version = self.get_system_info_attribute_uint32(0x1923)
+            update_version = self.get_system_info_attribute_uint32(0x2f22)
+            self._driver_version = DriverVersion(major_version, minor_version, update_version)
         return self._driver_version
 
 
     def add_cdaq_sync_connection(self, port_list):
         c_func = lib_importer.windll.DAQmxAddCDAQSyncConnection
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -118,7 +131,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def add_global_chans_to_task(self, task, channel_names):
         c_func = lib_importer.windll.DAQmxAddGlobalChansToTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -131,7 +144,7 @@ class LibraryInterpreter(BaseInterpreter):
     def add_network_device(
             self, ip_address, device_name, attempt_reservation, timeout):
         c_func = lib_importer.windll.DAQmxAddNetworkDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -160,7 +173,7 @@ class LibraryInterpreter(BaseInterpreter):
         disconnected_ports_exist = c_bool32()
 
         c_func = lib_importer.windll.DAQmxAreConfiguredCDAQSyncPortsDisconnected
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -176,7 +189,7 @@ class LibraryInterpreter(BaseInterpreter):
     def auto_configure_cdaq_sync_connections(
             self, chassis_devices_ports, timeout):
         c_func = lib_importer.windll.DAQmxAutoConfigureCDAQSyncConnections
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -193,7 +206,7 @@ class LibraryInterpreter(BaseInterpreter):
         reverse_coeffs = numpy.zeros(size, dtype=numpy.float64)
 
         c_func = lib_importer.windll.DAQmxCalculateReversePolyCoeff
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -213,7 +226,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, pretrigger_samples, trigger_slope,
             trigger_level):
         c_func = lib_importer.windll.DAQmxCfgAnlgEdgeRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -228,7 +241,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_anlg_edge_start_trig(
             self, task, trigger_source, trigger_slope, trigger_level):
         c_func = lib_importer.windll.DAQmxCfgAnlgEdgeStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -243,7 +256,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_sources, pretrigger_samples,
             trigger_slope_array, trigger_level_array):
         c_func = lib_importer.windll.DAQmxCfgAnlgMultiEdgeRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -261,7 +274,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_sources, trigger_slope_array,
             trigger_level_array):
         c_func = lib_importer.windll.DAQmxCfgAnlgMultiEdgeStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -279,7 +292,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, window_top, window_bottom,
             pretrigger_samples, trigger_when):
         c_func = lib_importer.windll.DAQmxCfgAnlgWindowRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -296,7 +309,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, window_top, window_bottom, trigger_source,
             trigger_when):
         c_func = lib_importer.windll.DAQmxCfgAnlgWindowStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -312,7 +325,7 @@ class LibraryInterpreter(BaseInterpreter):
             samps_per_chan, sample_clk_pulse_polarity, pause_when,
             ready_event_active_level):
         c_func = lib_importer.windll.DAQmxCfgBurstHandshakingTimingExportClock
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -331,7 +344,7 @@ class LibraryInterpreter(BaseInterpreter):
             samps_per_chan, sample_clk_active_edge, pause_when,
             ready_event_active_level):
         c_func = lib_importer.windll.DAQmxCfgBurstHandshakingTimingImportClock
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -349,7 +362,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rising_edge_chan, falling_edge_chan, sample_mode,
             samps_per_chan):
         c_func = lib_importer.windll.DAQmxCfgChangeDetectionTiming
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -364,7 +377,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_dig_edge_ref_trig(
             self, task, trigger_source, pretrigger_samples, trigger_edge):
         c_func = lib_importer.windll.DAQmxCfgDigEdgeRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -377,7 +390,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def cfg_dig_edge_start_trig(self, task, trigger_source, trigger_edge):
         c_func = lib_importer.windll.DAQmxCfgDigEdgeStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -392,7 +405,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, trigger_pattern, pretrigger_samples,
             trigger_when):
         c_func = lib_importer.windll.DAQmxCfgDigPatternRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -407,7 +420,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_dig_pattern_start_trig(
             self, task, trigger_source, trigger_pattern, trigger_when):
         c_func = lib_importer.windll.DAQmxCfgDigPatternStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -420,7 +433,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def cfg_handshaking_timing(self, task, sample_mode, samps_per_chan):
         c_func = lib_importer.windll.DAQmxCfgHandshakingTiming
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -433,7 +446,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def cfg_implicit_timing(self, task, sample_mode, samps_per_chan):
         c_func = lib_importer.windll.DAQmxCfgImplicitTiming
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -448,7 +461,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rate, source, active_edge, sample_mode,
             samps_per_chan):
         c_func = lib_importer.windll.DAQmxCfgPipelinedSampClkTiming
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -464,7 +477,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rate, source, active_edge, sample_mode,
             samps_per_chan):
         c_func = lib_importer.windll.DAQmxCfgSampClkTiming
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -478,7 +491,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def cfg_time_start_trig(self, task, when, timescale):
         c_func = lib_importer.windll.DAQmxCfgTimeStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -491,7 +504,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_ao_expir_states(
             self, task, channel_names, expir_state_array, output_type_array):
         c_func = lib_importer.windll.DAQmxCfgWatchdogAOExpirStates
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -508,7 +521,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_co_expir_states(
             self, task, channel_names, expir_state_array):
         c_func = lib_importer.windll.DAQmxCfgWatchdogCOExpirStates
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -523,7 +536,7 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_do_expir_states(
             self, task, channel_names, expir_state_array):
         c_func = lib_importer.windll.DAQmxCfgWatchdogDOExpirStates
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -537,7 +550,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def clear_task(self, task):
         c_func = lib_importer.windll.DAQmxClearTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -549,7 +562,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def clear_teds(self, physical_channel):
         c_func = lib_importer.windll.DAQmxClearTEDS
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -562,7 +575,7 @@ class LibraryInterpreter(BaseInterpreter):
     def configure_logging(
             self, task, file_path, logging_mode, group_name, operation):
         c_func = lib_importer.windll.DAQmxConfigureLogging
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -575,7 +588,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def configure_teds(self, physical_channel, file_path):
         c_func = lib_importer.windll.DAQmxConfigureTEDS
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -588,7 +601,7 @@ class LibraryInterpreter(BaseInterpreter):
     def connect_terms(
             self, source_terminal, destination_terminal, signal_modifiers):
         c_func = lib_importer.windll.DAQmxConnectTerms
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -600,7 +613,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def control_watchdog_task(self, task, action):
         c_func = lib_importer.windll.DAQmxControlWatchdogTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -616,7 +629,7 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, voltage_excit_source, voltage_excit_val,
             use_excit_for_scaling, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIAccel4WireDCVoltageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -639,7 +652,7 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIAccelChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -661,7 +674,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, sensitivity,
             sensitivity_units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIAccelChargeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -681,7 +694,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, bridge_config, voltage_excit_source,
             voltage_excit_val, nominal_bridge_resistance, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIBridgeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -702,7 +715,7 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_max_val, current_min_val, current_max_val, units,
             shunt_resistor_loc, ext_shunt_resistor_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAICalculatedPowerChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -723,7 +736,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIChargeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -741,7 +754,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAICurrentChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -761,7 +774,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAICurrentRMSChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -783,7 +796,7 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIForceBridgePolynomialChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -811,7 +824,7 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIForceBridgeTableChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -840,7 +853,7 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIForceBridgeTwoPointLinChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -866,7 +879,7 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIForceIEPEChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -887,7 +900,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, threshold_level, hysteresis, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIFreqVoltageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -906,7 +919,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, units, mic_sensitivity, max_snd_press_level,
             current_excit_source, current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIMicrophoneChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -926,7 +939,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, sensitivity, sensitivity_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPosEddyCurrProxProbeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -946,7 +959,7 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, voltage_excit_freq,
             ac_excit_wire_mode, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPosLVDTChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -969,7 +982,7 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, voltage_excit_freq,
             ac_excit_wire_mode, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPosRVDTChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -990,7 +1003,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, voltage_setpoint, current_setpoint,
             output_enable, name_to_assign_to_channel):
         c_func = lib_importer.windll.DAQmxCreateAIPowerChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1010,7 +1023,7 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPressureBridgePolynomialChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1038,7 +1051,7 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPressureBridgeTableChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1067,7 +1080,7 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIPressureBridgeTwoPointLinChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1092,7 +1105,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIResistanceChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1114,7 +1127,7 @@ class LibraryInterpreter(BaseInterpreter):
             gage_factor, nominal_gage_resistance, poisson_ratio,
             lead_wire_resistance):
         c_func = lib_importer.windll.DAQmxCreateAIRosetteStrainGageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1141,7 +1154,7 @@ class LibraryInterpreter(BaseInterpreter):
             nominal_gage_resistance, poisson_ratio, lead_wire_resistance,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIStrainGageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1163,7 +1176,7 @@ class LibraryInterpreter(BaseInterpreter):
     def create_ai_temp_built_in_sensor_chan(
             self, task, physical_channel, name_to_assign_to_channel, units):
         c_func = lib_importer.windll.DAQmxCreateAITempBuiltInSensorChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1179,7 +1192,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, thermocouple_type, cjc_source, cjc_val,
             cjc_channel):
         c_func = lib_importer.windll.DAQmxCreateAIThrmcplChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1199,7 +1212,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, a, b, c):
         c_func = lib_importer.windll.DAQmxCreateAIThrmstrChanIex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1220,7 +1233,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, voltage_excit_source,
             voltage_excit_val, a, b, c, r_1):
         c_func = lib_importer.windll.DAQmxCreateAIThrmstrChanVex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1243,7 +1256,7 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAITorqueBridgePolynomialChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1271,7 +1284,7 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAITorqueBridgeTableChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1300,7 +1313,7 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAITorqueBridgeTwoPointLinChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1326,7 +1339,7 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIVelocityIEPEChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1347,7 +1360,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIVoltageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1366,7 +1379,7 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, use_excit_for_scaling,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIVoltageChanWithExcit
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1387,7 +1400,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAIVoltageRMSChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1405,7 +1418,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, rtd_type, resistance_config, current_excit_source,
             current_excit_val, r_0):
         c_func = lib_importer.windll.DAQmxCreateAIRTDChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1424,7 +1437,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAOCurrentChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1441,7 +1454,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, type,
             freq, amplitude, offset):
         c_func = lib_importer.windll.DAQmxCreateAOFuncGenChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1458,7 +1471,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateAOVoltageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1476,7 +1489,7 @@ class LibraryInterpreter(BaseInterpreter):
             zidx_enable, zidx_val, zidx_phase, units, pulses_per_rev,
             initial_angle, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIAngEncoderChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1495,7 +1508,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, pulses_per_rev, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIAngVelocityChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1513,7 +1526,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, edge,
             initial_count, count_direction):
         c_func = lib_importer.windll.DAQmxCreateCICountEdgesChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1530,7 +1543,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_freq,
             max_freq, edge, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIDutyCycleChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1547,7 +1560,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, edge, meas_method, meas_time, divisor, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIFreqChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1566,7 +1579,7 @@ class LibraryInterpreter(BaseInterpreter):
             zidx_enable, zidx_val, zidx_phase, units, dist_per_pulse,
             initial_pos, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCILinEncoderChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1585,7 +1598,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, dist_per_pulse, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCILinVelocityChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1603,7 +1616,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, edge, meas_method, meas_time, divisor, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIPeriodChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1621,7 +1634,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units):
         c_func = lib_importer.windll.DAQmxCreateCIPulseChanFreq
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1637,7 +1650,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, source_terminal,
             min_val, max_val):
         c_func = lib_importer.windll.DAQmxCreateCIPulseChanTicks
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1654,7 +1667,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units):
         c_func = lib_importer.windll.DAQmxCreateCIPulseChanTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1670,7 +1683,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, starting_edge, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIPulseWidthChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1687,7 +1700,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCISemiPeriodChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1704,7 +1717,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, first_edge, second_edge, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCITwoEdgeSepChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1722,7 +1735,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units,
             sync_method, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateCIGPSTimestampChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1739,7 +1752,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, freq, duty_cycle):
         c_func = lib_importer.windll.DAQmxCreateCOPulseChanFreq
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1756,7 +1769,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, source_terminal, name_to_assign_to_channel,
             idle_state, initial_delay, low_ticks, high_ticks):
         c_func = lib_importer.windll.DAQmxCreateCOPulseChanTicks
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1773,7 +1786,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, low_time, high_time):
         c_func = lib_importer.windll.DAQmxCreateCOPulseChanTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1789,7 +1802,7 @@ class LibraryInterpreter(BaseInterpreter):
     def create_di_chan(
             self, task, lines, name_to_assign_to_lines, line_grouping):
         c_func = lib_importer.windll.DAQmxCreateDIChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1803,7 +1816,7 @@ class LibraryInterpreter(BaseInterpreter):
     def create_do_chan(
             self, task, lines, name_to_assign_to_lines, line_grouping):
         c_func = lib_importer.windll.DAQmxCreateDOChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1817,7 +1830,7 @@ class LibraryInterpreter(BaseInterpreter):
     def create_lin_scale(
             self, name, slope, y_intercept, pre_scaled_units, scaled_units):
         c_func = lib_importer.windll.DAQmxCreateLinScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1832,7 +1845,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, prescaled_min, prescaled_max, scaled_min, scaled_max,
             pre_scaled_units, scaled_units):
         c_func = lib_importer.windll.DAQmxCreateMapScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1849,7 +1862,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, forward_coeffs, reverse_coeffs, pre_scaled_units,
             scaled_units):
         c_func = lib_importer.windll.DAQmxCreatePolynomialScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1868,7 +1881,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, prescaled_vals, scaled_vals, pre_scaled_units,
             scaled_units):
         c_func = lib_importer.windll.DAQmxCreateTableScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1888,7 +1901,7 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         c_func = lib_importer.windll.DAQmxCreateTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1905,7 +1918,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, current_excit_source,
             current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIAccelChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1925,7 +1938,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIBridgeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1945,7 +1958,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAICurrentChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1965,7 +1978,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIForceBridgeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1985,7 +1998,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, current_excit_source,
             current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIForceIEPEChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2005,7 +2018,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, units, max_snd_press_level, current_excit_source,
             current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIMicrophoneChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2025,7 +2038,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIPosLVDTChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2045,7 +2058,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIPosRVDTChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2065,7 +2078,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIPressureBridgeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2085,7 +2098,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIResistanceChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2105,7 +2118,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             initial_bridge_voltage, lead_wire_resistance, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIStrainGageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2124,7 +2137,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, cjc_source, cjc_val, cjc_channel):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIThrmcplChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2143,7 +2156,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIThrmstrChanIex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2163,7 +2176,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, voltage_excit_source,
             voltage_excit_val, r_1):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIThrmstrChanVex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2183,7 +2196,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAITorqueBridgeChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2202,7 +2215,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIVoltageChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2220,7 +2233,7 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, voltage_excit_source,
             voltage_excit_val, custom_scale_name):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIVoltageChanWithExcit
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2240,7 +2253,7 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val):
         c_func = lib_importer.windll.DAQmxCreateTEDSAIRTDChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2261,7 +2274,7 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         c_func = lib_importer.windll.DAQmxCreateWatchdogTimerTaskEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2276,7 +2289,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def delete_network_device(self, device_name):
         c_func = lib_importer.windll.DAQmxDeleteNetworkDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2288,7 +2301,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def delete_saved_global_chan(self, channel_name):
         c_func = lib_importer.windll.DAQmxDeleteSavedGlobalChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2300,7 +2313,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def delete_saved_scale(self, scale_name):
         c_func = lib_importer.windll.DAQmxDeleteSavedScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2312,7 +2325,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def delete_saved_task(self, task_name):
         c_func = lib_importer.windll.DAQmxDeleteSavedTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2326,7 +2339,7 @@ class LibraryInterpreter(BaseInterpreter):
         cal_supported = c_bool32()
 
         c_func = lib_importer.windll.DAQmxDeviceSupportsCal
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2339,7 +2352,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def disable_ref_trig(self, task):
         c_func = lib_importer.windll.DAQmxDisableRefTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2351,7 +2364,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def disable_start_trig(self, task):
         c_func = lib_importer.windll.DAQmxDisableStartTrig
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2363,7 +2376,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def disconnect_terms(self, source_terminal, destination_terminal):
         c_func = lib_importer.windll.DAQmxDisconnectTerms
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2375,7 +2388,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def export_signal(self, task, signal_id, output_terminal):
         c_func = lib_importer.windll.DAQmxExportSignal
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2393,7 +2406,7 @@ class LibraryInterpreter(BaseInterpreter):
         array_size = ctypes.c_uint32(array_size)
 
         c_func = lib_importer.cdll.DAQmxGetAnalogPowerUpStatesWithOutputType
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2410,7 +2423,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_auto_configured_cdaq_sync_connections(self):
         c_func = lib_importer.windll.DAQmxGetAutoConfiguredCDAQSyncConnections
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2436,7 +2449,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetBufferAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2451,7 +2464,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2466,7 +2479,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2479,7 +2492,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_cal_info_attribute_string(self, device_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2505,7 +2518,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2520,7 +2533,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2536,7 +2549,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2550,7 +2563,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_chan_attribute_double_array(self, task, channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2578,7 +2591,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2592,7 +2605,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_chan_attribute_string(self, task, channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2619,7 +2632,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2635,7 +2648,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2650,7 +2663,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2663,7 +2676,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_double_array(self, device_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2690,7 +2703,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2703,7 +2716,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_int32_array(self, device_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2728,7 +2741,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_string(self, device_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2754,7 +2767,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2767,7 +2780,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_uint32_array(self, device_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2794,7 +2807,7 @@ class LibraryInterpreter(BaseInterpreter):
         logic_family = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxGetDigitalLogicFamilyPowerUpState
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2859,7 +2872,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_disconnected_cdaq_sync_ports(self):
         c_func = lib_importer.windll.DAQmxGetDisconnectedCDAQSyncPorts
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2885,7 +2898,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2900,7 +2913,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2915,7 +2928,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2928,7 +2941,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_exported_signal_attribute_string(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2954,7 +2967,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2973,7 +2986,7 @@ class LibraryInterpreter(BaseInterpreter):
         minute = ctypes.c_uint()
 
         c_func = lib_importer.windll.DAQmxGetExtCalLastDateAndTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -2993,7 +3006,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetPersistedChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3006,7 +3019,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_chan_attribute_string(self, channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPersistedChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3032,7 +3045,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetPersistedScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3045,7 +3058,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_scale_attribute_string(self, scale_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetPersistedScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3071,7 +3084,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetPersistedTaskAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3084,7 +3097,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_task_attribute_string(self, task_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetPersistedTaskAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3110,7 +3123,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3123,7 +3136,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_physical_chan_attribute_bytes(self, physical_channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3150,7 +3163,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3164,7 +3177,7 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_double_array(
             self, physical_channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3191,7 +3204,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3205,7 +3218,7 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_int32_array(
             self, physical_channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3230,7 +3243,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_physical_chan_attribute_string(self, physical_channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3256,7 +3269,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3270,7 +3283,7 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_uint32_array(
             self, physical_channel, attribute):
         c_func = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3297,7 +3310,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3312,7 +3325,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3327,7 +3340,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3340,7 +3353,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_read_attribute_string(self, task, attribute, size_hint=0):
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3366,7 +3379,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3381,7 +3394,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         c_func = lib_importer.cdll.DAQmxGetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3396,7 +3409,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3409,7 +3422,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_scale_attribute_double_array(self, scale_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3436,7 +3449,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3449,7 +3462,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_scale_attribute_string(self, scale_name, attribute):
         c_func = lib_importer.cdll.DAQmxGetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3479,7 +3492,7 @@ class LibraryInterpreter(BaseInterpreter):
         minute = ctypes.c_uint()
 
         c_func = lib_importer.windll.DAQmxGetSelfCalLastDateAndTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3497,7 +3510,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_system_info_attribute_string(self, attribute):
         c_func = lib_importer.cdll.DAQmxGetSystemInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3523,7 +3536,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetSystemInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3538,7 +3551,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetTaskAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3551,7 +3564,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_task_attribute_string(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetTaskAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3577,7 +3590,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetTaskAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3592,7 +3605,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3607,7 +3620,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3622,7 +3635,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3638,7 +3651,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3654,7 +3667,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3668,7 +3681,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_timing_attribute_ex_string(self, task, device_names, attribute):
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3695,7 +3708,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3711,7 +3724,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3727,7 +3740,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3740,7 +3753,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_timing_attribute_string(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3766,7 +3779,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = AbsoluteTime()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3781,7 +3794,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3796,7 +3809,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         c_func = lib_importer.cdll.DAQmxGetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3811,7 +3824,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3826,7 +3839,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3839,7 +3852,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_double_array(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3866,7 +3879,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3879,7 +3892,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_int32_array(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3904,7 +3917,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_string(self, task, attribute):
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3930,7 +3943,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = AbsoluteTime()
 
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3945,7 +3958,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3960,7 +3973,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3976,7 +3989,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -3992,7 +4005,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4006,7 +4019,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_watchdog_attribute_string(self, task, lines, attribute):
         c_func = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4033,7 +4046,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4048,7 +4061,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4063,7 +4076,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4076,7 +4089,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_write_attribute_string(self, task, attribute, size_hint=0):
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4102,7 +4115,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4117,7 +4130,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         c_func = lib_importer.cdll.DAQmxGetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4130,7 +4143,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def internal_get_last_created_chan(self):
         c_func = lib_importer.windll.DAQmxInternalGetLastCreatedChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4156,7 +4169,7 @@ class LibraryInterpreter(BaseInterpreter):
         is_task_done = c_bool32()
 
         c_func = lib_importer.windll.DAQmxIsTaskDone
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4172,7 +4185,7 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         c_func = lib_importer.windll.DAQmxLoadTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4187,7 +4200,7 @@ class LibraryInterpreter(BaseInterpreter):
     def perform_bridge_offset_nulling_cal_ex(
             self, task, channel, skip_unsupported_channels):
         c_func = lib_importer.windll.DAQmxPerformBridgeOffsetNullingCalEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4203,7 +4216,7 @@ class LibraryInterpreter(BaseInterpreter):
             shunt_resistor_source, bridge_resistance,
             skip_unsupported_channels):
         c_func = lib_importer.windll.DAQmxPerformBridgeShuntCalEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4222,7 +4235,7 @@ class LibraryInterpreter(BaseInterpreter):
             shunt_resistor_location, shunt_resistor_select,
             shunt_resistor_source, skip_unsupported_channels):
         c_func = lib_importer.windll.DAQmxPerformStrainShuntCalEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4239,7 +4252,7 @@ class LibraryInterpreter(BaseInterpreter):
     def perform_thrmcpl_lead_offset_nulling_cal(
             self, task, channel, skip_unsupported_channels):
         c_func = lib_importer.windll.DAQmxPerformThrmcplLeadOffsetNullingCal
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4254,7 +4267,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadAnalogF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4274,7 +4287,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.windll.DAQmxReadAnalogScalarF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4292,7 +4305,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadBinaryI16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4313,7 +4326,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadBinaryI32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4334,7 +4347,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadBinaryU16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4355,7 +4368,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadBinaryU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4375,7 +4388,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCounterF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4396,7 +4409,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCounterF64Ex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4416,7 +4429,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         c_func = lib_importer.windll.DAQmxReadCounterScalarF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4433,7 +4446,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint()
 
         c_func = lib_importer.windll.DAQmxReadCounterScalarU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4450,7 +4463,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCounterU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4470,7 +4483,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCounterU32Ex
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4492,7 +4505,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCtrFreq
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4517,7 +4530,7 @@ class LibraryInterpreter(BaseInterpreter):
         duty_cycle = ctypes.c_double()
 
         c_func = lib_importer.windll.DAQmxReadCtrFreqScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4538,7 +4551,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCtrTicks
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4562,7 +4575,7 @@ class LibraryInterpreter(BaseInterpreter):
         low_ticks = ctypes.c_uint32()
 
         c_func = lib_importer.windll.DAQmxReadCtrTicksScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4583,7 +4596,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadCtrTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4607,7 +4620,7 @@ class LibraryInterpreter(BaseInterpreter):
         low_time = ctypes.c_double()
 
         c_func = lib_importer.windll.DAQmxReadCtrTimeScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4628,7 +4641,7 @@ class LibraryInterpreter(BaseInterpreter):
         num_bytes_per_samp = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadDigitalLines
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4649,7 +4662,7 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint()
 
         c_func = lib_importer.windll.DAQmxReadDigitalScalarU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4667,7 +4680,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadDigitalU16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4688,7 +4701,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadDigitalU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4709,7 +4722,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxReadDigitalU8
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4730,7 +4743,7 @@ class LibraryInterpreter(BaseInterpreter):
         current = ctypes.c_double()
 
         c_func = lib_importer.windll.DAQmxReadPowerScalarF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4820,7 +4833,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def remove_cdaq_sync_connection(self, port_list):
         c_func = lib_importer.windll.DAQmxRemoveCDAQSyncConnection
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4832,7 +4845,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reserve_network_device(self, device_name, override_reservation):
         c_func = lib_importer.windll.DAQmxReserveNetworkDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4844,7 +4857,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_buffer_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetBufferAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4856,7 +4869,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_chan_attribute(self, task, channel, attribute):
         c_func = lib_importer.windll.DAQmxResetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4869,7 +4882,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_device(self, device_name):
         c_func = lib_importer.windll.DAQmxResetDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4881,7 +4894,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_exported_signal_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4893,7 +4906,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_read_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4905,7 +4918,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_timing_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4917,7 +4930,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_timing_attribute_ex(self, task, device_names, attribute):
         c_func = lib_importer.windll.DAQmxResetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4930,7 +4943,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_trig_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4942,7 +4955,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_watchdog_attribute(self, task, lines, attribute):
         c_func = lib_importer.windll.DAQmxResetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4955,7 +4968,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def reset_write_attribute(self, task, attribute):
         c_func = lib_importer.windll.DAQmxResetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4967,7 +4980,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def restore_last_ext_cal_const(self, device_name):
         c_func = lib_importer.windll.DAQmxRestoreLastExtCalConst
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4979,7 +4992,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def save_global_chan(self, task, channel_name, save_as, author, options):
         c_func = lib_importer.windll.DAQmxSaveGlobalChan
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -4992,7 +5005,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def save_scale(self, scale_name, save_as, author, options):
         c_func = lib_importer.windll.DAQmxSaveScale
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5005,7 +5018,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def save_task(self, task, save_as, author, options):
         c_func = lib_importer.windll.DAQmxSaveTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5018,7 +5031,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def self_cal(self, device_name):
         c_func = lib_importer.windll.DAQmxSelfCal
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5030,7 +5043,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def self_test_device(self, device_name):
         c_func = lib_importer.windll.DAQmxSelfTestDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5068,7 +5081,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_analog_power_up_states_with_output_type(
             self, channel_names, state_array, channel_type_array):
         c_func = lib_importer.cdll.DAQmxSetAnalogPowerUpStatesWithOutputType
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5084,7 +5097,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_buffer_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetBufferAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5096,7 +5109,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_cal_info_attribute_bool(self, device_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5108,7 +5121,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_cal_info_attribute_double(self, device_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5120,7 +5133,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_cal_info_attribute_string(self, device_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5132,7 +5145,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_cal_info_attribute_uint32(self, device_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetCalInfoAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5144,7 +5157,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_bool(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5157,7 +5170,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_double(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5170,7 +5183,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_double_array(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5184,7 +5197,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_int32(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5197,7 +5210,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_string(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5210,7 +5223,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_uint32(self, task, channel, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetChanAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5224,7 +5237,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_digital_logic_family_power_up_state(
             self, device_name, logic_family):
         c_func = lib_importer.windll.DAQmxSetDigitalLogicFamilyPowerUpState
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5279,7 +5292,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_bool(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5291,7 +5304,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_double(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5303,7 +5316,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_int32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5315,7 +5328,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_string(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5327,7 +5340,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5339,7 +5352,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_bool(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5351,7 +5364,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_double(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5363,7 +5376,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_int32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5375,7 +5388,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_string(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5387,7 +5400,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5399,7 +5412,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_read_attribute_uint64(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetReadAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5412,7 +5425,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_runtime_environment(
             self, environment, environment_version, reserved_1, reserved_2):
         c_func = lib_importer.windll.DAQmxSetRuntimeEnvironment
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5425,7 +5438,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_scale_attribute_double(self, scale_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5437,7 +5450,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_scale_attribute_double_array(self, scale_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5450,7 +5463,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_scale_attribute_int32(self, scale_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5462,7 +5475,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_scale_attribute_string(self, scale_name, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetScaleAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5474,7 +5487,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_bool(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5486,7 +5499,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_double(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5499,7 +5512,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_bool(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5513,7 +5526,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_double(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5527,7 +5540,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_int32(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5541,7 +5554,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_string(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5555,7 +5568,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_uint32(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5569,7 +5582,7 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_uint64(
             self, task, device_names, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5582,7 +5595,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_int32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5594,7 +5607,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_string(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5606,7 +5619,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5618,7 +5631,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_timing_attribute_uint64(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTimingAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5630,7 +5643,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_bool(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5642,7 +5655,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_double(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5654,7 +5667,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_double_array(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5666,7 +5679,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_int32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5678,7 +5691,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_int32_array(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5690,7 +5703,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_string(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5702,7 +5715,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_timestamp(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5714,7 +5727,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_trig_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetTrigAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5726,7 +5739,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_watchdog_attribute_bool(self, task, lines, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5739,7 +5752,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_watchdog_attribute_double(self, task, lines, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5752,7 +5765,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_watchdog_attribute_int32(self, task, lines, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5765,7 +5778,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_watchdog_attribute_string(self, task, lines, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5778,7 +5791,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_bool(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5790,7 +5803,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_double(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5802,7 +5815,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_int32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5814,7 +5827,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_string(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5826,7 +5839,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_uint32(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5838,7 +5851,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_write_attribute_uint64(self, task, attribute, value):
         c_func = lib_importer.cdll.DAQmxSetWriteAttribute
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5850,7 +5863,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def start_new_file(self, task, file_path):
         c_func = lib_importer.windll.DAQmxStartNewFile
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5862,7 +5875,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def start_task(self, task):
         c_func = lib_importer.windll.DAQmxStartTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5874,7 +5887,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def stop_task(self, task):
         c_func = lib_importer.windll.DAQmxStopTask
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5886,7 +5899,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def task_control(self, task, action):
         c_func = lib_importer.windll.DAQmxTaskControl
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5898,7 +5911,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def tristate_output_term(self, output_terminal):
         c_func = lib_importer.windll.DAQmxTristateOutputTerm
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5979,7 +5992,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def unreserve_network_device(self, device_name):
         c_func = lib_importer.windll.DAQmxUnreserveNetworkDevice
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -5989,11 +6002,27 @@ class LibraryInterpreter(BaseInterpreter):
             device_name)
         self.check_for_error(error_code)
 
+    def wait_for_next_sample_clock(self, task, timeout):
+        is_late = c_bool32()
+
+        c_func = lib_importer.windll.DAQmxWaitForNextSampleClock
+        if not _c_functions_bound and c_func.argtypes is None:
+            with c_func.arg_lock:
+                if c_func.argtypes is None:
+                    c_func.argtypes = [
+                        lib_importer.task_handle, ctypes.c_double,
+                        ctypes.POINTER(c_bool32)]
+
+        error_code = c_func(
+            task, timeout, ctypes.byref(is_late))
+        self.check_for_error(error_code)
+        return is_late.value
+
     def wait_for_valid_timestamp(self, task, timestamp_event, timeout):
         timestamp = AbsoluteTime()
 
         c_func = lib_importer.windll.DAQmxWaitForValidTimestamp
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6007,7 +6036,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def wait_until_task_done(self, task, time_to_wait):
         c_func = lib_importer.windll.DAQmxWaitUntilTaskDone
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6023,7 +6052,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteAnalogF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6040,7 +6069,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_analog_scalar_f64(self, task, auto_start, timeout, value):
         c_func = lib_importer.windll.DAQmxWriteAnalogScalarF64
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6057,7 +6086,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteBinaryI16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6078,7 +6107,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteBinaryI32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6099,7 +6128,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteBinaryU16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6120,7 +6149,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteBinaryU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6141,7 +6170,7 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteCtrFreq
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6161,7 +6190,7 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_freq_scalar(
             self, task, auto_start, timeout, frequency, duty_cycle):
         c_func = lib_importer.windll.DAQmxWriteCtrFreqScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6179,7 +6208,7 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteCtrTicks
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6199,7 +6228,7 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_ticks_scalar(
             self, task, auto_start, timeout, high_ticks, low_ticks):
         c_func = lib_importer.windll.DAQmxWriteCtrTicksScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6217,7 +6246,7 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteCtrTime
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6237,7 +6266,7 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_time_scalar(
             self, task, auto_start, timeout, high_time, low_time):
         c_func = lib_importer.windll.DAQmxWriteCtrTimeScalar
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6255,7 +6284,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteDigitalLines
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6272,7 +6301,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_digital_scalar_u32(self, task, auto_start, timeout, value):
         c_func = lib_importer.windll.DAQmxWriteDigitalScalarU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6289,7 +6318,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteDigitalU16
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6310,7 +6339,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteDigitalU32
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6331,7 +6360,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         c_func = lib_importer.windll.DAQmxWriteDigitalU8
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6348,7 +6377,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_id_pin_memory(self, device_name, id_pin_name, data, format_code):
         c_func = lib_importer.windll.DAQmxWriteIDPinMemory
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6363,7 +6392,7 @@ class LibraryInterpreter(BaseInterpreter):
     def write_to_teds_from_array(
             self, physical_channel, bit_stream, basic_teds_options):
         c_func = lib_importer.windll.DAQmxWriteToTEDSFromArray
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6377,7 +6406,7 @@ class LibraryInterpreter(BaseInterpreter):
     def write_to_teds_from_file(
             self, physical_channel, file_path, basic_teds_options):
         c_func = lib_importer.windll.DAQmxWriteToTEDSFromFile
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -6400,7 +6429,7 @@ class LibraryInterpreter(BaseInterpreter):
         query_error_code = c_func(error_code, error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get error string for error code %d. DAQmxGetErrorString returned error code %d.', error_code, query_error_code)
-            return 'Failed to retrieve error description.'
+            return ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE
         return error_buffer.value.decode(lib_importer.encoding)
 
     def get_extended_error_info(self):
@@ -6415,7 +6444,7 @@ class LibraryInterpreter(BaseInterpreter):
         query_error_code = c_func(error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get extended error info. DAQmxGetExtendedErrorInfo returned error code %d.', query_error_code)
-            return 'Failed to retrieve error description.'
+            return ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE
         return error_buffer.value.decode(lib_importer.encoding)
 
     def read_analog_waveform(
@@ -6424,17 +6453,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: AnalogWaveform[numpy.float64],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read an analog waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties]
+            properties = self._get_properties_to_read([waveform], read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(1, dtype=numpy.int64)
-            dt_array = numpy.zeros(1, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(1, read_context)
         else:
             t0_array = None
             dt_array = None
@@ -6450,14 +6479,20 @@ class LibraryInterpreter(BaseInterpreter):
             properties,
             t0_array,
             dt_array,
+            read_context,
         )
 
         waveform.sample_count = samples_read
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings([waveform], t0_array, dt_array)
+            self._set_waveform_timings([waveform], t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties([waveform])
         return samples_read
 
     def read_analog_waveforms(
@@ -6466,17 +6501,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveforms: Sequence[AnalogWaveform[numpy.float64]],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a set of analog waveforms with timing and attributes. All of the waveforms must be the same size."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties for waveform in waveforms]
+            properties = self._get_properties_to_read(waveforms, read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(len(waveforms), dtype=numpy.int64)
-            dt_array = numpy.zeros(len(waveforms), dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(len(waveforms), read_context)
         else:
             t0_array = None
             dt_array = None
@@ -6492,15 +6527,21 @@ class LibraryInterpreter(BaseInterpreter):
             properties,
             t0_array,
             dt_array,
+            read_context,
         )
 
         for waveform in waveforms:
             waveform.sample_count = samples_read
             
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties(waveforms)
         return samples_read
 
     def _internal_read_analog_waveform_ex(
@@ -6513,6 +6554,7 @@ class LibraryInterpreter(BaseInterpreter):
         properties: Sequence[ExtendedPropertyDictionary] | None,
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -6548,7 +6590,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array,
             read_array.size,
@@ -6567,6 +6609,7 @@ class LibraryInterpreter(BaseInterpreter):
         properties: Sequence[ExtendedPropertyDictionary] | None,
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -6610,7 +6653,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array_pointers,
             channel_count,
@@ -6622,8 +6665,46 @@ class LibraryInterpreter(BaseInterpreter):
 
         return error_code, samps_per_chan_read.value
 
-    def _get_wfm_attr_callback(self, properties):
-        if properties is not None:
+    def _get_properties_to_read(
+        self,
+        waveforms: Sequence[AnalogWaveform[Any] | DigitalWaveform[Any]],
+        read_context: WaveformReadContext | None,
+    ) -> Sequence[ExtendedPropertyDictionary] | None:
+        if read_context is not None:
+            return read_context.get_properties_to_read(waveforms)
+        return [waveform.extended_properties for waveform in waveforms]
+
+    def _get_timing_arrays(
+        self, channel_count: int, read_context: WaveformReadContext | None
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], numpy.typing.NDArray[numpy.int64]]:
+        if read_context is not None:
+            return read_context.get_timing_arrays(channel_count)
+        return (
+            numpy.zeros(channel_count, dtype=numpy.int64),
+            numpy.zeros(channel_count, dtype=numpy.int64),
+        )
+
+    def _get_wfm_attr_callback(self, properties, read_context=None):
+        if properties is not None and read_context is not None:
+            # Reuse the read context's callback, which updates whichever properties are
+            # currently assigned to the read context.
+            read_context.properties = properties
+            if read_context.wfm_attr_callback_ptr is None:
+                def set_read_context_wfm_attr_callback(
+                    channel_index: int,
+                    attribute_name: str,
+                    attribute_type: WfmAttrType,
+                    value: ExtendedPropertyValue,
+                    callback_data: object,
+                ) -> int:
+                    assert read_context.properties is not None
+                    read_context.properties[channel_index][attribute_name] = value
+                    return 0
+                read_context.wfm_attr_callback_ptr = self._get_wfm_attr_callback_ptr(
+                    set_read_context_wfm_attr_callback
+                )
+            return read_context.wfm_attr_callback_ptr
+        elif properties is not None:
             def set_wfm_attr_callback(
                 channel_index: int,
                 attribute_name: str,
@@ -6685,13 +6766,20 @@ class LibraryInterpreter(BaseInterpreter):
         self, 
         waveforms: Sequence[AnalogWaveform[numpy.float64] | DigitalWaveform[numpy.uint8]], 
         t0_array: numpy.typing.NDArray[numpy.int64], 
-        dt_array: numpy.typing.NDArray[numpy.int64]
+        dt_array: numpy.typing.NDArray[numpy.int64],
+        read_context: WaveformReadContext | None = None,
     ) -> None:
         for i, waveform in enumerate(waveforms):
+            if read_context is not None:
+                sample_interval = read_context.get_sample_interval(
+                    i, int(dt_array[i]), _INT64_WFM_SEC_PER_TICK
+                )
+            else:
+                sample_interval = ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK)
             waveform.timing = Timing(
                 sample_interval_mode=SampleIntervalMode.REGULAR,
                 timestamp=_T0_EPOCH + ht_timedelta(seconds=t0_array[i] * _INT64_WFM_SEC_PER_TICK),
-                sample_interval=ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK),
+                sample_interval=sample_interval,
             )
 
     def read_digital_waveform(
@@ -6700,17 +6788,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: DigitalWaveform[Any],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties]
+            properties = self._get_properties_to_read([waveform], read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(1, dtype=numpy.int64)
-            dt_array = numpy.zeros(1, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(1, read_context)
         else:
             t0_array = None
             dt_array = None
@@ -6727,16 +6815,39 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             None,
+            read_context,
         )
 
         waveform.sample_count = samples_read
         
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings([waveform], t0_array, dt_array)
+            self._set_waveform_timings([waveform], t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties([waveform])
         return samples_read
 
+    def _get_digital_read_arrays(
+        self,
+        number_of_samples_per_channel: int,
+        channel_count: int,
+        number_of_signals_per_sample: int,
+        read_context: WaveformReadContext | None,
+    ) -> tuple[numpy.typing.NDArray[numpy.uint8], numpy.typing.NDArray[numpy.uint32]]:
+        if read_context is not None:
+            return read_context.get_digital_read_arrays(
+                number_of_samples_per_channel, channel_count, number_of_signals_per_sample
+            )
+        read_array = numpy.zeros(
+            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
+            dtype=numpy.uint8)
+        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        return read_array, bytes_per_chan_array
+
     def _get_digital_read_array(self, waveform: DigitalWaveform[Any]) -> numpy.typing.NDArray[numpy.uint8]:  
         data = waveform.data
         if data.dtype != numpy.uint8:
@@ -6752,27 +6863,28 @@ class LibraryInterpreter(BaseInterpreter):
         timeout: float,
         waveforms: Sequence[DigitalWaveform[Any]],
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties for waveform in waveforms]
+            properties = self._get_properties_to_read(waveforms, read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(channel_count, dtype=numpy.int64)
-            dt_array = numpy.zeros(channel_count, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(channel_count, read_context)
         else:
             t0_array = None
             dt_array = None
 
-        # Since there's no DAQmxInternalReadDigitalWaveformPerChan, we have to allocate a
-        # temporary contiguous array to read the data from multiple channels into.
-        read_array = numpy.zeros(
-            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
-            dtype=numpy.uint8)
-
-        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        # Since there's no DAQmxInternalReadDigitalWaveformPerChan, we have to read the data from
+        # multiple channels into a temporary contiguous array.
+        read_array, bytes_per_chan_array = self._get_digital_read_arrays(
+            number_of_samples_per_channel,
+            channel_count,
+            number_of_signals_per_sample,
+            read_context,
+        )
 
         error_code, samples_read = self._internal_read_digital_waveform(
             task_handle,
@@ -6784,6 +6896,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             bytes_per_chan_array,
+            read_context,
         )
 
         for i, waveform in enumerate(waveforms):        
@@ -6792,12 +6905,17 @@ class LibraryInterpreter(BaseInterpreter):
             channel_signal_count = bytes_per_chan_array[i]
             if waveform_signal_count != channel_signal_count:
                 raise ValueError(f"waveforms[{i}].data has {waveform_signal_count} signals, but expected {channel_signal_count}")
-            waveform.data[:] = read_array[:, i, :channel_signal_count]
+            waveform.data[:] = read_array[:samples_read, i, :channel_signal_count]
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties(waveforms)
         return samples_read
 
     def read_new_digital_waveforms(
@@ -6808,6 +6926,7 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_signals_per_sample: int,
         timeout: float,
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> Sequence[DigitalWaveform[numpy.uint8]]:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
@@ -6816,17 +6935,19 @@ class LibraryInterpreter(BaseInterpreter):
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(channel_count, dtype=numpy.int64)
-            dt_array = numpy.zeros(channel_count, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(channel_count, read_context)
         else:
             t0_array = None
             dt_array = None
 
-        read_array = numpy.zeros(
-            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
-            dtype=numpy.uint8)
-
-        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        # With a read context, the waveforms are views of the read context's scratch array, which
+        # later reads overwrite.
+        read_array, bytes_per_chan_array = self._get_digital_read_arrays(
+            number_of_samples_per_channel,
+            channel_count,
+            number_of_signals_per_sample,
+            read_context,
+        )
 
         error_code, samples_read = self._internal_read_digital_waveform(
             task_handle,
@@ -6838,6 +6959,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             bytes_per_chan_array,
+            read_context,
         )
 
         waveforms = []
@@ -6851,7 +6973,7 @@ class LibraryInterpreter(BaseInterpreter):
             waveforms.append(waveform)
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
         return waveforms
@@ -6867,6 +6989,7 @@ class LibraryInterpreter(BaseInterpreter):
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
         bytes_per_chan_array: numpy.typing.NDArray[numpy.uint32] | None = None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -6906,7 +7029,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array,
             read_array.size,
@@ -7020,6 +7143,25 @@ class LibraryInterpreter(BaseInterpreter):
 
         return read_array, samples_read.value, number_of_bytes_per_sample.value
 
+    def read_analog_f64_stream(
+            self, task_handle, number_of_samples_per_channel, timeout, fill_mode,
+            array_size_in_samps):
+        # The driver reads directly into host memory, so there is no round trip to avoid.
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.float64)
+            _, samps_per_chan_read = self.read_analog_f64(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array)
+            yield read_array, samps_per_chan_read
+
+    def read_binary_i16_stream(
+            self, task_handle, number_of_samples_per_channel, timeout, fill_mode,
+            array_size_in_samps):
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.int16)
+            _, samps_per_chan_read = self.read_binary_i16(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array)
+            yield read_array, samps_per_chan_read
+
     def write_analog_waveform(
         self,
         task_handle: object,
@@ -7261,6 +7403,8 @@ class LibraryInterpreter(BaseInterpreter):
             return
 
         if error_code < 0:
+            # The extended error info names the task, channel, or property that caused the error,
+            # so it is not cached.
             extended_error_info = self.get_extended_error_info()
 
             if samps_per_chan_read is not None:
@@ -7271,7 +7415,7 @@ class LibraryInterpreter(BaseInterpreter):
                 raise DaqError(extended_error_info, error_code)
 
         elif error_code > 0:
-            error_string = self.get_error_string(error_code)
+            error_string = get_error_message(error_code, self.get_error_string)
 
             warnings.warn(DaqWarning(error_string, error_code))
 
@@ -7284,3 +7428,1585 @@ def is_string_buffer_too_small(error_code):
 
 def is_array_buffer_too_small(error_code):
     return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
+
+
+def _get_bindable_c_functions():
+    """Gets the (function name, "windll" or "cdll", argtypes) of the C functions to bind.
+
+    Event and varargs functions are not included because their argtypes depend on how they are
+    called.
+    """
+    return [
+        (
+            "DAQmxAddCDAQSyncConnection",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxAddGlobalChansToTask",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str],
+        ),
+        (
+            "DAQmxAddNetworkDevice",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str, c_bool32, ctypes.c_double,
+                ctypes.c_char_p, ctypes.c_uint],
+        ),
+        (
+            "DAQmxAreConfiguredCDAQSyncPortsDisconnected",
+            "windll",
+            [ctypes_byte_str, ctypes.c_double, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxAutoConfigureCDAQSyncConnections",
+            "windll",
+            [ctypes_byte_str, ctypes.c_double],
+        ),
+        (
+            "DAQmxCalculateReversePolyCoeff",
+            "windll",
+            [wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W'))],
+        ),
+        (
+            "DAQmxCfgAnlgEdgeRefTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes.c_double, ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgAnlgEdgeStartTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes.c_double],
+        ),
+        (
+            "DAQmxCfgAnlgMultiEdgeRefTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint32, ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgAnlgMultiEdgeStartTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgAnlgWindowRefTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgAnlgWindowStartTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCfgBurstHandshakingTimingExportClock",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong,
+                ctypes.c_double, ctypes_byte_str, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCfgBurstHandshakingTimingImportClock",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong,
+                ctypes.c_double, ctypes_byte_str, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCfgChangeDetectionTiming",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_ulonglong],
+        ),
+        (
+            "DAQmxCfgDigEdgeRefTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgDigEdgeStartTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxCfgDigPatternRefTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgDigPatternStartTrig",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCfgHandshakingTiming",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong],
+        ),
+        (
+            "DAQmxCfgImplicitTiming",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong],
+        ),
+        (
+            "DAQmxCfgPipelinedSampClkTiming",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+                ctypes.c_int, ctypes.c_int, ctypes.c_ulonglong],
+        ),
+        (
+            "DAQmxCfgSampClkTiming",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+                ctypes.c_int, ctypes.c_int, ctypes.c_ulonglong],
+        ),
+        (
+            "DAQmxCfgTimeStartTrig",
+            "windll",
+            [lib_importer.task_handle, AbsoluteTime, ctypes.c_int],
+        ),
+        (
+            "DAQmxCfgWatchdogAOExpirStates",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgWatchdogCOExpirStates",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                ctypes.c_uint],
+        ),
+        (
+            "DAQmxCfgWatchdogDOExpirStates",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                ctypes.c_uint],
+        ),
+        (
+            "DAQmxClearTask",
+            "windll",
+            [lib_importer.task_handle],
+        ),
+        (
+            "DAQmxClearTEDS",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxConfigureLogging",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+                ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxConfigureTEDS",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str],
+        ),
+        (
+            "DAQmxConnectTerms",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxControlWatchdogTask",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateAIAccel4WireDCVoltageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                c_bool32, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIAccelChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIAccelChargeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIBridgeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAICalculatedPowerChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes_byte_str, ctypes.c_int, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_double,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIChargeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAICurrentChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAICurrentRMSChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIForceBridgePolynomialChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), ctypes.c_uint, ctypes.c_int, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIForceBridgeTableChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIForceBridgeTwoPointLinChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIForceIEPEChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIFreqVoltageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIMicrophoneChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPosEddyCurrProxProbeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPosLVDTChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPosRVDTChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPowerChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, c_bool32],
+        ),
+        (
+            "DAQmxCreateAIPressureBridgePolynomialChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), ctypes.c_uint, ctypes.c_int, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPressureBridgeTableChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIPressureBridgeTwoPointLinChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIResistanceChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIRosetteStrainGageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, wrapped_ndpointer(dtype=numpy.int32,
+                flags=('C')), ctypes.c_uint, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateAIStrainGageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAITempBuiltInSensorChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateAIThrmcplChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIThrmstrChanIex",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateAIThrmstrChanVex",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateAITorqueBridgePolynomialChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), ctypes.c_uint, ctypes.c_int, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAITorqueBridgeTableChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAITorqueBridgeTwoPointLinChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIVelocityIEPEChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIVoltageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIVoltageChanWithExcit",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, c_bool32,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIVoltageRMSChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAIRTDChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateAOCurrentChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateAOFuncGenChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateAOVoltageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIAngEncoderChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, c_bool32, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_uint, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIAngVelocityChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_uint, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCICountEdgesChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_uint, ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateCIDutyCycleChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIFreqChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_uint, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCILinEncoderChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, c_bool32, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCILinVelocityChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIPeriodChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_uint, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIPulseChanFreq",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateCIPulseChanTicks",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes_byte_str, ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateCIPulseChanTime",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateCIPulseWidthChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCISemiPeriodChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCITwoEdgeSepChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCIGPSTimestampChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateCOPulseChanFreq",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateCOPulseChanTicks",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes_byte_str, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateCOPulseChanTime",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateDIChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateDOChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int],
+        ),
+        (
+            "DAQmxCreateLinScale",
+            "windll",
+            [ctypes_byte_str, ctypes.c_double, ctypes.c_double,
+                ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateMapScale",
+            "windll",
+            [ctypes_byte_str, ctypes.c_double, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreatePolynomialScale",
+            "windll",
+            [ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), ctypes.c_uint,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTableScale",
+            "windll",
+            [ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), ctypes.c_uint,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTask",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(lib_importer.task_handle)],
+        ),
+        (
+            "DAQmxCreateTEDSAIAccelChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIBridgeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAICurrentChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIForceBridgeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIForceIEPEChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIMicrophoneChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIPosLVDTChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIPosRVDTChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIPressureBridgeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIResistanceChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIStrainGageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes.c_double, ctypes.c_double,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIThrmcplChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIThrmstrChanIex",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateTEDSAIThrmstrChanVex",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateTEDSAITorqueBridgeChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIVoltageChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIVoltageChanWithExcit",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+        ),
+        (
+            "DAQmxCreateTEDSAIRTDChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+                ctypes.c_int, ctypes.c_double],
+        ),
+        (
+            "DAQmxCreateWatchdogTimerTaskEx",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str,
+                ctypes.POINTER(lib_importer.task_handle), ctypes.c_double],
+        ),
+        (
+            "DAQmxDeleteNetworkDevice",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxDeleteSavedGlobalChan",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxDeleteSavedScale",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxDeleteSavedTask",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxDeviceSupportsCal",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxDisableRefTrig",
+            "windll",
+            [lib_importer.task_handle],
+        ),
+        (
+            "DAQmxDisableStartTrig",
+            "windll",
+            [lib_importer.task_handle],
+        ),
+        (
+            "DAQmxDisconnectTerms",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str],
+        ),
+        (
+            "DAQmxExportSignal",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes_byte_str],
+        ),
+        (
+            "DAQmxGetAnalogPowerUpStatesWithOutputType",
+            "cdll",
+            [ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), wrapped_ndpointer(dtype=numpy.int32,
+                flags=('C','W')), ctypes.POINTER(ctypes.c_uint)],
+        ),
+        (
+            "DAQmxGetAutoConfiguredCDAQSyncConnections",
+            "windll",
+            [ctypes.c_char_p, ctypes.c_uint],
+        ),
+        (
+            "DAQmxGetBufferAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetCalInfoAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetChanAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetDeviceAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetDigitalLogicFamilyPowerUpState",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(ctypes.c_int)],
+        ),
+        (
+            "DAQmxGetDisconnectedCDAQSyncPorts",
+            "windll",
+            [ctypes.c_char_p, ctypes.c_uint],
+        ),
+        (
+            "DAQmxGetExportedSignalAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetExtCalLastDateAndTime",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(ctypes.c_uint),
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint),
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)],
+        ),
+        (
+            "DAQmxGetPersistedChanAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetPersistedScaleAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetPersistedTaskAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetPhysicalChanAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetReadAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetScaleAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetSelfCalLastDateAndTime",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(ctypes.c_uint),
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint),
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)],
+        ),
+        (
+            "DAQmxGetSystemInfoAttribute",
+            "cdll",
+            [ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetTaskAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetTimingAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetTimingAttributeEx",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetTrigAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetWatchdogAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxGetWriteAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxInternalGetLastCreatedChan",
+            "windll",
+            [ctypes.c_char_p, ctypes.c_uint],
+        ),
+        (
+            "DAQmxIsTaskDone",
+            "windll",
+            [lib_importer.task_handle, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxLoadTask",
+            "windll",
+            [ctypes_byte_str, ctypes.POINTER(lib_importer.task_handle)],
+        ),
+        (
+            "DAQmxPerformBridgeOffsetNullingCalEx",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, c_bool32],
+        ),
+        (
+            "DAQmxPerformBridgeShuntCalEx",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+                ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+                c_bool32],
+        ),
+        (
+            "DAQmxPerformStrainShuntCalEx",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+                ctypes.c_int, ctypes.c_int, ctypes.c_int, c_bool32],
+        ),
+        (
+            "DAQmxPerformThrmcplLeadOffsetNullingCal",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, c_bool32],
+        ),
+        (
+            "DAQmxReadAnalogF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadAnalogScalarF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadBinaryI16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.int16,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadBinaryI32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.int32,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadBinaryU16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadBinaryU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+                ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterF64Ex",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterScalarF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterScalarU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')),
+                ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCounterU32Ex",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrFreq",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrFreqScalar",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_double),
+                ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrTicks",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                flags=('C','W')), wrapped_ndpointer(dtype=numpy.uint32,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrTicksScalar",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_uint32),
+                ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrTime",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadCtrTimeScalar",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_double),
+                ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadDigitalLines",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=bool, flags=('C','W')),
+                ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadDigitalScalarU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadDigitalU16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadDigitalU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadDigitalU8",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint8,
+                flags=('C','W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxReadPowerScalarF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(ctypes.c_double),
+                ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxRemoveCDAQSyncConnection",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxReserveNetworkDevice",
+            "windll",
+            [ctypes_byte_str, c_bool32],
+        ),
+        (
+            "DAQmxResetBufferAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxResetChanAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxResetDevice",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxResetExportedSignalAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetReadAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetTimingAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetTimingAttributeEx",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetTrigAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetWatchdogAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxResetWriteAttribute",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxRestoreLastExtCalConst",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxSaveGlobalChan",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes_byte_str, ctypes.c_uint32],
+        ),
+        (
+            "DAQmxSaveScale",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_uint32],
+        ),
+        (
+            "DAQmxSaveTask",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+                ctypes.c_uint32],
+        ),
+        (
+            "DAQmxSelfCal",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxSelfTestDevice",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxSetAnalogPowerUpStatesWithOutputType",
+            "cdll",
+            [ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64,
+                flags=('C')), wrapped_ndpointer(dtype=numpy.int32,
+                flags=('C')), ctypes.c_uint],
+        ),
+        (
+            "DAQmxSetBufferAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetCalInfoAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetChanAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetDigitalLogicFamilyPowerUpState",
+            "windll",
+            [ctypes_byte_str, ctypes.c_int],
+        ),
+        (
+            "DAQmxSetExportedSignalAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetReadAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetRuntimeEnvironment",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str, ctypes_byte_str,
+                ctypes_byte_str],
+        ),
+        (
+            "DAQmxSetScaleAttribute",
+            "cdll",
+            [ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetTimingAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetTimingAttributeEx",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetTrigAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetWatchdogAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+        ),
+        (
+            "DAQmxSetWriteAttribute",
+            "cdll",
+            [lib_importer.task_handle, ctypes.c_int32],
+        ),
+        (
+            "DAQmxStartNewFile",
+            "windll",
+            [lib_importer.task_handle, ctypes_byte_str],
+        ),
+        (
+            "DAQmxStartTask",
+            "windll",
+            [lib_importer.task_handle],
+        ),
+        (
+            "DAQmxStopTask",
+            "windll",
+            [lib_importer.task_handle],
+        ),
+        (
+            "DAQmxTaskControl",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int],
+        ),
+        (
+            "DAQmxTristateOutputTerm",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxUnreserveNetworkDevice",
+            "windll",
+            [ctypes_byte_str],
+        ),
+        (
+            "DAQmxWaitForNextSampleClock",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double,
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWaitForValidTimestamp",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int32, ctypes.c_double,
+                ctypes.POINTER(AbsoluteTime)],
+        ),
+        (
+            "DAQmxWaitUntilTaskDone",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_double],
+        ),
+        (
+            "DAQmxWriteAnalogF64",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteAnalogScalarF64",
+            "windll",
+            [lib_importer.task_handle, c_bool32, ctypes.c_double,
+                ctypes.c_double, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteBinaryI16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.int16, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteBinaryI32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteBinaryU16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteBinaryU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrFreq",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrFreqScalar",
+            "windll",
+            [lib_importer.task_handle, c_bool32, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrTicks",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrTicksScalar",
+            "windll",
+            [lib_importer.task_handle, c_bool32, ctypes.c_double,
+                ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrTime",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteCtrTimeScalar",
+            "windll",
+            [lib_importer.task_handle, c_bool32, ctypes.c_double,
+                ctypes.c_double, ctypes.c_double, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteDigitalLines",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int, wrapped_ndpointer(dtype=bool,
+                flags=('C')), ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteDigitalScalarU32",
+            "windll",
+            [lib_importer.task_handle, c_bool32, ctypes.c_double,
+                ctypes.c_uint, ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteDigitalU16",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteDigitalU32",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteDigitalU8",
+            "windll",
+            [lib_importer.task_handle, ctypes.c_int, c_bool32,
+                ctypes.c_double, ctypes.c_int,
+                wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
+                ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+        ),
+        (
+            "DAQmxWriteIDPinMemory",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str,
+                wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
+                ctypes.c_uint, ctypes.c_uint],
+        ),
+        (
+            "DAQmxWriteToTEDSFromArray",
+            "windll",
+            [ctypes_byte_str, wrapped_ndpointer(dtype=numpy.uint8,
+                flags=('C')), ctypes.c_uint, ctypes.c_int],
+        ),
+        (
+            "DAQmxWriteToTEDSFromFile",
+            "windll",
+            [ctypes_byte_str, ctypes_byte_str, ctypes.c_int],
+        ),
+    ]
@@ -0,0 +1,1563 @@
+"""In-process simulation of NI-DAQmx tasks.
+
+The simulated interpreter implements tasks, channels, sample-clock timing, and buffers in memory,
+so the Python layers of this package can be exercised, profiled, and load-tested without the
+NI-DAQmx driver, the NI gRPC Device Server, or a device.
+
+It simulates the operations that most applications use: creating analog voltage, digital, and
+counter edge count or frequency channels, configuring sample clock timing, starting and stopping
+tasks, reading and writing numeric arrays, scalars, and waveforms, every N samples and done events,
+and the task, channel, read, write, buffer, and timing attributes. The other interpreter methods
+raise DaqFunctionNotSupportedError.
+
+Reads return deterministic synthetic data:
+
+- Analog input channels return a sine wave with a period of 100 samples that spans 90% of the
+  channel's range. The phase of each channel is offset by 1/8 of a period from the previous
+  channel. Unscaled reads return the same sine wave, scaled to the 16-bit range by the channel's
+  linear device scaling coefficients. Raw reads return the unscaled samples as 16-bit integers,
+  interleaved by scan.
+- Digital input channels return the sample index plus the channel index, masked to the number of
+  lines in the channel.
+- Counter edge count channels return the initial count plus or minus the sample index.
+- Counter frequency channels return the midpoint of the channel's range.
+
+Hardware-timed tasks acquire and generate samples at the sample clock rate, starting when the
+task starts. Reads wait for the requested samples to be acquired and writes wait for space in
+the buffer, subject to the timeout.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy
+import numpy.typing
+from hightime import timedelta as ht_timedelta
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, ExtendedPropertyDictionary, Timing
+
+from nidaqmx._base_interpreter import BaseEventHandler
+from nidaqmx._simulated_interpreter_base import SimulatedInterpreterBase
+from nidaqmx._waveform_read_context import WaveformReadContext
+from nidaqmx._waveform_utils import get_num_samps_per_chan
+from nidaqmx.constants import (
+    WAIT_INFINITELY,
+    AcquisitionType,
+    ChannelType,
+    CountDirection,
+    FillMode,
+    LineGrouping,
+    SampleTimingType,
+    TaskMode,
+    UsageTypeAI,
+    UsageTypeCI,
+    WaveformAttributeMode,
+)
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError, DaqReadError, DaqWriteError
+from nidaqmx.types import DriverVersion
+from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
+
+_DRIVER_VERSION = DriverVersion(26, 5, 0)
+_SAMPLES_PER_PERIOD = 100
+_LINES_PER_PORT = 8
+_UINT32_MASK = 0xFFFFFFFF
+
+# Task attributes
+_TASK_CHANNELS = 0x1273
+_TASK_COMPLETE = 0x1274
+_TASK_NAME = 0x1276
+_TASK_NUM_CHANS = 0x2181
+_TASK_DEVICES = 0x230E
+_TASK_NUM_DEVICES = 0x29BA
+
+# Channel attributes
+_CHAN_AI_MEAS_TYPE = 0x0695
+_CHAN_CI_COUNT_EDGES_DIR = 0x0696
+_CHAN_CI_COUNT_EDGES_INITIAL_CNT = 0x0698
+_CHAN_AO_MAX = 0x1186
+_CHAN_AO_MIN = 0x1187
+_CHAN_AI_DEV_SCALING_COEFF = 0x1930
+_CHAN_AI_MAX = 0x17DD
+_CHAN_AI_RAW_SAMP_SIZE = 0x22DA
+_CHAN_AI_MIN = 0x17DE
+_CHAN_TYPE = 0x187F
+_CHAN_CI_MAX = 0x189C
+_CHAN_CI_MIN = 0x189D
+_CHAN_CI_MEAS_TYPE = 0x18A0
+_CHAN_PHYSICAL_CHAN_NAME = 0x18F5
+
+# Read, write, and buffer attributes
+_READ_ALL_AVAIL_SAMP = 0x1215
+_READ_AVAIL_SAMP_PER_CHAN = 0x1223
+_READ_CHANNELS_TO_READ = 0x1823
+_READ_AUTO_START = 0x1826
+_READ_TOTAL_SAMP_PER_CHAN_ACQUIRED = 0x192A
+_READ_RAW_DATA_WIDTH = 0x217A
+_READ_NUM_CHANS = 0x217B
+_READ_DI_NUM_BOOLEANS_PER_CHAN = 0x217C
+_READ_DEFAULT_NUM_SAMPS = 0x31E8
+_WRITE_CURR_WRITE_POS = 0x1458
+_WRITE_SPACE_AVAIL = 0x1460
+_WRITE_TOTAL_SAMP_PER_CHAN_GENERATED = 0x192B
+_WRITE_NUM_CHANS = 0x217E
+_WRITE_DO_NUM_BOOLEANS_PER_CHAN = 0x217F
+_BUFFER_INPUT_BUF_SIZE = 0x186C
+_BUFFER_OUTPUT_BUF_SIZE = 0x186D
+
+# Timing attributes
+_TIMING_SAMP_QUANT_SAMP_MODE = 0x1300
+_TIMING_SAMP_QUANT_SAMP_PER_CHAN = 0x1310
+_TIMING_SAMP_CLK_RATE = 0x1344
+_TIMING_SAMP_TIMING_TYPE = 0x1347
+
+_DEFAULT_TASK_ATTRIBUTES: dict[int, Any] = {
+    _READ_ALL_AVAIL_SAMP: False,
+    _READ_AUTO_START: True,
+    _TIMING_SAMP_QUANT_SAMP_MODE: AcquisitionType.FINITE.value,
+    _TIMING_SAMP_QUANT_SAMP_PER_CHAN: 1000,
+    _TIMING_SAMP_CLK_RATE: 1000.0,
+    _TIMING_SAMP_TIMING_TYPE: SampleTimingType.ON_DEMAND.value,
+}
+
+_INPUT_CHANNEL_TYPES = (
+    ChannelType.ANALOG_INPUT.value,
+    ChannelType.DIGITAL_INPUT.value,
+    ChannelType.COUNTER_INPUT.value,
+)
+_OUTPUT_CHANNEL_TYPES = (
+    ChannelType.ANALOG_OUTPUT.value,
+    ChannelType.DIGITAL_OUTPUT.value,
+)
+
+_task_numbers = itertools.count()
+
+
+class _SimulatedChannel:
+    """A virtual channel and its attributes."""
+
+    __slots__ = ("name", "index", "num_lines", "attributes")
+
+    def __init__(self, name: str, index: int, num_lines: int, attributes: dict[int, Any]) -> None:
+        self.name = name
+        self.index = index
+        self.num_lines = num_lines
+        self.attributes = attributes
+
+    @property
+    def chan_type(self) -> int:
+        return self.attributes[_CHAN_TYPE]
+
+    def generate(self, sample_indices: numpy.typing.NDArray[numpy.int64]) -> numpy.typing.NDArray:
+        """Generate the synthetic samples with the specified sample indices."""
+        chan_type = self.chan_type
+        if chan_type == ChannelType.ANALOG_INPUT.value:
+            min_val = self.attributes[_CHAN_AI_MIN]
+            max_val = self.attributes[_CHAN_AI_MAX]
+            phase = sample_indices / _SAMPLES_PER_PERIOD + self.index / 8
+            return (max_val + min_val) / 2 + 0.45 * (max_val - min_val) * numpy.sin(
+                2 * numpy.pi * phase
+            )
+        elif chan_type in (ChannelType.DIGITAL_INPUT.value, ChannelType.DIGITAL_OUTPUT.value):
+            mask = (1 << self.num_lines) - 1
+            return ((sample_indices + self.index) & mask).astype(numpy.uint32)
+        elif self.attributes[_CHAN_CI_MEAS_TYPE] == UsageTypeCI.COUNT_EDGES.value:
+            initial_count = self.attributes[_CHAN_CI_COUNT_EDGES_INITIAL_CNT]
+            if self.attributes[_CHAN_CI_COUNT_EDGES_DIR] == CountDirection.COUNT_DOWN.value:
+                counts = initial_count - sample_indices
+            else:
+                counts = initial_count + sample_indices
+            return (counts & _UINT32_MASK).astype(numpy.uint32)
+        else:
+            frequency = (self.attributes[_CHAN_CI_MIN] + self.attributes[_CHAN_CI_MAX]) / 2
+            return numpy.full(sample_indices.shape, frequency)
+
+    def generate_lines(
+        self, sample_indices: numpy.typing.NDArray[numpy.int64], num_lines: int
+    ) -> numpy.typing.NDArray[numpy.bool_]:
+        """Generate the synthetic line states with the specified sample indices."""
+        values = self.generate(sample_indices)
+        lines = numpy.arange(min(num_lines, self.num_lines), dtype=numpy.uint32)
+        states = numpy.zeros((sample_indices.size, num_lines), dtype=numpy.bool_)
+        states[:, : lines.size] = (values[:, numpy.newaxis] >> lines) & 1
+        return states
+
+
+class _SimulatedEventHandler(BaseEventHandler):
+    """Event handler that holds a callback registered on a simulated task."""
+
+    __slots__ = ["_callback_function"]
+
+    def __init__(self, callback_function: Callable[..., Any]) -> None:
+        self._callback_function: Callable[..., Any] | None = callback_function
+
+    def close(self) -> None:
+        self._callback_function = None
+
+
+class _SimulatedTask:
+    """A simulated task. The interpreter uses it as the task handle."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.channels: list[_SimulatedChannel] = []
+        self.attributes = dict(_DEFAULT_TASK_ATTRIBUTES)
+        self.cleared = False
+        self.running = False
+        self.implicitly_started = False
+        self.start_time = 0.0
+        self.start_timestamp = datetime.now(timezone.utc)
+        self.samples_read = 0
+        self.samples_written = 0
+        self.last_sample_clock = 0
+        self.every_n_samples_events: dict[int, tuple[int, Callable[..., Any], Any]] = {}
+        self.done_event: tuple[Callable[..., Any], Any] | None = None
+        self._lock = threading.RLock()
+        self._stop_events = threading.Event()
+        self._event_threads: list[threading.Thread] = []
+
+    def __repr__(self) -> str:
+        return f"_SimulatedTask(name={self.name!r})"
+
+    # Channels
+
+    def add_channels(
+        self,
+        physical_channels: Sequence[str],
+        name_to_assign: str,
+        chan_type: ChannelType,
+        attributes: dict[int, Any],
+        num_lines: int = 0,
+    ) -> list[str]:
+        if name_to_assign:
+            names = unflatten_channel_string(name_to_assign)
+            if len(names) == 1 and len(physical_channels) > 1:
+                names = [f"{names[0]}{i}" for i in range(len(physical_channels))]
+        else:
+            names = list(physical_channels)
+        if len(names) != len(physical_channels):
+            raise DaqError(
+                "Number of channel names specified does not match the number of physical "
+                "channels.",
+                DAQmxErrors.CHANNEL_NAME_NOT_SPECIFIED_IN_LIST,
+                task_name=self.name,
+            )
+        with self._lock:
+            existing_names = {channel.name.lower() for channel in self.channels}
+            for name, physical_channel in zip(names, physical_channels):
+                if name.lower() in existing_names:
+                    raise DaqError(
+                        f"Channel name {name} is already in use in the task.",
+                        DAQmxErrors.CHAN_ALREADY_IN_TASK,
+                        task_name=self.name,
+                    )
+                channel_attributes = dict(attributes)
+                channel_attributes[_CHAN_TYPE] = chan_type.value
+                channel_attributes[_CHAN_PHYSICAL_CHAN_NAME] = physical_channel
+                self.channels.append(
+                    _SimulatedChannel(name, len(self.channels), num_lines, channel_attributes)
+                )
+            self.attributes.pop(_READ_CHANNELS_TO_READ, None)
+        return names
+
+    def get_channels(self, channel_names: str) -> list[_SimulatedChannel]:
+        """Get the channels with the specified names, or all channels if the names are empty."""
+        if not channel_names:
+            return list(self.channels)
+        channels_by_name = {channel.name.lower(): channel for channel in self.channels}
+        channels = []
+        for name in unflatten_channel_string(channel_names):
+            channel = channels_by_name.get(name.lower())
+            if channel is None:
+                raise DaqError(
+                    f"Channel {name} is not in the task.",
+                    DAQmxErrors.CHANNEL_NAME_NOT_SPECIFIED_IN_LIST,
+                    task_name=self.name,
+                )
+            channels.append(channel)
+        return channels
+
+    def get_channels_to_read(self) -> list[_SimulatedChannel]:
+        channels = self.get_channels(self.attributes.get(_READ_CHANNELS_TO_READ, ""))
+        if not channels or any(
+            channel.chan_type not in _INPUT_CHANNEL_TYPES
+            and channel.chan_type != ChannelType.DIGITAL_OUTPUT.value
+            for channel in channels
+        ):
+            raise DaqError(
+                "Read failed, because there are no channels in this task from which data can be "
+                "read.",
+                DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+                task_name=self.name,
+            )
+        return channels
+
+    def get_channels_to_write(self) -> list[_SimulatedChannel]:
+        channels = [
+            channel for channel in self.channels if channel.chan_type in _OUTPUT_CHANNEL_TYPES
+        ]
+        if not channels:
+            raise DaqError(
+                "Write failed, because there are no output channels in this task to which data "
+                "can be written.",
+                DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK,
+                task_name=self.name,
+            )
+        return channels
+
+    # Timing
+
+    @property
+    def is_hardware_timed(self) -> bool:
+        return self.attributes[_TIMING_SAMP_TIMING_TYPE] == SampleTimingType.SAMPLE_CLOCK.value
+
+    @property
+    def is_finite(self) -> bool:
+        return self.attributes[_TIMING_SAMP_QUANT_SAMP_MODE] == AcquisitionType.FINITE.value
+
+    @property
+    def is_single_point(self) -> bool:
+        return (
+            self.attributes[_TIMING_SAMP_QUANT_SAMP_MODE]
+            == AcquisitionType.HW_TIMED_SINGLE_POINT.value
+        )
+
+    @property
+    def rate(self) -> float:
+        return self.attributes[_TIMING_SAMP_CLK_RATE]
+
+    @property
+    def samps_per_chan(self) -> int:
+        return self.attributes[_TIMING_SAMP_QUANT_SAMP_PER_CHAN]
+
+    @property
+    def input_buffer_size(self) -> int:
+        buffer_size = self.attributes.get(_BUFFER_INPUT_BUF_SIZE)
+        if buffer_size is not None:
+            return buffer_size
+        if self.is_finite:
+            return self.samps_per_chan
+        # Like NI-DAQmx, size the buffer for continuous acquisitions based on the rate.
+        rate = self.rate
+        if rate <= 100:
+            minimum = 1_000
+        elif rate <= 10_000:
+            minimum = 10_000
+        elif rate <= 1_000_000:
+            minimum = 100_000
+        else:
+            minimum = 1_000_000
+        return max(minimum, self.samps_per_chan)
+
+    def get_sample_time(self, sample_count: int) -> float:
+        """Get the time at which the task has acquired or generated sample_count samples."""
+        return self.start_time + sample_count / self.rate
+
+    def get_samples_clocked(self, now: float) -> int:
+        """Get the number of samples per channel acquired or generated since the task started."""
+        if not self.running or not self.is_hardware_timed:
+            return 0
+        samples_clocked = int((now - self.start_time) * self.rate)
+        if self.is_finite:
+            samples_clocked = min(samples_clocked, self.samps_per_chan)
+        return samples_clocked
+
+    def is_done(self) -> bool:
+        if not self.running:
+            return True
+        if not self.is_hardware_timed or not self.is_finite:
+            return False
+        return self.get_samples_clocked(time.perf_counter()) >= self.samps_per_chan
+
+    # State
+
+    def check_not_cleared(self) -> None:
+        if self.cleared:
+            raise DaqError("Task specified is invalid or does not exist.", DAQmxErrors.INVALID_TASK)
+
+    def start(self, implicit: bool = False) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self.implicitly_started = implicit
+            self.samples_read = 0
+            self.last_sample_clock = 0
+            self.start_timestamp = datetime.now(timezone.utc)
+            self.start_time = time.perf_counter()
+            if self.is_hardware_timed:
+                self._start_event_threads()
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self.implicitly_started = False
+            self.samples_written = 0
+            self._stop_events.set()
+            threads = self._event_threads
+            self._event_threads = []
+            self._stop_events = threading.Event()
+        # An event callback may stop the task, and a thread cannot join itself.
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def _start_event_threads(self) -> None:
+        for event_type, (n_samples, callback, callback_data) in self.every_n_samples_events.items():
+            self._start_event_thread(
+                self._run_every_n_samples_event, event_type, n_samples, callback, callback_data
+            )
+        if self.done_event is not None and self.is_finite:
+            self._start_event_thread(self._run_done_event, *self.done_event)
+
+    def _start_event_thread(self, target: Callable[..., None], *args: Any) -> None:
+        thread = threading.Thread(
+            target=target, args=(self._stop_events, *args), name=f"{self.name} event", daemon=True
+        )
+        self._event_threads.append(thread)
+        thread.start()
+
+    def _run_every_n_samples_event(
+        self,
+        stop_event: threading.Event,
+        event_type: int,
+        n_samples: int,
+        callback: Callable[..., Any],
+        callback_data: Any,
+    ) -> None:
+        for event_number in itertools.count(1):
+            sample_count = event_number * n_samples
+            if self.is_finite and sample_count > self.samps_per_chan:
+                return
+            if stop_event.wait(max(self.get_sample_time(sample_count) - time.perf_counter(), 0)):
+                return
+            callback(self, event_type, n_samples, callback_data)
+
+    def _run_done_event(
+        self, stop_event: threading.Event, callback: Callable[..., Any], callback_data: Any
+    ) -> None:
+        done_time = self.get_sample_time(self.samps_per_chan)
+        if not stop_event.wait(max(done_time - time.perf_counter(), 0)):
+            callback(self, 0, callback_data)
+
+    # Reads and writes
+
+    def read(
+        self, num_samps_per_chan: int, timeout: float
+    ) -> tuple[list[_SimulatedChannel], numpy.typing.NDArray[numpy.int64], DaqReadError | None]:
+        """Read samples from the buffer, waiting for them to be acquired.
+
+        Returns the channels to read, the indices of the samples that were read, and the error
+        to raise after the caller copies the samples, if not all of the requested samples were
+        acquired within the timeout.
+        """
+        self.check_not_cleared()
+        channels = self.get_channels_to_read()
+        with self._lock:
+            if not self.running and self.is_hardware_timed:
+                if not self.attributes[_READ_AUTO_START]:
+                    raise DaqReadError(
+                        "Task must be started before reading.",
+                        DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE,
+                        0,
+                        task_name=self.name,
+                    )
+                self.start(implicit=True)
+            first_sample = self.samples_read
+
+        error = None
+        if not self.is_hardware_timed:
+            count = num_samps_per_chan
+        else:
+            if self.is_finite and first_sample + num_samps_per_chan > self.samps_per_chan:
+                raise DaqReadError(
+                    "Attempted to read samples beyond the final sample acquired.",
+                    DAQmxErrors.SAMPLES_WILL_NEVER_BE_AVAILABLE,
+                    0,
+                    task_name=self.name,
+                )
+            wait_time = (
+                self.get_sample_time(first_sample + num_samps_per_chan) - time.perf_counter()
+            )
+            if timeout != WAIT_INFINITELY:
+                wait_time = min(wait_time, timeout)
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+            samples_available = self.get_samples_clocked(time.perf_counter()) - first_sample
+            if samples_available > self.input_buffer_size:
+                raise DaqReadError(
+                    "The application is not able to keep up with the hardware acquisition.",
+                    DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE,
+                    0,
+                    task_name=self.name,
+                )
+            count = min(num_samps_per_chan, samples_available)
+            if count < num_samps_per_chan:
+                error = DaqReadError(
+                    "Some or all of the samples requested have not yet been acquired.",
+                    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE,
+                    count,
+                    task_name=self.name,
+                )
+
+        with self._lock:
+            self.samples_read = first_sample + count
+            # Like NI-DAQmx, stop a finite task that the read started after reading all samples.
+            stop = (
+                self.implicitly_started
+                and self.is_hardware_timed
+                and self.is_finite
+                and self.samples_read >= self.samps_per_chan
+            )
+        if stop:
+            self.stop()
+        return channels, numpy.arange(first_sample, first_sample + count), error
+
+    def get_samples_to_read(self) -> int:
+        """Get the number of samples per channel that a read of all available samples reads."""
+        if not self.is_hardware_timed:
+            return 1
+        if self.is_finite and not self.attributes[_READ_ALL_AVAIL_SAMP]:
+            return self.samps_per_chan - (self.samples_read if self.running else 0)
+        return self.get_samples_available()
+
+    def get_samples_available(self) -> int:
+        with self._lock:
+            return max(self.get_samples_clocked(time.perf_counter()) - self.samples_read, 0)
+
+    def _get_output_buffer_size(self, num_samps_per_chan: int) -> int:
+        buffer_size = self.attributes.get(_BUFFER_OUTPUT_BUF_SIZE)
+        if buffer_size is not None:
+            return buffer_size
+        # Like NI-DAQmx, size the buffer based on the first write.
+        return max(self.samples_written, num_samps_per_chan)
+
+    def get_output_space_available(self) -> int:
+        with self._lock:
+            buffer_size = self._get_output_buffer_size(0)
+            if not self.running or not self.is_hardware_timed:
+                return buffer_size - self.samples_written
+            samples_generated = self.get_samples_clocked(time.perf_counter())
+            return min(buffer_size, buffer_size - self.samples_written + samples_generated)
+
+    def write(self, num_samps_per_chan: int, auto_start: bool, timeout: float) -> int:
+        """Write samples to the buffer, waiting for space to become available."""
+        self.check_not_cleared()
+        self.get_channels_to_write()
+        if not self.is_hardware_timed:
+            return num_samps_per_chan
+        if self.is_single_point:
+            # Hardware-timed single-point tasks have no buffer, so writes update the outputs
+            # immediately.
+            if auto_start:
+                self.start()
+            return num_samps_per_chan
+        with self._lock:
+            running = self.running
+            if not running:
+                buffer_size = self._get_output_buffer_size(num_samps_per_chan)
+                self.attributes.setdefault(_BUFFER_OUTPUT_BUF_SIZE, buffer_size)
+                count = min(num_samps_per_chan, buffer_size - self.samples_written)
+                self.samples_written += count
+                if auto_start:
+                    self.start()
+            else:
+                buffer_size = self._get_output_buffer_size(num_samps_per_chan)
+                sample_count = self.samples_written + num_samps_per_chan - buffer_size
+                wait_time = self.get_sample_time(sample_count) - time.perf_counter()
+
+        if running:
+            if timeout != WAIT_INFINITELY:
+                wait_time = min(wait_time, timeout)
+            if wait_time > 0:
+                time.sleep(wait_time)
+            with self._lock:
+                count = min(num_samps_per_chan, max(self.get_output_space_available(), 0))
+                self.samples_written += count
+
+        if count < num_samps_per_chan:
+            raise DaqWriteError(
+                "Some or all of the samples to write could not be written to the buffer yet.",
+                DAQmxErrors.SAMPLES_CAN_NOT_YET_BE_WRITTEN,
+                count,
+                task_name=self.name,
+            )
+        return count
+
+    # Attributes
+
+    def get_attribute(self, attribute: int) -> Any:
+        self.check_not_cleared()
+        if attribute == _TASK_NAME:
+            return self.name
+        elif attribute == _TASK_CHANNELS:
+            return flatten_channel_string([channel.name for channel in self.channels])
+        elif attribute == _TASK_NUM_CHANS:
+            return len(self.channels)
+        elif attribute == _TASK_DEVICES:
+            return flatten_channel_string(sorted(self._get_device_names()))
+        elif attribute == _TASK_NUM_DEVICES:
+            return len(self._get_device_names())
+        elif attribute == _TASK_COMPLETE:
+            return self.is_done()
+        elif attribute == _READ_CHANNELS_TO_READ:
+            return flatten_channel_string([channel.name for channel in self.get_channels_to_read()])
+        elif attribute == _READ_NUM_CHANS:
+            return len(self.get_channels_to_read())
+        elif attribute == _READ_RAW_DATA_WIDTH:
+            return (
+                max(
+                    channel.attributes[_CHAN_AI_RAW_SAMP_SIZE]
+                    for channel in self.get_channels_to_read()
+                )
+                // 8
+            )
+        elif attribute == _READ_DI_NUM_BOOLEANS_PER_CHAN:
+            return max(channel.num_lines for channel in self.get_channels_to_read())
+        elif attribute == _READ_AVAIL_SAMP_PER_CHAN:
+            return self.get_samples_available()
+        elif attribute == _READ_TOTAL_SAMP_PER_CHAN_ACQUIRED:
+            return self.get_samples_clocked(time.perf_counter())
+        elif attribute == _READ_DEFAULT_NUM_SAMPS:
+            return self.get_samples_to_read()
+        elif attribute == _WRITE_NUM_CHANS:
+            return len(self.get_channels_to_write())
+        elif attribute == _WRITE_DO_NUM_BOOLEANS_PER_CHAN:
+            return max(channel.num_lines for channel in self.get_channels_to_write())
+        elif attribute == _WRITE_CURR_WRITE_POS:
+            return self.samples_written
+        elif attribute == _WRITE_SPACE_AVAIL:
+            return self.get_output_space_available()
+        elif attribute == _WRITE_TOTAL_SAMP_PER_CHAN_GENERATED:
+            return self.get_samples_clocked(time.perf_counter())
+        elif attribute == _BUFFER_INPUT_BUF_SIZE:
+            return self.input_buffer_size
+        elif attribute == _BUFFER_OUTPUT_BUF_SIZE:
+            return self._get_output_buffer_size(0)
+        elif attribute in self.attributes:
+            return self.attributes[attribute]
+        raise _create_attribute_not_supported_error(attribute, self.name)
+
+    def set_attribute(self, attribute: int, value: Any) -> None:
+        self.check_not_cleared()
+        with self._lock:
+            if attribute == _READ_CHANNELS_TO_READ:
+                self.get_channels(value)
+            self.attributes[attribute] = value
+
+    def reset_attribute(self, attribute: int) -> None:
+        self.check_not_cleared()
+        with self._lock:
+            if attribute in _DEFAULT_TASK_ATTRIBUTES:
+                self.attributes[attribute] = _DEFAULT_TASK_ATTRIBUTES[attribute]
+            else:
+                self.attributes.pop(attribute, None)
+
+    def _get_device_names(self) -> set[str]:
+        return {
+            channel.attributes[_CHAN_PHYSICAL_CHAN_NAME].split("/")[0] for channel in self.channels
+        }
+
+
+def _create_attribute_not_supported_error(attribute: int, task_name: str = "") -> DaqError:
+    return DaqError(
+        f"Attribute 0x{attribute:X} is not supported by the simulated interpreter.",
+        DAQmxErrors.ATTR_NOT_SUPPORTED,
+        task_name=task_name,
+    )
+
+
+def _get_task(task: object) -> _SimulatedTask:
+    if not isinstance(task, _SimulatedTask):
+        raise DaqError("Task specified is invalid or does not exist.", DAQmxErrors.INVALID_TASK)
+    return task
+
+
+def _get_num_lines(lines: str) -> int:
+    return sum(
+        _LINES_PER_PORT if "/line" not in line.lower() else 1
+        for line in unflatten_channel_string(lines)
+    )
+
+
+def _generate_unscaled(
+    channel: _SimulatedChannel, sample_indices: numpy.typing.NDArray[numpy.int64]
+) -> numpy.typing.NDArray:
+    """Generate the synthetic samples as the unscaled values that the scaling coefficients scale."""
+    _, gain = channel.attributes[_CHAN_AI_DEV_SCALING_COEFF]
+    return numpy.round(channel.generate(sample_indices) / gain)
+
+
+def _copy_to_read_array(
+    read_array: numpy.typing.NDArray,
+    channel_data: Sequence[numpy.typing.NDArray],
+    num_samps_per_chan: int,
+    fill_mode: int,
+) -> None:
+    number_of_channels = len(channel_data)
+    sample_shape = channel_data[0].shape[1:]
+    size = number_of_channels * num_samps_per_chan * int(numpy.prod(sample_shape))
+    flat_array = read_array.reshape(-1)[:size]
+    if fill_mode == FillMode.GROUP_BY_SCAN_NUMBER.value:
+        view = flat_array.reshape((num_samps_per_chan, number_of_channels) + sample_shape)
+        for i, data in enumerate(channel_data):
+            view[: len(data), i] = data
+    else:
+        view = flat_array.reshape((number_of_channels, num_samps_per_chan) + sample_shape)
+        for i, data in enumerate(channel_data):
+            view[i, : len(data)] = data
+
+
+def _get_waveform_timing(task: _SimulatedTask, first_sample: int) -> Timing[Any, Any, Any]:
+    if not task.is_hardware_timed:
+        return Timing.create_with_no_interval(datetime.now(timezone.utc))
+    return Timing.create_with_regular_interval(
+        ht_timedelta(seconds=1 / task.rate),
+        task.start_timestamp + timedelta(seconds=first_sample / task.rate),
+    )
+
+
+def _get_extended_properties(channel: _SimulatedChannel) -> dict[str, str]:
+    properties = {"NI_ChannelName": channel.name}
+    if channel.chan_type == ChannelType.ANALOG_INPUT.value:
+        properties["NI_UnitDescription"] = "Volts"
+    elif channel.chan_type in (ChannelType.DIGITAL_INPUT.value, ChannelType.DIGITAL_OUTPUT.value):
+        properties["NI_LineNames"] = channel.attributes[_CHAN_PHYSICAL_CHAN_NAME]
+    return properties
+
+
+def _update_extended_properties(
+    properties: Sequence[ExtendedPropertyDictionary] | None,
+    channels: Sequence[_SimulatedChannel],
+) -> None:
+    if properties is not None:
+        for channel_properties, channel in zip(properties, channels):
+            channel_properties.update(_get_extended_properties(channel))
+
+
+class SimulatedInterpreter(SimulatedInterpreterBase):
+    """Interpreter that simulates NI-DAQmx tasks in memory.
+
+    Each task handle is the simulated task itself, so this interpreter does not hold per-task
+    state and can be shared like the other interpreters.
+
+    It simulates this subset of the interpreter methods:
+
+    - Creating, starting, stopping, controlling, waiting for, and clearing tasks.
+    - Creating analog voltage input and output, digital input and output, and counter edge count
+      and frequency input channels.
+    - Configuring sample clock timing and waiting for the next sample clock.
+    - Reading analog, unscaled, raw, digital, and counter samples as arrays, scalars, streams,
+      and waveforms.
+    - Writing analog and digital samples as arrays, scalars, and waveforms.
+    - Registering and unregistering every N samples and done events.
+    - Getting, setting, and resetting the buffer, channel, exported signal, read, task, timing,
+      trigger, and write attributes that the simulated task or channel defines.
+
+    The other methods, such as those for devices, physical channels, scales, TEDS, calibration,
+    and storage, raise DaqFunctionNotSupportedError.
+    """
+
+    __slots__ = ("_last_created_chan",)
+
+    def __init__(self) -> None:
+        """Initialize a new SimulatedInterpreter."""
+        self._last_created_chan: str | None = None
+
+    @property
+    def driver_version(self) -> DriverVersion:
+        """Gets the simulated driver version."""
+        return _DRIVER_VERSION
+
+    def hash_task_handle(self, task_handle: object) -> int:
+        """Hashes a simulated task."""
+        return hash(task_handle)
+
+    # Task lifecycle
+
+    def create_task(self, session_name: str) -> tuple[_SimulatedTask, bool]:
+        """Creates a simulated task."""
+        name = session_name or f"_unnamedTask<{next(_task_numbers)}>"
+        return _SimulatedTask(name), True
+
+    def clear_task(self, task: object) -> None:
+        """Stops and clears a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        simulated_task.stop()
+        simulated_task.cleared = True
+
+    def start_task(self, task: object) -> None:
+        """Starts a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        simulated_task.start()
+
+    def stop_task(self, task: object) -> None:
+        """Stops a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        simulated_task.stop()
+
+    def task_control(self, task: object, action: int) -> None:
+        """Starts or stops a simulated task, or checks that it is not cleared."""
+        if action == TaskMode.TASK_START.value:
+            self.start_task(task)
+        elif action in (TaskMode.TASK_STOP.value, TaskMode.TASK_ABORT.value):
+            self.stop_task(task)
+        else:
+            _get_task(task).check_not_cleared()
+
+    def is_task_done(self, task: object) -> bool:
+        """Gets whether a simulated task is done."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        return simulated_task.is_done()
+
+    def wait_until_task_done(self, task: object, time_to_wait: float) -> None:
+        """Waits until a simulated task is done."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        if simulated_task.is_done() or not simulated_task.is_hardware_timed:
+            return
+        if simulated_task.is_finite:
+            wait_time = (
+                simulated_task.get_sample_time(simulated_task.samps_per_chan) - time.perf_counter()
+            )
+            if time_to_wait == WAIT_INFINITELY or wait_time <= time_to_wait:
+                time.sleep(max(wait_time, 0))
+                return
+        if time_to_wait != WAIT_INFINITELY:
+            time.sleep(time_to_wait)
+        raise DaqError(
+            "Wait Until Done did not indicate that the task was done within the specified "
+            "timeout.",
+            DAQmxErrors.WAIT_UNTIL_DONE_DOES_NOT_INDICATE_DONE,
+            task_name=simulated_task.name,
+        )
+
+    def wait_for_next_sample_clock(self, task: object, timeout: float) -> bool:
+        """Waits for the next sample clock of a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        if not simulated_task.running or not simulated_task.is_single_point:
+            raise DaqError(
+                "Wait For Next Sample Clock is supported only for running hardware-timed "
+                "single-point tasks.",
+                DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_NOT_SUPPORTED,
+                task_name=simulated_task.name,
+            )
+        with simulated_task._lock:
+            samples_clocked = simulated_task.get_samples_clocked(time.perf_counter())
+            # The loop is late if a sample clock occurred since the previous wait returned.
+            is_late = samples_clocked > simulated_task.last_sample_clock
+            next_sample_clock = samples_clocked + 1
+            wait_time = simulated_task.get_sample_time(next_sample_clock) - time.perf_counter()
+        if timeout != WAIT_INFINITELY and wait_time > timeout:
+            time.sleep(max(timeout, 0))
+            raise DaqError(
+                "Wait For Next Sample Clock did not detect a sample clock within the specified "
+                "timeout.",
+                DAQmxErrors.OPERATION_TIMED_OUT,
+                task_name=simulated_task.name,
+            )
+        if wait_time > 0:
+            time.sleep(wait_time)
+        with simulated_task._lock:
+            simulated_task.last_sample_clock = next_sample_clock
+            # Like NI-DAQmx, the next read returns the sample acquired on this sample clock.
+            simulated_task.samples_read = next_sample_clock - 1
+        return is_late
+
+    # Channels
+
+    def _create_channels(
+        self,
+        task: object,
+        physical_channel: str,
+        name_to_assign_to_channel: str,
+        chan_type: ChannelType,
+        attributes: dict[int, Any],
+        num_lines: int = 0,
+    ) -> None:
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        names = simulated_task.add_channels(
+            unflatten_channel_string(physical_channel),
+            name_to_assign_to_channel,
+            chan_type,
+            attributes,
+            num_lines,
+        )
+        self._last_created_chan = flatten_channel_string(names)
+
+    def internal_get_last_created_chan(self) -> str | None:
+        """Gets the name of the last simulated channel created."""
+        return self._last_created_chan
+
+    def create_ai_voltage_chan(
+        self,
+        task,
+        physical_channel,
+        name_to_assign_to_channel,
+        terminal_config,
+        min_val,
+        max_val,
+        units,
+        custom_scale_name,
+    ):
+        """Creates simulated analog voltage input channels."""
+        self._create_channels(
+            task,
+            physical_channel,
+            name_to_assign_to_channel,
+            ChannelType.ANALOG_INPUT,
+            {
+                _CHAN_AI_MEAS_TYPE: UsageTypeAI.VOLTAGE.value,
+                _CHAN_AI_MIN: min_val,
+                _CHAN_AI_MAX: max_val,
+                # The unscaled samples span the 16-bit range for the larger of the limits.
+                _CHAN_AI_DEV_SCALING_COEFF: (0.0, max(abs(min_val), abs(max_val)) / 32767),
+                _CHAN_AI_RAW_SAMP_SIZE: 16,
+            },
+        )
+
+    def create_ao_voltage_chan(
+        self,
+        task,
+        physical_channel,
+        name_to_assign_to_channel,
+        min_val,
+        max_val,
+        units,
+        custom_scale_name,
+    ):
+        """Creates simulated analog voltage output channels."""
+        self._create_channels(
+            task,
+            physical_channel,
+            name_to_assign_to_channel,
+            ChannelType.ANALOG_OUTPUT,
+            {_CHAN_AO_MIN: min_val, _CHAN_AO_MAX: max_val},
+        )
+
+    def create_di_chan(self, task, lines, name_to_assign_to_lines, line_grouping):
+        """Creates simulated digital input channels."""
+        self._create_digital_channels(
+            task, lines, name_to_assign_to_lines, line_grouping, ChannelType.DIGITAL_INPUT
+        )
+
+    def create_do_chan(self, task, lines, name_to_assign_to_lines, line_grouping):
+        """Creates simulated digital output channels."""
+        self._create_digital_channels(
+            task, lines, name_to_assign_to_lines, line_grouping, ChannelType.DIGITAL_OUTPUT
+        )
+
+    def _create_digital_channels(
+        self,
+        task: object,
+        lines: str,
+        name_to_assign_to_lines: str,
+        line_grouping: int,
+        chan_type: ChannelType,
+    ) -> None:
+        if line_grouping == LineGrouping.CHAN_FOR_ALL_LINES.value:
+            physical_channels = [lines]
+        else:
+            physical_channels = [
+                line
+                for port_or_line in unflatten_channel_string(lines)
+                for line in (
+                    [port_or_line]
+                    if "/line" in port_or_line.lower()
+                    else [f"{port_or_line}/line{i}" for i in range(_LINES_PER_PORT)]
+                )
+            ]
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        if len(physical_channels) == 1:
+            # Name a channel that contains a range of lines after its first line, so that the
+            # channel name does not expand to several channels in a list of channel names.
+            names = simulated_task.add_channels(
+                physical_channels,
+                name_to_assign_to_lines or unflatten_channel_string(physical_channels[0])[0],
+                chan_type,
+                {},
+                _get_num_lines(physical_channels[0]),
+            )
+        else:
+            names = simulated_task.add_channels(
+                physical_channels, name_to_assign_to_lines, chan_type, {}, 1
+            )
+        self._last_created_chan = flatten_channel_string(names)
+
+    def create_ci_count_edges_chan(
+        self, task, counter, name_to_assign_to_channel, edge, initial_count, count_direction
+    ):
+        """Creates a simulated counter edge count input channel."""
+        self._create_channels(
+            task,
+            counter,
+            name_to_assign_to_channel,
+            ChannelType.COUNTER_INPUT,
+            {
+                _CHAN_CI_MEAS_TYPE: UsageTypeCI.COUNT_EDGES.value,
+                _CHAN_CI_COUNT_EDGES_INITIAL_CNT: initial_count,
+                _CHAN_CI_COUNT_EDGES_DIR: count_direction,
+            },
+        )
+
+    def create_ci_freq_chan(
+        self,
+        task,
+        counter,
+        name_to_assign_to_channel,
+        min_val,
+        max_val,
+        units,
+        edge,
+        meas_method,
+        meas_time,
+        divisor,
+        custom_scale_name,
+    ):
+        """Creates a simulated counter frequency input channel."""
+        self._create_channels(
+            task,
+            counter,
+            name_to_assign_to_channel,
+            ChannelType.COUNTER_INPUT,
+            {
+                _CHAN_CI_MEAS_TYPE: UsageTypeCI.FREQUENCY.value,
+                _CHAN_CI_MIN: min_val,
+                _CHAN_CI_MAX: max_val,
+            },
+        )
+
+    # Timing
+
+    def cfg_samp_clk_timing(self, task, rate, source, active_edge, sample_mode, samps_per_chan):
+        """Configures the sample clock timing of a simulated task."""
+        simulated_task = _get_task(task)
+        if rate <= 0:
+            raise DaqError(
+                "Sample clock rate must be greater than 0.",
+                DAQmxErrors.INVALID_ATTRIBUTE_VALUE,
+                task_name=simulated_task.name,
+            )
+        simulated_task.set_attribute(_TIMING_SAMP_TIMING_TYPE, SampleTimingType.SAMPLE_CLOCK.value)
+        simulated_task.set_attribute(_TIMING_SAMP_CLK_RATE, float(rate))
+        simulated_task.set_attribute(_TIMING_SAMP_QUANT_SAMP_MODE, sample_mode)
+        simulated_task.set_attribute(_TIMING_SAMP_QUANT_SAMP_PER_CHAN, samps_per_chan)
+
+    # Reads
+
+    def _read(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+        read_array: numpy.typing.NDArray,
+        convert: Callable[[_SimulatedChannel, numpy.typing.NDArray[numpy.int64]], Any],
+    ) -> int:
+        channels, sample_indices, error = _get_task(task).read(num_samps_per_chan, timeout)
+        _copy_to_read_array(
+            read_array,
+            [convert(channel, sample_indices) for channel in channels],
+            num_samps_per_chan,
+            fill_mode,
+        )
+        if error is not None:
+            raise error
+        return sample_indices.size
+
+    def _read_scalar(self, task: object, timeout: float) -> Any:
+        channels, sample_indices, error = _get_task(task).read(1, timeout)
+        if error is not None:
+            raise error
+        return channels[0].generate(sample_indices)[0]
+
+    def read_analog_f64(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated analog samples."""
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _SimulatedChannel.generate
+        )
+        return read_array, samps_per_chan_read
+
+    def read_analog_scalar_f64(self, task, timeout):
+        """Reads a simulated analog sample."""
+        return float(self._read_scalar(task, timeout))
+
+    def read_binary_i16(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated unscaled analog samples as 16-bit integers."""
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _generate_unscaled
+        )
+        return read_array, samps_per_chan_read
+
+    def read_binary_i32(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated unscaled analog samples as 32-bit integers."""
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _generate_unscaled
+        )
+        return read_array, samps_per_chan_read
+
+    def read_raw(self, task, num_samps_per_chan, timeout, read_array):
+        """Reads simulated raw samples."""
+        # The raw samples are the 16-bit unscaled samples, interleaved by scan.
+        raw_array = read_array.reshape(-1).view(numpy.uint8)
+        raw_array = raw_array[: raw_array.size // 2 * 2].view(numpy.int16)
+        samps_per_chan_read = self._read(
+            task,
+            num_samps_per_chan,
+            timeout,
+            FillMode.GROUP_BY_SCAN_NUMBER.value,
+            raw_array,
+            _generate_unscaled,
+        )
+        return read_array, samps_per_chan_read, 2
+
+    def read_analog_f64_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.float64], int]]:
+        """Reads simulated analog samples into a stream buffer."""
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.float64)
+            yield self.read_analog_f64(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array
+            )
+
+    def read_binary_i16_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.int16], int]]:
+        """Reads simulated unscaled analog samples into a stream buffer."""
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.int16)
+            yield self.read_binary_i16(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array
+            )
+
+    def read_digital_lines(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated digital samples as line states."""
+        simulated_task = _get_task(task)
+        num_bytes_per_samp = simulated_task.get_attribute(_READ_DI_NUM_BOOLEANS_PER_CHAN)
+        samps_per_chan_read = self._read(
+            task,
+            num_samps_per_chan,
+            timeout,
+            fill_mode,
+            read_array,
+            lambda channel, sample_indices: channel.generate_lines(
+                sample_indices, num_bytes_per_samp
+            ),
+        )
+        return read_array, samps_per_chan_read, num_bytes_per_samp
+
+    def read_digital_scalar_u32(self, task, timeout):
+        """Reads a simulated digital sample."""
+        return int(self._read_scalar(task, timeout))
+
+    def read_digital_u8(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated digital samples as 8-bit integers."""
+        return self._read_digital_port(task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_digital_u16(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated digital samples as 16-bit integers."""
+        return self._read_digital_port(task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def read_digital_u32(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated digital samples as 32-bit integers."""
+        return self._read_digital_port(task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    def _read_digital_port(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _SimulatedChannel.generate
+        )
+        return read_array, samps_per_chan_read
+
+    def read_counter_f64(self, task, num_samps_per_chan, timeout, read_array):
+        """Reads simulated counter samples as floating-point values."""
+        return self.read_counter_f64_ex(
+            task, num_samps_per_chan, timeout, FillMode.GROUP_BY_CHANNEL.value, read_array
+        )
+
+    def read_counter_f64_ex(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated counter samples from one or more channels as floating-point values."""
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _SimulatedChannel.generate
+        )
+        return read_array, samps_per_chan_read
+
+    def read_counter_u32(self, task, num_samps_per_chan, timeout, read_array):
+        """Reads simulated counter samples as integers."""
+        return self.read_counter_u32_ex(
+            task, num_samps_per_chan, timeout, FillMode.GROUP_BY_CHANNEL.value, read_array
+        )
+
+    def read_counter_u32_ex(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Reads simulated counter samples from one or more channels as integers."""
+        samps_per_chan_read = self._read(
+            task, num_samps_per_chan, timeout, fill_mode, read_array, _SimulatedChannel.generate
+        )
+        return read_array, samps_per_chan_read
+
+    def read_counter_scalar_f64(self, task, timeout):
+        """Reads a simulated counter sample as a floating-point value."""
+        return float(self._read_scalar(task, timeout))
+
+    def read_counter_scalar_u32(self, task, timeout):
+        """Reads a simulated counter sample as an integer."""
+        return int(self._read_scalar(task, timeout))
+
+    # Waveform reads
+
+    def read_analog_waveform(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveform: AnalogWaveform[numpy.float64],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads simulated analog samples into a waveform."""
+        return self.read_analog_waveforms(
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            [waveform],
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_analog_waveforms(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveforms: Sequence[AnalogWaveform[numpy.float64]],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads simulated analog samples into waveforms."""
+        return self._read_waveforms(
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+            read_context,
+            lambda waveform, data: waveform.raw_data.__setitem__(slice(None), data),
+        )
+
+    def read_digital_waveform(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveform: DigitalWaveform[Any],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads simulated digital samples into a waveform."""
+        return self.read_digital_waveforms(
+            task_handle,
+            1,
+            number_of_samples_per_channel,
+            waveform.signal_count,
+            timeout,
+            [waveform],
+            waveform_attribute_mode,
+            read_context,
+        )
+
+    def read_digital_waveforms(
+        self,
+        task_handle: object,
+        channel_count: int,
+        number_of_samples_per_channel: int,
+        number_of_signals_per_sample: int,
+        timeout: float,
+        waveforms: Sequence[DigitalWaveform[Any]],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> int:
+        """Reads simulated digital samples into waveforms."""
+        return self._read_waveforms(
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+            read_context,
+            lambda waveform, data: waveform.data.__setitem__(slice(None), data),
+            number_of_signals_per_sample,
+        )
+
+    def read_new_digital_waveforms(
+        self,
+        task_handle: object,
+        channel_count: int,
+        number_of_samples_per_channel: int,
+        number_of_signals_per_sample: int,
+        timeout: float,
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
+    ) -> Sequence[DigitalWaveform[numpy.uint8]]:
+        """Reads simulated digital samples into new waveforms."""
+        waveforms = [
+            DigitalWaveform(number_of_samples_per_channel, number_of_signals_per_sample)
+            for _ in range(channel_count)
+        ]
+        self.read_digital_waveforms(
+            task_handle,
+            channel_count,
+            number_of_samples_per_channel,
+            number_of_signals_per_sample,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+            read_context,
+        )
+        return waveforms
+
+    def _read_waveforms(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        waveforms: Sequence[AnalogWaveform[Any] | DigitalWaveform[Any]],
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None,
+        copy_data: Callable[[Any, numpy.typing.NDArray], None],
+        number_of_signals_per_sample: int | None = None,
+    ) -> int:
+        simulated_task = _get_task(task_handle)
+        channels, sample_indices, error = simulated_task.read(
+            number_of_samples_per_channel, timeout
+        )
+        samples_read = sample_indices.size
+        for waveform, channel in zip(waveforms, channels):
+            waveform.sample_count = samples_read
+            if number_of_signals_per_sample is None:
+                copy_data(waveform, channel.generate(sample_indices))
+            else:
+                copy_data(
+                    waveform, channel.generate_lines(sample_indices, number_of_signals_per_sample)
+                )
+
+        if WaveformAttributeMode.TIMING in waveform_attribute_mode:
+            timing = _get_waveform_timing(
+                simulated_task, int(sample_indices[0]) if samples_read else 0
+            )
+            for waveform in waveforms:
+                waveform.timing = timing
+
+        if error is not None:
+            raise error
+
+        if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
+            if read_context is not None:
+                _update_extended_properties(
+                    read_context.get_properties_to_read(waveforms), channels
+                )
+                read_context.apply_extended_properties(waveforms)
+            else:
+                _update_extended_properties(
+                    [waveform.extended_properties for waveform in waveforms], channels
+                )
+        return samples_read
+
+    # Writes
+
+    def _write(
+        self, task: object, num_samps_per_chan: int, auto_start: bool, timeout: float
+    ) -> int:
+        return _get_task(task).write(num_samps_per_chan, auto_start, timeout)
+
+    def write_analog_f64(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Writes analog samples to a simulated task."""
+        return self._write(task, num_samps_per_chan, auto_start, timeout)
+
+    def write_analog_scalar_f64(self, task, auto_start, timeout, value):
+        """Writes an analog sample to a simulated task."""
+        self._write(task, 1, auto_start, timeout)
+
+    def write_digital_lines(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Writes digital line states to a simulated task."""
+        return self._write(task, num_samps_per_chan, auto_start, timeout)
+
+    def write_digital_scalar_u32(self, task, auto_start, timeout, value):
+        """Writes a digital sample to a simulated task."""
+        self._write(task, 1, auto_start, timeout)
+
+    def write_digital_u8(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Writes 8-bit digital samples to a simulated task."""
+        return self._write(task, num_samps_per_chan, auto_start, timeout)
+
+    def write_digital_u16(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Writes 16-bit digital samples to a simulated task."""
+        return self._write(task, num_samps_per_chan, auto_start, timeout)
+
+    def write_digital_u32(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Writes 32-bit digital samples to a simulated task."""
+        return self._write(task, num_samps_per_chan, auto_start, timeout)
+
+    def write_analog_waveform(
+        self,
+        task_handle: object,
+        waveform: AnalogWaveform[Any],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes an analog waveform to a simulated task."""
+        return self.write_analog_waveforms(task_handle, [waveform], auto_start, timeout)
+
+    def write_analog_waveforms(
+        self,
+        task_handle: object,
+        waveforms: Sequence[AnalogWaveform[Any]],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes analog waveforms to a simulated task."""
+        num_samps_per_chan = get_num_samps_per_chan(waveforms)
+        return self._write(task_handle, num_samps_per_chan, auto_start, timeout)
+
+    def write_digital_waveform(
+        self,
+        task_handle: object,
+        waveform: DigitalWaveform[Any],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes a digital waveform to a simulated task."""
+        return self.write_digital_waveforms(task_handle, [waveform], auto_start, timeout)
+
+    def write_digital_waveforms(
+        self,
+        task_handle: object,
+        waveform: Sequence[DigitalWaveform[Any]],
+        auto_start: bool,
+        timeout: float,
+    ) -> int:
+        """Writes digital waveforms to a simulated task."""
+        num_samps_per_chan = get_num_samps_per_chan(waveform)
+        return self._write(task_handle, num_samps_per_chan, auto_start, timeout)
+
+    # Events
+
+    def register_every_n_samples_event(
+        self,
+        task,
+        every_n_samples_event_type,
+        n_samples,
+        options,
+        callback_function,
+        callback_data,
+    ):
+        """Registers an every N samples event of a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        if every_n_samples_event_type in simulated_task.every_n_samples_events:
+            raise DaqError(
+                "Every N Samples event is already registered.",
+                DAQmxErrors.EVERY_N_SAMPS_ACQ_INTO_BUFFER_EVENT_ALREADY_REGISTERED,
+                task_name=simulated_task.name,
+            )
+        simulated_task.every_n_samples_events[every_n_samples_event_type] = (
+            n_samples,
+            callback_function,
+            callback_data,
+        )
+        return _SimulatedEventHandler(callback_function)
+
+    def unregister_every_n_samples_event(self, task, every_n_samples_event_type):
+        """Unregisters an every N samples event of a simulated task."""
+        _get_task(task).every_n_samples_events.pop(every_n_samples_event_type, None)
+
+    def register_done_event(self, task, options, callback_function, callback_data):
+        """Registers the done event of a simulated task."""
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        if simulated_task.done_event is not None:
+            raise DaqError(
+                "Done event is already registered.",
+                DAQmxErrors.DONE_EVENT_ALREADY_REGISTERED,
+                task_name=simulated_task.name,
+            )
+        simulated_task.done_event = (callback_function, callback_data)
+        return _SimulatedEventHandler(callback_function)
+
+    def unregister_done_event(self, task):
+        """Unregisters the done event of a simulated task."""
+        _get_task(task).done_event = None
+
+    # Attributes
+
+    def _get_task_attribute(self, task, attribute, size_hint=0):
+        return _get_task(task).get_attribute(attribute)
+
+    def _set_task_attribute(self, task, attribute, value):
+        _get_task(task).set_attribute(attribute, value)
+
+    def _reset_task_attribute(self, task, attribute):
+        _get_task(task).reset_attribute(attribute)
+
+    def _get_chan_attribute(self, task, channel, attribute):
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        values = set()
+        for simulated_channel in simulated_task.get_channels(channel):
+            if attribute not in simulated_channel.attributes:
+                raise _create_attribute_not_supported_error(attribute, simulated_task.name)
+            values.add(simulated_channel.attributes[attribute])
+        if len(values) != 1:
+            raise DaqError(
+                "The channels have different values for the requested attribute.",
+                (
+                    DAQmxErrors.PRPTY_GET_IMPLIED_ACTIVE_CHAN_FAILED_DUE_TO_DIFFT_VALS
+                    if not channel
+                    else DAQmxErrors.PRPTY_GET_SPECD_ACTIVE_CHAN_FAILED_DUE_TO_DIFFT_VALS
+                ),
+                task_name=simulated_task.name,
+            )
+        return values.pop()
+
+    def _set_chan_attribute(self, task, channel, attribute, value):
+        simulated_task = _get_task(task)
+        simulated_task.check_not_cleared()
+        for simulated_channel in simulated_task.get_channels(channel):
+            simulated_channel.attributes[attribute] = value
+
+    def _reset_chan_attribute(self, task, channel, attribute):
+        raise _create_attribute_not_supported_error(attribute, _get_task(task).name)
@@ -23,6 +23,9 @@ from nidaqmx.stream_readers._power_readers import (
     PowerMultiChannelReader,
     PowerSingleChannelReader,
 )
+from nidaqmx.stream_readers._prefetching_reader import PrefetchedBlock, PrefetchingReader
+from nidaqmx.stream_readers._raw_data_logger import RawDataLog, RawDataLogger
+from nidaqmx.stream_readers._ring_buffer_acquisition import RingBufferAcquisition
 
 __all__ = [
     "AnalogSingleChannelReader",
@@ -34,4 +37,9 @@ __all__ = [
     "PowerSingleChannelReader",
     "PowerMultiChannelReader",
     "PowerBinaryReader",
+    "PrefetchedBlock",
+    "PrefetchingReader",
+    "RawDataLog",
+    "RawDataLogger",
+    "RingBufferAcquisition",
 ]
@@ -101,6 +101,136 @@ class AnalogMultiChannelReader(ChannelReaderBase):
 
         return samps_per_chan_read
 
+    async def read_many_sample_async(
+        self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0
+    ):
+        """Reads floating-point samples from one or more analog input channels in a task.
+
+        This method is the asyncio counterpart of the "read_many_sample"
+        method. With a remote task whose gRPC session options specify a
+        grpc_aio_channel, it uses an asynchronous RPC. Otherwise, it
+        runs the read in the event loop's default executor. Do not
+        access the NumPy array until the returned coroutine completes.
+
+        This read method accepts a preallocated NumPy array to hold the
+        samples requested, which can be advantageous for performance and
+        interoperability with NumPy and SciPy.
+
+        Passing in a preallocated array is valuable in continuous
+        acquisition scenarios, where the same array can be used
+        repeatedly in each call to the method.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 2D NumPy
+                array of floating-point values to hold the samples
+                requested. The size of the array must be large enough to
+                hold all requested samples from all channels in the
+                task; otherwise, an error is thrown.
+
+                Each row corresponds to a channel in the task. Each
+                column corresponds to a sample from each channel. The
+                order of the channels in the array corresponds to the
+                order in which you add the channels to the task or to
+                the order of the channels you specify with the
+                "channels_to_read" property.
+
+                If the size of the array is too large or the array is
+                shaped incorrectly, the previous statement may not hold
+                true as the samples read may not be separated into rows
+                and columns properly. Set the "verify_array_shape"
+                property on this channel reader object to True to
+                validate that the NumPy array object is shaped properly.
+                Setting this property to True may marginally adversely
+                impact the performance of the method.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+
+                If you set this input to nidaqmx.constants.
+                READ_ALL_AVAILABLE, NI-DAQmx determines how many samples
+                to read based on if the task acquires samples
+                continuously or acquires a finite number of samples.
+
+                If the task acquires samples continuously and you set
+                this input to nidaqmx.constants.READ_ALL_AVAILABLE, this
+                method reads all the samples currently available in the
+                buffer.
+
+                If the task acquires a finite number of samples and you
+                set this input to nidaqmx.constants.READ_ALL_AVAILABLE,
+                the method waits for the task to acquire all requested
+                samples, then reads those samples. If you set the
+                "read_all_avail_samp" property to True, the method reads
+                the samples currently available in the buffer and does
+                not wait for the task to acquire all requested samples.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to read the requested samples and returns an error
+                if it is unable to.
+
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """
+        number_of_samples_per_channel = await self._prepare_read_async(
+            data, number_of_samples_per_channel, True, True
+        )
+
+        _, samps_per_chan_read = await self._interpreter.read_analog_f64_async(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            data,
+        )
+
+        return samps_per_chan_read
+
+    def read_many_sample_stream(self, number_of_samples_per_channel, timeout=10.0):
+        """Reads blocks of floating-point samples from one or more analog input channels in a task.
+
+        This read method is intended for continuous acquisition. It
+        returns an iterator that reads a block of samples each time you
+        advance it, until you close it or stop iterating. Each block is
+        a new NumPy array, so you can keep a reference to it.
+
+        With a remote task, the NI gRPC Device Server reads the blocks
+        and sends them over a single stream instead of performing one
+        request per read, so the read rate is not limited by the network
+        round-trip time. If your application processes the blocks more
+        slowly than the server reads them, gRPC flow control pauses the
+        server until your application catches up.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read in each block.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each block of samples to become
+                available. If the time elapses, the iterator raises an
+                error. The default timeout is 10 seconds. If you set
+                timeout to nidaqmx.constants.WAIT_INFINITELY, the method
+                waits indefinitely.
+
+        Returns:
+            collections.abc.Iterator[numpy.ndarray]:
+
+            An iterator of 2D NumPy arrays of floating-point values.
+            Each row corresponds to a channel in the task and each
+            column corresponds to a sample from each channel. Each array
+            contains the samples read into that block and may be read-
+            only.
+        """
+        return self._read_sample_blocks(
+            self._interpreter.read_analog_f64_stream, number_of_samples_per_channel, timeout, True
+        )
+
     def read_one_sample(self, data, timeout=10):
         """Reads a single floating-point sample from one or more analog input channels in a task.
 
@@ -232,4 +362,5 @@ class AnalogMultiChannelReader(ChannelReaderBase):
             timeout,
             waveforms,
             self._in_stream.waveform_attribute_mode,
+            self._get_waveform_read_context(),
         )
@@ -1,12 +1,49 @@
 from __future__ import annotations
 
+import numpy
+
+from nidaqmx._property_batch import get_properties
 from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
 from nidaqmx.stream_readers._channel_reader_base import ChannelReaderBase
 
 
 class AnalogUnscaledReader(ChannelReaderBase):
     """Reads unscaled samples from one or more analog input channels in an NI-DAQmx task."""
 
+    def __init__(self, task_in_stream):
+        """Initialize a new AnalogUnscaledReader.
+
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an NI-DAQmx task from which to read samples.
+        """
+        super().__init__(task_in_stream)
+        self._scaling_coefficients = None
+        self._scaling_configuration_generation = None
+        # The raw and intermediate arrays that the scaled read methods reuse between reads.
+        self._raw_buffers = {}
+        self._work_buffer = None
+
+    @property
+    def scaling_coefficients(self):
+        """numpy.ndarray: Indicates the coefficients that scale each channel's samples to volts.
+
+        Each row corresponds to a channel to read, and each column
+        corresponds to a term of the polynomial, starting with the
+        constant term. Rows are padded with zeros to the length of the
+        longest polynomial. These are the "ai_dev_scaling_coeff"
+        property of each channel, so they do not account for custom
+        scales or sensors.
+
+        The reader gets the coefficients once and caches them until you
+        add channels, change the "channels_to_read" property, or change
+        the task state with the "control" method. Use them to scale
+        unscaled samples that you store or send elsewhere.
+        """
+        return self._get_scaling_coefficients().copy()
+
     def read_int16(self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
         """Reads one or more unscaled 16-bit integer samples from one or more analog input channels in a task.
 
@@ -93,6 +130,44 @@ class AnalogUnscaledReader(ChannelReaderBase):
 
         return samps_per_chan_read
 
+    def read_int16_stream(self, number_of_samples_per_channel, timeout=10.0):
+        """Reads blocks of unscaled 16-bit integer samples from analog input channels in a task.
+
+        This read method is intended for continuous acquisition. It
+        returns an iterator that reads a block of samples each time you
+        advance it, until you close it or stop iterating. Each block is
+        a new NumPy array, so you can keep a reference to it.
+
+        With a remote task, the NI gRPC Device Server reads the blocks
+        and sends them over a single stream instead of performing one
+        request per read, so the read rate is not limited by the network
+        round-trip time. If your application processes the blocks more
+        slowly than the server reads them, gRPC flow control pauses the
+        server until your application catches up.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read in each block.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each block of samples to become
+                available. If the time elapses, the iterator raises an
+                error. The default timeout is 10 seconds. If you set
+                timeout to nidaqmx.constants.WAIT_INFINITELY, the method
+                waits indefinitely.
+
+        Returns:
+            collections.abc.Iterator[numpy.ndarray]:
+
+            An iterator of 2D NumPy arrays of unscaled 16-bit integer
+            values. Each row corresponds to a channel in the task and
+            each column corresponds to a sample from each channel. Each
+            array contains the samples read into that block and may be
+            read-only.
+        """
+        return self._read_sample_blocks(
+            self._interpreter.read_binary_i16_stream, number_of_samples_per_channel, timeout, True
+        )
+
     def read_int32(self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
         """Reads one or more unscaled 32-bit integer samples from one or more analog input channels in a task.
 
@@ -350,3 +425,179 @@ class AnalogUnscaledReader(ChannelReaderBase):
         )
 
         return samps_per_chan_read
+
+    def read_int16_scaled(
+        self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0
+    ):
+        """Reads unscaled 16-bit integer samples from analog input channels and scales them.
+
+        This read method transfers the samples from the device or the
+        NI gRPC Device Server as 16-bit integers, which is a quarter of
+        the size of 64-bit floating-point samples, and scales them on
+        the host with the "scaling_coefficients" of each channel. Use
+        it for high channel count or remote acquisitions, where the
+        size of the data limits the read rate.
+
+        The scaled samples are in volts, because the device scaling
+        coefficients do not account for custom scales or sensors. Use
+        the "read_many_sample" method of AnalogMultiChannelReader for
+        channels that use them.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 2D NumPy
+                array of 64-bit or 32-bit floating-point values to hold
+                the scaled samples requested. Each row corresponds to a
+                channel in the task. Each column corresponds to a sample
+                from each channel. If the read returns fewer samples
+                than requested, the remaining columns are not changed.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. If you set this input to
+                nidaqmx.constants.READ_ALL_AVAILABLE, NI-DAQmx
+                determines how many samples to read the same way as the
+                "read_int16" method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely.
+
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """
+        return self._read_scaled(
+            self._interpreter.read_binary_i16,
+            numpy.int16,
+            data,
+            number_of_samples_per_channel,
+            timeout,
+        )
+
+    def read_int32_scaled(
+        self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0
+    ):
+        """Reads unscaled 32-bit integer samples from analog input channels and scales them.
+
+        This read method is like the "read_int16_scaled" method, but
+        transfers the samples as 32-bit integers, for devices with a
+        resolution of more than 16 bits.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 2D NumPy
+                array of 64-bit or 32-bit floating-point values to hold
+                the scaled samples requested. Each row corresponds to a
+                channel in the task. Each column corresponds to a sample
+                from each channel. If the read returns fewer samples
+                than requested, the remaining columns are not changed.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. If you set this input to
+                nidaqmx.constants.READ_ALL_AVAILABLE, NI-DAQmx
+                determines how many samples to read the same way as the
+                "read_int32" method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely.
+
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """
+        return self._read_scaled(
+            self._interpreter.read_binary_i32,
+            numpy.int32,
+            data,
+            number_of_samples_per_channel,
+            timeout,
+        )
+
+    def _get_scaling_coefficients(self):
+        """Gets the scaling coefficients again if the task configuration changed."""
+        configuration_generation = self._task._configuration_generation
+        if (
+            self._scaling_coefficients is None
+            or self._scaling_configuration_generation != configuration_generation
+        ):
+            channels_to_read = self._in_stream.channels_to_read
+            coefficients = get_properties(
+                [(channel, "ai_dev_scaling_coeff") for channel in channels_to_read]
+            )
+            number_of_terms = max((len(c) for c in coefficients), default=1)
+            # Drop the highest terms if they are zero for every channel, so that scaling does
+            # fewer passes over the samples.
+            scaling_coefficients = numpy.zeros((len(coefficients), number_of_terms))
+            for row, channel_coefficients in zip(scaling_coefficients, coefficients):
+                row[: len(channel_coefficients)] = channel_coefficients
+            nonzero_terms = numpy.flatnonzero(scaling_coefficients.any(axis=0))
+            number_of_terms = int(nonzero_terms[-1]) + 1 if nonzero_terms.size else 1
+            self._scaling_coefficients = scaling_coefficients[:, :number_of_terms]
+            self._scaling_configuration_generation = configuration_generation
+        return self._scaling_coefficients
+
+    def _read_scaled(self, read_function, raw_dtype, data, number_of_samples_per_channel, timeout):
+        """Reads unscaled samples into a reused array and scales them into the data array."""
+        if data.dtype not in (numpy.float64, numpy.float32):
+            raise DaqError(
+                "Read cannot be performed because the NumPy array passed into this function "
+                "does not have a floating-point data type. You must pass in a NumPy array of "
+                "64-bit or 32-bit floating-point values.\n\n"
+                f"Data type of NumPy Array provided: {data.dtype}",
+                DAQmxErrors.UNKNOWN,
+                task_name=self._task.name,
+            )
+
+        number_of_samples_per_channel = self._task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+        self._verify_array(data, number_of_samples_per_channel, True, True)
+        coefficients = self._get_scaling_coefficients()
+
+        shape = (coefficients.shape[0], number_of_samples_per_channel)
+        raw_data = self._raw_buffers.get(raw_dtype)
+        if raw_data is None or raw_data.shape != shape:
+            raw_data = numpy.empty(shape, dtype=raw_dtype)
+            self._raw_buffers[raw_dtype] = raw_data
+
+        _, samps_per_chan_read = read_function(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            raw_data,
+        )
+
+        self._scale(raw_data[:, :samps_per_chan_read], coefficients, data[:, :samps_per_chan_read])
+        return samps_per_chan_read
+
+    def _scale(self, raw_data, coefficients, scaled_data):
+        """Evaluates the polynomial of each channel with Horner's method, in place."""
+        number_of_terms = coefficients.shape[1]
+        coefficients = coefficients.astype(scaled_data.dtype, copy=False)
+        if number_of_terms == 1:
+            scaled_data[...] = coefficients[:, :1]
+            return
+        if number_of_terms == 2:
+            numpy.multiply(raw_data, coefficients[:, 1:2], out=scaled_data)
+            scaled_data += coefficients[:, :1]
+            return
+
+        work = self._work_buffer
+        if work is None or work.shape != raw_data.shape or work.dtype != scaled_data.dtype:
+            work = numpy.empty(raw_data.shape, dtype=scaled_data.dtype)
+            self._work_buffer = work
+        numpy.copyto(work, raw_data)
+        scaled_data[...] = coefficients[:, -1:]
+        for term in range(number_of_terms - 2, -1, -1):
+            scaled_data *= work
+            scaled_data += coefficients[:, term : term + 1]
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import math
+
 from nidaqmx import DaqError
+from nidaqmx._waveform_read_context import WaveformReadContext
+from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode
 from nidaqmx.error_codes import DAQmxErrors
 
 
@@ -20,6 +25,7 @@ class ChannelReaderBase:
         self._interpreter = task_in_stream._task._interpreter
 
         self._verify_array_shape = True
+        self._waveform_read_context = WaveformReadContext()
 
     @property
     def verify_array_shape(self):
@@ -36,6 +42,74 @@ class ChannelReaderBase:
     def verify_array_shape(self, val):
         self._verify_array_shape = val
 
+    @property
+    def cache_extended_properties(self):
+        """bool: Specifies whether to cache waveform extended properties.
+
+        Defaults to False when this object is instantiated.
+
+        If you set this property to True, the waveform read methods
+        capture the extended properties, such as the channel name and
+        units, once per task configuration and copy them into the
+        waveforms returned by later reads. This improves the
+        performance of reading waveforms with
+        WaveformAttributeMode.EXTENDED_PROPERTIES, but the waveforms do
+        not reflect changes to channel properties until you add
+        channels, change the "channels_to_read" property, or change the
+        task state with the "control" method.
+        """
+        return self._waveform_read_context.cache_extended_properties
+
+    @cache_extended_properties.setter
+    def cache_extended_properties(self, val):
+        self._waveform_read_context.cache_extended_properties = val
+
+    def _get_waveform_read_context(self):
+        """Get the waveform read context, updated for the current task configuration."""
+        read_context = self._waveform_read_context
+        read_context.set_task_configuration_generation(self._task._configuration_generation)
+        return read_context
+
+    def _read_sample_blocks(
+        self, read_stream, number_of_samples_per_channel, timeout, is_many_chan
+    ):
+        """Start an interpreter read stream and reshape the blocks that it returns.
+
+        Args:
+            read_stream: Specifies the interpreter read stream method,
+                such as read_analog_f64_stream.
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel in each block.
+            timeout (float): Specifies the amount of time in seconds to
+                wait for each block.
+            is_many_chan (bool): Specifies if the read method is a many
+                channel version.
+        """
+        if number_of_samples_per_channel <= 0:
+            raise ValueError("number_of_samples_per_channel must be greater than 0.")
+
+        if is_many_chan:
+            shape: tuple[int, ...] = (self._in_stream.num_chans, number_of_samples_per_channel)
+        else:
+            shape = (number_of_samples_per_channel,)
+
+        blocks = read_stream(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            math.prod(shape),
+        )
+        return self._reshape_sample_blocks(blocks, shape)
+
+    @staticmethod
+    def _reshape_sample_blocks(blocks, shape):
+        try:
+            for read_array, samps_per_chan_read in blocks:
+                yield read_array.reshape(shape)[..., :samps_per_chan_read]
+        finally:
+            blocks.close()
+
     def _verify_array(self, data, number_of_samples_per_channel, is_many_chan, is_many_samp):
         """Verify the shape of a NumPy array.
 
@@ -81,6 +155,38 @@ class ChannelReaderBase:
                 task_name=self._task.name,
             )
 
+    async def _prepare_read_async(
+        self, data, number_of_samples_per_channel, is_many_chan, is_many_samp
+    ):
+        """Calculates the number of samples per channel to read and verifies the array shape.
+
+        Getting the number of available samples or the number of
+        channels queries the driver, so this method runs those queries
+        in the event loop's default executor instead of blocking the
+        event loop.
+
+        Args:
+            data (numpy.ndarray): Specifies the NumPy array to verify.
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel requested.
+            is_many_chan (bool): Specifies if the read method is a many
+                channel version.
+            is_many_samp (bool): Specifies if the read method is a many
+                samples version.
+        """
+        if number_of_samples_per_channel == READ_ALL_AVAILABLE or self._verify_array_shape:
+            return await asyncio.to_thread(
+                self._prepare_read, data, number_of_samples_per_channel, is_many_chan, is_many_samp
+            )
+        return self._task._calculate_num_samps_per_chan(number_of_samples_per_channel)
+
+    def _prepare_read(self, data, number_of_samples_per_channel, is_many_chan, is_many_samp):
+        number_of_samples_per_channel = self._task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+        self._verify_array(data, number_of_samples_per_channel, is_many_chan, is_many_samp)
+        return number_of_samples_per_channel
+
     def _verify_array_digital_lines(self, data, is_many_chan, is_many_line):
         """Verify the shape of a NumPy array of digital lines.
 
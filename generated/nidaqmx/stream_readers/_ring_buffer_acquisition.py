@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import numpy
+
+from nidaqmx.constants import FillMode
+from nidaqmx.stream_readers._analog_multi_channel_reader import AnalogMultiChannelReader
+from nidaqmx.stream_readers._analog_unscaled_reader import AnalogUnscaledReader
+from nidaqmx.types import AcquiredBlock
+
+
+class RingBufferAcquisition:
+    """Acquires blocks of samples into a ring buffer from an every N samples event.
+
+    This class registers an every N samples acquired into buffer event on the reader's task. Each
+    time the event occurs, the event callback reads the new samples directly into the next slot
+    of a preallocated ring buffer. Your application consumes the blocks from another thread by
+    calling "get", by iterating over this object, or by calling "get_latest_samples".
+
+    If your application consumes blocks more slowly than the device acquires them, the ring
+    buffer overwrites the oldest block that has not been consumed and increments
+    "overflow_count", so the event callback never blocks the driver.
+
+    Use this class as a context manager, and start the task inside the context:
+
+    >>> with RingBufferAcquisition(reader, 1000) as acquisition:
+    >>>     task.start()
+    >>>     for block in acquisition:
+    >>>         process(block.data)
+    """
+
+    def __init__(self, reader, samples_per_event, buffer_size_in_blocks=64, timeout=10.0):
+        """Initialize a new RingBufferAcquisition.
+
+        Args:
+            reader (Union[AnalogMultiChannelReader, AnalogUnscaledReader]):
+                Specifies the reader for the task to acquire samples
+                from. With an AnalogMultiChannelReader, the blocks
+                contain floating-point samples. With an
+                AnalogUnscaledReader, the blocks contain unscaled 16-bit
+                integer samples.
+            samples_per_event (int): Specifies the number of samples per
+                channel after which each event occurs. Each block
+                contains this number of samples per channel.
+            buffer_size_in_blocks (Optional[int]): Specifies the number
+                of blocks that the ring buffer holds.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the samples of each block to become
+                available.
+        """
+        if samples_per_event <= 0:
+            raise ValueError("samples_per_event must be greater than 0.")
+        if buffer_size_in_blocks <= 0:
+            raise ValueError("buffer_size_in_blocks must be greater than 0.")
+
+        if isinstance(reader, AnalogUnscaledReader):
+            dtype: type[numpy.generic] = numpy.int16
+            self._read_function = reader._interpreter.read_binary_i16
+        elif isinstance(reader, AnalogMultiChannelReader):
+            dtype = numpy.float64
+            self._read_function = reader._interpreter.read_analog_f64
+        else:
+            raise TypeError(
+                "reader must be an AnalogMultiChannelReader or an AnalogUnscaledReader, not "
+                f"{type(reader).__name__}."
+            )
+
+        self._task = reader._task
+        self._handle = reader._handle
+        self._samples_per_event = samples_per_event
+        self._timeout = timeout
+
+        number_of_channels = reader._in_stream.num_chans
+        self._blocks = numpy.zeros(
+            (buffer_size_in_blocks, number_of_channels, samples_per_event), dtype=dtype
+        )
+        self._first_sample_indices = [0] * buffer_size_in_blocks
+        self._timestamps: list[datetime | None] = [None] * buffer_size_in_blocks
+
+        self._condition = threading.Condition()
+        self._read_index = 0
+        self._block_count = 0
+        self._overflow_count = 0
+        self._total_samples_acquired = 0
+        self._error: Exception | None = None
+        self._registered = False
+        self._closed = False
+
+    def __enter__(self) -> RingBufferAcquisition:
+        """Register the event and return this object."""
+        self.register()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Unregister the event."""
+        self.close()
+
+    def __iter__(self) -> Iterator[AcquiredBlock]:
+        """Get blocks until the acquisition is closed and all blocks are consumed."""
+        while True:
+            block = self.get()
+            if block is None:
+                return
+            yield block
+
+    @property
+    def overflow_count(self) -> int:
+        """int: Indicates the number of blocks that were overwritten before they were consumed."""
+        with self._condition:
+            return self._overflow_count
+
+    @property
+    def total_samples_acquired(self) -> int:
+        """int: Indicates the number of samples per channel read into the ring buffer."""
+        with self._condition:
+            return self._total_samples_acquired
+
+    @property
+    def available_blocks(self) -> int:
+        """int: Indicates the number of blocks that have not been consumed."""
+        with self._condition:
+            return self._block_count
+
+    def register(self) -> None:
+        """Registers the every N samples acquired into buffer event on the task.
+
+        Call this method before you start the task.
+        """
+        self._task.register_every_n_samples_acquired_into_buffer_event(
+            self._samples_per_event, self._on_samples_acquired
+        )
+        with self._condition:
+            self._registered = True
+            self._closed = False
+
+    def close(self) -> None:
+        """Unregisters the event and wakes up consumers that are waiting for blocks.
+
+        Blocks that were not consumed remain available.
+        """
+        with self._condition:
+            registered = self._registered
+            self._registered = False
+            self._closed = True
+            self._condition.notify_all()
+        if registered:
+            self._task.register_every_n_samples_acquired_into_buffer_event(
+                self._samples_per_event, None
+            )
+
+    def get(self, timeout=None) -> AcquiredBlock | None:
+        """Removes the oldest block from the ring buffer and returns a copy of it.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for a block. If you set timeout
+                to None, the method waits indefinitely.
+
+        Returns:
+            Optional[nidaqmx.types.AcquiredBlock]:
+
+            The oldest block, or None if the acquisition is closed and
+            all blocks are consumed.
+
+        Raises:
+            TimeoutError: No block became available within the timeout.
+            nidaqmx.DaqError: Reading a block failed in the event
+                callback.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._block_count > 0 or self._closed or self._error is not None,
+                timeout,
+            ):
+                raise TimeoutError("No block of samples became available within the timeout.")
+            if self._error is not None:
+                error = self._error
+                self._error = None
+                raise error
+            if self._block_count == 0:
+                return None
+            index = self._read_index
+            block = AcquiredBlock(
+                self._blocks[index].copy(),
+                self._first_sample_indices[index],
+                self._timestamps[index],
+            )
+            self._read_index = (index + 1) % len(self._blocks)
+            self._block_count -= 1
+            return block
+
+    def get_latest_samples(self, number_of_samples_per_channel):
+        """Returns a copy of the most recently acquired samples without consuming any blocks.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to return. This number cannot
+                exceed the capacity of the ring buffer minus one block,
+                which is reserved for the block that is being read.
+
+        Returns:
+            numpy.ndarray:
+
+            A 2D NumPy array with a row for each channel. If fewer
+            samples were acquired, the array contains all samples that
+            are still in the ring buffer.
+        """
+        buffer_size_in_blocks = len(self._blocks)
+        max_block_count = buffer_size_in_blocks - 1
+        if number_of_samples_per_channel > max_block_count * self._samples_per_event:
+            raise ValueError("number_of_samples_per_channel exceeds the ring buffer capacity.")
+        with self._condition:
+            # Each block is full, so the next block to read goes into slot total_blocks modulo
+            # the buffer size, and the latest blocks precede it.
+            total_blocks = self._total_samples_acquired // self._samples_per_event
+            block_count = min(
+                (number_of_samples_per_channel + self._samples_per_event - 1)
+                // self._samples_per_event,
+                total_blocks,
+                max_block_count,
+            )
+            end = total_blocks % buffer_size_in_blocks
+            indices = [(end - block_count + i) % buffer_size_in_blocks for i in range(block_count)]
+            samples = numpy.concatenate(
+                [self._blocks[index] for index in indices] or [self._blocks[0, :, :0]], axis=1
+            )
+        return samples[:, samples.shape[1] - min(number_of_samples_per_channel, samples.shape[1]) :]
+
+    def _on_samples_acquired(
+        self, task_handle, every_n_samples_event_type, number_of_samples, callback_data
+    ):
+        buffer_size_in_blocks = len(self._blocks)
+        with self._condition:
+            if self._closed:
+                return 0
+            index = (self._read_index + self._block_count) % buffer_size_in_blocks
+            if self._block_count == buffer_size_in_blocks:
+                # Overwrite the oldest block. The consumer copies blocks while holding the lock,
+                # so it is not reading this block.
+                self._read_index = (self._read_index + 1) % buffer_size_in_blocks
+                self._block_count -= 1
+                self._overflow_count += 1
+            first_sample_index = self._total_samples_acquired
+
+        try:
+            _, samps_per_chan_read = self._read_function(
+                self._handle,
+                self._samples_per_event,
+                self._timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                self._blocks[index],
+            )
+        except Exception as error:
+            with self._condition:
+                self._error = error
+                self._condition.notify_all()
+            return 0
+        timestamp = datetime.now(timezone.utc)
+
+        with self._condition:
+            self._first_sample_indices[index] = first_sample_index
+            self._timestamps[index] = timestamp
+            self._total_samples_acquired += samps_per_chan_read
+            self._block_count += 1
+            self._condition.notify()
+        return 0
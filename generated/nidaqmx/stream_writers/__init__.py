@@ -21,6 +21,7 @@ from nidaqmx.stream_writers._digital_multi_channel_writer import (
 from nidaqmx.stream_writers._digital_single_channel_writer import (
     DigitalSingleChannelWriter,
 )
+from nidaqmx.stream_writers._output_streamer import OutputStreamer
 
 __all__ = [
     "AnalogSingleChannelWriter",
@@ -29,6 +30,7 @@ __all__ = [
     "CounterWriter",
     "DigitalSingleChannelWriter",
     "DigitalMultiChannelWriter",
+    "OutputStreamer",
     "UnsetAutoStartSentinel",
     "AUTO_START_UNSET",
 ]
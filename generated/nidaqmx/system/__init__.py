@@ -1,6 +1,7 @@
 """NI-DAQmx system classes."""
 
 from nidaqmx.system import storage
+from nidaqmx.system._system_snapshot import SystemSnapshot
 from nidaqmx.system.device import Device
 from nidaqmx.system.physical_channel import PhysicalChannel
 from nidaqmx.system.system import (
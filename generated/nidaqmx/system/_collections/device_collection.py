@@ -3,7 +3,7 @@ from collections.abc import Sequence
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import DaqError
 from nidaqmx.system.device import Device, _DeviceAlternateConstructor
-from nidaqmx.utils import unflatten_channel_string
+from nidaqmx.utils import _parse_channel_string, unflatten_channel_string
 
 
 class DeviceCollection(Sequence):
@@ -19,7 +19,7 @@ class DeviceCollection(Sequence):
     def __contains__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         self, item
     ):
-        device_names = self.device_names
+        device_names = self._get_device_names()
 
         if isinstance(item, str):
             items = unflatten_channel_string(item)
@@ -54,7 +54,7 @@ class DeviceCollection(Sequence):
             Indicates the subset of devices indexed.
         """
         if isinstance(index, int):
-            return _DeviceAlternateConstructor(self.device_names[index], self._interpreter)
+            return _DeviceAlternateConstructor(self._get_device_names()[index], self._interpreter)
         elif isinstance(index, slice):
             return [
                 _DeviceAlternateConstructor(name, self._interpreter)
@@ -76,7 +76,7 @@ class DeviceCollection(Sequence):
             yield _DeviceAlternateConstructor(device_name, self._interpreter)
 
     def __len__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
-        return len(self.device_names)
+        return len(self._get_device_names())
 
     def __ne__(self, other):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         return not self.__eq__(other)
@@ -88,8 +88,12 @@ class DeviceCollection(Sequence):
         for device_name in device_names:
             yield _DeviceAlternateConstructor(device_name, self._interpreter)
 
+    def _get_device_names(self):
+        """Gets the parsed device names, which support len(), indexing, and `in` without a list."""
+        val = self._interpreter.get_system_info_attribute_string(0x193B)
+        return _parse_channel_string(val)
+
     @property
     def device_names(self):
         """List[str]: Indicates the names of all devices on this device collection."""
-        val = self._interpreter.get_system_info_attribute_string(0x193B)
-        return unflatten_channel_string(val)
+        return list(self._get_device_names().names)
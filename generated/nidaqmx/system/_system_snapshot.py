@@ -0,0 +1,277 @@
+"""Captures an inventory of the devices and physical channels in a DAQmx system."""
+
+from __future__ import annotations
+
+import time
+import types
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from nidaqmx._property_batch import get_properties
+from nidaqmx.constants import ProductCategory
+from nidaqmx.errors import DaqError
+from nidaqmx.system.device import _DeviceAlternateConstructor
+from nidaqmx.types import DeviceSnapshot
+from nidaqmx.utils import unflatten_channel_string
+
+# DAQmx_Sys_DevNames
+_SYS_DEV_NAMES = 0x193B
+
+_COMMON_FIELDS = (
+    "product_type",
+    "product_category",
+    "product_num",
+    "serial_num",
+    "is_simulated",
+    "bus_type",
+)
+# Each of these device properties is a physical channel collection, so the snapshot gets the
+# channel_names property of the collection.
+_PHYSICAL_CHANNEL_FIELDS = (
+    "ai_physical_chans",
+    "ao_physical_chans",
+    "ci_physical_chans",
+    "co_physical_chans",
+    "di_lines",
+    "di_ports",
+    "do_lines",
+    "do_ports",
+)
+_AI_FIELDS = (
+    "ai_max_single_chan_rate",
+    "ai_max_multi_chan_rate",
+    "ai_min_rate",
+    "ai_simultaneous_sampling_supported",
+    "ai_meas_types",
+    "ai_voltage_rngs",
+)
+_AO_FIELDS = ("ao_max_rate", "ao_min_rate", "ao_voltage_rngs")
+_CHASSIS_FIELDS = ("chassis_module_devices",)
+_MODULE_FIELDS = ("compact_daq_chassis_device", "compact_daq_slot_num")
+
+_CHASSIS_CATEGORIES = frozenset(
+    (
+        ProductCategory.COMPACT_DAQ_CHASSIS,
+        ProductCategory.COMPACT_RIO_CHASSIS,
+        ProductCategory.TEST_SCALE_CHASSIS,
+    )
+)
+_MODULE_CATEGORIES = frozenset((ProductCategory.C_SERIES_MODULE, ProductCategory.TEST_SCALE_MODULE))
+
+
+class SystemSnapshot:
+    """Represents an inventory of the devices in a DAQmx system at one point in time.
+
+    Use :meth:`nidaqmx.system.System.snapshot` to capture a snapshot. A snapshot captures the
+    static capabilities of every device, such as its product type, its physical channels, and its
+    supported rates and ranges, with a few batches of NI-DAQmx calls, so enumerating a large
+    system does not make one call per property. The snapshot does not change after it is
+    captured. Use :meth:`has_changed` to check if devices were added or removed since then.
+
+    A DeviceSnapshot field is None if the device does not support the property, such as the AI
+    rates of a device without analog input channels.
+    """
+
+    __slots__ = (
+        "_interpreter",
+        "_devices",
+        "_device_names",
+        "_device_names_hash",
+        "_physical_channels",
+        "_timestamp",
+    )
+
+    def __init__(self, interpreter, devices: Sequence[DeviceSnapshot]) -> None:
+        """Do not construct this object directly; instead, call System.local().snapshot()."""
+        self._interpreter = interpreter
+        self._devices = types.MappingProxyType({device.name: device for device in devices})
+        self._device_names = tuple(device.name for device in devices)
+        self._device_names_hash = hash(self._device_names)
+        self._physical_channels = types.MappingProxyType(
+            {
+                channel_name: device
+                for device in devices
+                for field in _PHYSICAL_CHANNEL_FIELDS
+                for channel_name in getattr(device, field)
+            }
+        )
+        self._timestamp = time.monotonic()
+
+    def __repr__(self) -> str:
+        """Return a string that describes the snapshot."""
+        return f"SystemSnapshot(devices={len(self._devices)})"
+
+    @property
+    def age(self) -> float:
+        """float: Indicates the time in seconds since the snapshot was captured."""
+        return time.monotonic() - self._timestamp
+
+    @property
+    def device_names(self) -> tuple[str, ...]:
+        """Tuple[str]: Indicates the names of the devices in the snapshot."""
+        return self._device_names
+
+    @property
+    def device_names_hash(self) -> int:
+        """int: Indicates the hash of the device names in the snapshot.
+
+        Compare it with the hash of another snapshot to check if the devices differ.
+        """
+        return self._device_names_hash
+
+    @property
+    def devices(self) -> Mapping[str, DeviceSnapshot]:
+        """Mapping[str, nidaqmx.types.DeviceSnapshot]: Indicates the devices by name."""
+        return self._devices
+
+    @property
+    def physical_channels(self) -> Mapping[str, DeviceSnapshot]:
+        """Mapping[str, nidaqmx.types.DeviceSnapshot]: Indicates the device of each channel.
+
+        The keys are the names of the physical channels, lines, and ports of the devices.
+        """
+        return self._physical_channels
+
+    def get_modules(self, chassis_name: str) -> list[DeviceSnapshot]:
+        """Gets the modules in a chassis.
+
+        Args:
+            chassis_name (str): Specifies the name of the chassis.
+
+        Returns:
+            List[nidaqmx.types.DeviceSnapshot]:
+
+            Indicates the modules in the chassis that are in the snapshot.
+        """
+        chassis = self._devices.get(chassis_name)
+        if chassis is None or not chassis.chassis_module_devices:
+            return []
+        return [
+            self._devices[name] for name in chassis.chassis_module_devices if name in self._devices
+        ]
+
+    def has_changed(self) -> bool:
+        """Checks if devices were added to or removed from the system since the snapshot.
+
+        This makes one NI-DAQmx call to get the device names. It does not detect changes that
+        keep the device names, such as replacing a module with another module of the same name.
+
+        Returns:
+            bool:
+
+            Indicates if the device names differ from the device names in the snapshot.
+        """
+        return hash(tuple(_get_device_names(self._interpreter))) != self._device_names_hash
+
+    @staticmethod
+    def _capture(interpreter) -> SystemSnapshot:
+        """Captures a snapshot of the devices in the system."""
+        devices = [
+            _DeviceAlternateConstructor(name, interpreter)
+            for name in _get_device_names(interpreter)
+        ]
+
+        # The first pass gets the properties that every device supports. The second pass gets the
+        # properties that apply to the device, based on its category and physical channels.
+        first_fields = _COMMON_FIELDS + _PHYSICAL_CHANNEL_FIELDS
+        first_values = _get_values(
+            [[_get_target(device, field) for field in first_fields] for device in devices]
+        )
+        values_by_device = [dict(zip(first_fields, values)) for values in first_values]
+
+        second_fields_by_device = [_get_second_fields(values) for values in values_by_device]
+        second_values = _get_values(
+            [
+                [_get_target(device, field) for field in fields]
+                for device, fields in zip(devices, second_fields_by_device)
+            ]
+        )
+        for values, fields, device_values in zip(
+            values_by_device, second_fields_by_device, second_values
+        ):
+            values.update(zip(fields, device_values))
+
+        return SystemSnapshot(
+            interpreter,
+            [
+                _create_device_snapshot(device.name, values)
+                for device, values in zip(devices, values_by_device)
+            ],
+        )
+
+
+def _get_device_names(interpreter) -> list[str]:
+    return unflatten_channel_string(interpreter.get_system_info_attribute_string(_SYS_DEV_NAMES))
+
+
+def _get_target(device, field: str) -> tuple[object, str]:
+    if field in _PHYSICAL_CHANNEL_FIELDS:
+        return getattr(device, field), "channel_names"
+    return device, field
+
+
+def _get_second_fields(values: dict[str, Any]) -> tuple[str, ...]:
+    fields: tuple[str, ...] = ()
+    if values["ai_physical_chans"]:
+        fields += _AI_FIELDS
+    if values["ao_physical_chans"]:
+        fields += _AO_FIELDS
+    if values["product_category"] in _CHASSIS_CATEGORIES:
+        fields += _CHASSIS_FIELDS
+    if values["product_category"] in _MODULE_CATEGORIES:
+        fields += _MODULE_FIELDS
+    return fields
+
+
+def _get_values(properties_by_device: list[list[tuple[object, str]]]) -> list[list[Any]]:
+    """Gets the properties of the devices, with None for the properties that fail.
+
+    This gets all of the properties with one batch. If the batch fails, it gets the properties of
+    each device with one batch, and if that fails, it gets them one at a time.
+    """
+    try:
+        values = get_properties(
+            [target for properties in properties_by_device for target in properties]
+        )
+    except DaqError:
+        return [_get_device_values(properties) for properties in properties_by_device]
+
+    values_by_device = []
+    start = 0
+    for properties in properties_by_device:
+        values_by_device.append(values[start : start + len(properties)])
+        start += len(properties)
+    return values_by_device
+
+
+def _get_device_values(properties: list[tuple[object, str]]) -> list[Any]:
+    try:
+        return get_properties(properties)
+    except DaqError:
+        pass
+
+    values = []
+    for obj, name in properties:
+        try:
+            values.append(getattr(obj, name))
+        except DaqError:
+            values.append(None)
+    return values
+
+
+def _create_device_snapshot(name: str, values: dict[str, Any]) -> DeviceSnapshot:
+    fields: dict[str, Any] = dict.fromkeys(DeviceSnapshot._fields)
+    fields.update(values)
+    fields["name"] = name
+    for field in _PHYSICAL_CHANNEL_FIELDS:
+        fields[field] = tuple(fields[field] or ())
+    for field in ("ai_meas_types", "ai_voltage_rngs", "ao_voltage_rngs"):
+        if fields[field] is not None:
+            fields[field] = tuple(fields[field])
+    if fields["chassis_module_devices"] is not None:
+        fields["chassis_module_devices"] = tuple(
+            module.name for module in fields["chassis_module_devices"]
+        )
+    if fields["compact_daq_chassis_device"] is not None:
+        fields["compact_daq_chassis_device"] = fields["compact_daq_chassis_device"].name
+    return DeviceSnapshot(**fields)
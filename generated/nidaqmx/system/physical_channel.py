@@ -90,7 +90,9 @@ class PhysicalChannel:
     def ai_power_control_enable(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxSetPhysicalChanAIPowerControlEnable
         if c_func.argtypes is None:
@@ -100,13 +102,15 @@ class PhysicalChannel:
                         ctypes_byte_str, c_bool32]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @ai_power_control_enable.deleter
     def ai_power_control_enable(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxResetPhysicalChanAIPowerControlEnable
         if c_func.argtypes is None:
@@ -116,7 +120,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def ai_power_control_type(self):
@@ -132,7 +136,9 @@ class PhysicalChannel:
     def ai_power_control_type(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         val = val.value
         c_func = lib_importer.windll.DAQmxSetPhysicalChanAIPowerControlType
@@ -143,13 +149,15 @@ class PhysicalChannel:
                         ctypes_byte_str, ctypes.c_int]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @ai_power_control_type.deleter
     def ai_power_control_type(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxResetPhysicalChanAIPowerControlType
         if c_func.argtypes is None:
@@ -159,7 +167,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def ai_power_control_voltage(self):
@@ -175,7 +183,9 @@ class PhysicalChannel:
     def ai_power_control_voltage(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = (lib_importer.windll.
                  DAQmxSetPhysicalChanAIPowerControlVoltage)
@@ -186,13 +196,15 @@ class PhysicalChannel:
                         ctypes_byte_str, ctypes.c_double]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @ai_power_control_voltage.deleter
     def ai_power_control_voltage(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = (lib_importer.windll.
                  DAQmxResetPhysicalChanAIPowerControlVoltage)
@@ -203,7 +215,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def ai_sensor_power_open_chan(self):
@@ -285,7 +297,9 @@ class PhysicalChannel:
     def ao_manual_control_enable(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = (lib_importer.windll.
                  DAQmxSetPhysicalChanAOManualControlEnable)
@@ -296,13 +310,15 @@ class PhysicalChannel:
                         ctypes_byte_str, c_bool32]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @ao_manual_control_enable.deleter
     def ao_manual_control_enable(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = (lib_importer.windll.
                  DAQmxResetPhysicalChanAOManualControlEnable)
@@ -313,7 +329,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def ao_manual_control_freq(self):
@@ -360,7 +376,9 @@ class PhysicalChannel:
     def ao_power_amp_channel_enable(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxSetAOPowerAmpChannelEnable
         if c_func.argtypes is None:
@@ -370,13 +388,15 @@ class PhysicalChannel:
                         ctypes_byte_str, c_bool32]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @ao_power_amp_channel_enable.deleter
     def ao_power_amp_channel_enable(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxResetAOPowerAmpChannelEnable
         if c_func.argtypes is None:
@@ -386,7 +406,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def ao_power_amp_gain(self):
@@ -527,7 +547,9 @@ class PhysicalChannel:
     def dig_port_logic_family(self, val):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         val = val.value
         c_func = lib_importer.windll.DAQmxSetPhysicalChanDigPortLogicFamily
@@ -538,13 +560,15 @@ class PhysicalChannel:
                         ctypes_byte_str, ctypes.c_int]
         error_code = c_func(
             self._name, val)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @dig_port_logic_family.deleter
     def dig_port_logic_family(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
         c_func = lib_importer.windll.DAQmxResetPhysicalChanDigPortLogicFamily
         if c_func.argtypes is None:
@@ -554,7 +578,7 @@ class PhysicalChannel:
                         ctypes_byte_str]
         error_code = c_func(
             self._name)
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 
     @property
     def do_port_width(self):
@@ -16,6 +16,7 @@ from nidaqmx.system._collections.persisted_scale_collection import (
     PersistedScaleCollection)
 from nidaqmx.system._collections.persisted_task_collection import (
     PersistedTaskCollection)
+from nidaqmx.system._system_snapshot import SystemSnapshot
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 from nidaqmx.constants import (
     AOPowerUpOutputBehavior, LogicFamily, PowerUpChannelType, PowerUpStates, ResistorState,
@@ -40,7 +41,7 @@ class System:
     operations on DAQ hardware, and creates classes from which you can get
     information about the hardware.
     """
-    __slots__ = ('_interpreter')
+    __slots__ = ('_interpreter', '_snapshot')
 
     def __init__(self, grpc_options=None):
         """
@@ -49,6 +50,7 @@ class System:
                 the gRPC session options.
         """
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._snapshot = None
 
     @staticmethod
     def local():
@@ -218,6 +220,42 @@ class System:
         self._interpreter.tristate_output_term(
             output_terminal)
 
+    # region Snapshot Functions
+
+    def snapshot(self, max_age=None, refresh=False):
+        """
+        Gets an inventory of the devices in this DAQmx system and of
+        their physical channels and static capabilities.
+
+        The first call captures the snapshot with a few batches of
+        NI-DAQmx calls, and this object caches it. Later calls return
+        the cached snapshot until it expires or you refresh it. Use
+        **has_changed** on the snapshot to check if devices were added
+        or removed since it was captured.
+
+        Args:
+            max_age (Optional[float]): Specifies the maximum age in
+                seconds of the cached snapshot. If the cached snapshot
+                is older, this method captures a new snapshot. If you
+                do not specify a value, the cached snapshot does not
+                expire.
+            refresh (Optional[bool]): Specifies whether to capture a
+                new snapshot even if the cached snapshot has not
+                expired.
+        Returns:
+            nidaqmx.system.SystemSnapshot:
+
+            Indicates the inventory of the devices in the system.
+        """
+        snapshot = self._snapshot
+        if (refresh or snapshot is None or
+                (max_age is not None and snapshot.age > max_age)):
+            snapshot = SystemSnapshot._capture(self._interpreter)
+            self._snapshot = snapshot
+        return snapshot
+
+    # endregion
+
     # region Power Up States Functions
 
     def set_digital_power_up_states(
@@ -171,10 +171,12 @@ class InStream:
     def channels_to_read(self, val):
         val = val.name
         self._interpreter.set_read_attribute_string(self._handle, 0x1823, val)
+        self._task._invalidate_read_plan()
 
     @channels_to_read.deleter
     def channels_to_read(self):
         self._interpreter.reset_read_attribute(self._handle, 0x1823)
+        self._task._invalidate_read_plan()
 
     @property
     def common_mode_range_error_chans(self):
@@ -26,11 +26,11 @@ class AIChannelCollection(ChannelCollection):
     """
     Contains the collection of analog input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ai_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -67,6 +67,7 @@ class AIChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = physical_channel
 
+        self._channels_changed()
         return AIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ai_accel_4_wire_dc_voltage_chan(
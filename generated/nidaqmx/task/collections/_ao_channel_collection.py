@@ -12,11 +12,11 @@ class AOChannelCollection(ChannelCollection):
     """
     Contains the collection of analog output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ao_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -53,6 +53,7 @@ class AOChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = physical_channel
 
+        self._channels_changed()
         return AOChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ao_current_chan(
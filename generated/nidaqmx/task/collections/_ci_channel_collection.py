@@ -14,11 +14,11 @@ class CIChannelCollection(ChannelCollection):
     """
     Contains the collection of counter input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ci_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -55,6 +55,7 @@ class CIChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = counter
 
+        self._channels_changed()
         return CIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ci_ang_encoder_chan(
@@ -12,11 +12,11 @@ class COChannelCollection(ChannelCollection):
     """
     Contains the collection of counter output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.co_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -53,6 +53,7 @@ class COChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = counter
 
+        self._channels_changed()
         return COChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_co_pulse_chan_freq(
@@ -12,11 +12,11 @@ class DIChannelCollection(ChannelCollection):
     """
     Contains the collection of digital input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.di_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -65,6 +65,7 @@ class DIChannelCollection(ChannelCollection):
                 else:
                     virtual_channel_name = lines
 
+        self._channels_changed()
         return DIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_di_chan(
@@ -3,6 +3,8 @@
 import collections
 import typing
 
+import numpy
+
 # region Task Counter IO named tuples
 
 CtrFreq = collections.namedtuple("CtrFreq", ["freq", "duty_cycle"])
@@ -13,10 +15,26 @@ CtrTime = collections.namedtuple("CtrTime", ["high_time", "low_time"])
 
 # endregion
 
+# region Task Counter IO structured array data types
+
+CTR_FREQ_DTYPE = numpy.dtype([("freq", numpy.float64), ("duty_cycle", numpy.float64)])
+"""The NumPy structured data type of counter frequency samples, with the fields of CtrFreq."""
+
+CTR_TICK_DTYPE = numpy.dtype([("high_tick", numpy.uint32), ("low_tick", numpy.uint32)])
+"""The NumPy structured data type of counter tick samples, with the fields of CtrTick."""
+
+CTR_TIME_DTYPE = numpy.dtype([("high_time", numpy.float64), ("low_time", numpy.float64)])
+"""The NumPy structured data type of counter time samples, with the fields of CtrTime."""
+
+# endregion
+
 # region Power IO named tuples
 
 PowerMeasurement = collections.namedtuple("PowerMeasurement", ["voltage", "current"])
 
+POWER_MEASUREMENT_DTYPE = numpy.dtype([("voltage", numpy.float64), ("current", numpy.float64)])
+"""The NumPy structured data type of power samples, with the fields of PowerMeasurement."""
+
 # endregion
 
 # region Watchdog named tuples
@@ -49,6 +67,51 @@ DOResistorPowerUpState = collections.namedtuple(
 
 # endregion
 
+# region Stream reader named tuples
+
+AcquiredBlock = collections.namedtuple("AcquiredBlock", ["data", "first_sample_index", "timestamp"])
+
+PrefetchStatistics = collections.namedtuple(
+    "PrefetchStatistics",
+    [
+        "blocks_read",
+        "samples_read",
+        "overrun_count",
+        "underrun_count",
+        "max_ready_blocks",
+        "reader_wait_time",
+        "consumer_wait_time",
+    ],
+)
+
+# endregion
+
+# region Stream writer named tuples
+
+OutputStreamStatistics = collections.namedtuple(
+    "OutputStreamStatistics",
+    ["blocks_written", "samples_written", "min_lead", "lead_wait_time"],
+)
+
+# endregion
+
+# region Single point loop named tuples
+
+SinglePointLoopStatistics = collections.namedtuple(
+    "SinglePointLoopStatistics",
+    [
+        "cycle_count",
+        "late_cycle_count",
+        "mean_period",
+        "min_period",
+        "max_period",
+        "period_jitter",
+        "max_cycle_time",
+    ],
+)
+
+# endregion
+
 # region System named tuples
 
 CDAQSyncConnection = collections.namedtuple("CDAQSyncConnection", ["output_port", "input_port"])
@@ -57,6 +120,39 @@ DriverVersion = collections.namedtuple(
     "DriverVersion", ["major_version", "minor_version", "update_version"]
 )
 
+DeviceSnapshot = collections.namedtuple(
+    "DeviceSnapshot",
+    [
+        "name",
+        "product_type",
+        "product_category",
+        "product_num",
+        "serial_num",
+        "is_simulated",
+        "bus_type",
+        "chassis_module_devices",
+        "compact_daq_chassis_device",
+        "compact_daq_slot_num",
+        "ai_physical_chans",
+        "ao_physical_chans",
+        "ci_physical_chans",
+        "co_physical_chans",
+        "di_lines",
+        "di_ports",
+        "do_lines",
+        "do_ports",
+        "ai_max_single_chan_rate",
+        "ai_max_multi_chan_rate",
+        "ai_min_rate",
+        "ai_simultaneous_sampling_supported",
+        "ai_meas_types",
+        "ai_voltage_rngs",
+        "ao_max_rate",
+        "ao_min_rate",
+        "ao_voltage_rngs",
+    ],
+)
+
 # endregion
 
 # region ID Pin named tuples
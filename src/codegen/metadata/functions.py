@@ -24255,25 +24255,46 @@ functions = {
     },
     'WaitForNextSampleClock': {
         'calling_convention': 'StdCall',
+        'handle_parameter': {
+            'ctypes_data_type': 'lib_importer.task_handle',
+            'cvi_name': 'taskHandle',
+            'python_accessor': 'self._handle'
+        },
         'parameters': [
             {
+                'ctypes_data_type': 'ctypes.TaskHandle',
                 'direction': 'in',
+                'is_optional_in_python': False,
                 'name': 'task',
+                'python_data_type': 'TaskHandle',
+                'python_description': '',
+                'python_type_annotation': 'TaskHandle',
                 'type': 'TaskHandle'
             },
             {
+                'ctypes_data_type': 'ctypes.c_double',
                 'direction': 'in',
+                'is_optional_in_python': False,
                 'name': 'timeout',
+                'python_data_type': 'float',
+                'python_description': 'Specifies the maximum amount of time in seconds to wait for the next Sample Clock pulse.',
+                'python_type_annotation': 'float',
                 'type': 'float64'
             },
             {
+                'ctypes_data_type': 'c_bool32',
                 'direction': 'out',
+                'is_optional_in_python': False,
                 'is_streaming_type': True,
                 'name': 'isLate',
+                'python_data_type': 'bool',
+                'python_description': 'Indicates if an extra Sample Clock pulse occurred since the previous call.',
+                'python_type_annotation': 'bool',
                 'type': 'bool32'
             }
         ],
-        'python_codegen_method': 'no',
+        'python_class_name': 'Task',
+        'python_codegen_method': 'CustomCode',
         'python_description': 'Waits until the next pulse of the Sample Clock occurs. If an extra Sample Clock pulse occurs between calls to this VI, the second call returns an error or warning and waits for the next Sample Clock pulse. Use the Convert Late Errors to Warnings DAQmx Real-Time property to specify whether this function returns errors or warnings. If that property is True, any warnings this function returns do not include the **source** string.  Use this function to ensure I/O cycles complete within Sample Clock periods. National Instruments recommends you use this function for certain applications only.',
         'returns': 'int32',
         'supports_streaming': True
@@ -12,6 +12,14 @@ script_info = {
             "relativeOutputPath": "_grpc_interpreter.py",
             "templateFile": "_grpc_interpreter.py.mako",
         },
+        {
+            "relativeOutputPath": "_instrumented_interpreter_base.py",
+            "templateFile": "_instrumented_interpreter_base.py.mako",
+        },
+        {
+            "relativeOutputPath": "_simulated_interpreter_base.py",
+            "templateFile": "_simulated_interpreter_base.py.mako",
+        },
         {
             "relativeOutputPath": "task\\channels\\_channel.py",
             "templateFile": "task\\channels\\_channel.py.mako",
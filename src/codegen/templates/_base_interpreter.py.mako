@@ -13,12 +13,15 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import numpy
+import numpy.typing
 from nitypes.waveform import AnalogWaveform, DigitalWaveform
 from typing import Any
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from nidaqmx.constants import WaveformAttributeMode
+from nidaqmx._waveform_read_context import WaveformReadContext
 
 
 class BaseEventHandler(abc.ABC):
@@ -68,6 +71,48 @@ class BaseInterpreter(abc.ABC):
     def driver_version(self):
         raise NotImplementedError
 
+    # The asynchronous methods run the corresponding blocking method in the event loop's default
+    # executor. Interpreters that have a native asynchronous transport override them.
+    async def read_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+        read_array: numpy.typing.NDArray[numpy.float64],
+    ) -> tuple[numpy.typing.NDArray[numpy.float64], int]:
+        return await asyncio.to_thread(
+            self.read_analog_f64, task, num_samps_per_chan, timeout, fill_mode, read_array
+        )
+
+    async def write_analog_f64_async(
+        self,
+        task: object,
+        num_samps_per_chan: int,
+        auto_start: bool,
+        timeout: float,
+        data_layout: int,
+        write_array: numpy.typing.NDArray[numpy.float64],
+    ) -> int:
+        return await asyncio.to_thread(
+            self.write_analog_f64,
+            task,
+            num_samps_per_chan,
+            auto_start,
+            timeout,
+            data_layout,
+            write_array,
+        )
+
+    async def wait_until_task_done_async(self, task: object, time_to_wait: float) -> None:
+        await asyncio.to_thread(self.wait_until_task_done, task, time_to_wait)
+
+    # Call several methods, such as the get and set attribute methods that batched property access
+    # uses, and return their results in order. A call that raises an exception stops the batch.
+    # Interpreters whose calls are network round trips override this to overlap the get calls.
+    def call_batch(self, calls: Sequence[tuple[str, tuple[Any, ...]]]) -> list[Any]:
+        return [getattr(self, name)(*args) for name, args in calls]
+
     @abc.abstractmethod
     def read_analog_waveform(
         self,
@@ -75,7 +120,8 @@ class BaseInterpreter(abc.ABC):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: AnalogWaveform[numpy.float64],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         raise NotImplementedError
 
@@ -86,7 +132,8 @@ class BaseInterpreter(abc.ABC):
         number_of_samples_per_channel: int,
         timeout: float,
         waveforms: Sequence[AnalogWaveform[numpy.float64]],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         raise NotImplementedError
 
@@ -97,7 +144,8 @@ class BaseInterpreter(abc.ABC):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: DigitalWaveform[Any],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         raise NotImplementedError
 
@@ -111,6 +159,7 @@ class BaseInterpreter(abc.ABC):
         timeout: float,
         waveforms: Sequence[DigitalWaveform[Any]],
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         raise NotImplementedError
 
@@ -123,9 +172,42 @@ class BaseInterpreter(abc.ABC):
         number_of_signals_per_sample: int,
         timeout: float,
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> Sequence[DigitalWaveform[numpy.uint8]]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def read_analog_f64_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.float64], int]]:
+        """Read blocks of samples until the iterator is closed.
+
+        Each item is a new array of array_size_in_samps samples and the number of samples per
+        channel that were read into it. The array may be read-only.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def read_binary_i16_stream(
+        self,
+        task_handle: object,
+        number_of_samples_per_channel: int,
+        timeout: float,
+        fill_mode: int,
+        array_size_in_samps: int,
+    ) -> Iterator[tuple[numpy.typing.NDArray[numpy.int16], int]]:
+        """Read blocks of unscaled samples until the iterator is closed.
+
+        Each item is a new array of array_size_in_samps samples and the number of samples per
+        channel that were read into it. The array may be read-only.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def write_analog_waveform(
         self,
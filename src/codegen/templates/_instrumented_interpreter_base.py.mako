@@ -0,0 +1,62 @@
+<%
+    from codegen.utilities.interpreter_helpers import (
+        get_interpreter_functions,
+        get_interpreter_parameter_signature,
+        get_params_for_function_signature,
+        INCLUDE_SIZE_HINT_FUNCTIONS
+    )
+    from codegen.utilities.function_helpers import order_function_parameters_by_optional
+    from codegen.utilities.text_wrappers import wrap
+    functions = get_interpreter_functions(data)
+%>\
+# Do not edit this file; it was automatically generated.
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable
+from typing import Any
+
+from nidaqmx._base_interpreter import BaseInterpreter
+
+
+class InstrumentedInterpreterBase(BaseInterpreter):
+    """
+    Forwards the DAQmx APIs to another interpreter through the _call method.
+    """
+    __slots__ = ()
+
+    _interpreter: BaseInterpreter
+
+    @abc.abstractmethod
+    def _call(
+        self, function_name: str, task: object, function: Callable[..., Any], *args: Any
+    ) -> Any:
+        raise NotImplementedError
+
+% for func in functions:
+<%
+    params = get_params_for_function_signature(func)
+    sorted_params = order_function_parameters_by_optional(params)
+    parameter_signature = get_interpreter_parameter_signature(is_python_factory, sorted_params)
+    call_args = [param.parameter_name for param in sorted_params if param.type]
+    if func.function_name in INCLUDE_SIZE_HINT_FUNCTIONS:
+        parameter_signature = ", ".join([parameter_signature, "size_hint=0"])
+        call_args.append("size_hint")
+    task_arg = call_args[0] if call_args and call_args[0] in ("task", "task_handle") else "None"
+    call_arguments = ", ".join(
+        [f'"{func.function_name}"', task_arg, f"self._interpreter.{func.function_name}"] + call_args)
+%>\
+%if (len(func.function_name) + len(parameter_signature)) > 68:
+    def ${func.function_name}(
+            ${parameter_signature + '):' | wrap(12, 12)}
+%else:
+    def ${func.function_name}(${parameter_signature}):
+%endif
+%if len(call_arguments) > 67:
+        return self._call(
+            ${call_arguments + ')' | wrap(12, 12)}
+%else:
+        return self._call(${call_arguments})
+%endif
+
+% endfor
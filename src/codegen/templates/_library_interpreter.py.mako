@@ -1,6 +1,7 @@
 <%
     from codegen.utilities.function_helpers import order_function_parameters_by_optional
     from codegen.utilities.interpreter_helpers import (
+        get_bindable_c_functions,
         get_c_function_call_template,
         get_instantiation_lines_for_output,
         get_interpreter_functions,
@@ -32,12 +33,14 @@ from typing import Any, TYPE_CHECKING
 from collections.abc import Callable, Sequence
 
 from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
+from nidaqmx._error_messages import ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE, get_error_message
 from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, TaskHandle
 from nidaqmx.constants import FillMode, WaveformAttributeMode
 from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
 from nidaqmx.errors import DaqError, DaqFunctionNotSupportedError, DaqReadError, DaqWarning, DaqWriteError
 from nidaqmx.types import DriverVersion
 from nidaqmx._lib_time import AbsoluteTime
+from nidaqmx._waveform_read_context import WaveformReadContext
 from nidaqmx._waveform_utils import get_num_samps_per_chan
 from nitypes.waveform.typing import ExtendedPropertyValue
 from nitypes.waveform import AnalogWaveform, DigitalWaveform, SampleIntervalMode, Timing, ExtendedPropertyDictionary
@@ -47,6 +50,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 _was_runtime_environment_set = None
+# Set when the C functions are bound, so the generated methods skip the argtypes check.
+_c_functions_bound = False
 
 _INT64_WFM_SEC_PER_TICK = 100e-9
 _T0_EPOCH = ht_datetime(1, 1, 1, tzinfo=timezone.utc)
@@ -111,13 +116,22 @@ class LibraryInterpreter(BaseInterpreter):
             finally:
                 _was_runtime_environment_set = True
 
-        major_version = self.get_system_info_attribute_uint32(0x1272)
-        minor_version = self.get_system_info_attribute_uint32(0x1923)
-        update_version = self.get_system_info_attribute_uint32(0x2f22)
-        self._driver_version = DriverVersion(major_version, minor_version, update_version)
+        global _c_functions_bound
+        if lib_importer.bind_c_functions and not _c_functions_bound:
+            lib_importer.bind_functions(_get_bindable_c_functions())
+            _c_functions_bound = True
+
+        self._driver_version = None
 
     @property
     def driver_version(self):
+        # The driver version is queried on first use and memoized. Concurrent first calls may
+        # both query it, but they get the same value.
+        if self._driver_version is None:
+            major_version = self.get_system_info_attribute_uint32(0x1272)
+            minor_version = self.get_system_info_attribute_uint32(0x1923)
+            update_version = self.get_system_info_attribute_uint32(0x2f22)
+            self._driver_version = DriverVersion(major_version, minor_version, update_version)
         return self._driver_version
 
 
@@ -178,7 +192,7 @@ class LibraryInterpreter(BaseInterpreter):
         query_error_code = c_func(error_code, error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get error string for error code %d. DAQmxGetErrorString returned error code %d.', error_code, query_error_code)
-            return 'Failed to retrieve error description.'
+            return ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE
         return error_buffer.value.decode(lib_importer.encoding)
 
     ## get_extended_error_info has special error handling and it is library-only because it uses
@@ -195,7 +209,7 @@ class LibraryInterpreter(BaseInterpreter):
         query_error_code = c_func(error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get extended error info. DAQmxGetExtendedErrorInfo returned error code %d.', query_error_code)
-            return 'Failed to retrieve error description.'
+            return ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE
         return error_buffer.value.decode(lib_importer.encoding)
 
     ## read_analog_waveform has special handling for waveform attributes and callbacks
@@ -205,17 +219,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: AnalogWaveform[numpy.float64],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read an analog waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties]
+            properties = self._get_properties_to_read([waveform], read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(1, dtype=numpy.int64)
-            dt_array = numpy.zeros(1, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(1, read_context)
         else:
             t0_array = None
             dt_array = None
@@ -231,14 +245,20 @@ class LibraryInterpreter(BaseInterpreter):
             properties,
             t0_array,
             dt_array,
+            read_context,
         )
 
         waveform.sample_count = samples_read
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings([waveform], t0_array, dt_array)
+            self._set_waveform_timings([waveform], t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties([waveform])
         return samples_read
 
     ## read_analog_waveforms has special handling for waveform attributes and callbacks
@@ -248,17 +268,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveforms: Sequence[AnalogWaveform[numpy.float64]],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a set of analog waveforms with timing and attributes. All of the waveforms must be the same size."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties for waveform in waveforms]
+            properties = self._get_properties_to_read(waveforms, read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(len(waveforms), dtype=numpy.int64)
-            dt_array = numpy.zeros(len(waveforms), dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(len(waveforms), read_context)
         else:
             t0_array = None
             dt_array = None
@@ -274,15 +294,21 @@ class LibraryInterpreter(BaseInterpreter):
             properties,
             t0_array,
             dt_array,
+            read_context,
         )
 
         for waveform in waveforms:
             waveform.sample_count = samples_read
             
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties(waveforms)
         return samples_read
 
     def _internal_read_analog_waveform_ex(
@@ -295,6 +321,7 @@ class LibraryInterpreter(BaseInterpreter):
         properties: Sequence[ExtendedPropertyDictionary] | None,
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -330,7 +357,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array,
             read_array.size,
@@ -349,6 +376,7 @@ class LibraryInterpreter(BaseInterpreter):
         properties: Sequence[ExtendedPropertyDictionary] | None,
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -392,7 +420,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array_pointers,
             channel_count,
@@ -404,8 +432,46 @@ class LibraryInterpreter(BaseInterpreter):
 
         return error_code, samps_per_chan_read.value
 
-    def _get_wfm_attr_callback(self, properties):
-        if properties is not None:
+    def _get_properties_to_read(
+        self,
+        waveforms: Sequence[AnalogWaveform[Any] | DigitalWaveform[Any]],
+        read_context: WaveformReadContext | None,
+    ) -> Sequence[ExtendedPropertyDictionary] | None:
+        if read_context is not None:
+            return read_context.get_properties_to_read(waveforms)
+        return [waveform.extended_properties for waveform in waveforms]
+
+    def _get_timing_arrays(
+        self, channel_count: int, read_context: WaveformReadContext | None
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], numpy.typing.NDArray[numpy.int64]]:
+        if read_context is not None:
+            return read_context.get_timing_arrays(channel_count)
+        return (
+            numpy.zeros(channel_count, dtype=numpy.int64),
+            numpy.zeros(channel_count, dtype=numpy.int64),
+        )
+
+    def _get_wfm_attr_callback(self, properties, read_context=None):
+        if properties is not None and read_context is not None:
+            # Reuse the read context's callback, which updates whichever properties are
+            # currently assigned to the read context.
+            read_context.properties = properties
+            if read_context.wfm_attr_callback_ptr is None:
+                def set_read_context_wfm_attr_callback(
+                    channel_index: int,
+                    attribute_name: str,
+                    attribute_type: WfmAttrType,
+                    value: ExtendedPropertyValue,
+                    callback_data: object,
+                ) -> int:
+                    assert read_context.properties is not None
+                    read_context.properties[channel_index][attribute_name] = value
+                    return 0
+                read_context.wfm_attr_callback_ptr = self._get_wfm_attr_callback_ptr(
+                    set_read_context_wfm_attr_callback
+                )
+            return read_context.wfm_attr_callback_ptr
+        elif properties is not None:
             def set_wfm_attr_callback(
                 channel_index: int,
                 attribute_name: str,
@@ -467,13 +533,20 @@ class LibraryInterpreter(BaseInterpreter):
         self, 
         waveforms: Sequence[AnalogWaveform[numpy.float64] | DigitalWaveform[numpy.uint8]], 
         t0_array: numpy.typing.NDArray[numpy.int64], 
-        dt_array: numpy.typing.NDArray[numpy.int64]
+        dt_array: numpy.typing.NDArray[numpy.int64],
+        read_context: WaveformReadContext | None = None,
     ) -> None:
         for i, waveform in enumerate(waveforms):
+            if read_context is not None:
+                sample_interval = read_context.get_sample_interval(
+                    i, int(dt_array[i]), _INT64_WFM_SEC_PER_TICK
+                )
+            else:
+                sample_interval = ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK)
             waveform.timing = Timing(
                 sample_interval_mode=SampleIntervalMode.REGULAR,
                 timestamp=_T0_EPOCH + ht_timedelta(seconds=t0_array[i] * _INT64_WFM_SEC_PER_TICK),
-                sample_interval=ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK),
+                sample_interval=sample_interval,
             )
 
     ## read_digital_waveform has special handling for waveform attributes and callbacks
@@ -483,17 +556,17 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_samples_per_channel: int,
         timeout: float,
         waveform: DigitalWaveform[Any],
-        waveform_attribute_mode: WaveformAttributeMode
+        waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties]
+            properties = self._get_properties_to_read([waveform], read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(1, dtype=numpy.int64)
-            dt_array = numpy.zeros(1, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(1, read_context)
         else:
             t0_array = None
             dt_array = None
@@ -510,16 +583,39 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             None,
+            read_context,
         )
 
         waveform.sample_count = samples_read
         
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings([waveform], t0_array, dt_array)
+            self._set_waveform_timings([waveform], t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties([waveform])
         return samples_read
 
+    def _get_digital_read_arrays(
+        self,
+        number_of_samples_per_channel: int,
+        channel_count: int,
+        number_of_signals_per_sample: int,
+        read_context: WaveformReadContext | None,
+    ) -> tuple[numpy.typing.NDArray[numpy.uint8], numpy.typing.NDArray[numpy.uint32]]:
+        if read_context is not None:
+            return read_context.get_digital_read_arrays(
+                number_of_samples_per_channel, channel_count, number_of_signals_per_sample
+            )
+        read_array = numpy.zeros(
+            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
+            dtype=numpy.uint8)
+        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        return read_array, bytes_per_chan_array
+
     def _get_digital_read_array(self, waveform: DigitalWaveform[Any]) -> numpy.typing.NDArray[numpy.uint8]:  
         data = waveform.data
         if data.dtype != numpy.uint8:
@@ -535,27 +631,28 @@ class LibraryInterpreter(BaseInterpreter):
         timeout: float,
         waveforms: Sequence[DigitalWaveform[Any]],
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> int:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
-            properties = [waveform.extended_properties for waveform in waveforms]
+            properties = self._get_properties_to_read(waveforms, read_context)
         else:
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(channel_count, dtype=numpy.int64)
-            dt_array = numpy.zeros(channel_count, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(channel_count, read_context)
         else:
             t0_array = None
             dt_array = None
 
-        # Since there's no DAQmxInternalReadDigitalWaveformPerChan, we have to allocate a
-        # temporary contiguous array to read the data from multiple channels into.
-        read_array = numpy.zeros(
-            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
-            dtype=numpy.uint8)
-
-        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        # Since there's no DAQmxInternalReadDigitalWaveformPerChan, we have to read the data from
+        # multiple channels into a temporary contiguous array.
+        read_array, bytes_per_chan_array = self._get_digital_read_arrays(
+            number_of_samples_per_channel,
+            channel_count,
+            number_of_signals_per_sample,
+            read_context,
+        )
 
         error_code, samples_read = self._internal_read_digital_waveform(
             task_handle,
@@ -567,6 +664,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             bytes_per_chan_array,
+            read_context,
         )
 
         for i, waveform in enumerate(waveforms):        
@@ -575,12 +673,17 @@ class LibraryInterpreter(BaseInterpreter):
             channel_signal_count = bytes_per_chan_array[i]
             if waveform_signal_count != channel_signal_count:
                 raise ValueError(f"waveforms[{i}].data has {waveform_signal_count} signals, but expected {channel_signal_count}")
-            waveform.data[:] = read_array[:, i, :channel_signal_count]
+            waveform.data[:] = read_array[:samples_read, i, :channel_signal_count]
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
+        if (
+            read_context is not None
+            and WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode
+        ):
+            read_context.apply_extended_properties(waveforms)
         return samples_read
 
     def read_new_digital_waveforms(
@@ -591,6 +694,7 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_signals_per_sample: int,
         timeout: float,
         waveform_attribute_mode: WaveformAttributeMode,
+        read_context: WaveformReadContext | None = None,
     ) -> Sequence[DigitalWaveform[numpy.uint8]]:
         """Read a digital waveform with timing and attributes."""
         if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
@@ -599,17 +703,19 @@ class LibraryInterpreter(BaseInterpreter):
             properties = None
 
         if WaveformAttributeMode.TIMING in waveform_attribute_mode:
-            t0_array = numpy.zeros(channel_count, dtype=numpy.int64)
-            dt_array = numpy.zeros(channel_count, dtype=numpy.int64)
+            t0_array, dt_array = self._get_timing_arrays(channel_count, read_context)
         else:
             t0_array = None
             dt_array = None
 
-        read_array = numpy.zeros(
-            (number_of_samples_per_channel, channel_count, number_of_signals_per_sample),
-            dtype=numpy.uint8)
-
-        bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        # With a read context, the waveforms are views of the read context's scratch array, which
+        # later reads overwrite.
+        read_array, bytes_per_chan_array = self._get_digital_read_arrays(
+            number_of_samples_per_channel,
+            channel_count,
+            number_of_signals_per_sample,
+            read_context,
+        )
 
         error_code, samples_read = self._internal_read_digital_waveform(
             task_handle,
@@ -621,6 +727,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             bytes_per_chan_array,
+            read_context,
         )
 
         waveforms = []
@@ -634,7 +741,7 @@ class LibraryInterpreter(BaseInterpreter):
             waveforms.append(waveform)
 
         if t0_array is not None and dt_array is not None:
-            self._set_waveform_timings(waveforms, t0_array, dt_array)
+            self._set_waveform_timings(waveforms, t0_array, dt_array, read_context)
 
         self.check_for_error(error_code, samps_per_chan_read=samples_read)
         return waveforms
@@ -650,6 +757,7 @@ class LibraryInterpreter(BaseInterpreter):
         t0_array: numpy.typing.NDArray[numpy.int64] | None,
         dt_array: numpy.typing.NDArray[numpy.int64] | None,
         bytes_per_chan_array: numpy.typing.NDArray[numpy.uint32] | None = None,
+        read_context: WaveformReadContext | None = None,
     ) -> tuple[
         int, # error code
         int, # The number of samples per channel that were read
@@ -689,7 +797,7 @@ class LibraryInterpreter(BaseInterpreter):
             t0_array,
             dt_array,
             0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
+            self._get_wfm_attr_callback(properties, read_context),
             None,
             read_array,
             read_array.size,
@@ -808,6 +916,25 @@ class LibraryInterpreter(BaseInterpreter):
 
         return read_array, samples_read.value, number_of_bytes_per_sample.value
 
+    def read_analog_f64_stream(
+            self, task_handle, number_of_samples_per_channel, timeout, fill_mode,
+            array_size_in_samps):
+        # The driver reads directly into host memory, so there is no round trip to avoid.
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.float64)
+            _, samps_per_chan_read = self.read_analog_f64(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array)
+            yield read_array, samps_per_chan_read
+
+    def read_binary_i16_stream(
+            self, task_handle, number_of_samples_per_channel, timeout, fill_mode,
+            array_size_in_samps):
+        while True:
+            read_array = numpy.zeros(array_size_in_samps, dtype=numpy.int16)
+            _, samps_per_chan_read = self.read_binary_i16(
+                task_handle, number_of_samples_per_channel, timeout, fill_mode, read_array)
+            yield read_array, samps_per_chan_read
+
     ## write_analog_waveform has special handling
     def write_analog_waveform(
         self,
@@ -1052,6 +1179,8 @@ class LibraryInterpreter(BaseInterpreter):
             return
 
         if error_code < 0:
+            # The extended error info names the task, channel, or property that caused the error,
+            # so it is not cached.
             extended_error_info = self.get_extended_error_info()
 
             if samps_per_chan_read is not None:
@@ -1062,7 +1191,7 @@ class LibraryInterpreter(BaseInterpreter):
                 raise DaqError(extended_error_info, error_code)
 
         elif error_code > 0:
-            error_string = self.get_error_string(error_code)
+            error_string = get_error_message(error_code, self.get_error_string)
 
             warnings.warn(DaqWarning(error_string, error_code))
 
@@ -1075,3 +1204,20 @@ def is_string_buffer_too_small(error_code):
 
 def is_array_buffer_too_small(error_code):
     return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
+
+
+def _get_bindable_c_functions():
+    """Gets the (function name, "windll" or "cdll", argtypes) of the C functions to bind.
+
+    Event and varargs functions are not included because their argtypes depend on how they are
+    called.
+    """
+    return [
+%for c_function_name, calling_convention, argtypes in get_bindable_c_functions(functions):
+        (
+            "${c_function_name}",
+            "${calling_convention}",
+            [${', '.join(argtypes) | wrap(16, 16)}],
+        ),
+%endfor
+    ]
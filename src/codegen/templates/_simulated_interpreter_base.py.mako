@@ -0,0 +1,80 @@
+<%
+    from codegen.utilities.interpreter_helpers import (
+        get_interpreter_functions,
+        get_interpreter_parameter_signature,
+        get_params_for_function_signature,
+        get_simulated_attribute_method,
+        INCLUDE_SIZE_HINT_FUNCTIONS
+    )
+    from codegen.utilities.function_helpers import order_function_parameters_by_optional
+    from codegen.utilities.text_wrappers import wrap
+    functions = get_interpreter_functions(data)
+%>\
+# Do not edit this file; it was automatically generated.
+from __future__ import annotations
+
+import abc
+from typing import Any
+
+from nidaqmx._base_interpreter import BaseInterpreter
+from nidaqmx.errors import DaqFunctionNotSupportedError
+
+
+class SimulatedInterpreterBase(BaseInterpreter):
+    """
+    Implements the DAQmx APIs that SimulatedInterpreter does not simulate individually.
+
+    The task and channel attribute functions call the attribute method of their operation. The
+    other functions raise DaqFunctionNotSupportedError unless SimulatedInterpreter overrides them.
+    """
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _get_task_attribute(self, task: object, attribute: int) -> Any:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _set_task_attribute(self, task: object, attribute: int, value: Any) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _reset_task_attribute(self, task: object, attribute: int) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _get_chan_attribute(self, task: object, channel: str, attribute: int) -> Any:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _set_chan_attribute(self, task: object, channel: str, attribute: int, value: Any) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _reset_chan_attribute(self, task: object, channel: str, attribute: int) -> None:
+        raise NotImplementedError
+
+% for func in functions:
+<%
+    params = get_params_for_function_signature(func)
+    sorted_params = order_function_parameters_by_optional(params)
+    parameter_signature = get_interpreter_parameter_signature(is_python_factory, sorted_params)
+    call_args = [param.parameter_name for param in sorted_params if param.type]
+    if func.function_name in INCLUDE_SIZE_HINT_FUNCTIONS:
+        parameter_signature = ", ".join([parameter_signature, "size_hint=0"])
+    attribute_method = get_simulated_attribute_method(func)
+%>\
+%if (len(func.function_name) + len(parameter_signature)) > 68:
+    def ${func.function_name}(
+            ${parameter_signature + '):' | wrap(12, 12)}
+%else:
+    def ${func.function_name}(${parameter_signature}):
+%endif
+%if attribute_method is None:
+        raise DaqFunctionNotSupportedError(_NOT_SUPPORTED_MESSAGE.format("${func.function_name}"))
+%else:
+        return self.${attribute_method}(${', '.join(call_args)})
+%endif
+
+% endfor
+
+_NOT_SUPPORTED_MESSAGE = "The simulated interpreter does not support {}."
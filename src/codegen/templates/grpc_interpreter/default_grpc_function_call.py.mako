@@ -14,6 +14,7 @@
         is_custom_read_write_function,
         is_event_unregister_function,
         get_samps_per_chan_read_param,
+        get_write_packed_array_params,
     )
     from codegen.utilities.function_helpers import order_function_parameters_by_optional
     from codegen.utilities.text_wrappers import wrap
@@ -25,6 +26,7 @@
     compound_parameter = get_compound_parameter(function.base_parameters)
     grpc_interpreter_params = get_grpc_interpreter_call_params(function, sorted_params)
     is_read_method = check_if_parameters_contain_read_array(function.base_parameters)
+    packed_array_params = get_write_packed_array_params(function)
 %>\
 %if compound_parameter is not None:
         ${compound_parameter.parameter_name} = []
@@ -43,7 +45,12 @@
 %endif
         response = self._invoke(
             self._client.${snake_to_pascal(function.function_name)},
-%if (len(function.function_name) + len(grpc_interpreter_params)) > 68:
+%if packed_array_params:
+            self._create_packed_array_request(
+                grpc_types.${snake_to_pascal(function.function_name)}Request(
+                    ${grpc_interpreter_params + '),' | wrap(20, 20)}
+                ${', '.join(f'{name}={name}' for name in packed_array_params) + '))' | wrap(16, 16)}
+%elif (len(function.function_name) + len(grpc_interpreter_params)) > 68:
             grpc_types.${snake_to_pascal(function.function_name)}Request(
     %if function.is_init_method:
                 ${grpc_interpreter_params | wrap(16, 16)}),
@@ -14,7 +14,7 @@
     samps_per_chan_param = get_samps_per_chan_read_or_write_param(function.base_parameters)
 %>\
         c_func = lib_importer.${'windll' if function.calling_convention == 'StdCall' else 'cdll'}.DAQmx${function.c_function_name}
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -14,7 +14,7 @@
     explicit_output_param = get_output_param_with_ivi_dance_mechanism(function)
 %>\
         c_func = lib_importer.${'windll' if function.calling_convention == 'StdCall' else 'cdll'}.DAQmx${function.c_function_name}
-        if c_func.argtypes is None:
+        if not _c_functions_bound and c_func.argtypes is None:
             with c_func.arg_lock:
                 if c_func.argtypes is None:
                     c_func.argtypes = [
@@ -1,6 +1,6 @@
 <%def name="script_property_deleter(attribute)">\
 <%
-        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, has_attribute_with_filter
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, has_attribute_with_filter, ATTRIBUTES_INVALIDATING_READ_PLAN
     %>\
     @${attribute.name}.deleter
     def ${attribute.name}(self):
@@ -35,4 +35,7 @@
     %else:
         self._interpreter.reset_${generic_attribute_func}(${', '.join(function_call_args)})
     %endif
+    %if attribute.python_class_name == "InStream" and attribute.name in ATTRIBUTES_INVALIDATING_READ_PLAN:
+        self._task._invalidate_read_plan()
+    %endif
 </%def>
\ No newline at end of file
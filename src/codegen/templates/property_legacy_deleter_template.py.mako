@@ -6,7 +6,9 @@
     def ${attribute.name}(self):
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
     ## When the length of the function name is too long, it will be wrapped to the next line
     %if len(attribute.c_function_name) < 33:
@@ -29,5 +31,5 @@
     %>\
         error_code = c_func(
             ${', '.join(function_call_args) | wrap(initial_indent=12)})
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 </%def>
\ No newline at end of file
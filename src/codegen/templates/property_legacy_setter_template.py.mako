@@ -7,7 +7,9 @@
 \
         from nidaqmx._library_interpreter import LibraryInterpreter
         from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
-        if not isinstance(self._interpreter, LibraryInterpreter):
+        # An InstrumentedInterpreter wraps the interpreter while instrumentation is enabled.
+        interpreter = getattr(self._interpreter, "interpreter", self._interpreter)
+        if not isinstance(interpreter, LibraryInterpreter):
             raise NotImplementedError
     %if attribute.bitfield_enum is not None:
         val = enum_list_to_bitfield(
@@ -68,5 +70,5 @@
     %>\
         error_code = c_func(
             ${', '.join(function_call_args) | wrap(initial_indent=12)})
-        self._interpreter.check_for_error(error_code)
+        interpreter.check_for_error(error_code)
 </%def>
\ No newline at end of file
@@ -1,6 +1,6 @@
 <%def name="script_property_setter(attribute)">\
 <%
-        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type, has_attribute_with_filter, ATTRIBUTE_WITH_FILE_PATH_TYPE
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type, has_attribute_with_filter, ATTRIBUTE_WITH_FILE_PATH_TYPE, ATTRIBUTES_INVALIDATING_READ_PLAN
     %>\
     @${attribute.name}.setter
     %if attribute.name in ATTRIBUTE_WITH_FILE_PATH_TYPE:
@@ -62,4 +62,7 @@
     %else:
         self._interpreter.set_${generic_attribute_func}(${', '.join(function_call_args)})
     %endif
+    %if attribute.python_class_name == "InStream" and attribute.name in ATTRIBUTES_INVALIDATING_READ_PLAN:
+        self._task._invalidate_read_plan()
+    %endif
 </%def>
\ No newline at end of file
@@ -43,6 +43,8 @@ class Channel:
                 'Cannot concatenate Channel objects from different tasks.')
 
         name = flatten_channel_string([self.name, other.name])
+        if type(other) is type(self) and type(self) is not Channel:
+            return type(self)(self._handle, name, self._interpreter)
         return Channel._factory(self._handle, name, self._interpreter)
 
     def __contains__(self, item):
@@ -69,7 +71,7 @@ class Channel:
 
     def __iter__(self):
         for channel_name in self.channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+            yield self._create_subset(channel_name)
 
     def __len__(self):
         return len(self.channel_names)
@@ -82,7 +84,7 @@ class Channel:
         channel_names.reverse()
 
         for channel_name in channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+            yield self._create_subset(channel_name)
 
     def __repr__(self):
         return f'Channel(name={self.name})'
@@ -105,26 +107,49 @@ class Channel:
         """
         chan_type = interpreter.get_chan_attribute_int32(task_handle, virtual_or_physical_name, 0x187f)
 
-        channel_type = ChannelType(chan_type)
+        channel_class = Channel._get_channel_class(ChannelType(chan_type))
+        if channel_class is not None:
+            return channel_class(task_handle, virtual_or_physical_name, interpreter)
 
+    @staticmethod
+    def _get_channel_class(channel_type):
+        """
+        Gets the class that represents channels of the specified type.
+
+        Args:
+            channel_type (nidaqmx.constants.ChannelType): Specifies the
+                type of the channels.
+        Returns:
+            type:
+
+            Indicates the Channel subclass for the channel type, or None
+            if there is no such class.
+        """
         if channel_type == ChannelType.ANALOG_INPUT:
-            return nidaqmx.task.channels.AIChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.AIChannel
         elif channel_type == ChannelType.ANALOG_OUTPUT:
-            return nidaqmx.task.channels.AOChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.AOChannel
         elif channel_type == ChannelType.COUNTER_INPUT:
-            return nidaqmx.task.channels.CIChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.CIChannel
         elif channel_type == ChannelType.COUNTER_OUTPUT:
-            return nidaqmx.task.channels.COChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.COChannel
         elif channel_type == ChannelType.DIGITAL_INPUT:
-            return nidaqmx.task.channels.DIChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.DIChannel
         elif channel_type == ChannelType.DIGITAL_OUTPUT:
-            return nidaqmx.task.channels.DOChannel(
-                task_handle, virtual_or_physical_name, interpreter)
+            return nidaqmx.task.channels.DOChannel
+        return None
+
+    def _create_subset(self, virtual_or_physical_name):
+        """
+        Creates a channel object that represents some of the virtual
+        channels that this object represents.
+
+        Every channel in a typed channel object has the channel type of the
+        object, so this does not query the channel type again.
+        """
+        if type(self) is Channel:
+            return Channel._factory(self._handle, virtual_or_physical_name, self._interpreter)
+        return type(self)(self._handle, virtual_or_physical_name, self._interpreter)
 
     @property
     def name(self):
@@ -225,6 +225,10 @@ GENERIC_ATTRIBUTE_GROUP_NAME_MAP = {
 
 ATTRIBUTE_WITH_FILE_PATH_TYPE = ("logging_file_path",)
 
+# Attributes that change which channels Task.read() reads, so setting or resetting them must
+# invalidate the task's cached read plan.
+ATTRIBUTES_INVALIDATING_READ_PLAN = ("channels_to_read",)
+
 
 def get_attributes(metadata, class_name):
     """Converts the scrapigen metadata into a list of attributes."""
@@ -43,7 +43,6 @@ INTERPRETER_IGNORED_FUNCTIONS = [
     "SetRealTimeAttributeBool",
     "SetRealTimeAttributeInt32",
     "SetRealTimeAttributeUInt32",
-    "WaitForNextSampleClock",
     # Time triggers
     # Single-attribute get/set functions are not used
     # Generic Get/SetTimingAttribute{Type} functions are used instead
@@ -103,6 +102,13 @@ EVENT_UNREGISTER_IGNORED_PARAMS = [
     "options",
 ]
 
+# The simulated interpreter implements the task and channel attribute functions with one method per
+# operation, because they differ only in their data types. The device-specific "_ex" timing and
+# trigger attribute functions are not simulated.
+SIMULATED_ATTRIBUTE_FUNCTION_REGEX = re.compile(
+    r"(get|set|reset)_(buffer|chan|exported_signal|read|task|timing|trig|write)_attribute(?!_ex)"
+)
+
 READ_SAMPLES_PARAMETER_NAMES = [
     "samps_read",
     "samps_per_chan_read",
@@ -360,6 +366,9 @@ def get_grpc_interpreter_call_params(func, params):
             else:
                 if is_write_bytes_param(param):
                     grpc_params.append(f"{name}={param.parameter_name}.tobytes()")
+                elif is_write_function and is_write_packed_array_param(param):
+                    # The interpreter adds packed array parameters to the request separately.
+                    continue
                 elif is_write_function:
                     grpc_params.append(get_write_array_param(param))
                 else:
@@ -469,6 +478,35 @@ def get_c_function_call_template(func):
     return "/default_c_function_call.py.mako"
 
 
+def get_bindable_c_functions(functions):
+    """Gets the C functions whose argtypes can be applied when the library is loaded.
+
+    Returns a list of (c_function_name, calling_convention, argtypes) tuples. Event and varargs
+    functions are excluded because their argtypes depend on how they are called. Attribute
+    functions share a C function across value types, so each C function is listed once.
+    """
+    bindable_functions = []
+    c_function_names = set()
+    for func in functions:
+        if (
+            func.function_name in LIBRARY_INTERPRETER_IGNORED_FUNCTIONS
+            or not func.is_python_codegen_method
+            or get_c_function_call_template(func)
+            not in ("/default_c_function_call.py.mako", "/double_c_function_call.py.mako")
+            or func.c_function_name in c_function_names
+        ):
+            continue
+        c_function_names.add(func.c_function_name)
+        bindable_functions.append(
+            (
+                f"DAQmx{func.c_function_name}",
+                "windll" if func.calling_convention == "StdCall" else "cdll",
+                get_argument_types(func),
+            )
+        )
+    return bindable_functions
+
+
 def get_grpc_function_call_template(func):
     """Gets the template to use for generating the logic of calling the grpc functions."""
     if func.stream_response:
@@ -706,6 +744,22 @@ def is_write_bytes_param(param):
         return False
 
 
+def is_write_packed_array_param(param):
+    """Returns true if parameter writes a float64 array that can be serialized as packed bytes."""
+    return is_numpy_array_datatype(param) and param.ctypes_data_type == "numpy.float64"
+
+
+def get_write_packed_array_params(func):
+    """Gets the names of the write parameters that can be serialized as packed bytes."""
+    if not is_custom_write_function(func):
+        return []
+    return [
+        param.parameter_name
+        for param in func.base_parameters
+        if param.include_in_proto and is_write_packed_array_param(param)
+    ]
+
+
 def get_numpy_array_params(func):
     """Returns a dictionary of numpy data type parameters."""
     numpy_params = {}
@@ -731,3 +785,15 @@ def get_write_array_param(param):
     if is_numpy_array_datatype(param):
         return f"{param.parameter_name}={param.parameter_name}.flat"
     return f"{param.parameter_name}={param.parameter_name}"
+
+
+def get_simulated_attribute_method(func):
+    """Gets the name of the SimulatedInterpreter method that implements an attribute function.
+
+    Returns None if the simulated interpreter does not support the function.
+    """
+    match = SIMULATED_ATTRIBUTE_FUNCTION_REGEX.match(func.function_name)
+    if match is None:
+        return None
+    operation, attribute_type = match.groups()
+    return f"_{operation}_{'chan' if attribute_type == 'chan' else 'task'}_attribute"
@@ -0,0 +1,170 @@
+"""Caches the descriptions of NI-DAQmx error and warning codes.
+
+The description of a code does not depend on the task or the function that returned it, so the
+interpreters look it up once per process with get_error_message() instead of calling
+DAQmxGetErrorString or the GetErrorString RPC every time the code is returned.
+
+Set NIDAQMX_ERROR_MESSAGE_CATALOG to the path of a JSON file to keep the descriptions across
+runs. The cache loads the file on first use and adds each description it looks up to it. Delete
+the file after you upgrade or change the language of the driver.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import threading
+from collections.abc import Callable
+
+from decouple import config
+
+from nidaqmx.error_codes import DAQmxErrors
+
+_logger = logging.getLogger(__name__)
+
+_CATALOG_FORMAT_VERSION = 1
+
+ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE = "Failed to retrieve error description."
+UNABLE_TO_LOCATE_ERROR_RESOURCES_MESSAGE = (
+    "Error code could not be found. Reinstalling the driver might fix the issue. "
+    "Otherwise, contact National Instruments technical support."
+)
+
+# The interpreters return these messages when the lookup fails, so they are not cached.
+_LOOKUP_FAILED_MESSAGES = frozenset(
+    [ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE, UNABLE_TO_LOCATE_ERROR_RESOURCES_MESSAGE]
+)
+
+# Descriptions that are known without a lookup. Partial reads return SAMPLES_NOT_YET_AVAILABLE
+# often, so it is never looked up.
+_BUILT_IN_MESSAGES: dict[int, str] = {
+    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE: (
+        "Some or all of the samples requested have not yet been acquired.\n\n"
+        "To wait for the samples to become available use a longer read timeout or read later in "
+        "your program. To make the samples available sooner, increase the sample rate. If your "
+        "task uses a start trigger, make sure that your start trigger is configured correctly. "
+        "It is also possible that you configured the task for external timing, and no clock was "
+        "supplied. If this is the case, supply an external clock."
+    ),
+}
+
+
+class ErrorMessageCache:
+    """Caches the descriptions of error and warning codes, optionally in a catalog file."""
+
+    def __init__(self, catalog_path: str | os.PathLike[str] | None = None) -> None:
+        """Initialize a new ErrorMessageCache.
+
+        Args:
+            catalog_path: Specifies the path of the JSON file that keeps
+                the descriptions across runs. If you set this input to
+                None, the descriptions are cached only in memory.
+        """
+        self._catalog_path = None if catalog_path is None else pathlib.Path(catalog_path)
+        self._lock = threading.Lock()
+        self._messages: dict[int, str] = dict(_BUILT_IN_MESSAGES)
+        self._catalog_loaded = self._catalog_path is None
+
+    def get(self, error_code: int, get_error_string: Callable[[int], str]) -> str:
+        """Gets the description of an error or warning code.
+
+        Args:
+            error_code: Specifies the error or warning code.
+            get_error_string: Specifies the function that looks up the
+                description of a code that is not cached yet.
+        """
+        message = self._messages.get(error_code)
+        if message is not None:
+            return message
+        if not self._catalog_loaded:
+            self._load_catalog()
+            message = self._messages.get(error_code)
+            if message is not None:
+                return message
+
+        message = get_error_string(error_code)
+        if message and message not in _LOOKUP_FAILED_MESSAGES:
+            with self._lock:
+                self._messages[error_code] = message
+            if self._catalog_path is not None:
+                self._save_catalog()
+        return message
+
+    def clear(self) -> None:
+        """Discards the cached descriptions, except the built-in ones."""
+        with self._lock:
+            self._messages = dict(_BUILT_IN_MESSAGES)
+
+    def _load_catalog(self) -> None:
+        assert self._catalog_path is not None
+        with self._lock:
+            if self._catalog_loaded:
+                return
+            self._catalog_loaded = True
+            try:
+                catalog = json.loads(self._catalog_path.read_text(encoding="utf-8"))
+                if catalog.get("format_version") != _CATALOG_FORMAT_VERSION:
+                    raise ValueError(f"Unsupported format version {catalog.get('format_version')}.")
+                messages = {
+                    int(code): str(message) for code, message in catalog["messages"].items()
+                }
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError, KeyError, AttributeError) as error:
+                _logger.warning(
+                    "Ignoring the error message catalog %s: %s", self._catalog_path, error
+                )
+                return
+            self._messages = {**messages, **self._messages}
+
+    def _save_catalog(self) -> None:
+        assert self._catalog_path is not None
+        with self._lock:
+            contents = json.dumps(
+                {
+                    "format_version": _CATALOG_FORMAT_VERSION,
+                    "messages": {
+                        str(code): message
+                        for code, message in sorted(self._messages.items())
+                        if code not in _BUILT_IN_MESSAGES
+                    },
+                },
+                indent=2,
+            )
+            # Replace the catalog file atomically, so other processes never load a partial file.
+            temporary_path = self._catalog_path.with_name(
+                f"{self._catalog_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                temporary_path.write_text(contents, encoding="utf-8")
+                os.replace(temporary_path, self._catalog_path)
+            except OSError as error:
+                # The catalog is optional, so failing to save it must not hide the error or
+                # warning being reported.
+                _logger.warning(
+                    "Failed to save the error message catalog %s: %s", self._catalog_path, error
+                )
+
+
+_cache: ErrorMessageCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_error_message(error_code: int, get_error_string: Callable[[int], str]) -> str:
+    """Gets the description of an error or warning code from the cache shared by all interpreters.
+
+    Args:
+        error_code: Specifies the error or warning code.
+        get_error_string: Specifies the function that looks up the
+            description of a code that is not cached yet.
+    """
+    global _cache
+    cache = _cache
+    if cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ErrorMessageCache(config("NIDAQMX_ERROR_MESSAGE_CATALOG", default=None))
+            cache = _cache
+    return cache.get(error_code, get_error_string)
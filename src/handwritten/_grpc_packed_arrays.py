@@ -0,0 +1,225 @@
+"""Packed-bytes encoding of floating-point sample arrays in NI-DAQmx gRPC messages.
+
+Protobuf encodes ``repeated double`` fields as packed little-endian IEEE 754 doubles, so NumPy can
+read and write them directly. These helpers split the packed array fields out of serialized
+responses and append them to serialized requests, which avoids converting each sample to or from a
+Python float.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import Any
+
+import google.protobuf.message
+import grpc
+import numpy
+import numpy.typing
+
+from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+
+_SERVICE_NAME = "nidaqmx_grpc.NiDAQmx"
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_I64 = 1
+_WIRE_TYPE_LEN = 2
+_WIRE_TYPE_I32 = 5
+
+_PACKED_DTYPE = numpy.dtype("<f8")
+
+# The RPCs with packed arrays, mapped to the names of their repeated double fields.
+_PACKED_ARRAY_READ_RPCS = {
+    "ReadAnalogF64": ("read_array",),
+    "ReadCounterF64": ("read_array",),
+    "ReadCounterF64Ex": ("read_array",),
+    "ReadCtrFreq": ("read_array_frequency", "read_array_duty_cycle"),
+    "ReadCtrTime": ("read_array_high_time", "read_array_low_time"),
+    "ReadPowerF64": ("read_array_voltage", "read_array_current"),
+}
+_PACKED_ARRAY_WRITE_RPCS = {
+    "WriteAnalogF64": ("write_array",),
+    "WriteCtrFreq": ("frequency", "duty_cycle"),
+    "WriteCtrTime": ("high_time", "low_time"),
+}
+
+
+class PackedArrayRequest:
+    """A request message with array fields that are serialized as packed bytes."""
+
+    __slots__ = ("_message", "_arrays")
+
+    def __init__(
+        self,
+        message: google.protobuf.message.Message,
+        arrays: Mapping[str, numpy.typing.NDArray[numpy.float64]],
+    ) -> None:
+        """Initialize a new PackedArrayRequest."""
+        self._message = message
+        self._arrays = arrays
+
+    def SerializeToString(self) -> bytes:  # noqa: N802 - matches the protobuf message method
+        """Serialize the message followed by its packed array fields."""
+        fields_by_name = self._message.DESCRIPTOR.fields_by_name
+        chunks: list[bytes | memoryview] = [self._message.SerializeToString()]
+        for name, array in self._arrays.items():
+            if array.size == 0:
+                continue
+            data = numpy.ascontiguousarray(array, dtype=_PACKED_DTYPE)
+            chunks.append(_encode_varint(fields_by_name[name].number << 3 | _WIRE_TYPE_LEN))
+            chunks.append(_encode_varint(data.nbytes))
+            chunks.append(data.data)
+        return b"".join(chunks)
+
+
+class PackedArrayResponse:
+    """A response message with array fields that were decoded from packed bytes.
+
+    The array fields are read-only NumPy arrays that share memory with the serialized response.
+    Other fields are read from the response message.
+    """
+
+    __slots__ = ("_message", "_arrays")
+
+    def __init__(
+        self,
+        message: google.protobuf.message.Message,
+        arrays: Mapping[str, numpy.typing.NDArray[numpy.float64]],
+    ) -> None:
+        """Initialize a new PackedArrayResponse."""
+        self._message = message
+        self._arrays = arrays
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an array field or a message field."""
+        array = self._arrays.get(name)
+        if array is not None:
+            return array
+        return getattr(self._message, name)
+
+
+class PackedArrayStub(nidaqmx_grpc.NiDAQmxStub):
+    """NI-DAQmx stub that encodes and decodes floating-point sample arrays as packed bytes."""
+
+    def __init__(self, channel: grpc.Channel) -> None:
+        """Initialize a new PackedArrayStub."""
+        super().__init__(channel)
+        for rpc_name, field_names in _PACKED_ARRAY_READ_RPCS.items():
+            setattr(
+                self,
+                rpc_name,
+                channel.unary_unary(
+                    f"/{_SERVICE_NAME}/{rpc_name}",
+                    request_serializer=_serialize,
+                    response_deserializer=create_response_deserializer(
+                        getattr(grpc_types, f"{rpc_name}Response"), field_names
+                    ),
+                ),
+            )
+        for rpc_name in _PACKED_ARRAY_WRITE_RPCS:
+            setattr(
+                self,
+                rpc_name,
+                channel.unary_unary(
+                    f"/{_SERVICE_NAME}/{rpc_name}",
+                    request_serializer=_serialize,
+                    response_deserializer=getattr(grpc_types, f"{rpc_name}Response").FromString,
+                ),
+            )
+
+
+def create_response_deserializer(
+    response_type: type[google.protobuf.message.Message], field_names: Sequence[str]
+) -> Callable[[bytes], PackedArrayResponse]:
+    """Create a function that deserializes a response, decoding the specified fields as packed."""
+    field_numbers = {
+        response_type.DESCRIPTOR.fields_by_name[name].number: name for name in field_names
+    }
+
+    def deserialize(data: bytes) -> PackedArrayResponse:
+        remaining_data, packed_fields = split_packed_fields(data, field_numbers.keys())
+        message = response_type.FromString(remaining_data)
+        arrays = {}
+        for field_number, name in field_numbers.items():
+            chunks = packed_fields.get(field_number)
+            if chunks is None:
+                # The field was absent or was not packed, so protobuf decoded it.
+                arrays[name] = numpy.asarray(getattr(message, name), dtype=numpy.float64)
+            elif len(chunks) == 1:
+                arrays[name] = numpy.frombuffer(chunks[0], dtype=_PACKED_DTYPE)
+            else:
+                arrays[name] = numpy.frombuffer(b"".join(chunks), dtype=_PACKED_DTYPE)
+        return PackedArrayResponse(message, arrays)
+
+    return deserialize
+
+
+def split_packed_fields(
+    data: bytes, field_numbers: Collection[int]
+) -> tuple[bytes, dict[int, list[memoryview]]]:
+    """Split the length-delimited occurrences of the specified fields out of a serialized message.
+
+    Returns:
+        A tuple of the serialized message without those occurrences and a mapping from field
+        number to the payloads of those occurrences, which share memory with ``data``.
+    """
+    view = memoryview(data)
+    remaining_chunks: list[memoryview] = []
+    packed_fields: dict[int, list[memoryview]] = {}
+    chunk_start = 0
+    position = 0
+    end = len(view)
+    while position < end:
+        field_start = position
+        key, position = _decode_varint(view, position)
+        field_number = key >> 3
+        wire_type = key & 0x7
+        if wire_type == _WIRE_TYPE_VARINT:
+            _, position = _decode_varint(view, position)
+        elif wire_type == _WIRE_TYPE_I64:
+            position += 8
+        elif wire_type == _WIRE_TYPE_I32:
+            position += 4
+        elif wire_type == _WIRE_TYPE_LEN:
+            length, payload_start = _decode_varint(view, position)
+            position = payload_start + length
+            if field_number in field_numbers:
+                remaining_chunks.append(view[chunk_start:field_start])
+                packed_fields.setdefault(field_number, []).append(view[payload_start:position])
+                chunk_start = position
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}.")
+        if position > end:
+            raise ValueError("Truncated protobuf message.")
+    if not packed_fields:
+        return data, packed_fields
+    remaining_chunks.append(view[chunk_start:end])
+    return b"".join(remaining_chunks), packed_fields
+
+
+def _serialize(request: google.protobuf.message.Message | PackedArrayRequest) -> bytes:
+    return request.SerializeToString()
+
+
+def _decode_varint(view: memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = view[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
@@ -4,8 +4,9 @@ import ctypes
 import locale
 import sys
 import threading
+from collections.abc import Iterable, Sequence
 from ctypes.util import find_library
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from decouple import config
 from numpy.ctypeslib import ndpointer
@@ -111,6 +112,25 @@ class DaqFunctionImporter:
         except AttributeError:
             raise DaqFunctionNotSupportedError(_FUNCTION_NOT_SUPPORTED_MESSAGE.format(function))
 
+    def bind(self, function: str, argtypes: Sequence[Any]) -> None:
+        """Resolves a function and applies its argtypes ahead of time.
+
+        The bound function is stored as an instance attribute, so later lookups do not go through
+        __getattr__. Functions that are not supported in this version of NI-DAQmx are skipped and
+        still raise DaqFunctionNotSupportedError when they are looked up.
+        """
+        try:
+            c_func = getattr(self._library, function)
+        except AttributeError:
+            return
+        with self._lib_lock:
+            if not hasattr(c_func, "arg_lock"):
+                c_func.arg_lock = threading.Lock()
+        with c_func.arg_lock:
+            if c_func.argtypes is None:
+                c_func.argtypes = list(argtypes)
+        self.__dict__[function] = c_func
+
 
 CalHandle: TypeAlias = ctypes.c_uint
 """Calibration handle.
@@ -145,6 +165,10 @@ class DaqLibImporter:
         self._cal_handle = None
         self._task_handle = None
         self._encoding = None
+        # Feature Toggle to resolve C functions and apply their argtypes when the
+        # library interpreter is created instead of on first call.
+        # The Feature Toggle can be set in the .env file
+        self.bind_c_functions: bool = config("NIDAQMX_BIND_C_FUNCTIONS", default=False, cast=bool)
 
     @property
     def windll(self):  # noqa: D102 - Missing docstring in public method (auto-generated noqa)
@@ -176,6 +200,16 @@ class DaqLibImporter:
             self._import_lib()
         return self._encoding
 
+    def bind_functions(self, functions: Iterable[tuple[str, str, Sequence[Any]]]) -> None:
+        """Resolves functions and applies their argtypes ahead of time.
+
+        Args:
+            functions: (function name, "windll" or "cdll", argtypes) tuples.
+        """
+        for function, calling_convention, argtypes in functions:
+            importer = self.windll if calling_convention == "windll" else self.cdll
+            importer.bind(function, argtypes)
+
     def _import_lib(self):
         """Determines the location of and loads the NI-DAQmx CAI DLL."""
         self._windll = None
@@ -0,0 +1,132 @@
+"""Gets and sets the properties of NI-DAQmx objects with batches of interpreter calls.
+
+Each property getter and setter makes one interpreter call, such as get_chan_attribute_double,
+and converts the value. To batch them, this module runs each getter or setter with a stand-in
+for the interpreter that records the call instead of making it. It makes the recorded calls with
+one BaseInterpreter.call_batch() call per interpreter, and then runs each getter again with a
+stand-in that returns the result of the recorded call, so the getter converts it as usual.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+_GET_METHOD_PREFIX = "get_"
+_SET_METHOD_PREFIXES = ("set_", "reset_")
+
+
+class _CallRecorded(BaseException):
+    """Stops a property getter after it makes the call to record."""
+
+    def __init__(self, name: str, args: tuple[Any, ...]) -> None:
+        super().__init__(name)
+        self.name = name
+        self.args_to_call = args
+
+
+class _RecordingInterpreter:
+    """Records the calls that a property getter or setter makes."""
+
+    __slots__ = ("_interpreter", "_prefixes", "_stop", "calls")
+
+    def __init__(self, interpreter: Any, prefixes: str | tuple[str, ...], stop: bool) -> None:
+        self._interpreter = interpreter
+        self._prefixes = prefixes
+        self._stop = stop
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith(self._prefixes):
+            return getattr(self._interpreter, name)
+
+        def record(*args: Any) -> None:
+            if self._stop:
+                raise _CallRecorded(name, args)
+            self.calls.append((name, args))
+
+        return record
+
+
+class _ReplayingInterpreter:
+    """Returns the result of a batched call to a property getter."""
+
+    __slots__ = ("_interpreter", "_result", "_replayed")
+
+    def __init__(self, interpreter: Any, result: Any) -> None:
+        self._interpreter = interpreter
+        self._result = result
+        self._replayed = False
+
+    def __getattr__(self, name: str) -> Any:
+        if self._replayed or not name.startswith(_GET_METHOD_PREFIX):
+            return getattr(self._interpreter, name)
+        self._replayed = True
+        return lambda *args: self._result
+
+
+class _ObjectProxy:
+    """Stands in for an object so that its properties use another interpreter."""
+
+    __slots__ = ("_target", "_interpreter")
+
+    def __init__(self, target: object, interpreter: Any) -> None:
+        self._target = target
+        self._interpreter = interpreter
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+def _get_property(obj: object, name: str) -> property:
+    prop = getattr(type(obj), name, None)
+    if not isinstance(prop, property):
+        raise AttributeError(f"'{type(obj).__name__}' object has no property '{name}'")
+    return prop
+
+
+def get_properties(properties: Iterable[tuple[object, str]]) -> list[Any]:
+    """Gets the values of the properties of objects, batching the calls per interpreter."""
+    properties = list(properties)
+    values: list[Any] = [None] * len(properties)
+    # Maps each interpreter to its calls and the indices of the properties that made them.
+    batches: dict[int, tuple[Any, list[tuple[str, tuple[Any, ...]]], list[int]]] = {}
+    for index, (obj, name) in enumerate(properties):
+        fget = _get_property(obj, name).fget
+        if fget is None:
+            raise AttributeError(f"property '{name}' of '{type(obj).__name__}' has no getter")
+        interpreter = obj._interpreter  # type: ignore[attr-defined]
+        try:
+            values[index] = fget(
+                _ObjectProxy(obj, _RecordingInterpreter(interpreter, _GET_METHOD_PREFIX, stop=True))
+            )
+        except _CallRecorded as call:
+            _, calls, indices = batches.setdefault(id(interpreter), (interpreter, [], []))
+            calls.append((call.name, call.args_to_call))
+            indices.append(index)
+
+    for interpreter, calls, indices in batches.values():
+        results = interpreter.call_batch(calls)
+        for index, result in zip(indices, results):
+            obj, name = properties[index]
+            fget = _get_property(obj, name).fget
+            assert fget is not None
+            values[index] = fget(_ObjectProxy(obj, _ReplayingInterpreter(interpreter, result)))
+    return values
+
+
+def set_properties(values: Iterable[tuple[tuple[object, str], Any]]) -> None:
+    """Sets the values of the properties of objects, batching the calls per interpreter."""
+    batches: dict[int, tuple[Any, list[tuple[str, tuple[Any, ...]]]]] = {}
+    for (obj, name), value in values:
+        fset = _get_property(obj, name).fset
+        if fset is None:
+            raise AttributeError(f"property '{name}' of '{type(obj).__name__}' has no setter")
+        interpreter = obj._interpreter  # type: ignore[attr-defined]
+        recorder = _RecordingInterpreter(interpreter, _SET_METHOD_PREFIXES, stop=False)
+        fset(_ObjectProxy(obj, recorder), value)
+        _, calls = batches.setdefault(id(interpreter), (interpreter, []))
+        calls.extend(recorder.calls)
+
+    for interpreter, calls in batches.values():
+        interpreter.call_batch(calls)
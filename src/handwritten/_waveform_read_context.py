@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy
+import numpy.typing
+from hightime import timedelta as ht_timedelta
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, ExtendedPropertyDictionary
+
+
+class WaveformReadContext:
+    """Buffers and callbacks that are reused across waveform reads.
+
+    Interpreters do not hold per-task state, so each stream reader owns a read context and passes it
+    to the interpreter's waveform read methods. Reusing the context avoids reallocating the timing
+    arrays and the waveform attribute callback on every read, and recomputing the sample interval
+    when it has not changed.
+
+    Multi-channel digital reads also reuse a scratch array to read the data for all channels into,
+    because the driver does not have a per-channel digital waveform read.
+
+    If cache_extended_properties is True, the extended properties are captured by the first read
+    after the task configuration changes and copied into the waveforms of later reads, so the
+    driver does not invoke the waveform attribute callback for every attribute on every read.
+    """
+
+    __slots__ = (
+        "properties",
+        "wfm_attr_callback_ptr",
+        "_cache_extended_properties",
+        "_cached_properties",
+        "_pending_properties",
+        "_task_configuration_generation",
+        "_t0_array",
+        "_dt_array",
+        "_dt_values",
+        "_sample_intervals",
+        "_digital_read_array",
+        "_bytes_per_chan_array",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a new WaveformReadContext."""
+        self.properties: Sequence[ExtendedPropertyDictionary] | None = None
+        """The extended property dictionaries to update during the current read."""
+        self.wfm_attr_callback_ptr: object | None = None
+        """The interpreter's waveform attribute callback, which updates `properties`."""
+        self._cache_extended_properties = False
+        self._cached_properties: list[ExtendedPropertyDictionary] | None = None
+        self._pending_properties: list[ExtendedPropertyDictionary] | None = None
+        self._task_configuration_generation: int | None = None
+        self._t0_array: numpy.typing.NDArray[numpy.int64] | None = None
+        self._dt_array: numpy.typing.NDArray[numpy.int64] | None = None
+        self._dt_values: list[int] = []
+        self._sample_intervals: list[ht_timedelta] = []
+        self._digital_read_array: numpy.typing.NDArray[numpy.uint8] | None = None
+        self._bytes_per_chan_array: numpy.typing.NDArray[numpy.uint32] | None = None
+
+    def get_timing_arrays(
+        self, channel_count: int
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], numpy.typing.NDArray[numpy.int64]]:
+        """Get the t0 and dt arrays for a read, reallocating them if the channel count changed."""
+        if self._t0_array is None or self._dt_array is None or self._t0_array.size != channel_count:
+            self._t0_array = numpy.zeros(channel_count, dtype=numpy.int64)
+            self._dt_array = numpy.zeros(channel_count, dtype=numpy.int64)
+        return self._t0_array, self._dt_array
+
+    def get_sample_interval(self, channel_index: int, dt: int, sec_per_tick: float) -> ht_timedelta:
+        """Get the sample interval for a channel, recomputing it only when dt changes."""
+        if channel_index >= len(self._dt_values):
+            missing = channel_index + 1 - len(self._dt_values)
+            self._dt_values.extend([-1] * missing)
+            self._sample_intervals.extend([ht_timedelta()] * missing)
+        if self._dt_values[channel_index] != dt:
+            self._sample_intervals[channel_index] = ht_timedelta(seconds=dt * sec_per_tick)
+            self._dt_values[channel_index] = dt
+        return self._sample_intervals[channel_index]
+
+    def get_digital_read_arrays(
+        self, number_of_samples_per_channel: int, channel_count: int, signal_count: int
+    ) -> tuple[numpy.typing.NDArray[numpy.uint8], numpy.typing.NDArray[numpy.uint32]]:
+        """Get the scratch arrays for a multi-channel digital read.
+
+        The read array has the shape (samples, channels, signals). It is a view of a scratch
+        array that is reallocated only when the channel or signal count changes or when a read
+        requests more samples than it can hold, so its contents are overwritten by later reads.
+        """
+        read_array = self._digital_read_array
+        if (
+            read_array is None
+            or read_array.shape[1:] != (channel_count, signal_count)
+            or read_array.shape[0] < number_of_samples_per_channel
+        ):
+            read_array = numpy.zeros(
+                (number_of_samples_per_channel, channel_count, signal_count), dtype=numpy.uint8
+            )
+            self._digital_read_array = read_array
+            self._bytes_per_chan_array = numpy.zeros(channel_count, dtype=numpy.uint32)
+        assert self._bytes_per_chan_array is not None
+        return read_array[:number_of_samples_per_channel], self._bytes_per_chan_array
+
+    @property
+    def cache_extended_properties(self) -> bool:
+        """Indicates whether to capture the extended properties once and reuse them."""
+        return self._cache_extended_properties
+
+    @cache_extended_properties.setter
+    def cache_extended_properties(self, value: bool) -> None:
+        self._cache_extended_properties = value
+        self._discard_cached_properties()
+
+    def set_task_configuration_generation(self, generation: int) -> None:
+        """Discard the cached extended properties if the task configuration changed."""
+        if generation != self._task_configuration_generation:
+            self._task_configuration_generation = generation
+            self._discard_cached_properties()
+
+    def get_properties_to_read(
+        self, waveforms: Sequence[AnalogWaveform[Any] | DigitalWaveform[Any]]
+    ) -> Sequence[ExtendedPropertyDictionary] | None:
+        """Get the extended property dictionaries for the driver to update during a read.
+
+        Returns None if the extended properties are cached, in which case the driver does not
+        need to report them. Call apply_extended_properties() after the read succeeds.
+        """
+        if not self._cache_extended_properties:
+            return [waveform.extended_properties for waveform in waveforms]
+        if self._cached_properties is not None and len(self._cached_properties) == len(waveforms):
+            return None
+        self._pending_properties = [ExtendedPropertyDictionary() for _ in waveforms]
+        return self._pending_properties
+
+    def apply_extended_properties(
+        self, waveforms: Sequence[AnalogWaveform[Any] | DigitalWaveform[Any]]
+    ) -> None:
+        """Copy the cached extended properties into the waveforms after a successful read."""
+        if not self._cache_extended_properties:
+            return
+        if self._pending_properties is not None:
+            self._cached_properties = self._pending_properties
+            self._pending_properties = None
+        if self._cached_properties is not None:
+            for waveform, properties in zip(waveforms, self._cached_properties):
+                waveform.extended_properties.update(properties)
+
+    def _discard_cached_properties(self) -> None:
+        self._cached_properties = None
+        self._pending_properties = None
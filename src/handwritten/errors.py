@@ -1,6 +1,8 @@
 """NI-DAQmx error classes."""
 
 import warnings
+from collections.abc import Callable
+from typing import Optional
 
 import deprecation
 
@@ -115,6 +117,11 @@ class DaqWriteError(DaqError):
         return self._samps_per_chan_written
 
 
+# Called with each DaqWarning when it is constructed. nidaqmx.instrumentation sets this to count
+# warnings, because the warnings filters may prevent it from observing them.
+_warning_hook: Optional[Callable[["DaqWarning"], None]] = None
+
+
 class DaqWarning(Warning):
     """Warning raised by any NI-DAQmx method."""
 
@@ -134,6 +141,9 @@ class DaqWarning(Warning):
         except ValueError:
             self._error_type = DAQmxWarnings.UNKNOWN
 
+        if _warning_hook is not None:
+            _warning_hook(self)
+
     @property
     def error_code(self):
         """int: Specifies the NI-DAQmx error code."""
@@ -159,9 +169,9 @@ warnings.filterwarnings("always", category=DaqResourceWarning)
     deprecated_in="0.8.0", details="This function will be removed in a future update."
 )
 def check_for_error(error_code, samps_per_chan_written=None, samps_per_chan_read=None):
-    from nidaqmx._library_interpreter import LibraryInterpreter
+    from nidaqmx._interpreter_pool import get_library_interpreter
 
-    return LibraryInterpreter().check_for_error(
+    return get_library_interpreter().check_for_error(
         error_code, samps_per_chan_written, samps_per_chan_read
     )
 
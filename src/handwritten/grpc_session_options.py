@@ -56,6 +56,8 @@ class GrpcSessionOptions:
         *,
         api_key=MEASUREMENTLINK_23Q1_NIDAQMX_PYTHON_API_KEY,
         initialization_behavior=SessionInitializationBehavior.AUTO,
+        packed_arrays=False,
+        grpc_aio_channel=None,
     ):
         """Initialize a new GrpcSessionOptions.
 
@@ -70,8 +72,19 @@ class GrpcSessionOptions:
             initialization_behavior (enum): Specifies whether it is acceptable to initialize a new
                 session or attach to an existing one, or if only one of the behaviors is desired.
                 The driver session exists on the NI gRPC Device Server.
+            packed_arrays (bool): Specifies whether to encode and decode floating-point sample
+                arrays directly between the serialized gRPC messages and NumPy arrays. This
+                avoids converting each sample to or from a Python float when reading or writing
+                large numbers of floating-point samples.
+            grpc_aio_channel (grpc.aio.Channel): Specifies an asyncio channel to the same NI gRPC
+                Device Server. If you specify this channel, the asynchronous methods, such as
+                Task.wait_until_done_async, use it instead of running the blocking methods in the
+                event loop's default executor. Use the channel only from the event loop that
+                created it.
         """  # noqa: W505 - doc line too long (108 > 100 characters) (auto-generated noqa)
         self.grpc_channel = grpc_channel
         self.session_name = session_name
         self.api_key = api_key
         self.initialization_behavior = initialization_behavior
+        self.packed_arrays = packed_arrays
+        self.grpc_aio_channel = grpc_aio_channel
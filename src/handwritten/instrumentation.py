@@ -0,0 +1,305 @@
+"""Instrumentation of the NI-DAQmx functions that the nidaqmx package calls.
+
+When you enable instrumentation, tasks, systems, scales, and other objects that you construct
+afterward record each NI-DAQmx function that they call. For each function and for each task, the
+instrumentation counts calls, errors, and warnings, accumulates the time spent in the function and
+the bytes of sample data transferred, and maintains a histogram of call durations. Instrumentation
+works the same with the NI-DAQmx C library and with NI gRPC Device Server.
+
+Objects that you construct while instrumentation is disabled do not record calls and have no
+instrumentation overhead.
+
+>>> import nidaqmx.instrumentation
+>>> nidaqmx.instrumentation.enable()
+>>> with nidaqmx.Task() as task:  # doctest: +SKIP
+...     task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+...     task.read(number_of_samples_per_channel=100)
+...     statistics = nidaqmx.instrumentation.get_snapshot().functions["read_analog_f64"]
+
+To export calls to a tracing or metrics system such as OpenTelemetry, add a call listener. The
+listener is called with an :class:`InterpreterCallRecord` after each call, on the thread that made
+the call:
+
+>>> def export_span(record):
+...     span = tracer.start_span(record.function_name, start_time=record.start_time_ns)
+...     span.end(end_time=record.start_time_ns + record.duration_ns)
+>>> nidaqmx.instrumentation.add_call_listener(export_span)
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from nidaqmx import errors
+
+__all__ = [
+    "HISTOGRAM_BOUNDS",
+    "InstrumentationSnapshot",
+    "InterpreterCallRecord",
+    "InterpreterCallStatistics",
+    "add_call_listener",
+    "disable",
+    "enable",
+    "get_snapshot",
+    "is_enabled",
+    "remove_call_listener",
+    "reset",
+]
+
+HISTOGRAM_BOUNDS: tuple[float, ...] = tuple(
+    mantissa * 10.0**exponent for exponent in range(-6, 1) for mantissa in (1, 2, 5)
+) + (10.0,)
+"""The upper bounds, in seconds, of the buckets of the call duration histograms.
+
+The last bucket of each histogram counts the calls that take longer than the last bound.
+"""
+
+
+@dataclass(frozen=True)
+class InterpreterCallRecord:
+    """A completed call to an NI-DAQmx function."""
+
+    function_name: str
+    """The name of the function, such as "read_analog_f64"."""
+
+    task_key: object
+    """Identifies the task that the function was called for, or None if the function is not
+    called for a task. Use :meth:`InstrumentationSnapshot.get_task_statistics` to look up the
+    statistics of a :class:`nidaqmx.Task`."""
+
+    start_time_ns: int
+    """The time that the call started, in nanoseconds since the epoch."""
+
+    duration_ns: int
+    """The duration of the call, in nanoseconds."""
+
+    bytes_transferred: int
+    """The number of bytes in the sample arrays or waveforms that a read or write function
+    transferred."""
+
+    error: Exception | None
+    """The exception that the function raised, or None if it succeeded."""
+
+    warning_count: int
+    """The number of NI-DAQmx warnings that the function reported."""
+
+
+@dataclass(frozen=True)
+class InterpreterCallStatistics:
+    """Statistics for the calls to an NI-DAQmx function."""
+
+    call_count: int
+    """The number of calls."""
+
+    error_count: int
+    """The number of calls that raised an exception."""
+
+    warning_count: int
+    """The number of NI-DAQmx warnings that the calls reported."""
+
+    total_time: float
+    """The total duration of the calls, in seconds."""
+
+    min_time: float
+    """The duration of the shortest call, in seconds."""
+
+    max_time: float
+    """The duration of the longest call, in seconds."""
+
+    bytes_transferred: int
+    """The number of bytes in the sample arrays or waveforms that the calls transferred."""
+
+    histogram: tuple[int, ...]
+    """The number of calls in each bucket of :data:`HISTOGRAM_BOUNDS`, followed by the number of
+    calls that took longer than the last bound."""
+
+    @property
+    def mean_time(self) -> float:
+        """float: The mean duration of the calls, in seconds."""
+        return self.total_time / self.call_count if self.call_count else 0.0
+
+
+@dataclass(frozen=True)
+class InstrumentationSnapshot:
+    """The statistics recorded since instrumentation was enabled or reset."""
+
+    functions: dict[str, InterpreterCallStatistics]
+    """The statistics for each function, keyed by function name."""
+
+    tasks: dict[object, dict[str, InterpreterCallStatistics]]
+    """The statistics for each function called for each task, keyed by task key and then by
+    function name."""
+
+    def get_task_statistics(self, task) -> dict[str, InterpreterCallStatistics]:
+        """Gets the statistics for each function called for a task.
+
+        Call this method before you close the task.
+
+        Args:
+            task (nidaqmx.Task): Specifies the task.
+
+        Returns:
+            dict[str, InterpreterCallStatistics]:
+
+            The statistics for each function called for the task, keyed by function name.
+        """
+        return self.tasks.get(_get_task_key(task._handle), {})
+
+
+class _Statistics:
+    __slots__ = (
+        "call_count",
+        "error_count",
+        "warning_count",
+        "total_time_ns",
+        "min_time_ns",
+        "max_time_ns",
+        "bytes_transferred",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        self.call_count = 0
+        self.error_count = 0
+        self.warning_count = 0
+        self.total_time_ns = 0
+        self.min_time_ns = 0
+        self.max_time_ns = 0
+        self.bytes_transferred = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def add(self, record: InterpreterCallRecord) -> None:
+        duration_ns = record.duration_ns
+        if self.call_count == 0 or duration_ns < self.min_time_ns:
+            self.min_time_ns = duration_ns
+        if duration_ns > self.max_time_ns:
+            self.max_time_ns = duration_ns
+        self.call_count += 1
+        self.error_count += record.error is not None
+        self.warning_count += record.warning_count
+        self.total_time_ns += duration_ns
+        self.bytes_transferred += record.bytes_transferred
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS, duration_ns / 1e9)] += 1
+
+    def to_public(self) -> InterpreterCallStatistics:
+        return InterpreterCallStatistics(
+            self.call_count,
+            self.error_count,
+            self.warning_count,
+            self.total_time_ns / 1e9,
+            self.min_time_ns / 1e9,
+            self.max_time_ns / 1e9,
+            self.bytes_transferred,
+            tuple(self.histogram),
+        )
+
+
+_lock = threading.Lock()
+_enabled = False
+_functions: dict[str, _Statistics] = {}
+_tasks: dict[object, dict[str, _Statistics]] = {}
+_listeners: list[Callable[[InterpreterCallRecord], None]] = []
+_thread_local = threading.local()
+
+
+def enable() -> None:
+    """Enables instrumentation.
+
+    Objects that you construct after you call this function record the NI-DAQmx functions that
+    they call.
+    """
+    global _enabled
+    errors._warning_hook = _on_warning
+    _enabled = True
+
+
+def disable() -> None:
+    """Disables instrumentation.
+
+    Objects stop recording calls, and objects that you construct afterward have no
+    instrumentation overhead. The recorded statistics remain available.
+    """
+    global _enabled
+    _enabled = False
+    errors._warning_hook = None
+
+
+def is_enabled() -> bool:
+    """Indicates whether instrumentation is enabled."""
+    return _enabled
+
+
+def reset() -> None:
+    """Discards the recorded statistics."""
+    with _lock:
+        _functions.clear()
+        _tasks.clear()
+
+
+def get_snapshot() -> InstrumentationSnapshot:
+    """Gets a copy of the statistics recorded since instrumentation was enabled or reset."""
+    with _lock:
+        return InstrumentationSnapshot(
+            {name: statistics.to_public() for name, statistics in _functions.items()},
+            {
+                task_key: {name: statistics.to_public() for name, statistics in functions.items()}
+                for task_key, functions in _tasks.items()
+            },
+        )
+
+
+def add_call_listener(listener: Callable[[InterpreterCallRecord], None]) -> None:
+    """Adds a function to call with an :class:`InterpreterCallRecord` after each call.
+
+    Listeners run on the thread that made the call, so they add to its duration as seen by your
+    application. Exceptions that a listener raises propagate to the caller.
+    """
+    with _lock:
+        _listeners.append(listener)
+
+
+def remove_call_listener(listener: Callable[[InterpreterCallRecord], None]) -> None:
+    """Removes a function added by :func:`add_call_listener`."""
+    with _lock:
+        _listeners.remove(listener)
+
+
+def _get_task_key(task_handle: object) -> object:
+    # gRPC sessions are not hashable, so use their names. Library task handles are ctypes
+    # pointers, which compare by identity, so use their addresses.
+    name = getattr(task_handle, "name", None)
+    if isinstance(name, str):
+        return name
+    value = getattr(task_handle, "value", None)
+    return value if value is not None else id(task_handle)
+
+
+def _on_warning(warning: errors.DaqWarning) -> None:
+    _thread_local.warning_count = getattr(_thread_local, "warning_count", 0) + 1
+
+
+def _get_warning_count() -> int:
+    return getattr(_thread_local, "warning_count", 0)
+
+
+def _record(record: InterpreterCallRecord) -> None:
+    with _lock:
+        statistics = _functions.get(record.function_name)
+        if statistics is None:
+            statistics = _functions[record.function_name] = _Statistics()
+        statistics.add(record)
+
+        if record.task_key is not None:
+            task_functions = _tasks.setdefault(record.task_key, {})
+            statistics = task_functions.get(record.function_name)
+            if statistics is None:
+                statistics = task_functions[record.function_name] = _Statistics()
+            statistics.add(record)
+
+        listeners = list(_listeners)
+
+    for listener in listeners:
+        listener(record)
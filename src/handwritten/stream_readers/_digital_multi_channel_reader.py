@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
+import numpy
 from nitypes.waveform import DigitalWaveform
 
 from nidaqmx import DaqError
@@ -576,4 +578,71 @@ class DigitalMultiChannelReader(ChannelReaderBase):
             timeout,
             waveforms,
             self._in_stream.waveform_attribute_mode,
+            self._get_waveform_read_context(),
+        )
+
+    @requires_feature(WAVEFORM_SUPPORT)
+    def read_waveform_views(
+        self,
+        number_of_samples_per_channel: int = READ_ALL_AVAILABLE,
+        timeout: float = 10.0,
+    ) -> Sequence[DigitalWaveform[numpy.uint8]]:
+        """Reads samples from digital input channels into waveforms that share a buffer.
+
+        Unlike read_waveforms, this method does not copy the samples
+        for each channel into a separate waveform. Instead, each
+        waveform's data is a view of a buffer that this reader reuses
+        for every call to this method or to read_waveforms. The next
+        read overwrites the samples in the returned waveforms, so copy
+        any data that you need to keep before reading again.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+
+                If you set this input to nidaqmx.constants.
+                READ_ALL_AVAILABLE, NI-DAQmx determines how many samples
+                to read based on if the task acquires samples
+                continuously or acquires a finite number of samples.
+
+                If the task acquires samples continuously and you set
+                this input to nidaqmx.constants.READ_ALL_AVAILABLE, this
+                method reads all the samples currently available in the
+                buffer.
+
+                If the task acquires a finite number of samples and you
+                set this input to nidaqmx.constants.READ_ALL_AVAILABLE,
+                the method waits for the task to acquire all requested
+                samples, then reads those samples. If you set the
+                "read_all_avail_samp" property to True, the method reads
+                the samples currently available in the buffer and does
+                not wait for the task to acquire all requested samples.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to read the requested samples and returns an error
+                if it is unable to.
+
+        Returns:
+            Sequence[DigitalWaveform[numpy.uint8]]:
+
+            Contains one waveform for each channel in the task. The
+            waveform data is only valid until the next read.
+        """
+        number_of_samples_per_channel = self._task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+
+        return self._interpreter.read_new_digital_waveforms(
+            self._handle,
+            self._in_stream.num_chans,
+            number_of_samples_per_channel,
+            self._in_stream.di_num_booleans_per_chan,
+            timeout,
+            self._in_stream.waveform_attribute_mode,
+            self._get_waveform_read_context(),
         )
@@ -469,4 +469,5 @@ class DigitalSingleChannelReader(ChannelReaderBase):
             timeout,
             waveform,
             self._in_stream.waveform_attribute_mode,
+            self._get_waveform_read_context(),
         )
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from collections.abc import Iterator
+
+import numpy
+
+from nidaqmx.constants import FillMode
+from nidaqmx.stream_readers._analog_multi_channel_reader import AnalogMultiChannelReader
+from nidaqmx.stream_readers._analog_single_channel_reader import AnalogSingleChannelReader
+from nidaqmx.stream_readers._analog_unscaled_reader import AnalogUnscaledReader
+from nidaqmx.types import PrefetchStatistics
+
+
+class PrefetchedBlock:
+    """Represents a block of samples in one of the buffers of a :class:`PrefetchingReader`.
+
+    The data of the block is a view of the buffer, so the reader does not read into the buffer
+    again until you release the block. Release each block when you finish processing it, by
+    calling "release" or by using the block as a context manager.
+    """
+
+    __slots__ = ("_reader", "_index", "data", "first_sample_index", "_released")
+
+    def __init__(self, reader: PrefetchingReader, index: int, data, first_sample_index: int):
+        """Do not construct this object directly; instead, call PrefetchingReader.get()."""
+        self._reader = reader
+        self._index = index
+        self.data = data
+        self.first_sample_index = first_sample_index
+        self._released = False
+
+    def __enter__(self) -> PrefetchedBlock:
+        """Return this block."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release this block."""
+        self.release()
+
+    @property
+    def samples_per_channel(self) -> int:
+        """int: Indicates the number of samples per channel in the block."""
+        return self.data.shape[-1]
+
+    def release(self) -> None:
+        """Returns the buffer of the block to the reader.
+
+        Do not access the data of the block after you release it. Releasing a block more than
+        once has no effect.
+        """
+        if not self._released:
+            self._released = True
+            self._reader._release(self._index)
+
+
+class PrefetchingReader:
+    """Reads blocks of samples on a background thread while your application processes them.
+
+    The stream readers read synchronously, so the time your application spends processing a
+    block is time during which it does not read samples from the DAQmx buffer. This class reads
+    blocks into a set of preallocated buffers on a background thread instead. NI-DAQmx releases
+    the global interpreter lock while a read waits for samples, so your application processes
+    one block while the next block is read.
+
+    Your application gets the blocks in order by calling "get" or by iterating over this object.
+    Each block remains valid until you release it. If your application holds all of the buffers,
+    the background thread waits for one to be released and increments the overrun count of the
+    statistics; samples accumulate in the DAQmx buffer while it waits.
+
+    Use this class as a context manager, and start the task inside the context:
+
+    >>> with PrefetchingReader(reader, 1000) as prefetching_reader:
+    >>>     task.start()
+    >>>     for block in prefetching_reader:
+    >>>         with block:
+    >>>             process(block.data)
+    """
+
+    def __init__(
+        self,
+        reader,
+        samples_per_block,
+        buffer_count=4,
+        number_of_samples_per_channel=None,
+        timeout=10.0,
+    ):
+        """Initialize a new PrefetchingReader.
+
+        Args:
+            reader (AnalogMultiChannelReader): Specifies the reader for
+                the task to read samples from. You can also specify an
+                AnalogSingleChannelReader or an AnalogUnscaledReader.
+                With an AnalogSingleChannelReader, the blocks contain
+                1D arrays of floating-point samples. With an
+                AnalogMultiChannelReader, the blocks contain 2D arrays of
+                floating-point samples. With an AnalogUnscaledReader,
+                the blocks contain 2D arrays of unscaled 16-bit integer
+                samples.
+            samples_per_block (int): Specifies the number of samples per
+                channel to read into each block.
+            buffer_count (Optional[int]): Specifies the number of
+                buffers. Use at least two, so the background thread can
+                read a block while your application processes another.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples per channel to read. If you set this
+                input to None, the background thread reads blocks until
+                you call the "stop" method. The last block contains
+                fewer samples if this number is not a multiple of
+                samples_per_block.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the samples of each block to become
+                available.
+        """
+        if samples_per_block <= 0:
+            raise ValueError("samples_per_block must be greater than 0.")
+        if buffer_count <= 0:
+            raise ValueError("buffer_count must be greater than 0.")
+        if number_of_samples_per_channel is not None and number_of_samples_per_channel <= 0:
+            raise ValueError("number_of_samples_per_channel must be greater than 0.")
+
+        if isinstance(reader, AnalogUnscaledReader):
+            dtype: type[numpy.generic] = numpy.int16
+            self._read_function = reader._interpreter.read_binary_i16
+        elif isinstance(reader, (AnalogMultiChannelReader, AnalogSingleChannelReader)):
+            dtype = numpy.float64
+            self._read_function = reader._interpreter.read_analog_f64
+        else:
+            raise TypeError(
+                "reader must be an AnalogSingleChannelReader, an AnalogMultiChannelReader, or an "
+                f"AnalogUnscaledReader, not {type(reader).__name__}."
+            )
+
+        self._handle = reader._handle
+        self._samples_per_block = samples_per_block
+        self._number_of_samples_per_channel = number_of_samples_per_channel
+        self._timeout = timeout
+
+        if isinstance(reader, AnalogSingleChannelReader):
+            self._channel_shape: tuple[int, ...] = ()
+        else:
+            self._channel_shape = (reader._in_stream.num_chans,)
+        buffer_size = int(numpy.prod(self._channel_shape)) * samples_per_block
+        self._buffers = [numpy.zeros(buffer_size, dtype=dtype) for _ in range(buffer_count)]
+
+        self._condition = threading.Condition()
+        self._free_indices: collections.deque[int] = collections.deque()
+        self._ready_blocks: collections.deque[tuple[int, int, int]] = collections.deque()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._done = False
+        self._error: Exception | None = None
+        self._next_sample_index = 0
+        self.reset_statistics()
+
+    def __enter__(self) -> PrefetchingReader:
+        """Start reading and return this object."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop reading."""
+        self.stop()
+
+    def __iter__(self) -> Iterator[PrefetchedBlock]:
+        """Get blocks until the reader stops and all blocks are consumed."""
+        while True:
+            block = self.get()
+            if block is None:
+                return
+            yield block
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Indicates if the background thread is reading blocks."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def ready_blocks(self) -> int:
+        """int: Indicates the number of blocks that were read and not yet consumed."""
+        with self._condition:
+            return len(self._ready_blocks)
+
+    @property
+    def statistics(self) -> PrefetchStatistics:
+        """nidaqmx.types.PrefetchStatistics: The statistics of the blocks read so far.
+
+        The statistics cover the blocks read since the reader started or its statistics were reset.
+        overrun_count is the number of times the background thread waited for your application
+        to release a buffer, and reader_wait_time is the total time, in seconds, that it waited.
+        underrun_count is the number of times "get" waited for the background thread to read a
+        block, and consumer_wait_time is the total time, in seconds, that it waited.
+        max_ready_blocks is the largest number of blocks that were read and not yet consumed.
+        """
+        with self._condition:
+            return PrefetchStatistics(
+                self._blocks_read,
+                self._samples_read,
+                self._overrun_count,
+                self._underrun_count,
+                self._max_ready_blocks,
+                self._reader_wait_time_ns / 1e9,
+                self._consumer_wait_time_ns / 1e9,
+            )
+
+    def reset_statistics(self) -> None:
+        """Discards the statistics of the blocks read so far."""
+        with self._condition:
+            self._blocks_read = 0
+            self._samples_read = 0
+            self._overrun_count = 0
+            self._underrun_count = 0
+            self._max_ready_blocks = 0
+            self._reader_wait_time_ns = 0
+            self._consumer_wait_time_ns = 0
+
+    def start(self) -> None:
+        """Starts reading blocks on a background thread.
+
+        All buffers must be released before you start the reader again.
+        """
+        if self.is_running:
+            raise RuntimeError("The reader is already running.")
+        with self._condition:
+            if self._thread is not None and len(self._free_indices) + len(self._ready_blocks) < len(
+                self._buffers
+            ):
+                raise RuntimeError("Release all blocks before you start the reader again.")
+            self._free_indices = collections.deque(range(len(self._buffers)))
+            self._ready_blocks.clear()
+            self._stopping = False
+            self._done = False
+            self._error = None
+            self._next_sample_index = 0
+        self.reset_statistics()
+        self._thread = threading.Thread(target=self._read_blocks, name="PrefetchingReader")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None) -> None:
+        """Stops reading blocks and wakes up consumers that are waiting for blocks.
+
+        The background thread finishes the read in progress before it stops. Blocks that were
+        read remain available.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for the background thread to
+                stop. If you set timeout to None, the method waits
+                indefinitely.
+
+        Raises:
+            TimeoutError: The background thread did not stop within the
+                timeout.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                raise TimeoutError("The reader did not stop within the timeout.")
+
+    def get(self, timeout=None) -> PrefetchedBlock | None:
+        """Gets the next block of samples.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for a block. If you set timeout
+                to None, the method waits indefinitely.
+
+        Returns:
+            Optional[PrefetchedBlock]:
+
+            The next block, or None if the reader stopped and all blocks
+            are consumed. Release the block when you finish processing
+            it.
+
+        Raises:
+            TimeoutError: No block became available within the timeout.
+            nidaqmx.DaqError: Reading a block failed on the background
+                thread. The blocks read before the failure are returned
+                first.
+        """
+        with self._condition:
+            if not self._ready_blocks and not self._done:
+                self._underrun_count += 1
+                start = time.perf_counter_ns()
+                ready = self._condition.wait_for(lambda: self._ready_blocks or self._done, timeout)
+                self._consumer_wait_time_ns += time.perf_counter_ns() - start
+                if not ready:
+                    raise TimeoutError("No block of samples became available within the timeout.")
+            if self._ready_blocks:
+                index, first_sample_index, samples_per_channel = self._ready_blocks.popleft()
+            elif self._error is not None:
+                error = self._error
+                self._error = None
+                raise error
+            else:
+                return None
+        return PrefetchedBlock(
+            self, index, self._get_block_data(index, samples_per_channel), first_sample_index
+        )
+
+    def _get_block_data(self, index: int, samples_per_channel: int):
+        size = int(numpy.prod(self._channel_shape)) * samples_per_channel
+        return self._buffers[index][:size].reshape(self._channel_shape + (samples_per_channel,))
+
+    def _release(self, index: int) -> None:
+        with self._condition:
+            self._free_indices.append(index)
+            self._condition.notify_all()
+
+    def _read_blocks(self) -> None:
+        try:
+            self._read_blocks_until_done()
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def _read_blocks_until_done(self) -> None:
+        while True:
+            with self._condition:
+                remaining = self._get_remaining_samples()
+                if self._stopping or remaining == 0:
+                    return
+                if not self._free_indices:
+                    self._overrun_count += 1
+                    start = time.perf_counter_ns()
+                    self._condition.wait_for(lambda: self._free_indices or self._stopping)
+                    self._reader_wait_time_ns += time.perf_counter_ns() - start
+                    # Check whether the reader is stopping or done again.
+                    continue
+                index = self._free_indices.popleft()
+                first_sample_index = self._next_sample_index
+
+            number_of_samples = self._samples_per_block
+            if remaining is not None:
+                number_of_samples = min(number_of_samples, remaining)
+            try:
+                _, samps_per_chan_read = self._read_function(
+                    self._handle,
+                    number_of_samples,
+                    self._timeout,
+                    FillMode.GROUP_BY_CHANNEL.value,
+                    self._get_block_data(index, number_of_samples),
+                )
+            except Exception as error:
+                with self._condition:
+                    self._free_indices.appendleft(index)
+                    # A read fails when the task stops, so only report the errors of a reader that
+                    # was not asked to stop.
+                    if not self._stopping:
+                        self._error = error
+                return
+
+            with self._condition:
+                self._next_sample_index += samps_per_chan_read
+                self._ready_blocks.append((index, first_sample_index, samps_per_chan_read))
+                self._blocks_read += 1
+                self._samples_read += samps_per_chan_read
+                self._max_ready_blocks = max(self._max_ready_blocks, len(self._ready_blocks))
+                self._condition.notify_all()
+
+    def _get_remaining_samples(self) -> int | None:
+        if self._number_of_samples_per_channel is None:
+            return None
+        return self._number_of_samples_per_channel - self._next_sample_index
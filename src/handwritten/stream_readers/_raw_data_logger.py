@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import threading
+from datetime import datetime, timezone
+
+import numpy
+
+from nidaqmx._property_batch import get_properties
+from nidaqmx.constants import AcquisitionType
+from nidaqmx.errors import DaqError
+
+_HEADER_FORMAT_VERSION = 1
+_RAW_DTYPES = {1: numpy.int8, 2: numpy.int16, 4: numpy.int32}
+
+
+class RawDataLogger:
+    """Logs raw samples from a task to a set of memory-mapped files on a background thread.
+
+    The logger reads raw samples, which are the unscaled samples in the native format of the
+    device, directly into the pages of a memory-mapped data file, so the samples are not copied
+    or converted in Python. When a data file holds "samples_per_file" samples per channel, the
+    logger continues with the next data file.
+
+    The logger writes a JSON header file that contains the channel names, the scaling
+    coefficients of the channels, the timing of the acquisition, and the data files. The data
+    files are named after the header file, with a number and the .bin extension. Use
+    :class:`RawDataLog` to load the data files as memory-mapped arrays.
+
+    The data files contain the raw samples as the driver returns them. Depending on the raw
+    ordering of the device, each read of "samples_per_read" samples per channel is interleaved
+    by scan or grouped by channel. Refer to your device documentation for more information.
+
+    Use this class as a context manager, and start the task inside the context:
+
+    >>> with RawDataLogger(task.in_stream, "acquisition.json") as logger:
+    >>>     task.start()
+    >>>     time.sleep(60.0)
+    """
+
+    def __init__(
+        self,
+        task_in_stream,
+        path,
+        samples_per_read=1000,
+        samples_per_file=1000000,
+        number_of_samples_per_channel=None,
+        timeout=10.0,
+    ):
+        """Initialize a new RawDataLogger.
+
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an NI-DAQmx task from which to read samples.
+            path (Union[str, os.PathLike]): Specifies the path of the
+                header file. The data files are created in the same
+                directory.
+            samples_per_read (Optional[int]): Specifies the number of
+                samples per channel to read at a time.
+            samples_per_file (Optional[int]): Specifies the number of
+                samples per channel in each data file.
+            number_of_samples_per_channel (Optional[int]): Specifies
+                the number of samples per channel to log. If you set
+                this input to None, the logger logs samples until you
+                call the "stop" method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the samples of each read to become
+                available.
+        """
+        if samples_per_read <= 0:
+            raise ValueError("samples_per_read must be greater than 0.")
+        if samples_per_file <= 0:
+            raise ValueError("samples_per_file must be greater than 0.")
+        if number_of_samples_per_channel is not None and number_of_samples_per_channel <= 0:
+            raise ValueError("number_of_samples_per_channel must be greater than 0.")
+
+        self._in_stream = task_in_stream
+        self._task = task_in_stream._task
+        self._handle = task_in_stream._handle
+        self._interpreter = task_in_stream._interpreter
+        self._path = pathlib.Path(path)
+        self._samples_per_read = samples_per_read
+        self._samples_per_file = samples_per_file
+        self._number_of_samples_per_channel = number_of_samples_per_channel
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._header: dict | None = None
+        self._total_samples_logged = 0
+        self._error: Exception | None = None
+
+    def __enter__(self) -> RawDataLogger:
+        """Start logging and return this object."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop logging."""
+        self.stop()
+
+    @property
+    def files(self) -> list[pathlib.Path]:
+        """List[pathlib.Path]: Indicates the data files that the logger created."""
+        with self._lock:
+            if self._header is None:
+                return []
+            return [self._path.parent / file["name"] for file in self._header["files"]]
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Indicates if the background thread is logging samples."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def total_samples_logged(self) -> int:
+        """int: Indicates the number of samples per channel written to the data files."""
+        with self._lock:
+            return self._total_samples_logged
+
+    def start(self) -> None:
+        """Writes the header file and starts logging samples on a background thread.
+
+        Configure the timing of the task before you call this method, so the header contains
+        it. The first read starts the task if you have not started it.
+        """
+        if self.is_running:
+            raise RuntimeError("The logger is already running.")
+
+        channels_to_read = self._in_stream.channels_to_read
+        channel_names = channels_to_read.channel_names
+        raw_data_width = self._in_stream.raw_data_width
+        if raw_data_width not in _RAW_DTYPES:
+            raise ValueError(
+                f"Raw samples with a width of {raw_data_width} bytes are not supported."
+            )
+        try:
+            sample_mode, sample_rate = get_properties(
+                [
+                    (self._task.timing, "samp_quant_samp_mode"),
+                    (self._task.timing, "samp_clk_rate"),
+                ]
+            )
+        except DaqError:
+            # The task does not use sample clock timing.
+            sample_mode, sample_rate = None, None
+        try:
+            scaling_coefficients = [
+                list(coefficients)
+                for coefficients in get_properties(
+                    [(channel, "ai_dev_scaling_coeff") for channel in channels_to_read]
+                )
+            ]
+        except (AttributeError, DaqError):
+            # Only analog input channels have device scaling coefficients.
+            scaling_coefficients = None
+
+        with self._lock:
+            self._header = {
+                "format_version": _HEADER_FORMAT_VERSION,
+                "dtype": numpy.dtype(_RAW_DTYPES[raw_data_width]).str,
+                "channel_names": channel_names,
+                "scaling_coefficients": scaling_coefficients,
+                "sample_mode": None if sample_mode is None else sample_mode.name,
+                "sample_rate": sample_rate,
+                "samples_per_read": self._samples_per_read,
+                "start_time": datetime.now(timezone.utc).isoformat(),
+                "files": [],
+            }
+            self._total_samples_logged = 0
+            self._error = None
+        self._write_header()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._log, name=f"RawDataLogger-{self._path.stem}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None) -> None:
+        """Stops logging, truncates the last data file, and updates the header file.
+
+        The background thread finishes the read in progress before it stops.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for the background thread to
+                stop. If you set timeout to None, the method waits
+                indefinitely.
+
+        Raises:
+            TimeoutError: The background thread did not stop within the
+                timeout.
+            nidaqmx.DaqError: Reading samples failed on the background
+                thread.
+        """
+        thread = self._thread
+        if thread is not None:
+            self._stop_event.set()
+            thread.join(timeout)
+            if thread.is_alive():
+                raise TimeoutError("The logger did not stop within the timeout.")
+            self._thread = None
+
+        with self._lock:
+            error = self._error
+            self._error = None
+        if error is not None:
+            raise error
+
+    def wait_until_done(self, timeout=None) -> None:
+        """Waits for the logger to log "number_of_samples_per_channel" samples per channel.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait. If you set timeout to None, the
+                method waits indefinitely.
+
+        Raises:
+            TimeoutError: The logger did not finish within the timeout.
+            nidaqmx.DaqError: Reading samples failed on the background
+                thread.
+        """
+        if self._number_of_samples_per_channel is None:
+            raise RuntimeError("The logger logs samples until it is stopped.")
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                raise TimeoutError("The logger did not finish within the timeout.")
+        self.stop()
+
+    def _log(self) -> None:
+        header = self._header
+        assert header is not None
+        dtype = numpy.dtype(header["dtype"])
+        number_of_channels = len(header["channel_names"])
+        bytes_per_sample = number_of_channels * dtype.itemsize
+        data: numpy.memmap | None = None
+        samples_in_file = 0
+        try:
+            while not self._stop_event.is_set():
+                number_of_samples = self._samples_per_read
+                remaining = self._get_remaining_samples()
+                if remaining is not None:
+                    if remaining == 0:
+                        break
+                    number_of_samples = min(number_of_samples, remaining)
+                if data is None or samples_in_file == self._samples_per_file:
+                    if data is not None:
+                        filename, data = self._unmap_file(data), None
+                        self._close_file(filename, samples_in_file, bytes_per_sample)
+                    data = self._open_file(dtype, number_of_channels)
+                    samples_in_file = 0
+
+                number_of_samples = min(number_of_samples, self._samples_per_file - samples_in_file)
+                start = samples_in_file * number_of_channels
+                _, samples_read, _ = self._interpreter.read_raw(
+                    self._handle,
+                    number_of_samples,
+                    self._timeout,
+                    data[start : start + number_of_samples * number_of_channels],
+                )
+
+                samples_in_file += samples_read
+                with self._lock:
+                    header["files"][-1]["samples_per_channel"] = samples_in_file
+                    self._total_samples_logged += samples_read
+        except Exception as error:
+            # A read fails when the task stops, so only report the errors of a logger that was not
+            # asked to stop.
+            if not self._stop_event.is_set():
+                with self._lock:
+                    self._error = error
+        finally:
+            if data is not None:
+                filename, data = self._unmap_file(data), None
+                self._close_file(filename, samples_in_file, bytes_per_sample)
+
+    def _get_remaining_samples(self) -> int | None:
+        if self._number_of_samples_per_channel is None:
+            return None
+        with self._lock:
+            return self._number_of_samples_per_channel - self._total_samples_logged
+
+    def _open_file(self, dtype: numpy.dtype, number_of_channels: int) -> numpy.memmap:
+        header = self._header
+        assert header is not None
+        name = f"{self._path.stem}_{len(header['files']):04d}.bin"
+        with self._lock:
+            header["files"].append({"name": name, "samples_per_channel": 0})
+        self._write_header()
+        return numpy.memmap(
+            self._path.parent / name,
+            dtype=dtype,
+            mode="w+",
+            shape=(self._samples_per_file * number_of_channels,),
+        )
+
+    @staticmethod
+    def _unmap_file(data: numpy.memmap) -> str:
+        # The data file is unmapped when the caller releases the last reference to it, so it can be
+        # truncated.
+        data.flush()
+        assert data.filename is not None
+        return data.filename
+
+    def _close_file(self, filename: str, samples_in_file: int, bytes_per_sample: int) -> None:
+        if samples_in_file < self._samples_per_file:
+            # The data file was preallocated at its full size.
+            os.truncate(filename, samples_in_file * bytes_per_sample)
+        self._write_header()
+
+    def _write_header(self) -> None:
+        with self._lock:
+            contents = json.dumps(self._header, indent=2)
+        # Replace the header file atomically, so it is complete if the application stops.
+        temporary_path = self._path.with_name(self._path.name + ".tmp")
+        temporary_path.write_text(contents, encoding="utf-8")
+        os.replace(temporary_path, self._path)
+
+
+class RawDataLog:
+    """Loads the raw samples that a :class:`RawDataLogger` logged as memory-mapped arrays.
+
+    Loading a log reads only the header file. Each data file is memory-mapped when you index
+    this object, so the operating system reads the samples from disk as you access them.
+    """
+
+    def __init__(self, path):
+        """Initialize a new RawDataLog.
+
+        Args:
+            path (Union[str, os.PathLike]): Specifies the path of the
+                header file.
+        """
+        self._path = pathlib.Path(path)
+        self._header = json.loads(self._path.read_text(encoding="utf-8"))
+        if self._header.get("format_version") != _HEADER_FORMAT_VERSION:
+            raise ValueError(f"{self._path} is not a supported raw data log header file.")
+
+    def __getitem__(self, index: int) -> numpy.memmap:
+        """Memory-map the raw samples in a data file as a read-only 1D array."""
+        file = self._header["files"][index]
+        number_of_samples = file["samples_per_channel"] * len(self.channel_names)
+        if number_of_samples == 0:
+            return numpy.empty(0, dtype=self.dtype)  # type: ignore[return-value]
+        return numpy.memmap(
+            self._path.parent / file["name"],
+            dtype=self.dtype,
+            mode="r",
+            shape=(number_of_samples,),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of data files."""
+        return len(self._header["files"])
+
+    @property
+    def channel_names(self) -> list[str]:
+        """List[str]: Indicates the names of the logged channels."""
+        return self._header["channel_names"]
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """numpy.dtype: Indicates the data type of the raw samples."""
+        return numpy.dtype(self._header["dtype"])
+
+    @property
+    def sample_mode(self) -> AcquisitionType:
+        """:class:`nidaqmx.constants.AcquisitionType`: Indicates the sample mode of the task."""
+        return AcquisitionType[self._header["sample_mode"]]
+
+    @property
+    def sample_rate(self) -> float:
+        """float: Indicates the sample clock rate of the task in samples per channel per second."""
+        return self._header["sample_rate"]
+
+    @property
+    def samples_per_read(self) -> int:
+        """int: Indicates the number of samples per channel that the logger read at a time."""
+        return self._header["samples_per_read"]
+
+    @property
+    def scaling_coefficients(self) -> list[list[float]] | None:
+        """Optional[List[List[float]]]: Indicates the device scaling coefficients of each channel.
+
+        The coefficients are None if the channels are not analog input channels.
+        """
+        return self._header["scaling_coefficients"]
+
+    @property
+    def start_time(self) -> datetime:
+        """datetime.datetime: Indicates the time in UTC when logging started."""
+        return datetime.fromisoformat(self._header["start_time"])
+
+    @property
+    def total_samples_per_channel(self) -> int:
+        """int: Indicates the number of samples per channel in all data files."""
+        return sum(file["samples_per_channel"] for file in self._header["files"])
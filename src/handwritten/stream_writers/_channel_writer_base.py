@@ -1,3 +1,5 @@
+import asyncio
+
 from nidaqmx import DaqError
 from nidaqmx.error_codes import DAQmxErrors
 
@@ -111,6 +113,23 @@ class ChannelWriterBase:
         if expected_num_dimensions is not None:
             self._raise_error_if_invalid_write_dimensions(expected_num_dimensions, len(data.shape))
 
+    async def _verify_array_async(self, data, is_many_chan, is_many_samp):
+        """Verifies the shape of a NumPy array without blocking the event loop.
+
+        Getting the number of channels queries the driver, so this
+        method runs the verification in the event loop's default
+        executor if the "verify_array_shape" property is set to True.
+
+        Args:
+            data (numpy.ndarray): Specifies the NumPy array to verify.
+            is_many_chan (bool): Specifies if the write method is a many
+                channel version.
+            is_many_samp (bool): Specifies if the write method is a many
+                sample version.
+        """
+        if self._verify_array_shape:
+            await asyncio.to_thread(self._verify_array, data, is_many_chan, is_many_samp)
+
     def _verify_array_digital_lines(self, data, is_many_chan, is_many_line):
         """Verify the shape of a NumPy array of digital lines.
 
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+
+import numpy
+
+from nidaqmx._property_batch import get_properties, set_properties
+from nidaqmx.constants import FillMode, RegenerationMode
+from nidaqmx.stream_writers._analog_multi_channel_writer import AnalogMultiChannelWriter
+from nidaqmx.stream_writers._analog_single_channel_writer import AnalogSingleChannelWriter
+from nidaqmx.stream_writers._analog_unscaled_writer import AnalogUnscaledWriter
+from nidaqmx.types import OutputStreamStatistics
+
+# DAQmx_Write_TotalSampPerChanGenerated
+_WRITE_TOTAL_SAMP_PER_CHAN_GENERATED = 0x192B
+
+# The longest time that the background thread sleeps while it waits for the lead to shrink, so it
+# stops promptly.
+_MAX_LEAD_WAIT = 0.05
+
+
+class OutputStreamer:
+    """Streams blocks of samples from a source to a continuous output task on a background thread.
+
+    The streamer configures the task not to regenerate samples and writes each block from the
+    source once. It keeps "lead" samples per channel written ahead of the samples that the device
+    generated, so the source computes each block just before the device needs it and the output
+    buffer never runs dry while the source keeps up. The smallest lead measured before each write
+    is the underflow margin of the stream, which the statistics report.
+
+    The source can be:
+
+    - A NumPy array of samples, which the streamer writes in blocks. The blocks of a 1D array are
+      views of it, so they are not copied.
+    - A callable that fills a preallocated buffer, which the streamer passes to it for each block.
+      It takes the buffer and the index of the first sample of the block, and returns the number
+      of samples per channel it filled, or 0 to end the stream.
+    - An iterable, such as a generator, of NumPy arrays of samples.
+
+    The blocks have the same layout as the data of the writer's "write_many_sample" or
+    "write_int16" method.
+
+    Use this class as a context manager, and start the task inside the context:
+
+    >>> with OutputStreamer(writer, generate_blocks(), 1000) as streamer:
+    >>>     task.start()
+    >>>     streamer.wait_until_done()
+    """
+
+    def __init__(self, writer, source, samples_per_block, lead=None, timeout=10.0):
+        """Initialize a new OutputStreamer.
+
+        Args:
+            writer (AnalogMultiChannelWriter): Specifies the writer for
+                the task to write samples to. You can also specify an
+                AnalogSingleChannelWriter or an AnalogUnscaledWriter.
+                With an AnalogUnscaledWriter, the blocks contain
+                unscaled 16-bit integer samples. Otherwise, they contain
+                floating-point samples.
+            source (Union[numpy.ndarray, Callable, Iterable]): Specifies
+                the samples to write: an array, a callable that fills a
+                buffer, or an iterable of arrays.
+            samples_per_block (int): Specifies the number of samples per
+                channel in each block. The blocks of an iterable source
+                can have a different number of samples.
+            lead (Optional[int]): Specifies the number of samples per
+                channel to keep written ahead of the samples that the
+                device generated. If you set this input to None, the
+                lead is four blocks. The streamer increases the output
+                buffer size of the task if it cannot hold the lead and
+                one more block.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each write.
+        """
+        if samples_per_block <= 0:
+            raise ValueError("samples_per_block must be greater than 0.")
+        if lead is None:
+            lead = 4 * samples_per_block
+        if lead <= 0:
+            raise ValueError("lead must be greater than 0.")
+
+        if isinstance(writer, AnalogUnscaledWriter):
+            dtype: type[numpy.generic] = numpy.int16
+            self._write_function = writer._interpreter.write_binary_i16
+        elif isinstance(writer, (AnalogMultiChannelWriter, AnalogSingleChannelWriter)):
+            dtype = numpy.float64
+            self._write_function = writer._interpreter.write_analog_f64
+        else:
+            raise TypeError(
+                "writer must be an AnalogSingleChannelWriter, an AnalogMultiChannelWriter, or an "
+                f"AnalogUnscaledWriter, not {type(writer).__name__}."
+            )
+
+        self._writer = writer
+        self._out_stream = writer._out_stream
+        self._task = writer._task
+        self._handle = writer._handle
+        self._interpreter = writer._interpreter
+        self._is_many_chan = not isinstance(writer, AnalogSingleChannelWriter)
+        self._dtype = dtype
+        self._source = source
+        self._samples_per_block = samples_per_block
+        self._lead = lead
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._blocks: Iterator[numpy.ndarray] | None = None
+        self._sample_rate = 0.0
+        self._write_position = 0
+        self._error: Exception | None = None
+        self.reset_statistics()
+
+    def __enter__(self) -> OutputStreamer:
+        """Start streaming and return this object."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop streaming."""
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """bool: Indicates if the background thread is writing blocks."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def statistics(self) -> OutputStreamStatistics:
+        """nidaqmx.types.OutputStreamStatistics: The statistics of the blocks written so far.
+
+        The statistics cover the blocks written since the streamer started or its statistics were
+        reset.
+        min_lead is the smallest number of samples per channel that were written and not yet
+        generated, measured before each write after the device started generating samples. It
+        is None if no such write occurred. If it approaches 0, the source does not keep up and the
+        device is about to run out of samples. lead_wait_time is the total time, in seconds, that
+        the background thread waited for the lead to shrink.
+        """
+        with self._lock:
+            return OutputStreamStatistics(
+                self._blocks_written,
+                self._samples_written,
+                self._min_lead,
+                self._lead_wait_time_ns / 1e9,
+            )
+
+    def reset_statistics(self) -> None:
+        """Discards the statistics of the blocks written so far."""
+        with self._lock:
+            self._blocks_written = 0
+            self._samples_written = 0
+            self._min_lead: int | None = None
+            self._lead_wait_time_ns = 0
+
+    def start(self) -> None:
+        """Starts writing blocks on a background thread.
+
+        This method configures the task and writes the initial lead first. Call it before you
+        start the task, because the task cannot start with an empty output buffer.
+        """
+        if self.is_running:
+            raise RuntimeError("The streamer is already running.")
+
+        output_buf_size, self._sample_rate = get_properties(
+            [(self._out_stream, "output_buf_size"), (self._task.timing, "samp_clk_rate")]
+        )
+        values = [((self._out_stream, "regen_mode"), RegenerationMode.DONT_ALLOW_REGENERATION)]
+        if output_buf_size < self._lead + self._samples_per_block:
+            values.append(
+                ((self._out_stream, "output_buf_size"), self._lead + self._samples_per_block)
+            )
+        set_properties(values)
+
+        self._blocks = self._get_blocks()
+        self._stop_event.clear()
+        self._error = None
+        self._write_position = 0
+        self.reset_statistics()
+        # Write the initial lead before the task starts.
+        while self._write_position < self._lead:
+            if not self._write_next_block():
+                break
+
+        self._thread = threading.Thread(target=self._write_blocks, name="OutputStreamer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None) -> None:
+        """Stops writing blocks.
+
+        The background thread finishes the write in progress before it stops. This method does
+        not stop the task.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for the background thread to
+                stop. If you set timeout to None, the method waits
+                indefinitely.
+
+        Raises:
+            TimeoutError: The background thread did not stop within the
+                timeout.
+            nidaqmx.DaqError: Writing a block failed on the background
+                thread.
+        """
+        self._stop_event.set()
+        self._join(timeout)
+
+    def wait_until_done(self, timeout=None) -> None:
+        """Waits for the streamer to write all blocks and the device to generate them.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait. If you set timeout to None, the
+                method waits indefinitely.
+
+        Raises:
+            TimeoutError: The samples were not generated within the
+                timeout.
+            nidaqmx.DaqError: Writing a block failed on the background
+                thread.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._join(timeout)
+        while True:
+            samples_not_generated = self._write_position - self._get_total_samples_generated()
+            if samples_not_generated <= 0:
+                return
+            remaining_time = None if deadline is None else deadline - time.monotonic()
+            if remaining_time is not None and remaining_time <= 0:
+                raise TimeoutError("The samples were not generated within the timeout.")
+            time.sleep(self._get_wait_time(samples_not_generated, remaining_time))
+
+    def _join(self, timeout) -> None:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                raise TimeoutError("The streamer did not stop within the timeout.")
+        with self._lock:
+            error = self._error
+            self._error = None
+        if error is not None:
+            raise error
+
+    def _get_blocks(self) -> Iterator[numpy.ndarray]:
+        source = self._source
+        if isinstance(source, numpy.ndarray):
+            return self._get_array_blocks(source)
+        if callable(source):
+            return self._get_filled_blocks(source)
+        return (self._get_block(block) for block in source)
+
+    def _get_array_blocks(self, source: numpy.ndarray) -> Iterator[numpy.ndarray]:
+        source = self._get_block(source)
+        number_of_samples = source.shape[-1]
+        for start in range(0, number_of_samples, self._samples_per_block):
+            block = source[..., start : start + self._samples_per_block]
+            # A block of a 2D array is not contiguous, so the write copies it.
+            yield block if block.flags.c_contiguous else numpy.ascontiguousarray(block)
+
+    def _get_filled_blocks(self, fill) -> Iterator[numpy.ndarray]:
+        shape: tuple[int, ...] = (self._samples_per_block,)
+        if self._is_many_chan:
+            shape = (self._out_stream.num_chans, self._samples_per_block)
+        buffer = numpy.zeros(shape, dtype=self._dtype)
+        first_sample_index = 0
+        while True:
+            number_of_samples = fill(buffer, first_sample_index)
+            if not number_of_samples:
+                return
+            if number_of_samples == self._samples_per_block:
+                yield buffer
+            else:
+                yield numpy.ascontiguousarray(buffer[..., :number_of_samples])
+            first_sample_index += number_of_samples
+
+    def _get_block(self, block) -> numpy.ndarray:
+        block = numpy.ascontiguousarray(block, dtype=self._dtype)
+        self._writer._verify_array(block, self._is_many_chan, True)
+        return block
+
+    def _write_next_block(self) -> bool:
+        assert self._blocks is not None
+        block = next(self._blocks, None)
+        if block is None or block.shape[-1] == 0:
+            return False
+        number_of_samples = block.shape[-1]
+        samples_written = self._write_function(
+            self._handle,
+            number_of_samples,
+            False,
+            self._timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            block,
+        )
+        self._write_position += samples_written
+        with self._lock:
+            self._blocks_written += 1
+            self._samples_written += samples_written
+        return True
+
+    def _write_blocks(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                if not self._wait_for_lead():
+                    return
+                if not self._write_next_block():
+                    return
+        except Exception as error:
+            with self._lock:
+                self._error = error
+
+    def _wait_for_lead(self) -> bool:
+        """Waits until the next block fits in the lead. Returns False if the streamer stops."""
+        while not self._stop_event.is_set():
+            total_samples_generated = self._get_total_samples_generated()
+            current_lead = self._write_position - total_samples_generated
+            excess = current_lead + self._samples_per_block - self._lead
+            with self._lock:
+                if total_samples_generated > 0 and (
+                    self._min_lead is None or current_lead < self._min_lead
+                ):
+                    self._min_lead = current_lead
+            if excess <= 0:
+                return True
+            start = time.perf_counter_ns()
+            self._stop_event.wait(self._get_wait_time(excess, _MAX_LEAD_WAIT))
+            with self._lock:
+                self._lead_wait_time_ns += time.perf_counter_ns() - start
+        return False
+
+    def _get_total_samples_generated(self) -> int:
+        return self._interpreter.get_write_attribute_uint64(
+            self._handle, _WRITE_TOTAL_SAMP_PER_CHAN_GENERATED
+        )
+
+    def _get_wait_time(self, number_of_samples: int, max_wait_time: float | None) -> float:
+        wait_time = number_of_samples / self._sample_rate if self._sample_rate > 0 else 0.001
+        return wait_time if max_wait_time is None else min(wait_time, max_wait_time)
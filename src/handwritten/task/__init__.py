@@ -3,6 +3,7 @@
 from nidaqmx.task._export_signals import ExportSignals
 from nidaqmx.task._in_stream import InStream
 from nidaqmx.task._out_stream import OutStream
+from nidaqmx.task._single_point_loop import SinglePointLoop
 from nidaqmx.task._task import Task, _TaskAlternateConstructor, _TaskEventType
 from nidaqmx.task._timing import Timing
 
@@ -12,4 +13,5 @@ __all__ = [
     "OutStream",
     "ExportSignals",
     "Timing",
+    "SinglePointLoop",
 ]
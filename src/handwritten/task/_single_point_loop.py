@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import math
+import time
+
+import numpy
+
+from nidaqmx.constants import ChannelType, FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
+from nidaqmx.types import SinglePointLoopStatistics
+
+# NI-DAQmx reports these errors when the loop misses one or more sample clocks. It still waits
+# for the next sample clock, so the loop counts the cycle as late and continues.
+_LATE_ERROR_CODES = frozenset(
+    (
+        DAQmxErrors.READ_NOT_COMPLETE_BEFORE_SAMP_CLK.value,
+        DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_DETECTED_MISSED_SAMP_CLK.value,
+        DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_DETECTED_3_OR_MORE_SAMP_CLKS.value,
+    )
+)
+
+
+class SinglePointLoop:
+    """Runs a hardware-timed single-point control loop.
+
+    Each cycle of the loop waits for the next sample clock of the input task, reads one sample
+    from each channel of the input task, passes the samples to your compute function, and writes
+    the values that it returns to the channels of the output task. The loop uses the scalar
+    NI-DAQmx read and write functions and preallocated arrays, so each cycle does little work in
+    Python.
+
+    Configure the input task and the output task for hardware-timed single-point sample timing,
+    and start them before you run the loop:
+
+    >>> input_task.timing.cfg_samp_clk_timing(
+    >>>     1000, sample_mode=AcquisitionType.HW_TIMED_SINGLE_POINT)
+    >>> output_task.timing.cfg_samp_clk_timing(
+    >>>     1000, source="/Dev1/ai/SampleClock",
+    >>>     sample_mode=AcquisitionType.HW_TIMED_SINGLE_POINT)
+    >>> output_task.start()
+    >>> input_task.start()
+    >>> loop = SinglePointLoop(input_task, lambda value: gain * (setpoint - value), output_task)
+    >>> loop.run(10000)
+    >>> loop.statistics.late_cycle_count
+    0
+
+    The loop counts the cycles in which it missed a sample clock and records the period between
+    cycles, so you can verify that your loop is deterministic.
+    """
+
+    __slots__ = (
+        "_compute",
+        "_input_handle",
+        "_interpreter",
+        "_is_late",
+        "_read",
+        "_running",
+        "_stop_requested",
+        "_timeout",
+        "_write",
+        "_cycle_count",
+        "_late_cycle_count",
+        "_period_count",
+        "_mean_period_ns",
+        "_period_m2",
+        "_min_period_ns",
+        "_max_period_ns",
+        "_max_cycle_time_ns",
+        "_previous_wake_ns",
+    )
+
+    def __init__(self, input_task, compute, output_task=None, timeout=10.0):
+        """Initialize a new SinglePointLoop.
+
+        Args:
+            input_task (nidaqmx.Task): Specifies the hardware-timed
+                single-point task to wait on and read from. The task
+                must contain analog input, digital input, or counter
+                input channels.
+            compute (Callable): Specifies the function that the loop
+                calls in each cycle. For a task with one channel, the
+                loop passes a float for analog and counter channels or
+                an int for digital channels. For a task with multiple
+                channels, the loop passes a 1D NumPy array with one
+                sample per channel. The loop reuses this array in each
+                cycle. The function returns the values to write in the
+                same form, or None if there is no output task.
+            output_task (Optional[nidaqmx.Task]): Specifies the
+                hardware-timed single-point task to write to. The task
+                must contain analog output or digital output channels.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each sample clock, read, and write.
+        """
+        self._compute = compute
+        self._interpreter = input_task._interpreter
+        self._input_handle = input_task._handle
+        self._timeout = timeout
+        self._read = _create_read(input_task, timeout)
+        self._write = _create_write(output_task, timeout) if output_task is not None else None
+        self._is_late = False
+        self._running = False
+        self._stop_requested = False
+        self.reset_statistics()
+
+    @property
+    def is_late(self) -> bool:
+        """bool: Indicates if the most recent cycle missed a sample clock."""
+        return self._is_late
+
+    @property
+    def statistics(self) -> SinglePointLoopStatistics:
+        """nidaqmx.types.SinglePointLoopStatistics: The statistics of the cycles run so far.
+
+        The statistics cover the cycles run since the loop was created or its statistics were reset.
+        The periods are the times, in seconds, between the sample clock waits of consecutive
+        cycles returning, and period_jitter is their standard deviation. max_cycle_time is the
+        longest time, in seconds, from a sample clock wait returning to the write completing.
+        """
+        period_count = self._period_count
+        return SinglePointLoopStatistics(
+            self._cycle_count,
+            self._late_cycle_count,
+            self._mean_period_ns / 1e9,
+            self._min_period_ns / 1e9,
+            self._max_period_ns / 1e9,
+            math.sqrt(self._period_m2 / period_count) / 1e9 if period_count else 0.0,
+            self._max_cycle_time_ns / 1e9,
+        )
+
+    def reset_statistics(self):
+        """Discards the statistics of the cycles run so far."""
+        self._cycle_count = 0
+        self._late_cycle_count = 0
+        self._period_count = 0
+        self._mean_period_ns = 0.0
+        self._period_m2 = 0.0
+        self._min_period_ns = 0
+        self._max_period_ns = 0
+        self._max_cycle_time_ns = 0
+        self._previous_wake_ns = None
+
+    def run(self, number_of_cycles=None):
+        """Runs cycles of the loop.
+
+        Args:
+            number_of_cycles (Optional[int]): Specifies the number of
+                cycles to run. If you do not specify a value, the loop
+                runs until you call "stop" from another thread or from
+                the compute function.
+
+        Returns:
+            int:
+
+            The number of cycles that ran.
+        """
+        if self._running:
+            raise RuntimeError("The loop is already running.")
+        self._running = True
+        self._stop_requested = False
+        wait = self._interpreter.wait_for_next_sample_clock
+        read = self._read
+        compute = self._compute
+        write = self._write
+        handle = self._input_handle
+        timeout = self._timeout
+        perf_counter_ns = time.perf_counter_ns
+        cycles = 0
+        try:
+            while not self._stop_requested and (
+                number_of_cycles is None or cycles < number_of_cycles
+            ):
+                try:
+                    is_late = wait(handle, timeout)
+                except DaqError as error:
+                    if error.error_code not in _LATE_ERROR_CODES:
+                        raise
+                    is_late = True
+                wake_ns = perf_counter_ns()
+                output = compute(read())
+                if write is not None:
+                    write(output)
+                self._record_cycle(is_late, wake_ns, perf_counter_ns() - wake_ns)
+                cycles += 1
+        finally:
+            self._running = False
+        return cycles
+
+    def stop(self):
+        """Stops the loop after the current cycle completes."""
+        self._stop_requested = True
+
+    def _record_cycle(self, is_late: bool, wake_ns: int, cycle_time_ns: int) -> None:
+        self._is_late = is_late
+        self._cycle_count += 1
+        if is_late:
+            self._late_cycle_count += 1
+        if cycle_time_ns > self._max_cycle_time_ns:
+            self._max_cycle_time_ns = cycle_time_ns
+
+        previous_wake_ns = self._previous_wake_ns
+        self._previous_wake_ns = wake_ns
+        if previous_wake_ns is None:
+            return
+        # Use Welford's algorithm so that the jitter is accurate over long runs.
+        period_ns = wake_ns - previous_wake_ns
+        self._period_count += 1
+        if self._period_count == 1 or period_ns < self._min_period_ns:
+            self._min_period_ns = period_ns
+        if period_ns > self._max_period_ns:
+            self._max_period_ns = period_ns
+        delta = period_ns - self._mean_period_ns
+        self._mean_period_ns += delta / self._period_count
+        self._period_m2 += delta * (period_ns - self._mean_period_ns)
+
+
+def _create_read(task, timeout):
+    interpreter = task._interpreter
+    handle = task._handle
+    channels_to_read = task.in_stream.channels_to_read
+    number_of_channels = len(channels_to_read.channel_names)
+    read_chan_type = channels_to_read.chan_type
+    fill_mode = FillMode.GROUP_BY_CHANNEL.value
+
+    if read_chan_type == ChannelType.ANALOG_INPUT:
+        if number_of_channels == 1:
+            read_scalar = interpreter.read_analog_scalar_f64
+            return lambda: read_scalar(handle, timeout)
+        read_array = numpy.zeros(number_of_channels, dtype=numpy.float64)
+        read_function = interpreter.read_analog_f64
+    elif (
+        read_chan_type == ChannelType.DIGITAL_INPUT or read_chan_type == ChannelType.DIGITAL_OUTPUT
+    ):
+        if number_of_channels == 1:
+            read_scalar = interpreter.read_digital_scalar_u32
+            return lambda: read_scalar(handle, timeout)
+        read_array = numpy.zeros(number_of_channels, dtype=numpy.uint32)
+        read_function = interpreter.read_digital_u32
+    elif read_chan_type == ChannelType.COUNTER_INPUT:
+        read_scalar = interpreter.read_counter_scalar_f64
+        return lambda: read_scalar(handle, timeout)
+    else:
+        raise DaqError(
+            "Read failed, because there are no channels in this task from which data can be read.",
+            DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+            task_name=task.name,
+        )
+
+    def read():
+        read_function(handle, 1, timeout, fill_mode, read_array)
+        return read_array
+
+    return read
+
+
+def _create_write(task, timeout):
+    interpreter = task._interpreter
+    handle = task._handle
+    channels_to_write = task.channels
+    number_of_channels = len(channels_to_write.channel_names)
+    write_chan_type = channels_to_write.chan_type
+    data_layout = FillMode.GROUP_BY_CHANNEL.value
+
+    if write_chan_type == ChannelType.ANALOG_OUTPUT:
+        if number_of_channels == 1:
+            write_scalar = interpreter.write_analog_scalar_f64
+            return lambda value: write_scalar(handle, False, timeout, value)
+        write_array = numpy.zeros(number_of_channels, dtype=numpy.float64)
+        write_function = interpreter.write_analog_f64
+    elif write_chan_type == ChannelType.DIGITAL_OUTPUT:
+        if number_of_channels == 1:
+            write_scalar = interpreter.write_digital_scalar_u32
+            return lambda value: write_scalar(handle, False, timeout, value)
+        write_array = numpy.zeros(number_of_channels, dtype=numpy.uint32)
+        write_function = interpreter.write_digital_u32
+    else:
+        raise DaqError(
+            "Write failed, because there are no output channels in this task to which data can "
+            "be written.",
+            DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK,
+            task_name=task.name,
+        )
+
+    def write(values):
+        write_array[:] = values
+        write_function(handle, 1, False, timeout, data_layout, write_array)
+
+    return write
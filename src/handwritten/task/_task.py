@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import threading
 import warnings
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, NoReturn
 
 import numpy
 from nitypes.waveform import AnalogWaveform, DigitalWaveform
 
-from nidaqmx import utils
+from nidaqmx import _property_batch, utils
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
 from nidaqmx.constants import (
     READ_ALL_AVAILABLE,
@@ -40,7 +41,16 @@ from nidaqmx.task.collections._co_channel_collection import COChannelCollection
 from nidaqmx.task.collections._di_channel_collection import DIChannelCollection
 from nidaqmx.task.collections._do_channel_collection import DOChannelCollection
 from nidaqmx.task.triggering._triggers import Triggers
-from nidaqmx.types import CtrFreq, CtrTick, CtrTime, PowerMeasurement
+from nidaqmx.types import (
+    CTR_FREQ_DTYPE,
+    CTR_TICK_DTYPE,
+    CTR_TIME_DTYPE,
+    POWER_MEASUREMENT_DTYPE,
+    CtrFreq,
+    CtrTick,
+    CtrTime,
+    PowerMeasurement,
+)
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 
 __all__ = ["Task"]
@@ -83,6 +93,8 @@ class Task:
         "_triggers",
         "_out_stream",
         "_event_handler_lock",
+        "_read_plan",
+        "_configuration_generation",
         "__weakref__",
     )
 
@@ -265,12 +277,15 @@ class Task:
         # double closes.
         self._saved_name = self.name
 
-        self._ai_channels = AIChannelCollection(task_handle, interpreter)
-        self._ao_channels = AOChannelCollection(task_handle, interpreter)
-        self._ci_channels = CIChannelCollection(task_handle, interpreter)
-        self._co_channels = COChannelCollection(task_handle, interpreter)
-        self._di_channels = DIChannelCollection(task_handle, interpreter)
-        self._do_channels = DOChannelCollection(task_handle, interpreter)
+        self._read_plan = None
+        self._configuration_generation = 0
+
+        self._ai_channels = AIChannelCollection(task_handle, interpreter, self)
+        self._ao_channels = AOChannelCollection(task_handle, interpreter, self)
+        self._ci_channels = CIChannelCollection(task_handle, interpreter, self)
+        self._co_channels = COChannelCollection(task_handle, interpreter, self)
+        self._di_channels = DIChannelCollection(task_handle, interpreter, self)
+        self._do_channels = DOChannelCollection(task_handle, interpreter, self)
         self._export_signals = ExportSignals(task_handle, interpreter)
         self._in_stream = InStream(self, interpreter)
         self._timing = Timing(task_handle, interpreter)
@@ -307,6 +322,99 @@ class Task:
         else:
             return num_samps_per_chan
 
+    def _get_read_plan(self) -> _ReadPlan:
+        """Gets the cached read plan, building it if the task configuration changed."""
+        read_plan = self._read_plan
+        if read_plan is None:
+            read_plan = self._build_read_plan()
+            self._read_plan = read_plan
+        return read_plan
+
+    def _build_read_plan(self) -> _ReadPlan:
+        """Queries the channels to read and determines how Task.read() reads them."""
+        channels_to_read = self.in_stream.channels_to_read
+        number_of_channels = len(channels_to_read.channel_names)
+        read_chan_type = channels_to_read.chan_type
+
+        if read_chan_type == ChannelType.ANALOG_INPUT:
+            if any(chan.ai_meas_type == UsageTypeAI.POWER for chan in channels_to_read):
+                return _ReadPlan(
+                    number_of_channels,
+                    _ReadKind.POWER,
+                    POWER_MEASUREMENT_DTYPE,
+                    self._interpreter.read_power_f64,
+                )
+            return _ReadPlan(
+                number_of_channels,
+                _ReadKind.NUMERIC,
+                numpy.float64,
+                self._interpreter.read_analog_f64,
+            )
+
+        elif (
+            read_chan_type == ChannelType.DIGITAL_INPUT
+            or read_chan_type == ChannelType.DIGITAL_OUTPUT
+        ):
+            if self.in_stream.di_num_booleans_per_chan == 1:
+                return _ReadPlan(
+                    number_of_channels,
+                    _ReadKind.NUMERIC,
+                    numpy.bool_,
+                    self._interpreter.read_digital_lines,
+                )
+            return _ReadPlan(
+                number_of_channels,
+                _ReadKind.NUMERIC,
+                numpy.uint32,
+                self._interpreter.read_digital_u32,
+            )
+
+        elif read_chan_type == ChannelType.COUNTER_INPUT:
+            meas_type = channels_to_read.ci_meas_type
+
+            if meas_type in [
+                UsageTypeCI.PULSE_FREQ,
+                UsageTypeCI.PULSE_TIME,
+                UsageTypeCI.PULSE_TICKS,
+            ]:
+                if meas_type == UsageTypeCI.PULSE_FREQ:
+                    dtype, read_function = CTR_FREQ_DTYPE, self._interpreter.read_ctr_freq
+                elif meas_type == UsageTypeCI.PULSE_TIME:
+                    dtype, read_function = CTR_TIME_DTYPE, self._interpreter.read_ctr_time
+                else:
+                    dtype, read_function = CTR_TICK_DTYPE, self._interpreter.read_ctr_ticks
+                return _ReadPlan(
+                    number_of_channels,
+                    _ReadKind.COUNTER_PULSE,
+                    dtype,
+                    read_function,
+                    ci_meas_type=meas_type,
+                )
+            return _ReadPlan(
+                number_of_channels,
+                _ReadKind.NUMERIC,
+                numpy.float64,
+                self._interpreter.read_counter_f64_ex,
+            )
+
+        else:
+            raise DaqError(
+                "Read failed, because there are no channels in this task from "
+                "which data can be read.",
+                DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+                task_name=self.name,
+            )
+
+    def _invalidate_read_plan(self) -> None:
+        """Discards the cached read plan so that the next read rebuilds it.
+
+        This also advances the configuration generation, which stream readers use to discard
+        other read state that depends on the task configuration, such as cached extended
+        properties.
+        """
+        self._read_plan = None
+        self._configuration_generation += 1
+
     def add_global_channels(self, global_channels):
         """Adds global virtual channels from MAX to the given task.
 
@@ -321,6 +429,7 @@ class Task:
         channels = flatten_channel_string([g._name for g in global_channels])
 
         self._interpreter.add_global_chans_to_task(self._handle, channels)
+        self._invalidate_read_plan()
 
     def clear(self):
         """Clears the task.
@@ -375,6 +484,37 @@ class Task:
                 the task state.
         """
         self._interpreter.task_control(self._handle, action.value)
+        self._invalidate_read_plan()
+
+    def get_properties(self, properties):
+        """Gets the values of several properties with one batch of NI-DAQmx calls.
+
+        Getting each property separately makes one NI-DAQmx call per
+        property. With a remote task, each call is a network round
+        trip, so getting the configuration of a task with many channels
+        takes a long time. This method starts the calls for all the
+        properties before it waits for any of them, so getting them
+        takes about one round trip. With a local task, it makes the
+        calls in a tight loop.
+
+        Args:
+            properties (Iterable[Tuple[object, str]]): Specifies the
+                object and the name of each property to get, such as
+                (task.timing, "samp_clk_rate") or
+                (task.ai_channels["Dev1/ai0"], "ai_max"). The objects
+                can belong to this task or to other tasks.
+
+        Returns:
+            List[object]:
+
+            The value of each property, in the order specified.
+
+        Example:
+            >>> rate, ai_max = task.get_properties(
+            ...     [(task.timing, "samp_clk_rate"), (task.ai_channels[0], "ai_max")]
+            ... )
+        """
+        return _property_batch.get_properties(properties)
 
     def is_task_done(self):
         """Queries the status of the task and indicates if it completed execution.
@@ -520,7 +660,14 @@ class Task:
             self._handle, channel, skip_unsupported_channels
         )
 
-    def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET, timeout=10.0):
+    def read(
+        self,
+        number_of_samples_per_channel=NUM_SAMPLES_UNSET,
+        timeout=10.0,
+        *,
+        as_numpy=False,
+        out=None,
+    ):
         """Reads samples from the task or virtual channels you specify.
 
         This read method is dynamic, and is capable of inferring an appropriate
@@ -549,6 +696,16 @@ class Task:
         returns either a list (1 channel to read) or a list of lists (N
         channels to read).
 
+        Converting the samples to Python objects takes much longer than
+        reading them for large reads. To skip the conversion, set
+        "as_numpy" to True or pass a NumPy array in "out". This method
+        then returns a NumPy scalar instead of a scalar, and a 1D or 2D
+        NumPy array instead of a list or a list of lists. For counter
+        pulse and power measurements, the samples have a structured data
+        type, such as nidaqmx.types.CTR_FREQ_DTYPE or
+        nidaqmx.types.POWER_MEASUREMENT_DTYPE, whose fields match the
+        fields of the named tuples that this method otherwise returns.
+
         Args:
             number_of_samples_per_channel (Optional[int]): Specifies the
                 number of samples to read. If this input is not set,
@@ -581,12 +738,24 @@ class Task:
                 indefinitely. If you set timeout to 0, the method tries
                 once to read the requested samples and returns an error
                 if it is unable to.
+            as_numpy (Optional[bool]): Specifies whether to return the
+                samples as NumPy scalars and arrays instead of Python
+                objects.
+            out (Optional[numpy.ndarray]): Specifies a preallocated
+                NumPy array to read the samples into. The array must have
+                the shape and data type of the array that this method
+                returns when "as_numpy" is True and all the requested
+                samples are read. If you pass this array, this method
+                returns a view of it that contains the samples read, and
+                "as_numpy" is implied.
 
         Returns:
             dynamic:
 
             The samples requested in the form of a scalar, a list, or a
-            list of lists. See method docstring for more info.
+            list of lists, or their NumPy equivalents if "as_numpy" is
+            True or "out" is specified. See method docstring for more
+            info.
 
             NI-DAQmx scales the data to the units of the measurement,
             including any custom scaling you apply to the channels. Use a
@@ -601,9 +770,8 @@ class Task:
             >>> type(data[0])
             <type 'float'>
         """
-        channels_to_read = self.in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
-        read_chan_type = channels_to_read.chan_type
+        read_plan = self._get_read_plan()
+        number_of_channels = read_plan.number_of_channels
 
         num_samples_not_set = number_of_samples_per_channel is NUM_SAMPLES_UNSET
 
@@ -620,79 +788,42 @@ class Task:
         else:
             array_shape = (number_of_samples_per_channel,)
 
-        if read_chan_type == ChannelType.ANALOG_INPUT:
-            if any(chan.ai_meas_type == UsageTypeAI.POWER for chan in channels_to_read):
-                return self._read_power(
-                    array_shape, number_of_channels, number_of_samples_per_channel, timeout
-                )
-            else:
-                data: numpy.typing.NDArray = numpy.zeros(array_shape, dtype=numpy.float64)
-                _, samples_read = self._interpreter.read_analog_f64(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-
-        elif (
-            read_chan_type == ChannelType.DIGITAL_INPUT
-            or read_chan_type == ChannelType.DIGITAL_OUTPUT
-        ):
-            if self.in_stream.di_num_booleans_per_chan == 1:
-                data = numpy.zeros(array_shape, dtype=bool)
-                _, samples_read, _ = self._interpreter.read_digital_lines(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-            else:
-                data = numpy.zeros(array_shape, dtype=numpy.uint32)
-                _, samples_read = self._interpreter.read_digital_u32(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-
-        elif read_chan_type == ChannelType.COUNTER_INPUT:
-            meas_type = channels_to_read.ci_meas_type
-
-            if meas_type in [
-                UsageTypeCI.PULSE_FREQ,
-                UsageTypeCI.PULSE_TIME,
-                UsageTypeCI.PULSE_TICKS,
-            ]:
-                return self._read_ctr_pulse(
-                    array_shape,
-                    meas_type,
-                    number_of_channels,
-                    number_of_samples_per_channel,
-                    num_samples_not_set,
-                    timeout,
-                )
-
-            else:
-                data = numpy.zeros(array_shape, dtype=numpy.float64)
+        if as_numpy or out is not None:
+            return self._read_numpy(
+                read_plan,
+                array_shape,
+                number_of_samples_per_channel,
+                num_samples_not_set,
+                timeout,
+                out,
+            )
 
-                _, samples_read = self._interpreter.read_counter_f64_ex(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-        else:
-            raise DaqError(
-                "Read failed, because there are no channels in this task from "
-                "which data can be read.",
-                DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
-                task_name=self.name,
+        if read_plan.kind == _ReadKind.POWER:
+            return self._read_power(
+                array_shape, number_of_channels, number_of_samples_per_channel, timeout
+            )
+        elif read_plan.kind == _ReadKind.COUNTER_PULSE:
+            assert read_plan.ci_meas_type is not None
+            return self._read_ctr_pulse(
+                array_shape,
+                read_plan.ci_meas_type,
+                number_of_channels,
+                number_of_samples_per_channel,
+                num_samples_not_set,
+                timeout,
             )
 
+        assert read_plan.read_function is not None
+        data: numpy.typing.NDArray = numpy.zeros(array_shape, dtype=read_plan.dtype)
+        # read_digital_lines also returns the number of bytes per sample, so index the result.
+        samples_read = read_plan.read_function(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            data,
+        )[1]
+
         if num_samples_not_set and array_shape == (1,):
             return data.tolist()[0]
 
@@ -704,6 +835,86 @@ class Task:
 
         return data.tolist()
 
+    def _read_numpy(
+        self,
+        read_plan: _ReadPlan,
+        array_shape: tuple[int, ...],
+        number_of_samples_per_channel: int,
+        num_samples_not_set: bool,
+        timeout: float,
+        out: numpy.typing.NDArray | None,
+    ) -> Any:
+        if out is None:
+            data: numpy.typing.NDArray = numpy.zeros(array_shape, dtype=read_plan.dtype)
+        else:
+            self._verify_read_array(out, array_shape, read_plan.dtype)
+            data = out
+
+        assert read_plan.read_function is not None
+        if read_plan.kind == _ReadKind.NUMERIC:
+            samples_read = read_plan.read_function(
+                self._handle,
+                number_of_samples_per_channel,
+                timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                data,
+            )[1]
+        else:
+            # The driver reads each field of the counter pulse and power samples into a separate
+            # contiguous array, so copy them into the fields of the structured array.
+            assert data.dtype.names is not None
+            first_field, second_field = data.dtype.names
+            first_array = numpy.zeros(array_shape, dtype=data.dtype[first_field])
+            second_array = numpy.zeros(array_shape, dtype=data.dtype[second_field])
+            samples_read = read_plan.read_function(
+                self._handle,
+                number_of_samples_per_channel,
+                timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                first_array,
+                second_array,
+            )[2]
+            data[first_field] = first_array
+            data[second_field] = second_array
+
+        if num_samples_not_set and array_shape == (1,):
+            return data[0]
+
+        if samples_read != number_of_samples_per_channel:
+            return data[..., :samples_read]
+
+        return data
+
+    def _verify_read_array(
+        self,
+        data: numpy.typing.NDArray,
+        array_shape: tuple[int, ...],
+        dtype: numpy.typing.DTypeLike,
+    ) -> None:
+        if data.shape != array_shape or data.dtype != dtype:
+            raise DaqError(
+                "Read cannot be performed because the NumPy array passed into "
+                "this function is not shaped correctly or does not have the "
+                "correct data type. You must pass in a NumPy array of the "
+                "correct shape based on the number of channels in task and the "
+                "number of samples per channel requested.\n\n"
+                "Shape of NumPy Array provided: {}\n"
+                "Shape of NumPy Array required: {}\n"
+                "Data type of NumPy Array provided: {}\n"
+                "Data type of NumPy Array required: {}".format(
+                    data.shape, array_shape, data.dtype, numpy.dtype(dtype)
+                ),
+                DAQmxErrors.UNKNOWN,
+                task_name=self.name,
+            )
+        if not data.flags.c_contiguous or not data.flags.writeable:
+            raise DaqError(
+                "Read cannot be performed because the NumPy array passed into "
+                "this function is not C-contiguous and writeable.",
+                DAQmxErrors.UNKNOWN,
+                task_name=self.name,
+            )
+
     def _read_ctr_pulse(
         self,
         array_shape: tuple[int, ...],
@@ -1204,6 +1415,29 @@ class Task:
 
         self._interpreter.save_task(self._handle, save_as, author, options)
 
+    def set_properties(self, values):
+        """Sets the values of several properties with one batch of NI-DAQmx calls.
+
+        Setting a property can change the value of another property, so
+        unlike "get_properties", this method waits for each call to
+        complete before it makes the next one. NI-DAQmx sets the
+        properties in the order specified.
+
+        Args:
+            values (Mapping[Tuple[object, str], object]): Specifies the
+                object and the name of each property to set, and the
+                value to set it to. You can also specify an iterable of
+                ((object, name), value) pairs.
+
+        Example:
+            >>> task.set_properties(
+            ...     {(channel, "ai_max"): 5.0 for channel in task.ai_channels}
+            ... )
+        """
+        if isinstance(values, Mapping):
+            values = values.items()
+        _property_batch.set_properties(values)
+
     def start(self):
         """Start the task.
 
@@ -1239,6 +1473,30 @@ class Task:
         """
         self._interpreter.stop_task(self._handle)
 
+    def wait_for_next_sample_clock(self, timeout=10.0):
+        """Waits until the next pulse of the Sample Clock occurs.
+
+        Use this method only with hardware-timed single-point tasks,
+        such as control loops. Call this method before you read or
+        write samples in each iteration of the loop. If the loop is
+        late, NI-DAQmx either reports an error or returns True,
+        depending on how you configure the task to report late errors.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for the next Sample Clock pulse.
+                This method returns an error if the time elapses. The
+                default is 10. If you set timeout (sec) to
+                nidaqmx.WAIT_INFINITELY, the method waits indefinitely.
+
+        Returns:
+            bool:
+
+            Indicates if an extra Sample Clock pulse occurred since the
+            previous call, which means that the loop is late.
+        """
+        return self._interpreter.wait_for_next_sample_clock(self._handle, timeout)
+
     def wait_for_valid_timestamp(self, timestamp_event, timeout=10.0):
         """Wait until the specified timestamp has a value.
 
@@ -1278,6 +1536,31 @@ class Task:
         """
         self._interpreter.wait_until_task_done(self._handle, timeout)
 
+    async def wait_until_done_async(self, timeout=10.0):
+        """Waits for the measurement or generation to complete without blocking the event loop.
+
+        This method is the asyncio counterpart of the "wait_until_done"
+        method. With a remote task whose gRPC session options specify a
+        grpc_aio_channel, it uses an asynchronous RPC. Otherwise, it
+        runs "wait_until_done" in the event loop's default executor, so
+        the number of concurrent waits is limited by the size of that
+        executor.
+
+        Cancelling the awaiting coroutine does not stop the wait in the
+        driver, which continues until the operation completes or the
+        timeout elapses.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of time in
+                seconds to wait for the measurement or generation to complete.
+                This method returns an error if the time elapses. The
+                default is 10. If you set timeout (sec) to
+                nidaqmx.WAIT_INFINITELY, the method waits indefinitely. If you
+                set timeout (sec) to 0, the method checks once and returns
+                an error if the measurement or generation is not done.
+        """
+        await self._interpreter.wait_until_task_done_async(self._handle, timeout)
+
     def _raise_invalid_num_lines_error(self, num_lines_expected, num_lines_in_data) -> NoReturn:
         raise DaqError(
             "Specified read or write operation failed, because the number "
@@ -1359,6 +1642,11 @@ class Task:
         - List of CtrFreq, CtrTime, CtrTick (from nidaqmx.types):
           Multiple samples for 1 channel or 1 sample for multiple
           channels.
+        - 1D structured numpy.ndarray with the fields of CtrFreq,
+          CtrTime, or CtrTick, such as an array with the data type
+          nidaqmx.types.CTR_FREQ_DTYPE: Multiple samples for 1 channel
+          or 1 sample for multiple channels. Writing a structured array
+          does not create a Python object for each sample.
 
         If the task uses on-demand timing, this method returns only
         after the device generates all samples. On-demand is the default
@@ -1474,12 +1762,18 @@ class Task:
 
         elif write_chan_type == ChannelType.DIGITAL_OUTPUT:
             if self.out_stream.do_num_booleans_per_chan == 1:
-                if not isinstance(element, bool) and not isinstance(element, numpy.bool_):
+                if isinstance(data, numpy.ndarray):
+                    is_valid = data.dtype == numpy.bool_
+                else:
+                    is_valid = isinstance(element, (bool, numpy.bool_))
+                if not is_valid:
                     raise DaqError(
                         "Write failed, because this write method only accepts "
                         "boolean samples when there is one digital line per "
                         "channel in a task.\n\n"
-                        "Requested sample type: {}".format(type(element)),
+                        "Requested sample type: {}".format(
+                            data.dtype if isinstance(data, numpy.ndarray) else type(element)
+                        ),
                         DAQmxErrors.UNKNOWN,
                         task_name=self.name,
                     )
@@ -1494,12 +1788,18 @@ class Task:
                     data,
                 )
             else:
-                if not isinstance(element, int) and not isinstance(element, numpy.uint32):
+                if isinstance(data, numpy.ndarray):
+                    is_valid = self._is_uint32_array(data)
+                else:
+                    is_valid = isinstance(element, (int, numpy.uint32))
+                if not is_valid:
                     raise DaqError(
                         "Write failed, because this write method only accepts "
                         "unsigned 32-bit integer samples when there are "
                         "multiple digital lines per channel in a task.\n\n"
-                        "Requested sample type: {}".format(type(element)),
+                        "Requested sample type: {}".format(
+                            data.dtype if isinstance(data, numpy.ndarray) else type(element)
+                        ),
                         DAQmxErrors.UNKNOWN,
                         task_name=self.name,
                     )
@@ -1517,6 +1817,55 @@ class Task:
         elif write_chan_type == ChannelType.COUNTER_OUTPUT:
             output_type = channels_to_write.co_output_type
 
+            if output_type == UsageTypeCO.PULSE_FREQUENCY:
+                write_function = self._interpreter.write_ctr_freq
+            elif output_type == UsageTypeCO.PULSE_TIME:
+                write_function = self._interpreter.write_ctr_time
+            elif output_type == UsageTypeCO.PULSE_TICKS:
+                write_function = self._interpreter.write_ctr_ticks
+            else:
+                self._raise_unsupported_output_type_error(output_type)
+
+            first_array, second_array = self._get_ctr_write_arrays(
+                data, output_type, number_of_samples_per_channel
+            )
+            return write_function(
+                self._handle,
+                number_of_samples_per_channel,
+                auto_start,
+                timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                first_array,
+                second_array,
+            )
+
+        else:
+            self._raise_no_output_channels_error()
+
+    @staticmethod
+    def _is_uint32_array(data: numpy.typing.NDArray) -> bool:
+        """Check if an array contains integers that fit in an unsigned 32-bit integer."""
+        if not numpy.issubdtype(data.dtype, numpy.integer):
+            return False
+        if numpy.can_cast(data.dtype, numpy.uint32) or data.size == 0:
+            return True
+        return bool(data.min() >= 0 and data.max() <= _UINT32_MAX)
+
+    def _get_ctr_write_arrays(
+        self, data: Any, output_type: UsageTypeCO, number_of_samples_per_channel: int
+    ) -> tuple[numpy.typing.NDArray, numpy.typing.NDArray]:
+        """Get the contiguous arrays of the two fields of counter output samples."""
+        sample_type, dtype = _CTR_WRITE_SAMPLE_TYPES[output_type]
+        assert dtype.names is not None
+        first_field, second_field = dtype.names
+        if isinstance(data, (numpy.ndarray, numpy.void)) and data.dtype.names is not None:
+            if not {first_field, second_field}.issubset(data.dtype.names):
+                raise TypeError(
+                    f"Output type {output_type} requires a structured array with the fields "
+                    f"{dtype.names}, not {data.dtype.names}."
+                )
+            samples = data
+        else:
             if number_of_samples_per_channel == 1:
                 data = [data]
             elif not isinstance(data, Iterable):
@@ -1526,65 +1875,22 @@ class Task:
                     DAQmxErrors.UNKNOWN,
                     task_name=self.name,
                 )
-
-            if output_type == UsageTypeCO.PULSE_FREQUENCY:
-                if not all(isinstance(sample, CtrFreq) for sample in data):
-                    raise TypeError(f"Output type {output_type} requires samples of type CtrFreq.")
-
-                frequencies = numpy.array([sample.freq for sample in data], dtype=numpy.float64)
-                duty_cycles = numpy.array(
-                    [sample.duty_cycle for sample in data], dtype=numpy.float64
-                )
-
-                return self._interpreter.write_ctr_freq(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    auto_start,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    frequencies,
-                    duty_cycles,
-                )
-
-            elif output_type == UsageTypeCO.PULSE_TIME:
-                if not all(isinstance(sample, CtrTime) for sample in data):
-                    raise TypeError(f"Output type {output_type} requires samples of type CtrTime.")
-
-                high_times = numpy.array([sample.high_time for sample in data], dtype=numpy.float64)
-                low_times = numpy.array([sample.low_time for sample in data], dtype=numpy.float64)
-
-                return self._interpreter.write_ctr_time(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    auto_start,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    high_times,
-                    low_times,
-                )
-
-            elif output_type == UsageTypeCO.PULSE_TICKS:
-                if not all(isinstance(sample, CtrTick) for sample in data):
-                    raise TypeError(f"Output type {output_type} requires samples of type CtrTick.")
-
-                high_ticks = numpy.array([sample.high_tick for sample in data], dtype=numpy.uint32)
-                low_ticks = numpy.array([sample.low_tick for sample in data], dtype=numpy.uint32)
-
-                return self._interpreter.write_ctr_ticks(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    auto_start,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    high_ticks,
-                    low_ticks,
+            elif not isinstance(data, Sequence):
+                data = list(data)
+            # NumPy converts tuples by position and broadcasts scalars, so check every sample to
+            # keep samples of another type from being written as valid pulses.
+            if not all(isinstance(sample, sample_type) for sample in data):
+                raise TypeError(
+                    f"Output type {output_type} requires samples of type {sample_type.__name__}."
                 )
+            # The samples are tuples, so NumPy converts them to a structured array without
+            # creating an intermediate list for each field.
+            samples = numpy.asarray(data, dtype=dtype)
 
-            else:
-                self._raise_unsupported_output_type_error(output_type)
-
-        else:
-            self._raise_no_output_channels_error()
+        return (
+            numpy.ascontiguousarray(samples[first_field], dtype=dtype[first_field]),
+            numpy.ascontiguousarray(samples[second_field], dtype=dtype[second_field]),
+        )
 
     def _is_waveform_data(self, data):
         """Check if data is waveform data (single waveform or list of waveforms)."""
@@ -1742,6 +2048,38 @@ class _TaskAlternateConstructor(Task):
         self.__class__ = Task  # type: ignore[assignment]
 
 
+_UINT32_MAX = 0xFFFFFFFF
+
+_CTR_WRITE_SAMPLE_TYPES = {
+    UsageTypeCO.PULSE_FREQUENCY: (CtrFreq, CTR_FREQ_DTYPE),
+    UsageTypeCO.PULSE_TIME: (CtrTime, CTR_TIME_DTYPE),
+    UsageTypeCO.PULSE_TICKS: (CtrTick, CTR_TICK_DTYPE),
+}
+
+
+class _ReadKind(Enum):
+    """Internal enum for the read method that Task.read() uses."""
+
+    NUMERIC = 1
+    POWER = 2
+    COUNTER_PULSE = 3
+
+
+@dataclass(frozen=True)
+class _ReadPlan:
+    """Cached channel metadata that Task.read() needs in order to read from the task.
+
+    Building a read plan queries the channels to read, their channel types, and their measurement
+    types. The task caches the read plan until the channel configuration changes.
+    """
+
+    number_of_channels: int
+    kind: _ReadKind
+    dtype: numpy.typing.DTypeLike
+    read_function: Callable[..., tuple[Any, ...]] | None = None
+    ci_meas_type: UsageTypeCI | None = None
+
+
 class _TaskEventType(Enum):
     """Internal enum for task event bookkeeping."""
 
@@ -1,10 +1,50 @@
+from __future__ import annotations
+
 from collections.abc import Sequence
+from dataclasses import dataclass
 
+from nidaqmx.constants import ChannelType
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import DaqError
 from nidaqmx.task.channels._channel import Channel
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 
+# DAQmx_Task_Channels and DAQmx_ChanType
+_TASK_CHANNELS = 0x1273
+_CHAN_TYPE = 0x187F
+
+# Getting a channel attribute of several channels returns these errors when their values differ.
+_DIFFERENT_VALUES_ERRORS = (
+    DAQmxErrors.PRPTY_GET_IMPLIED_ACTIVE_CHAN_FAILED_DUE_TO_DIFFT_VALS,
+    DAQmxErrors.PRPTY_GET_SPECD_ACTIVE_CHAN_FAILED_DUE_TO_DIFFT_VALS,
+)
+
+
+@dataclass(frozen=True)
+class _ChannelSnapshot:
+    """The virtual channels of a task and the classes that represent them.
+
+    ChannelCollection caches a snapshot per task configuration generation, so that indexing and
+    iterating over the collection neither query the channel names again nor query the type of
+    each channel.
+    """
+
+    configuration_generation: int | None
+    channel_names: tuple[str, ...]
+    channel_classes: tuple[type[Channel], ...]
+    channel_classes_by_name: dict[str, type[Channel]]
+
+
+def _get_common_class(channel_classes) -> type[Channel] | None:
+    """Gets the class shared by all of the specified channel classes, if there is one."""
+    common_class = None
+    for channel_class in channel_classes:
+        if common_class is None:
+            common_class = channel_class
+        elif channel_class is not common_class:
+            return None
+    return common_class
+
 
 class ChannelCollection(Sequence):
     """Contains the collection of channels for a DAQmx Task.
@@ -12,10 +52,12 @@ class ChannelCollection(Sequence):
     This class defines methods that implements a container object.
     """
 
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task_handle, interpreter, task=None):
         """Do not construct this object directly; instead, construct a nidaqmx.Task and use the appropriate property, such as task.ai_channels."""  # noqa: W505 - doc line too long (146 > 100 characters) (auto-generated noqa)
         self._handle = task_handle
         self._interpreter = interpreter
+        self._task = task
+        self._snapshot: _ChannelSnapshot | None = None
 
     def __contains__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         self, item
@@ -55,12 +97,17 @@ class ChannelCollection(Sequence):
             Indicates a channel object representing the subset of virtual
             channels indexed.
         """
+        snapshot = self._get_snapshot()
+        channel_class: type[Channel] | None
         if isinstance(index, int):
-            channel_names = self.channel_names[index]
+            channel_names = snapshot.channel_names[index]
+            channel_class = snapshot.channel_classes[index]
         elif isinstance(index, slice):
-            channel_names = flatten_channel_string(self.channel_names[index])
+            channel_names = flatten_channel_string(list(snapshot.channel_names[index]))
+            channel_class = _get_common_class(snapshot.channel_classes[index])
         elif isinstance(index, str):
             channel_names = index
+            channel_class = snapshot.channel_classes_by_name.get(index)
         else:
             raise DaqError(
                 f'Invalid index type "{type(index)}" used to access channels.',
@@ -68,6 +115,8 @@ class ChannelCollection(Sequence):
             )
 
         if channel_names:
+            if channel_class is not None:
+                return channel_class(self._handle, channel_names, self._interpreter)
             return Channel._factory(self._handle, channel_names, self._interpreter)
         else:
             raise DaqError(
@@ -80,30 +129,93 @@ class ChannelCollection(Sequence):
         return self._interpreter.hash_task_handle(self._handle)
 
     def __iter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
-        for channel_name in self.channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+        snapshot = self._get_snapshot()
+        for channel_name, channel_class in zip(snapshot.channel_names, snapshot.channel_classes):
+            yield channel_class(self._handle, channel_name, self._interpreter)
 
     def __len__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
-        return len(self.channel_names)
+        return len(self._get_snapshot().channel_names)
 
     def __ne__(self, other):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         return not self.__eq__(other)
 
     def __reversed__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
-        channel_names = self.channel_names
-        channel_names.reverse()
-
-        for channel_name in channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+        snapshot = self._get_snapshot()
+        for channel_name, channel_class in zip(
+            reversed(snapshot.channel_names), reversed(snapshot.channel_classes)
+        ):
+            yield channel_class(self._handle, channel_name, self._interpreter)
+
+    def _channels_changed(self):
+        """Notifies the owning task that channels were added to it."""
+        self._snapshot = None
+        if self._task is not None:
+            self._task._invalidate_read_plan()
+
+    def _get_snapshot(self) -> _ChannelSnapshot:
+        """Gets the cached channel snapshot, building it if the task configuration changed.
+
+        Without an owning task, the collection cannot tell when channels are added, so it builds
+        a new snapshot each time.
+        """
+        configuration_generation = (
+            self._task._configuration_generation if self._task is not None else None
+        )
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or configuration_generation is None
+            or snapshot.configuration_generation != configuration_generation
+        ):
+            snapshot = self._build_snapshot(configuration_generation)
+            self._snapshot = snapshot
+        return snapshot
+
+    def _build_snapshot(self, configuration_generation: int | None) -> _ChannelSnapshot:
+        """Queries the names of the virtual channels and resolves their classes in bulk."""
+        channel_names = tuple(
+            unflatten_channel_string(
+                self._interpreter.get_task_attribute_string(self._handle, _TASK_CHANNELS)
+            )
+        )
+        chan_types: list[int] = []
+        if channel_names:
+            try:
+                # A blank channel name means all channels. This succeeds with one call when all
+                # of the channels have the same type, which is the common case.
+                chan_type = self._interpreter.get_chan_attribute_int32(self._handle, "", _CHAN_TYPE)
+                chan_types = [chan_type] * len(channel_names)
+            except DaqError as error:
+                if error.error_code not in _DIFFERENT_VALUES_ERRORS:
+                    raise
+                chan_types = self._interpreter.call_batch(
+                    [
+                        ("get_chan_attribute_int32", (self._handle, channel_name, _CHAN_TYPE))
+                        for channel_name in channel_names
+                    ]
+                )
+
+        channel_classes = tuple(
+            Channel._get_channel_class(ChannelType(chan_type)) for chan_type in chan_types
+        )
+        return _ChannelSnapshot(
+            configuration_generation,
+            channel_names,
+            channel_classes,
+            dict(zip(channel_names, channel_classes)),
+        )
 
     @property
     def all(self):
         """:class:`nidaqmx.task.channels.Channel`: Specifies a channel object that represents the entire list of virtual channels on this channel collection."""  # noqa: W505 - doc line too long (160 > 100 characters) (auto-generated noqa)
         # Passing a blank string means all channels.
+        snapshot = self._get_snapshot()
+        channel_class = _get_common_class(snapshot.channel_classes)
+        if channel_class is not None:
+            return channel_class(self._handle, "", self._interpreter)
         return Channel._factory(self._handle, "", self._interpreter)
 
     @property
     def channel_names(self):
         """List[str]: Specifies the entire list of virtual channels on this channel collection."""
-        val = self._interpreter.get_task_attribute_string(self._handle, 0x1273)
-        return unflatten_channel_string(val)
+        return list(self._get_snapshot().channel_names)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from typing import NamedTuple
 
+from nidaqmx import _interpreter_pool, instrumentation
 from nidaqmx._base_interpreter import BaseInterpreter
 from nidaqmx.errors import DaqError
 from nidaqmx.grpc_session_options import GrpcSessionOptions
@@ -22,6 +27,13 @@ _invalid_range_syntax_message = (
     "objects."
 )
 
+# The channel string functions are called for most channel and collection operations, so they
+# precompile their patterns and cache their results by input.
+_CHANNEL_STRING_CACHE_SIZE = 256
+_RANGE_BOUND_REGEX = re.compile("(.*?)([0-9]+)$")
+_TRAILING_NUMBER_REGEX = re.compile("(.*[^0-9])?([0-9]+)$")
+_NUMBER_REGEX = re.compile("[0-9]+")
+
 
 @dataclass
 class _ChannelInfo:
@@ -61,15 +73,20 @@ def flatten_channel_string(channel_names: list[str]) -> str:
     Returns:
         The resulting comma-delimited list of physical or virtual channel names.
     """
-    unflattened_channel_names = []
+    return _flatten_channel_names(tuple(channel_names))
+
+
+@functools.lru_cache(maxsize=_CHANNEL_STRING_CACHE_SIZE)
+def _flatten_channel_names(channel_names: tuple[str, ...]) -> str:
+    unflattened_channel_names: list[str] = []
     for channel_name in channel_names:
-        unflattened_channel_names.extend(unflatten_channel_string(channel_name))
+        unflattened_channel_names.extend(_parse_channel_string(channel_name).names)
 
     # Go through the channel names and flatten them.
     flattened_channel_list = []
     previous = _ChannelInfo()
     for channel_name in unflattened_channel_names:
-        m = re.search("(.*[^0-9])?([0-9]+)$", channel_name)
+        m = _TRAILING_NUMBER_REGEX.search(channel_name)
         if not m:
             # If the channel name doesn't end in a valid number, just use the
             # channel name as-is.
@@ -140,7 +157,137 @@ def unflatten_channel_string(channel_names: str) -> list[str]:
 
         Each element of the list contains a single channel.
     """
-    channel_list_to_return = []
+    return list(_parse_channel_string(channel_names).names)
+
+
+class _ChannelRange(NamedTuple):
+    """A range of channel names that share a prefix and end in consecutive numbers."""
+
+    prefix: str
+    first: int
+    last: int
+    # The minimum number of digits, or 0 if the numbers are not zero-padded.
+    width: int
+
+    def __len__(self) -> int:
+        return abs(self.last - self.first) + 1
+
+    def format(self, number: int) -> str:
+        """Gets the channel name that ends in the specified number."""
+        if self.width:
+            return self.prefix + str(number).zfill(self.width)
+        return self.prefix + str(number)
+
+    def find(self, channel_name: str) -> int:
+        """Gets the position of a channel name in the range, or -1 if it is not in the range."""
+        if not channel_name.startswith(self.prefix):
+            return -1
+        number_str = channel_name[len(self.prefix) :]
+        if not _NUMBER_REGEX.fullmatch(number_str):
+            return -1
+        number = int(number_str)
+        if not min(self.first, self.last) <= number <= max(self.first, self.last):
+            return -1
+        if self.format(number) != channel_name:
+            return -1
+        return number - self.first if self.first <= self.last else self.first - number
+
+    def names(self) -> list[str]:
+        """Gets the channel names in the range."""
+        step = 1 if self.first <= self.last else -1
+        return [self.format(number) for number in range(self.first, self.last + step, step)]
+
+
+class _ChannelString:
+    """The channel names in a comma-delimited list or range of channel names.
+
+    This stores each range of channels as a prefix and a range of numbers, so len(), indexing,
+    `in`, and index() do not expand the ranges into a list of names.
+    """
+
+    __slots__ = ("_segments", "_offsets", "_names")
+
+    def __init__(self, segments: Sequence[str | _ChannelRange]) -> None:
+        self._segments = tuple(segments)
+        offsets = []
+        offset = 0
+        for segment in self._segments:
+            offsets.append(offset)
+            offset += 1 if isinstance(segment, str) else len(segment)
+        offsets.append(offset)
+        # The position of the first channel name of each segment, followed by the total length.
+        self._offsets = tuple(offsets)
+        self._names: tuple[str, ...] | None = None
+
+    def __contains__(self, channel_name: object) -> bool:
+        return isinstance(channel_name, str) and self._find(channel_name) != -1
+
+    def __getitem__(self, index: int) -> str:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("channel index out of range")
+        segment_index = bisect.bisect_right(self._offsets, index) - 1
+        segment = self._segments[segment_index]
+        if isinstance(segment, str):
+            return segment
+        position = index - self._offsets[segment_index]
+        if segment.first <= segment.last:
+            return segment.format(segment.first + position)
+        return segment.format(segment.first - position)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def index(self, channel_name: str) -> int:
+        """Gets the position of the first occurrence of a channel name.
+
+        Raises:
+            ValueError: The channel name is not in the list.
+        """
+        position = self._find(channel_name)
+        if position == -1:
+            raise ValueError(f"{channel_name!r} is not in the list of channel names")
+        return position
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Tuple[str]: The channel names, with the ranges expanded."""
+        names = self._names
+        if names is None:
+            expanded: list[str] = []
+            for segment in self._segments:
+                if isinstance(segment, str):
+                    expanded.append(segment)
+                else:
+                    expanded.extend(segment.names())
+            names = tuple(expanded)
+            self._names = names
+        return names
+
+    def _find(self, channel_name: str) -> int:
+        for segment, offset in zip(self._segments, self._offsets):
+            if isinstance(segment, str):
+                if segment == channel_name:
+                    return offset
+            else:
+                position = segment.find(channel_name)
+                if position != -1:
+                    return offset + position
+        return -1
+
+
+@functools.lru_cache(maxsize=_CHANNEL_STRING_CACHE_SIZE)
+def _parse_channel_string(channel_names: str) -> _ChannelString:
+    """Parses a comma-delimited list or range of channel names.
+
+    The results are cached by channel string, so do not modify them.
+    """
+    segments: list[str | _ChannelRange] = []
     channel_list = [c for c in channel_names.strip().split(",") if c]
 
     for channel in channel_list:
@@ -148,13 +295,13 @@ def unflatten_channel_string(channel_names: str) -> list[str]:
         colon_index = channel.find(":")
 
         if colon_index == -1:
-            channel_list_to_return.append(channel)
+            segments.append(channel)
         else:
             before = channel[:colon_index]
             after = channel[colon_index + 1 :]
 
-            m_before = re.match("(.*?)([0-9]+)$", before)
-            m_after = re.match("(.*?)([0-9]+)$", after)
+            m_before = _RANGE_BOUND_REGEX.match(before)
+            m_after = _RANGE_BOUND_REGEX.match(after)
 
             if not m_before or not m_after:
                 raise DaqError(_invalid_range_syntax_message, error_code=-200498)
@@ -164,8 +311,7 @@ def unflatten_channel_string(channel_names: str) -> list[str]:
 
             num_before_str = m_before.group(2)
             num_before = int(num_before_str)
-            num_after_str = m_after.group(2)
-            num_after = int(num_after_str)
+            num_after = int(m_after.group(2))
 
             num_min_width = 0
             # If there are any leading 0s in the first number, we want to ensure
@@ -174,30 +320,12 @@ def unflatten_channel_string(channel_names: str) -> list[str]:
             if num_before > 0 and len(num_before_str.lstrip("0")) < len(num_before_str):
                 num_min_width = len(num_before_str)
 
-            num_max = max([num_before, num_after])
-            num_min = min([num_before, num_after])
-            number_of_channels = (num_max - num_min) + 1
-
-            if number_of_channels >= 15000:
+            if abs(num_after - num_before) + 1 >= 15000:
                 raise DaqError(_invalid_range_syntax_message, error_code=-200498)
 
-            colon_expanded_channel = []
-            for i in range(number_of_channels):
-                current_number = num_min + i
-                if num_min_width > 0:
-                    # Using f-strings to create format strings. Braces for days!
-                    zero_padded_format_specifier = f"{{:0{num_min_width}d}}"
-                    current_number_str = zero_padded_format_specifier.format(current_number)
-                else:
-                    current_number_str = str(current_number)
-                colon_expanded_channel.append(f"{m_before.group(1)}{current_number_str}")
-
-            if num_after < num_before:
-                colon_expanded_channel.reverse()
-
-            channel_list_to_return.extend(colon_expanded_channel)
+            segments.append(_ChannelRange(m_before.group(1), num_before, num_after, num_min_width))
 
-    return channel_list_to_return
+    return _ChannelString(segments)
 
 
 def _select_interpreter(
@@ -207,10 +335,11 @@ def _select_interpreter(
         return interpreter
     else:
         if grpc_options:
-            from nidaqmx._grpc_interpreter import GrpcStubInterpreter
-
-            return GrpcStubInterpreter(grpc_options)
+            interpreter = _interpreter_pool.get_grpc_interpreter(grpc_options)
         else:
-            from nidaqmx._library_interpreter import LibraryInterpreter
+            interpreter = _interpreter_pool.get_default_interpreter()
+        if instrumentation.is_enabled():
+            from nidaqmx._instrumented_interpreter import InstrumentedInterpreter
 
-            return LibraryInterpreter()
+            interpreter = InstrumentedInterpreter(interpreter)
+        return interpreter
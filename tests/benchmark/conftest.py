@@ -50,6 +50,19 @@ def _commit_output_task(task: Task, num_samples: int) -> None:
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add command line options to pytest."""
     parser.addoption("--device", action="store", default=None, help="Device name for benchmarks")
+    parser.addoption(
+        "--overhead-baseline",
+        action="store",
+        default=None,
+        help="Benchmark JSON file (from --benchmark-json) to compare overhead benchmarks against",
+    )
+    parser.addoption(
+        "--overhead-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Fraction by which an overhead benchmark may exceed its baseline before it fails",
+    )
 
 
 @pytest.fixture
@@ -0,0 +1 @@
+"""Driver-free benchmarks for the Python overhead of the nidaqmx package."""
@@ -0,0 +1,190 @@
+"""A zero-cost interpreter for measuring the Python overhead of the nidaqmx package."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from nidaqmx._simulated_interpreter import SimulatedInterpreter
+
+
+class StubInterpreter(SimulatedInterpreter):
+    """An interpreter whose reads and writes return immediately without touching any data.
+
+    Task, channel, and attribute management come from the simulated interpreter, so tasks behave
+    as they do with a device. Reads and writes only report the requested number of samples, so
+    benchmarks that use this interpreter measure the overhead of the Python layers above it.
+    """
+
+    __slots__ = ()
+
+    # Simulated interpreter hooks
+
+    def _read(self, task, num_samps_per_chan, timeout, fill_mode, read_array, convert) -> int:
+        return num_samps_per_chan
+
+    def _read_scalar(self, task, timeout) -> Any:
+        return 0
+
+    def _read_waveforms(
+        self,
+        task_handle,
+        number_of_samples_per_channel,
+        timeout,
+        waveforms,
+        waveform_attribute_mode,
+        read_context,
+        copy_data,
+        number_of_signals_per_sample=None,
+    ) -> int:
+        for waveform in waveforms:
+            waveform.sample_count = number_of_samples_per_channel
+        return number_of_samples_per_channel
+
+    def _write(self, task, num_samps_per_chan, auto_start, timeout) -> int:
+        return num_samps_per_chan
+
+    # Reads that the simulated interpreter does not support
+
+    def read_binary_i32(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Returns the read arrays without filling them."""
+        return read_array, num_samps_per_chan
+
+    def read_binary_u16(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Returns the read arrays without filling them."""
+        return read_array, num_samps_per_chan
+
+    def read_binary_u32(self, task, num_samps_per_chan, timeout, fill_mode, read_array):
+        """Returns the read arrays without filling them."""
+        return read_array, num_samps_per_chan
+
+    def read_ctr_freq(
+        self,
+        task,
+        num_samps_per_chan,
+        timeout,
+        interleaved,
+        read_array_frequency,
+        read_array_duty_cycle,
+    ):
+        """Returns the read arrays without filling them."""
+        return read_array_frequency, read_array_duty_cycle, num_samps_per_chan
+
+    def read_ctr_freq_scalar(self, task, timeout):
+        """Returns zeros without reading a sample."""
+        return 0.0, 0.0
+
+    def read_ctr_ticks(
+        self,
+        task,
+        num_samps_per_chan,
+        timeout,
+        interleaved,
+        read_array_high_ticks,
+        read_array_low_ticks,
+    ):
+        """Returns the read arrays without filling them."""
+        return read_array_high_ticks, read_array_low_ticks, num_samps_per_chan
+
+    def read_ctr_ticks_scalar(self, task, timeout):
+        """Returns zeros without reading a sample."""
+        return 0, 0
+
+    def read_ctr_time(
+        self,
+        task,
+        num_samps_per_chan,
+        timeout,
+        interleaved,
+        read_array_high_time,
+        read_array_low_time,
+    ):
+        """Returns the read arrays without filling them."""
+        return read_array_high_time, read_array_low_time, num_samps_per_chan
+
+    def read_ctr_time_scalar(self, task, timeout):
+        """Returns zeros without reading a sample."""
+        return 0.0, 0.0
+
+    def read_power_f64(
+        self,
+        task,
+        num_samps_per_chan,
+        timeout,
+        fill_mode,
+        read_voltage_array,
+        read_current_array,
+    ):
+        """Returns the read arrays without filling them."""
+        return read_voltage_array, read_current_array, num_samps_per_chan
+
+    def read_power_binary_i16(
+        self,
+        task,
+        num_samps_per_chan,
+        timeout,
+        fill_mode,
+        read_voltage_array,
+        read_current_array,
+    ):
+        """Returns the read arrays without filling them."""
+        return read_voltage_array, read_current_array, num_samps_per_chan
+
+    def read_power_scalar_f64(self, task, timeout):
+        """Returns zeros without reading a sample."""
+        return 0.0, 0.0
+
+    # Writes that the simulated interpreter does not support
+
+    def write_binary_i16(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_binary_i32(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_binary_u16(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_binary_u32(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, write_array
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_ctr_freq(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, frequency, duty_cycle
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_ctr_freq_scalar(self, task, auto_start, timeout, frequency, duty_cycle):
+        """Discards the sample."""
+        pass
+
+    def write_ctr_ticks(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, high_ticks, low_ticks
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_ctr_ticks_scalar(self, task, auto_start, timeout, high_ticks, low_ticks):
+        """Discards the sample."""
+        pass
+
+    def write_ctr_time(
+        self, task, num_samps_per_chan, auto_start, timeout, data_layout, high_time, low_time
+    ):
+        """Discards the samples and returns the number of samples written."""
+        return num_samps_per_chan
+
+    def write_ctr_time_scalar(self, task, auto_start, timeout, high_time, low_time):
+        """Discards the sample."""
+        pass
@@ -0,0 +1,230 @@
+"""Fixtures for driver-free overhead benchmark tests."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nidaqmx.utils
+from nidaqmx import Task
+from nidaqmx.constants import AcquisitionType, LineGrouping
+from tests.benchmark.overhead._stub_interpreter import StubInterpreter
+
+_DEVICE_NAME = "OverheadDev1"
+_ALLOCATION_ITERATIONS = 100
+# Allocation sizes vary by a few small objects between runs, so allocation comparisons allow this
+# many bytes on top of the relative tolerance.
+_ALLOCATION_SLACK_IN_BYTES = 256
+
+_allocations_key = pytest.StashKey[dict[str, tuple[float, int]]]()
+
+
+@pytest.fixture
+def stub_interpreter(monkeypatch: pytest.MonkeyPatch) -> StubInterpreter:
+    """Make new tasks use a zero-cost stub interpreter."""
+    interpreter = StubInterpreter()
+    monkeypatch.setattr(nidaqmx.utils, "_select_interpreter", lambda *args: interpreter)
+    return interpreter
+
+
+@pytest.fixture
+def overhead_task(stub_interpreter: StubInterpreter) -> Generator[Task]:
+    """Get a task that uses the stub interpreter."""
+    with Task() as task:
+        yield task
+
+
+def _get_param(request: pytest.FixtureRequest, name: str) -> int:
+    callspec = getattr(request.node, "callspec", None)
+    return callspec.params.get(name, 1) if callspec is not None else 1
+
+
+def _configure_timing(task: Task, num_samples: int) -> None:
+    task.timing.cfg_samp_clk_timing(
+        rate=25000.0, sample_mode=AcquisitionType.CONTINUOUS, samps_per_chan=num_samples * 2
+    )
+
+
+def _add_digital_channels(
+    add_channel: Callable[..., Any], num_channels: int, num_lines: int
+) -> None:
+    for chan in range(num_channels):
+        lines = [
+            f"{_DEVICE_NAME}/port0/line{line}"
+            for line in range(chan * num_lines, (chan + 1) * num_lines)
+        ]
+        add_channel(",".join(lines), line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
+
+
+@pytest.fixture
+def ai_overhead_task(overhead_task: Task, request: pytest.FixtureRequest) -> Task:
+    """Configure an AI task for overhead benchmarking."""
+    num_channels = _get_param(request, "num_channels")
+    num_samples = _get_param(request, "num_samples")
+
+    overhead_task.ai_channels.add_ai_voltage_chan(
+        f"{_DEVICE_NAME}/ai0:{num_channels - 1}", min_val=-5.0, max_val=5.0
+    )
+    _configure_timing(overhead_task, num_samples)
+    return overhead_task
+
+
+@pytest.fixture
+def ao_overhead_task(overhead_task: Task, request: pytest.FixtureRequest) -> Task:
+    """Configure an AO task for overhead benchmarking."""
+    num_channels = _get_param(request, "num_channels")
+    num_samples = _get_param(request, "num_samples")
+
+    overhead_task.ao_channels.add_ao_voltage_chan(
+        f"{_DEVICE_NAME}/ao0:{num_channels - 1}", min_val=-10.0, max_val=10.0
+    )
+    _configure_timing(overhead_task, num_samples)
+    return overhead_task
+
+
+@pytest.fixture
+def di_lines_overhead_task(overhead_task: Task, request: pytest.FixtureRequest) -> Task:
+    """Configure a DI task for overhead benchmarking."""
+    num_channels = _get_param(request, "num_channels")
+    num_samples = _get_param(request, "num_samples")
+    num_lines = _get_param(request, "num_lines")
+
+    _add_digital_channels(overhead_task.di_channels.add_di_chan, num_channels, num_lines)
+    _configure_timing(overhead_task, num_samples)
+    return overhead_task
+
+
+@pytest.fixture
+def do_lines_overhead_task(overhead_task: Task, request: pytest.FixtureRequest) -> Task:
+    """Configure a DO task for overhead benchmarking."""
+    num_channels = _get_param(request, "num_channels")
+    num_samples = _get_param(request, "num_samples")
+    num_lines = _get_param(request, "num_lines")
+
+    _add_digital_channels(overhead_task.do_channels.add_do_chan, num_channels, num_lines)
+    _configure_timing(overhead_task, num_samples)
+    return overhead_task
+
+
+@pytest.fixture
+def ci_overhead_task(overhead_task: Task, request: pytest.FixtureRequest) -> Task:
+    """Configure a CI count edges task for overhead benchmarking."""
+    num_samples = _get_param(request, "num_samples")
+
+    overhead_task.ci_channels.add_ci_count_edges_chan(f"{_DEVICE_NAME}/ctr0")
+    _configure_timing(overhead_task, num_samples)
+    return overhead_task
+
+
+@pytest.fixture(scope="session")
+def overhead_baseline(pytestconfig: pytest.Config) -> dict[str, dict[str, Any]] | None:
+    """Load the benchmarks to compare overhead benchmarks against, keyed by test node ID."""
+    path: str | None = pytestconfig.getoption("--overhead-baseline")
+    if path is None:
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        benchmarks = json.load(file)["benchmarks"]
+    return {benchmark["fullname"]: benchmark for benchmark in benchmarks}
+
+
+def _measure_allocations(function: Callable[..., Any], *args: Any) -> tuple[float, int]:
+    """Measure the bytes retained per call and the peak bytes allocated by one call."""
+    # Warm up caches so that they are not counted as allocations.
+    function(*args)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(_ALLOCATION_ITERATIONS):
+            function(*args)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return (after - before) / _ALLOCATION_ITERATIONS, peak - before
+
+
+def _compare_with_baseline(
+    benchmark: BenchmarkFixture, baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    if benchmark.stats is not None:
+        # The median is less sensitive than the mean to outliers caused by other processes.
+        median = benchmark.stats.stats.median
+        baseline_median = baseline["stats"]["median"]
+        if median > baseline_median * (1.0 + tolerance):
+            regressions.append(
+                f"median time {median * 1e6:.2f} us exceeds baseline "
+                f"{baseline_median * 1e6:.2f} us"
+            )
+
+    baseline_info = baseline.get("extra_info", {})
+    for key in ("retained_bytes_per_call", "peak_bytes_per_call"):
+        if key not in baseline_info:
+            continue
+        value = benchmark.extra_info[key]
+        limit = baseline_info[key] * (1.0 + tolerance) + _ALLOCATION_SLACK_IN_BYTES
+        if value > limit:
+            regressions.append(f"{key} {value:.0f} exceeds baseline {baseline_info[key]:.0f}")
+    return regressions
+
+
+@pytest.fixture
+def overhead_benchmark(
+    benchmark: BenchmarkFixture,
+    overhead_baseline: dict[str, dict[str, Any]] | None,
+    request: pytest.FixtureRequest,
+) -> Callable[..., Any]:
+    """Get a function that benchmarks the time and memory overhead of calling a function.
+
+    The function records the allocations per call in the benchmark's extra_info. If you specify
+    --overhead-baseline, it fails the test when the time or allocations regress by more than
+    --overhead-tolerance compared to the baseline.
+    """
+
+    def measure(function: Callable[..., Any], *args: Any) -> Any:
+        result = benchmark(function, *args)
+
+        retained, peak = _measure_allocations(function, *args)
+        benchmark.extra_info["retained_bytes_per_call"] = retained
+        benchmark.extra_info["peak_bytes_per_call"] = peak
+        request.config.stash.setdefault(_allocations_key, {})[request.node.nodeid] = (
+            retained,
+            peak,
+        )
+
+        if overhead_baseline is not None and request.node.nodeid in overhead_baseline:
+            regressions = _compare_with_baseline(
+                benchmark,
+                overhead_baseline[request.node.nodeid],
+                request.config.getoption("--overhead-tolerance"),
+            )
+            if regressions:
+                pytest.fail("Overhead regressed: " + "; ".join(regressions), pytrace=False)
+        return result
+
+    return measure
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, exitstatus: int, config: pytest.Config
+) -> None:
+    """Report the allocations measured by the overhead benchmarks."""
+    allocations = config.stash.get(_allocations_key, {})
+    if not allocations:
+        return
+
+    terminalreporter.section("overhead allocations")
+    width = max(len(node_id) for node_id in allocations)
+    terminalreporter.write_line(f"{'Name':<{width}}  {'Retained/call (B)':>18}  {'Peak (B)':>10}")
+    for node_id, (retained, peak) in sorted(allocations.items()):
+        terminalreporter.write_line(f"{node_id:<{width}}  {retained:>18.1f}  {peak:>10}")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from nidaqmx import Task
+
+
+@pytest.mark.benchmark(group="property_overhead")
+def test___timing___get_samp_clk_rate(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task
+) -> None:
+    overhead_benchmark(lambda: ai_overhead_task.timing.samp_clk_rate)
+
+
+@pytest.mark.benchmark(group="property_overhead")
+def test___timing___set_samp_clk_rate(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task
+) -> None:
+    timing = ai_overhead_task.timing
+
+    overhead_benchmark(setattr, timing, "samp_clk_rate", 1000.0)
+
+
+@pytest.mark.benchmark(group="property_overhead")
+def test___in_stream___get_num_chans(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task
+) -> None:
+    overhead_benchmark(lambda: ai_overhead_task.in_stream.num_chans)
+
+
+@pytest.mark.benchmark(group="property_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+def test___ai_channel___get_ai_max(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task, num_channels: int
+) -> None:
+    channel = ai_overhead_task.ai_channels[0]
+
+    overhead_benchmark(lambda: channel.ai_max)
+
+
+@pytest.mark.benchmark(group="property_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+def test___task___get_channel_names(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task, num_channels: int
+) -> None:
+    overhead_benchmark(lambda: ai_overhead_task.channel_names)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+import pytest
+from nitypes.waveform import AnalogWaveform, DigitalWaveform
+
+from nidaqmx import Task
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogSingleChannelReader,
+    AnalogUnscaledReader,
+    CounterReader,
+    DigitalMultiChannelReader,
+    DigitalSingleChannelReader,
+    PowerMultiChannelReader,
+)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+def test___analog_single_channel_reader___read_one_sample(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task
+) -> None:
+    reader = AnalogSingleChannelReader(ai_overhead_task.in_stream)
+
+    overhead_benchmark(reader.read_one_sample)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_single_channel_reader___read_many_sample(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task, num_samples: int
+) -> None:
+    reader = AnalogSingleChannelReader(ai_overhead_task.in_stream)
+    data = numpy.zeros(num_samples, dtype=numpy.float64)
+
+    overhead_benchmark(reader.read_many_sample, data, num_samples)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_single_channel_reader___read_waveform(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task, num_samples: int
+) -> None:
+    reader = AnalogSingleChannelReader(ai_overhead_task.in_stream)
+    waveform = AnalogWaveform(num_samples)
+
+    overhead_benchmark(reader.read_waveform, waveform, num_samples)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+def test___analog_multi_channel_reader___read_one_sample(
+    overhead_benchmark: Callable[..., Any], ai_overhead_task: Task, num_channels: int
+) -> None:
+    reader = AnalogMultiChannelReader(ai_overhead_task.in_stream)
+    data = numpy.zeros(num_channels, dtype=numpy.float64)
+
+    overhead_benchmark(reader.read_one_sample, data)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_multi_channel_reader___read_many_sample(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    reader = AnalogMultiChannelReader(ai_overhead_task.in_stream)
+    data = numpy.zeros((num_channels, num_samples), dtype=numpy.float64)
+
+    overhead_benchmark(reader.read_many_sample, data, num_samples)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_multi_channel_reader___read_waveforms(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    reader = AnalogMultiChannelReader(ai_overhead_task.in_stream)
+    waveforms = [AnalogWaveform(num_samples) for _ in range(num_channels)]
+
+    overhead_benchmark(reader.read_waveforms, waveforms, num_samples)
+
+
+@pytest.mark.benchmark(group="analog_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize(
+    "method_name, dtype",
+    [
+        ("read_int16", numpy.int16),
+        ("read_int32", numpy.int32),
+        ("read_uint16", numpy.uint16),
+        ("read_uint32", numpy.uint32),
+    ],
+)
+def test___analog_unscaled_reader___read(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    method_name: str,
+    dtype: type[numpy.generic],
+) -> None:
+    reader = AnalogUnscaledReader(ai_overhead_task.in_stream)
+    data = numpy.zeros((num_channels, num_samples), dtype=dtype)
+
+    overhead_benchmark(getattr(reader, method_name), data, num_samples)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+def test___digital_single_channel_reader___read_one_sample_one_line(
+    overhead_benchmark: Callable[..., Any], di_lines_overhead_task: Task
+) -> None:
+    reader = DigitalSingleChannelReader(di_lines_overhead_task.in_stream)
+
+    overhead_benchmark(reader.read_one_sample_one_line)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___digital_single_channel_reader___read_many_sample_port_uint32(
+    overhead_benchmark: Callable[..., Any], di_lines_overhead_task: Task, num_samples: int
+) -> None:
+    reader = DigitalSingleChannelReader(di_lines_overhead_task.in_stream)
+    data = numpy.zeros(num_samples, dtype=numpy.uint32)
+
+    overhead_benchmark(reader.read_many_sample_port_uint32, data, num_samples)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_single_channel_reader___read_waveform(
+    overhead_benchmark: Callable[..., Any],
+    di_lines_overhead_task: Task,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    reader = DigitalSingleChannelReader(di_lines_overhead_task.in_stream)
+    waveform = DigitalWaveform(num_samples, num_lines)
+
+    overhead_benchmark(reader.read_waveform, waveform, num_samples)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_multi_channel_reader___read_one_sample_multi_line(
+    overhead_benchmark: Callable[..., Any],
+    di_lines_overhead_task: Task,
+    num_channels: int,
+    num_lines: int,
+) -> None:
+    reader = DigitalMultiChannelReader(di_lines_overhead_task.in_stream)
+    data = numpy.zeros((num_channels, num_lines), dtype=numpy.bool_)
+
+    overhead_benchmark(reader.read_one_sample_multi_line, data)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___digital_multi_channel_reader___read_many_sample_port_uint32(
+    overhead_benchmark: Callable[..., Any],
+    di_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    reader = DigitalMultiChannelReader(di_lines_overhead_task.in_stream)
+    data = numpy.zeros((num_channels, num_samples), dtype=numpy.uint32)
+
+    overhead_benchmark(reader.read_many_sample_port_uint32, data, num_samples)
+
+
+@pytest.mark.benchmark(group="digital_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_multi_channel_reader___read_waveforms(
+    overhead_benchmark: Callable[..., Any],
+    di_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    reader = DigitalMultiChannelReader(di_lines_overhead_task.in_stream)
+    waveforms = [DigitalWaveform(num_samples, num_lines) for _ in range(num_channels)]
+
+    overhead_benchmark(reader.read_waveforms, waveforms, num_samples)
+
+
+@pytest.mark.benchmark(group="counter_reader_overhead")
+def test___counter_reader___read_one_sample_double(
+    overhead_benchmark: Callable[..., Any], ci_overhead_task: Task
+) -> None:
+    reader = CounterReader(ci_overhead_task.in_stream)
+
+    overhead_benchmark(reader.read_one_sample_double)
+
+
+@pytest.mark.benchmark(group="counter_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___counter_reader___read_many_sample_double(
+    overhead_benchmark: Callable[..., Any], ci_overhead_task: Task, num_samples: int
+) -> None:
+    reader = CounterReader(ci_overhead_task.in_stream)
+    data = numpy.zeros(num_samples, dtype=numpy.float64)
+
+    overhead_benchmark(reader.read_many_sample_double, data, num_samples)
+
+
+@pytest.mark.benchmark(group="counter_reader_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___counter_reader___read_many_sample_pulse_frequency(
+    overhead_benchmark: Callable[..., Any], ci_overhead_task: Task, num_samples: int
+) -> None:
+    reader = CounterReader(ci_overhead_task.in_stream)
+    frequencies = numpy.zeros(num_samples, dtype=numpy.float64)
+    duty_cycles = numpy.zeros(num_samples, dtype=numpy.float64)
+
+    overhead_benchmark(
+        reader.read_many_sample_pulse_frequency, frequencies, duty_cycles, num_samples
+    )
+
+
+@pytest.mark.benchmark(group="power_reader_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___power_multi_channel_reader___read_many_sample(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    reader = PowerMultiChannelReader(ai_overhead_task.in_stream)
+    voltage_data = numpy.zeros((num_channels, num_samples), dtype=numpy.float64)
+    current_data = numpy.zeros((num_channels, num_samples), dtype=numpy.float64)
+
+    overhead_benchmark(reader.read_many_sample, voltage_data, current_data, num_samples)
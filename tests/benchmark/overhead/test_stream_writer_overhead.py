@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+import pytest
+from nitypes.waveform import AnalogWaveform, DigitalWaveform
+
+from nidaqmx import Task
+from nidaqmx.stream_writers import (
+    AnalogMultiChannelWriter,
+    AnalogSingleChannelWriter,
+    AnalogUnscaledWriter,
+    CounterWriter,
+    DigitalMultiChannelWriter,
+    DigitalSingleChannelWriter,
+)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+def test___analog_single_channel_writer___write_one_sample(
+    overhead_benchmark: Callable[..., Any], ao_overhead_task: Task
+) -> None:
+    writer = AnalogSingleChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+
+    overhead_benchmark(writer.write_one_sample, 1.0)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_single_channel_writer___write_many_sample(
+    overhead_benchmark: Callable[..., Any], ao_overhead_task: Task, num_samples: int
+) -> None:
+    writer = AnalogSingleChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+    data = numpy.linspace(0.0, 1.0, num=num_samples, dtype=numpy.float64)
+
+    overhead_benchmark(writer.write_many_sample, data)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_single_channel_writer___write_waveform(
+    overhead_benchmark: Callable[..., Any], ao_overhead_task: Task, num_samples: int
+) -> None:
+    writer = AnalogSingleChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+    waveform = AnalogWaveform.from_array_1d(
+        numpy.linspace(0.0, 1.0, num=num_samples, dtype=numpy.float64)
+    )
+
+    overhead_benchmark(writer.write_waveform, waveform)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+def test___analog_multi_channel_writer___write_one_sample(
+    overhead_benchmark: Callable[..., Any], ao_overhead_task: Task, num_channels: int
+) -> None:
+    writer = AnalogMultiChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+    data = numpy.full(num_channels, 1.0, dtype=numpy.float64)
+
+    overhead_benchmark(writer.write_one_sample, data)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_multi_channel_writer___write_many_sample(
+    overhead_benchmark: Callable[..., Any],
+    ao_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    writer = AnalogMultiChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+    data = numpy.full((num_channels, num_samples), 1.0, dtype=numpy.float64)
+
+    overhead_benchmark(writer.write_many_sample, data)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___analog_multi_channel_writer___write_waveforms(
+    overhead_benchmark: Callable[..., Any],
+    ao_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    writer = AnalogMultiChannelWriter(ao_overhead_task.out_stream, auto_start=False)
+    waveforms = [
+        AnalogWaveform.from_array_1d(numpy.full(num_samples, 1.0, dtype=numpy.float64))
+        for _ in range(num_channels)
+    ]
+
+    overhead_benchmark(writer.write_waveforms, waveforms)
+
+
+@pytest.mark.benchmark(group="analog_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize(
+    "method_name, dtype",
+    [
+        ("write_int16", numpy.int16),
+        ("write_int32", numpy.int32),
+        ("write_uint16", numpy.uint16),
+        ("write_uint32", numpy.uint32),
+    ],
+)
+def test___analog_unscaled_writer___write(
+    overhead_benchmark: Callable[..., Any],
+    ao_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    method_name: str,
+    dtype: type[numpy.generic],
+) -> None:
+    writer = AnalogUnscaledWriter(ao_overhead_task.out_stream, auto_start=False)
+    data = numpy.zeros((num_channels, num_samples), dtype=dtype)
+
+    overhead_benchmark(getattr(writer, method_name), data)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+def test___digital_single_channel_writer___write_one_sample_one_line(
+    overhead_benchmark: Callable[..., Any], do_lines_overhead_task: Task
+) -> None:
+    writer = DigitalSingleChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+
+    overhead_benchmark(writer.write_one_sample_one_line, True)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___digital_single_channel_writer___write_many_sample_port_uint32(
+    overhead_benchmark: Callable[..., Any], do_lines_overhead_task: Task, num_samples: int
+) -> None:
+    writer = DigitalSingleChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+    data = numpy.zeros(num_samples, dtype=numpy.uint32)
+
+    overhead_benchmark(writer.write_many_sample_port_uint32, data)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_single_channel_writer___write_waveform(
+    overhead_benchmark: Callable[..., Any],
+    do_lines_overhead_task: Task,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    writer = DigitalSingleChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+    waveform = DigitalWaveform(num_samples, num_lines)
+
+    overhead_benchmark(writer.write_waveform, waveform)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_multi_channel_writer___write_one_sample_multi_line(
+    overhead_benchmark: Callable[..., Any],
+    do_lines_overhead_task: Task,
+    num_channels: int,
+    num_lines: int,
+) -> None:
+    writer = DigitalMultiChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+    data = numpy.zeros((num_channels, num_lines), dtype=numpy.bool_)
+
+    overhead_benchmark(writer.write_one_sample_multi_line, data)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___digital_multi_channel_writer___write_many_sample_port_uint32(
+    overhead_benchmark: Callable[..., Any],
+    do_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    writer = DigitalMultiChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+    data = numpy.zeros((num_channels, num_samples), dtype=numpy.uint32)
+
+    overhead_benchmark(writer.write_many_sample_port_uint32, data)
+
+
+@pytest.mark.benchmark(group="digital_writer_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___digital_multi_channel_writer___write_waveforms(
+    overhead_benchmark: Callable[..., Any],
+    do_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    writer = DigitalMultiChannelWriter(do_lines_overhead_task.out_stream, auto_start=False)
+    waveforms = [DigitalWaveform(num_samples, num_lines) for _ in range(num_channels)]
+
+    overhead_benchmark(writer.write_waveforms, waveforms)
+
+
+@pytest.mark.benchmark(group="counter_writer_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___counter_writer___write_many_sample_pulse_frequency(
+    overhead_benchmark: Callable[..., Any], ao_overhead_task: Task, num_samples: int
+) -> None:
+    writer = CounterWriter(ao_overhead_task.out_stream, auto_start=False)
+    frequencies = numpy.full(num_samples, 1000.0, dtype=numpy.float64)
+    duty_cycles = numpy.full(num_samples, 0.5, dtype=numpy.float64)
+
+    overhead_benchmark(writer.write_many_sample_pulse_frequency, frequencies, duty_cycles)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+import pytest
+from nitypes.waveform import AnalogWaveform
+
+from nidaqmx import Task
+from nidaqmx.constants import WaveformAttributeMode
+from tests.benchmark.conftest import (
+    _WAVEFORM_BENCHMARK_MODE_IDS,
+    _WAVEFORM_BENCHMARK_MODES,
+)
+
+
+def _create_analog_data(num_channels: int, num_samples: int) -> Any:
+    if num_channels == 1:
+        if num_samples == 1:
+            return 1.0
+        return numpy.full((num_samples), 1.0, numpy.float64)
+    else:
+        return numpy.full((num_channels, num_samples), 1.0, numpy.float64)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___read_analog(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    overhead_benchmark(ai_overhead_task.read, num_samples)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___read_analog_as_numpy(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    overhead_benchmark(functools.partial(ai_overhead_task.read, as_numpy=True), num_samples)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___read_analog_into_out(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    out = _create_analog_data(num_channels, num_samples)
+    if num_samples == 1 and num_channels == 1:
+        out = numpy.zeros(1)
+
+    overhead_benchmark(functools.partial(ai_overhead_task.read, out=out), num_samples)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+@pytest.mark.parametrize(
+    "waveform_attribute_mode", _WAVEFORM_BENCHMARK_MODES, ids=_WAVEFORM_BENCHMARK_MODE_IDS
+)
+def test___task___read_analog_waveform(
+    overhead_benchmark: Callable[..., Any],
+    ai_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    waveform_attribute_mode: WaveformAttributeMode,
+) -> None:
+    ai_overhead_task.in_stream.waveform_attribute_mode = waveform_attribute_mode
+
+    overhead_benchmark(ai_overhead_task.read_waveform, num_samples)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___write_analog(
+    overhead_benchmark: Callable[..., Any],
+    ao_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    data = _create_analog_data(num_channels, num_samples)
+
+    overhead_benchmark(ao_overhead_task.write, data, False)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___write_analog_waveform(
+    overhead_benchmark: Callable[..., Any],
+    ao_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    waveforms = [
+        AnalogWaveform.from_array_1d(numpy.full(num_samples, 1.0, numpy.float64))
+        for _ in range(num_channels)
+    ]
+    data = waveforms[0] if num_channels == 1 else waveforms
+
+    overhead_benchmark(ao_overhead_task.write_waveform, data, False)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___task___read_digital_lines(
+    overhead_benchmark: Callable[..., Any],
+    di_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    overhead_benchmark(di_lines_overhead_task.read, num_samples)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_channels", [1, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000])
+@pytest.mark.parametrize("num_lines", [1, 8])
+def test___task___write_digital_lines(
+    overhead_benchmark: Callable[..., Any],
+    do_lines_overhead_task: Task,
+    num_channels: int,
+    num_samples: int,
+    num_lines: int,
+) -> None:
+    if num_lines == 1:
+        data: Any = numpy.full((num_channels, num_samples), True, numpy.bool_)
+    else:
+        data = numpy.full((num_channels, num_samples), 1, numpy.uint32)
+    if num_channels == 1:
+        data = data[0]
+
+    overhead_benchmark(do_lines_overhead_task.write, data, False)
+
+
+@pytest.mark.benchmark(group="task_overhead")
+@pytest.mark.parametrize("num_samples", [1, 1000, 10000])
+def test___task___read_counter(
+    overhead_benchmark: Callable[..., Any], ci_overhead_task: Task, num_samples: int
+) -> None:
+    overhead_benchmark(ci_overhead_task.read, num_samples)
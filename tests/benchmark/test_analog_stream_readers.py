@@ -123,3 +123,22 @@ def test___analog_multi_channel_reader___read_waveform(
     waveforms = [AnalogWaveform(num_samples) for _ in range(num_channels)]
 
     benchmark(reader.read_waveforms, waveforms, num_samples)
+
+
+@pytest.mark.benchmark(group="analog_readers")
+@pytest.mark.parametrize("num_channels", [1, 2, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000])
+def test___analog_multi_channel_reader___read_waveforms_with_cached_extended_properties(
+    benchmark: BenchmarkFixture,
+    ai_benchmark_task: Task,
+    num_channels: int,
+    num_samples: int,
+) -> None:
+    ai_benchmark_task.in_stream.waveform_attribute_mode = (
+        WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
+    )
+    reader = AnalogMultiChannelReader(ai_benchmark_task.in_stream)
+    reader.cache_extended_properties = True
+    waveforms = [AnalogWaveform(num_samples) for _ in range(num_channels)]
+
+    benchmark(reader.read_waveforms, waveforms, num_samples)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nidaqmx
+from nidaqmx.constants import FillMode
+
+try:
+    import grpc
+
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+    from session_pb2 import Session
+except ImportError:
+    grpc = None  # type: ignore
+
+# These benchmarks measure the client-side cost of encoding and decoding floating-point sample
+# arrays, so they use an in-process stand-in for the NI gRPC Device Server instead of NI-DAQmx or a
+# device. The stand-in server sends and receives the same number of samples for every call.
+_SAMPLE_COUNTS = [1_000, 100_000]
+
+
+class _StandInServicer(nidaqmx_grpc.NiDAQmxServicer if grpc else object):  # type: ignore[misc]
+    def __init__(self) -> None:
+        self._read_responses: dict[int, grpc_types.ReadAnalogF64Response] = {}
+
+    def ReadAnalogF64(self, request, context):  # noqa: N802 - gRPC method name
+        count = request.array_size_in_samps
+        response = self._read_responses.get(count)
+        if response is None:
+            response = grpc_types.ReadAnalogF64Response(
+                status=0,
+                read_array=numpy.linspace(-10.0, 10.0, count),
+                samps_per_chan_read=request.num_samps_per_chan,
+            )
+            self._read_responses[count] = response
+        return response
+
+    def WriteAnalogF64(self, request, context):  # noqa: N802 - gRPC method name
+        return grpc_types.WriteAnalogF64Response(
+            status=0, samps_per_chan_written=len(request.write_array)
+        )
+
+
+@pytest.fixture(scope="module")
+def grpc_channel() -> Generator[grpc.Channel]:
+    """Start the stand-in server and connect to it."""
+    if grpc is None:
+        pytest.skip("The grpc module is not available.")
+    server = grpc.server(ThreadPoolExecutor(max_workers=1))
+    nidaqmx_grpc.add_NiDAQmxServicer_to_server(_StandInServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    options = [("grpc.max_receive_message_length", -1), ("grpc.max_send_message_length", -1)]
+    with grpc.insecure_channel(f"localhost:{port}", options=options) as channel:
+        yield channel
+    server.stop(grace=None)
+
+
+def _create_interpreter(grpc_channel: grpc.Channel, packed_arrays: bool) -> GrpcStubInterpreter:
+    grpc_options = nidaqmx.GrpcSessionOptions(grpc_channel, "", packed_arrays=packed_arrays)
+    return GrpcStubInterpreter(grpc_options)
+
+
+@pytest.mark.benchmark(group="grpc_interpreter_read")
+@pytest.mark.parametrize("num_samples", _SAMPLE_COUNTS)
+@pytest.mark.parametrize("packed_arrays", [False, True], ids=["protobuf", "packed"])
+def test___grpc_interpreter___read_analog_f64(
+    benchmark: BenchmarkFixture, grpc_channel: grpc.Channel, num_samples: int, packed_arrays: bool
+) -> None:
+    interpreter = _create_interpreter(grpc_channel, packed_arrays)
+    task = Session(name="benchmark")
+    data = numpy.zeros(num_samples, dtype=numpy.float64)
+
+    benchmark(
+        interpreter.read_analog_f64,
+        task,
+        num_samples,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        data,
+    )
+
+    assert data[-1] == 10.0
+
+
+@pytest.mark.benchmark(group="grpc_interpreter_write")
+@pytest.mark.parametrize("num_samples", _SAMPLE_COUNTS)
+@pytest.mark.parametrize("packed_arrays", [False, True], ids=["protobuf", "packed"])
+def test___grpc_interpreter___write_analog_f64(
+    benchmark: BenchmarkFixture, grpc_channel: grpc.Channel, num_samples: int, packed_arrays: bool
+) -> None:
+    interpreter = _create_interpreter(grpc_channel, packed_arrays)
+    task = Session(name="benchmark")
+    data = numpy.linspace(-10.0, 10.0, num_samples)
+
+    samps_per_chan_written = benchmark(
+        interpreter.write_analog_f64,
+        task,
+        num_samples,
+        False,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        data,
+    )
+
+    assert samps_per_chan_written == num_samples
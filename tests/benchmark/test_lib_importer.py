@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import ctypes
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from nidaqmx._lib import DaqFunctionImporter
+
+# These benchmarks measure the Python overhead of looking up a C function and checking its argtypes,
+# so they call a trivial Python C API function instead of an NI-DAQmx function. They do not require
+# NI-DAQmx or a device.
+_FUNCTION = "Py_GetRecursionLimit"
+
+
+def _call_function(importer: DaqFunctionImporter, functions_bound: bool) -> int:
+    # Same lookup and argtypes check as the generated LibraryInterpreter methods.
+    c_func = getattr(importer, _FUNCTION)
+    if not functions_bound and c_func.argtypes is None:
+        with c_func.arg_lock:
+            if c_func.argtypes is None:
+                c_func.argtypes = []
+    return c_func()
+
+
+@pytest.mark.benchmark(group="lib_importer")
+@pytest.mark.parametrize("bound", [False, True], ids=["unbound", "bound"])
+def test___daq_function_importer___call_function(benchmark: BenchmarkFixture, bound: bool) -> None:
+    importer = DaqFunctionImporter(ctypes.PyDLL(ctypes.pythonapi._name))
+    if bound:
+        importer.bind(_FUNCTION, [])
+
+    benchmark(_call_function, importer, bound)
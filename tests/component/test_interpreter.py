@@ -1,13 +1,9 @@
 import pytest
 
 from nidaqmx._base_interpreter import BaseInterpreter
+from nidaqmx._error_messages import _BUILT_IN_MESSAGES
 from nidaqmx.error_codes import DAQmxErrors
 
-try:
-    from nidaqmx._grpc_interpreter import _ERROR_MESSAGES
-except ImportError:
-    _ERROR_MESSAGES = {}
-
 
 def test___known_error_code___get_error_string___returns_known_error_message(
     interpreter: BaseInterpreter,
@@ -35,11 +31,10 @@ def test___grpc_channel_with_errors___get_error_string___returns_failed_to_retri
     assert error_message.startswith("Failed to retrieve error description.")
 
 
-@pytest.mark.grpc_only(reason="Tests gRPC-specific error message lookup")
-@pytest.mark.parametrize("error_code", list(_ERROR_MESSAGES))
-def test___error_code_with_hardcoded_error_message___get_error_string___returns_hardcoded_error_message(
+@pytest.mark.parametrize("error_code", list(_BUILT_IN_MESSAGES))
+def test___error_code_with_built_in_error_message___get_error_string___returns_built_in_error_message(
     interpreter: BaseInterpreter, error_code: DAQmxErrors
 ) -> None:
     error_message = interpreter.get_error_string(error_code)
 
-    assert error_message == _ERROR_MESSAGES[error_code]
+    assert error_message == _BUILT_IN_MESSAGES[error_code]
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import DaqError
+from nidaqmx.constants import BusType, ProductCategory, UsageTypeAI
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system import System
+
+_PRODUCT_TYPE = 0x631
+_PRODUCT_CATEGORY = 0x29A9
+_PRODUCT_NUM = 0x231D
+_SERIAL_NUM = 0x632
+_IS_SIMULATED = 0x22CA
+_BUS_TYPE = 0x2326
+_CHASSIS_MODULE_DEV_NAMES = 0x29B6
+_COMPACT_DAQ_CHASSIS_DEV_NAME = 0x29B7
+_COMPACT_DAQ_SLOT_NUM = 0x29B8
+_AI_PHYSICAL_CHANS = 0x231E
+_AO_PHYSICAL_CHANS = 0x231F
+_AI_MAX_SINGLE_CHAN_RATE = 0x298C
+_AI_MAX_MULTI_CHAN_RATE = 0x298D
+_AI_MIN_RATE = 0x298E
+_AI_SIMULTANEOUS_SAMPLING_SUPPORTED = 0x298F
+_AI_MEAS_TYPES = 0x2FD2
+_AI_VOLTAGE_RNGS = 0x2990
+_AO_MAX_RATE = 0x2997
+_AO_MIN_RATE = 0x2998
+_AO_VOLTAGE_RNGS = 0x299B
+
+
+def _common_attributes(product_type: str, category: ProductCategory) -> dict[int, Any]:
+    return {
+        _PRODUCT_TYPE: product_type,
+        _PRODUCT_CATEGORY: category.value,
+        _PRODUCT_NUM: 0x1234,
+        _SERIAL_NUM: 0x5678,
+        _IS_SIMULATED: True,
+        _BUS_TYPE: BusType.USB.value,
+    }
+
+
+def _ai_attributes(physical_chans: str) -> dict[int, Any]:
+    return {
+        _AI_PHYSICAL_CHANS: physical_chans,
+        _AI_MAX_SINGLE_CHAN_RATE: 250000.0,
+        _AI_MAX_MULTI_CHAN_RATE: 250000.0,
+        _AI_MIN_RATE: 0.1,
+        _AI_SIMULTANEOUS_SAMPLING_SUPPORTED: False,
+        _AI_MEAS_TYPES: [UsageTypeAI.VOLTAGE.value],
+        _AI_VOLTAGE_RNGS: [-10.0, 10.0],
+    }
+
+
+@pytest.fixture
+def devices() -> dict[str, dict[int, Any]]:
+    """Create the attributes of the devices in a simulated system."""
+    return {
+        "cDAQ1": {
+            **_common_attributes("cDAQ-9178", ProductCategory.COMPACT_DAQ_CHASSIS),
+            _CHASSIS_MODULE_DEV_NAMES: "cDAQ1Mod1, cDAQ1Mod2",
+        },
+        "cDAQ1Mod1": {
+            **_common_attributes("NI 9215", ProductCategory.C_SERIES_MODULE),
+            **_ai_attributes("cDAQ1Mod1/ai0, cDAQ1Mod1/ai1"),
+            _COMPACT_DAQ_CHASSIS_DEV_NAME: "cDAQ1",
+            _COMPACT_DAQ_SLOT_NUM: 1,
+        },
+        "Dev1": {
+            **_common_attributes("USB-6001", ProductCategory.USBDAQ),
+            **_ai_attributes("Dev1/ai0"),
+            _AO_PHYSICAL_CHANS: "Dev1/ao0",
+            _AO_MAX_RATE: 5000.0,
+            _AO_MIN_RATE: 0.0,
+            _AO_VOLTAGE_RNGS: [-10.0, 10.0],
+        },
+    }
+
+
+@pytest.fixture
+def system(interpreter: Mock, devices: dict[str, dict[int, Any]]) -> System:
+    """Create a System whose interpreter gets the attributes of the devices."""
+    interpreter.get_system_info_attribute_string.side_effect = lambda attribute: ", ".join(devices)
+
+    def get_device_attribute(device_name: str, attribute: int) -> Any:
+        attributes = devices[device_name]
+        if attribute in attributes:
+            return attributes[attribute]
+        if attribute in range(_AI_PHYSICAL_CHANS, _AO_PHYSICAL_CHANS + 7):
+            return ""
+        raise DaqError(
+            "Specified property is not supported by the device.",
+            DAQmxErrors.ATTR_NOT_SUPPORTED,
+        )
+
+    for data_type in ("bool", "double", "double_array", "int32", "int32_array", "string", "uint32"):
+        getattr(interpreter, f"get_device_attribute_{data_type}").side_effect = get_device_attribute
+    interpreter.call_batch.side_effect = lambda calls: [
+        getattr(interpreter, name)(*args) for name, args in calls
+    ]
+    return System()
+
+
+def test___system___snapshot___devices_captured_with_two_batches(system: System, interpreter: Mock):
+    snapshot = system.snapshot()
+
+    assert snapshot.device_names == ("cDAQ1", "cDAQ1Mod1", "Dev1")
+    chassis = snapshot.devices["cDAQ1"]
+    assert chassis.product_category == ProductCategory.COMPACT_DAQ_CHASSIS
+    assert chassis.chassis_module_devices == ("cDAQ1Mod1", "cDAQ1Mod2")
+    assert chassis.ai_physical_chans == ()
+    assert chassis.ai_max_single_chan_rate is None
+    module = snapshot.devices["cDAQ1Mod1"]
+    assert module.ai_physical_chans == ("cDAQ1Mod1/ai0", "cDAQ1Mod1/ai1")
+    assert module.ai_meas_types == (UsageTypeAI.VOLTAGE,)
+    assert (module.compact_daq_chassis_device, module.compact_daq_slot_num) == ("cDAQ1", 1)
+    assert module.ao_max_rate is None
+    device = snapshot.devices["Dev1"]
+    assert (device.product_type, device.bus_type, device.is_simulated) == (
+        "USB-6001",
+        BusType.USB,
+        True,
+    )
+    assert (device.ao_physical_chans, device.ao_voltage_rngs) == (("Dev1/ao0",), (-10.0, 10.0))
+    assert snapshot.physical_channels["Dev1/ao0"] is device
+    assert snapshot.get_modules("cDAQ1") == [module]
+    assert interpreter.call_batch.call_count == 2
+
+
+def test___cached_snapshot___snapshot___driver_not_queried_again(system: System, interpreter: Mock):
+    first = system.snapshot()
+    interpreter.reset_mock(return_value=False, side_effect=False)
+
+    second = system.snapshot()
+    not_expired = system.snapshot(max_age=60.0)
+
+    assert second is first
+    assert not_expired is first
+    interpreter.call_batch.assert_not_called()
+    interpreter.get_system_info_attribute_string.assert_not_called()
+
+
+@pytest.mark.parametrize("kwargs", [{"refresh": True}, {"max_age": 0.0}])
+def test___cached_snapshot___snapshot_refresh_or_expired___new_snapshot_captured(
+    system: System, kwargs: dict[str, Any]
+):
+    first = system.snapshot()
+
+    second = system.snapshot(**kwargs)
+
+    assert second is not first
+    assert second.device_names_hash == first.device_names_hash
+
+
+def test___device_added___has_changed___returns_true(
+    system: System, devices: dict[str, dict[int, Any]]
+):
+    snapshot = system.snapshot()
+    assert not snapshot.has_changed()
+
+    devices["Dev2"] = _common_attributes("USB-6001", ProductCategory.USBDAQ)
+
+    assert snapshot.has_changed()
+    assert system.snapshot(refresh=True).devices["Dev2"].product_type == "USB-6001"
+
+
+def test___property_not_supported_by_one_device___snapshot___property_is_none(
+    system: System, devices: dict[str, dict[int, Any]]
+):
+    del devices["Dev1"][_AI_MIN_RATE]
+
+    snapshot = system.snapshot()
+
+    assert snapshot.devices["Dev1"].ai_min_rate is None
+    assert snapshot.devices["Dev1"].ai_max_single_chan_rate == 250000.0
+    assert snapshot.devices["cDAQ1Mod1"].ai_min_rate == 0.1
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType, ChannelType, FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import AnalogMultiChannelReader, AnalogUnscaledReader
+
+_READ_CHANNELS_TO_READ = 0x1823
+_CHAN_AI_DEV_SCALING_COEFF = 0x1930
+
+
+def _expect_channels(interpreter: Mock, coefficients: dict[str, list[float]]) -> None:
+    interpreter.get_read_attribute_string.side_effect = lambda handle, attribute: ",".join(
+        coefficients
+    )
+    interpreter.get_read_attribute_uint32.return_value = len(coefficients)
+    interpreter.get_chan_attribute_int32.return_value = ChannelType.ANALOG_INPUT.value
+    interpreter.get_chan_attribute_double_array.side_effect = (
+        lambda handle, channel, attribute: coefficients[channel]
+    )
+    interpreter.call_batch.side_effect = lambda calls: [
+        getattr(interpreter, name)(*args) for name, args in calls
+    ]
+
+
+def _fill_with(raw_data: numpy.typing.NDArray, samps_per_chan_read: int) -> Mock:
+    def read(handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[:, :samps_per_chan_read] = raw_data[:, :samps_per_chan_read]
+        return read_array, samps_per_chan_read
+
+    return Mock(side_effect=read)
+
+
+def _count_coefficient_queries(interpreter: Mock) -> int:
+    return sum(
+        call.args[2] == _CHAN_AI_DEV_SCALING_COEFF
+        for call in interpreter.get_chan_attribute_double_array.mock_calls
+    )
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with Task() as task:
+        yield task
+
+
+def test___polynomial_coefficients___read_int16_scaled___samples_scaled_per_channel(
+    task: Task, interpreter: Mock
+):
+    _expect_channels(
+        interpreter, {"Dev1/ai0": [0.5, 2.0], "Dev1/ai1": [1.0, 0.0, 0.25, 0.0], "Dev1/ai2": [3.0]}
+    )
+    raw_data = numpy.array([[1, 2, 3], [-4, 0, 4], [7, 8, 9]], dtype=numpy.int16)
+    interpreter.read_binary_i16 = _fill_with(raw_data, 3)
+    reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.zeros((3, 3))
+
+    samps_per_chan_read = reader.read_int16_scaled(data, 3, timeout=5.0)
+
+    assert samps_per_chan_read == 3
+    assert reader.scaling_coefficients.shape == (3, 3)
+    assert data.tolist() == [[2.5, 4.5, 6.5], [5.0, 1.0, 5.0], [3.0, 3.0, 3.0]]
+    interpreter.read_binary_i16.assert_called_once()
+    handle, num_samps_per_chan, timeout, fill_mode, read_array = (
+        interpreter.read_binary_i16.call_args.args
+    )
+    assert (handle, num_samps_per_chan, timeout, fill_mode) == (
+        task._handle,
+        3,
+        5.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+    )
+    assert (read_array.dtype, read_array.shape) == (numpy.int16, (3, 3))
+
+
+def test___partial_read___read_int32_scaled___remaining_samples_unchanged(
+    task: Task, interpreter: Mock
+):
+    _expect_channels(interpreter, {"Dev1/ai0": [0.0, 0.5]})
+    interpreter.read_binary_i32 = _fill_with(numpy.array([[2, 4, 6, 8]], dtype=numpy.int32), 2)
+    reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.full((1, 4), -1.0, dtype=numpy.float32)
+
+    samps_per_chan_read = reader.read_int32_scaled(data, 4)
+
+    assert samps_per_chan_read == 2
+    assert data.tolist() == [[1.0, 2.0, -1.0, -1.0]]
+
+
+def test___repeated_reads___read_int16_scaled___coefficients_and_buffer_reused(
+    task: Task, interpreter: Mock
+):
+    _expect_channels(interpreter, {"Dev1/ai0": [0.0, 1.0], "Dev1/ai1": [0.0, 1.0]})
+    interpreter.read_binary_i16 = _fill_with(numpy.zeros((2, 4), dtype=numpy.int16), 4)
+    reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.zeros((2, 4))
+
+    for _ in range(3):
+        reader.read_int16_scaled(data, 4)
+
+    read_arrays = [call.args[4] for call in interpreter.read_binary_i16.call_args_list]
+    assert all(read_array is read_arrays[0] for read_array in read_arrays)
+    assert _count_coefficient_queries(interpreter) == 2
+
+
+def test___channels_to_read_changed___read_int16_scaled___coefficients_queried_again(
+    task: Task, interpreter: Mock
+):
+    _expect_channels(interpreter, {"Dev1/ai0": [0.0, 1.0]})
+    interpreter.read_binary_i16 = _fill_with(numpy.array([[5]], dtype=numpy.int16), 1)
+    reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.zeros((1, 1))
+    reader.read_int16_scaled(data, 1)
+
+    _expect_channels(interpreter, {"Dev1/ai0": [0.0, 3.0]})
+    task.in_stream.channels_to_read = task.ai_channels["Dev1/ai0"]
+    reader.read_int16_scaled(data, 1)
+
+    assert data.tolist() == [[15.0]]
+    assert _count_coefficient_queries(interpreter) == 2
+    interpreter.set_read_attribute_string.assert_called_once_with(
+        task._handle, _READ_CHANNELS_TO_READ, "Dev1/ai0"
+    )
+
+
+def test___integer_array___read_int16_scaled___raises_daq_error(task: Task, interpreter: Mock):
+    reader = AnalogUnscaledReader(task.in_stream)
+
+    with pytest.raises(DaqError) as exc_info:
+        reader.read_int16_scaled(numpy.zeros((1, 4), dtype=numpy.int16), 4)
+
+    assert exc_info.value.error_code == DAQmxErrors.UNKNOWN
+    interpreter.read_binary_i16.assert_not_called()
+
+
+@pytest.mark.parametrize("dtype", [numpy.float64, numpy.float32])
+@pytest.mark.parametrize("read_method", ["read_int16_scaled", "read_int32_scaled"])
+def test___simulated_task___read_scaled___matches_scaled_read_within_one_lsb(
+    simulated_task: Task, read_method: str, dtype: numpy.typing.DTypeLike
+):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:3", min_val=-5.0, max_val=5.0)
+    simulated_task.timing.cfg_samp_clk_timing(
+        1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=200
+    )
+    reader = AnalogUnscaledReader(simulated_task.in_stream)
+    data = numpy.zeros((4, 200), dtype=dtype)
+    expected = numpy.zeros((4, 200))
+
+    samps_per_chan_read = getattr(reader, read_method)(data, 200)
+    simulated_task.stop()
+    AnalogMultiChannelReader(simulated_task.in_stream).read_many_sample(expected, 200)
+
+    assert samps_per_chan_read == 200
+    numpy.testing.assert_allclose(data, expected, rtol=0.0, atol=5.0 / 32767)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import ChannelType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task.channels import AIChannel, AOChannel
+
+_TASK_CHANNELS = 0x1273
+_TASK_NAME = 0x1276
+_CHAN_TYPE = 0x187F
+
+
+def _expect_chans(interpreter: Mock, channel_names: str, chan_types: dict[str, int]) -> None:
+    interpreter.get_task_attribute_string.side_effect = lambda handle, attr: {
+        _TASK_CHANNELS: channel_names,
+        _TASK_NAME: "MyTask",
+    }[attr]
+
+    def get_chan_type(handle, chan, attr):
+        assert attr == _CHAN_TYPE
+        if chan in chan_types:
+            return chan_types[chan]
+        if len(set(chan_types.values())) != 1:
+            raise DaqError(
+                "Different values.",
+                DAQmxErrors.PRPTY_GET_IMPLIED_ACTIVE_CHAN_FAILED_DUE_TO_DIFFT_VALS,
+            )
+        return next(iter(chan_types.values()))
+
+    interpreter.get_chan_attribute_int32.side_effect = get_chan_type
+    interpreter.call_batch.side_effect = lambda calls: [
+        getattr(interpreter, name)(*args) for name, args in calls
+    ]
+
+
+def _count_chan_names_queries(interpreter: Mock) -> int:
+    return sum(
+        call.args[1] == _TASK_CHANNELS for call in interpreter.get_task_attribute_string.mock_calls
+    )
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with Task() as task:
+        yield task
+
+
+def test___channels_of_one_type___iterate_and_index___types_queried_once(
+    task: Task, interpreter: Mock
+):
+    names = [f"Dev1/ai{i}" for i in range(8)]
+    _expect_chans(interpreter, "Dev1/ai0:7", {"": ChannelType.ANALOG_INPUT.value})
+
+    channels = list(task.ai_channels)
+    length = len(task.ai_channels)
+    third = task.ai_channels[2]
+    by_name = task.ai_channels["Dev1/ai5"]
+    subset = task.ai_channels[1:3]
+
+    assert [channel.name for channel in channels] == names
+    assert all(type(channel) is AIChannel for channel in channels)
+    assert length == 8
+    assert (type(third), third.name) == (AIChannel, "Dev1/ai2")
+    assert (type(by_name), by_name.name) == (AIChannel, "Dev1/ai5")
+    assert (type(subset), subset.name) == (AIChannel, "Dev1/ai1:2")
+    interpreter.get_chan_attribute_int32.assert_called_once_with(task._handle, "", _CHAN_TYPE)
+    assert _count_chan_names_queries(interpreter) == 1
+
+
+def test___channels_of_different_types___iterate___types_queried_in_one_batch(
+    task: Task, interpreter: Mock
+):
+    _expect_chans(
+        interpreter,
+        "Dev1/ai0, Dev1/ao0",
+        {"Dev1/ai0": ChannelType.ANALOG_INPUT.value, "Dev1/ao0": ChannelType.ANALOG_OUTPUT.value},
+    )
+
+    channels = list(task.ai_channels)
+
+    assert [type(channel) for channel in channels] == [AIChannel, AOChannel]
+    interpreter.call_batch.assert_called_once_with(
+        [
+            ("get_chan_attribute_int32", (task._handle, "Dev1/ai0", _CHAN_TYPE)),
+            ("get_chan_attribute_int32", (task._handle, "Dev1/ao0", _CHAN_TYPE)),
+        ]
+    )
+
+
+def test___channel_type_query_fails___iterate___error_raised(task: Task, interpreter: Mock):
+    _expect_chans(interpreter, "Dev1/ai0, Dev1/ai1", {})
+    interpreter.get_chan_attribute_int32.side_effect = DaqError(
+        "Device removed.", DAQmxErrors.DEVICE_REMOVED
+    )
+
+    with pytest.raises(DaqError) as exc_info:
+        list(task.ai_channels)
+
+    assert exc_info.value.error_code == DAQmxErrors.DEVICE_REMOVED
+    interpreter.call_batch.assert_not_called()
+
+
+def test___channel_added___len___channel_names_queried_again(task: Task, interpreter: Mock):
+    _expect_chans(interpreter, "Dev1/ai0", {"": ChannelType.ANALOG_INPUT.value})
+    assert len(task.ai_channels) == 1
+    interpreter.internal_get_last_created_chan.return_value = "Dev1/ai1"
+    _expect_chans(interpreter, "Dev1/ai0:1", {"": ChannelType.ANALOG_INPUT.value})
+
+    task.ai_channels.add_ai_voltage_chan("Dev1/ai1")
+
+    assert len(task.ai_channels) == 2
+    assert _count_chan_names_queries(interpreter) == 2
+
+
+def test___multichannel_channel___iterate___types_not_queried(task: Task, interpreter: Mock):
+    channel = AIChannel(task._handle, "Dev1/ai0:3", interpreter)
+
+    channels = list(channel)
+
+    assert [(type(c), c.name) for c in channels] == [(AIChannel, f"Dev1/ai{i}") for i in range(4)]
+    interpreter.get_chan_attribute_int32.assert_not_called()
+
+
+def test___simulated_task___add_channels___collection_reflects_channels(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:1", "voltage")
+    assert len(simulated_task.ai_channels) == 2
+
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai2", "current")
+
+    assert [channel.name for channel in simulated_task.ai_channels] == [
+        "voltage0",
+        "voltage1",
+        "current",
+    ]
+    assert [channel.name for channel in reversed(simulated_task.ai_channels)] == [
+        "current",
+        "voltage1",
+        "voltage0",
+    ]
+    assert all(type(channel) is AIChannel for channel in simulated_task.ai_channels)
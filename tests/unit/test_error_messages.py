@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import _error_messages
+from nidaqmx._error_messages import (
+    ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE,
+    ErrorMessageCache,
+    get_error_message,
+)
+from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
+
+
+def test___uncached_code___get_twice___looked_up_once():
+    get_error_string = Mock(return_value="Some samples were overwritten.")
+    cache = ErrorMessageCache()
+
+    messages = [cache.get(DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE, get_error_string)] * 2
+
+    assert messages == ["Some samples were overwritten."] * 2
+    get_error_string.assert_called_once_with(DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE)
+
+
+def test___built_in_code___get___not_looked_up():
+    get_error_string = Mock()
+    cache = ErrorMessageCache()
+
+    message = cache.get(DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE, get_error_string)
+
+    assert message.startswith("Some or all of the samples requested have not yet been acquired.")
+    get_error_string.assert_not_called()
+
+
+def test___lookup_fails___get_twice___looked_up_again():
+    get_error_string = Mock(return_value=ERROR_DESCRIPTION_NOT_RETRIEVED_MESSAGE)
+    cache = ErrorMessageCache()
+
+    cache.get(DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK, get_error_string)
+    cache.get(DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK, get_error_string)
+
+    assert get_error_string.call_count == 2
+
+
+def test___catalog_from_earlier_run___get___not_looked_up(tmp_path: pathlib.Path):
+    catalog_path = tmp_path / "error_messages.json"
+    ErrorMessageCache(catalog_path).get(
+        DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK, Mock(return_value="The read was late.")
+    )
+    get_error_string = Mock()
+
+    message = ErrorMessageCache(catalog_path).get(
+        DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK, get_error_string
+    )
+
+    assert message == "The read was late."
+    get_error_string.assert_not_called()
+    assert json.loads(catalog_path.read_text()) == {
+        "format_version": 1,
+        "messages": {
+            str(DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK.value): "The read was late."
+        },
+    }
+
+
+@pytest.mark.parametrize("contents", ["not json", "[]", '{"format_version": 2, "messages": {}}'])
+def test___invalid_catalog___get___looked_up_and_catalog_replaced(
+    tmp_path: pathlib.Path, contents: str
+):
+    catalog_path = tmp_path / "error_messages.json"
+    catalog_path.write_text(contents)
+    get_error_string = Mock(return_value="The read was late.")
+
+    message = ErrorMessageCache(catalog_path).get(
+        DAQmxWarnings.READ_NOT_COMPLETE_BEFORE_SAMP_CLK, get_error_string
+    )
+
+    assert message == "The read was late."
+    get_error_string.assert_called_once()
+    assert json.loads(catalog_path.read_text())["format_version"] == 1
+
+
+def test___catalog_environment_variable___get_error_message___catalog_saved(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    catalog_path = tmp_path / "error_messages.json"
+    monkeypatch.setenv("NIDAQMX_ERROR_MESSAGE_CATALOG", str(catalog_path))
+    monkeypatch.setattr(_error_messages, "_cache", None)
+
+    message = get_error_message(200010, Mock(return_value="Finite acquisition is complete."))
+
+    assert message == "Finite acquisition is complete."
+    assert json.loads(catalog_path.read_text())["messages"] == {
+        "200010": "Finite acquisition is complete."
+    }
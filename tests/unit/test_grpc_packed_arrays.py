@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import numpy
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx.utils import _select_interpreter
+from tests.unit._grpc_utils import create_grpc_options
+
+try:
+    from nidaqmx import _grpc_packed_arrays
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+except ImportError:
+    pass
+
+
+def test___read_analog_f64_response___deserialize___read_array_matches():
+    samples = numpy.linspace(-10.0, 10.0, 1000)
+    response = grpc_types.ReadAnalogF64Response(
+        status=0, read_array=samples, samps_per_chan_read=1000
+    )
+    deserialize = _grpc_packed_arrays.create_response_deserializer(
+        grpc_types.ReadAnalogF64Response, ("read_array",)
+    )
+
+    packed_response = deserialize(response.SerializeToString())
+
+    assert isinstance(packed_response.read_array, numpy.ndarray)
+    assert packed_response.read_array.tolist() == samples.tolist()
+    assert packed_response.samps_per_chan_read == 1000
+
+
+def test___read_ctr_freq_response___deserialize___both_arrays_match():
+    frequency = numpy.array([1.0, 2.0, 3.0])
+    duty_cycle = numpy.array([0.25, 0.5, 0.75])
+    response = grpc_types.ReadCtrFreqResponse(
+        read_array_frequency=frequency,
+        read_array_duty_cycle=duty_cycle,
+        samps_per_chan_read=3,
+    )
+    deserialize = _grpc_packed_arrays.create_response_deserializer(
+        grpc_types.ReadCtrFreqResponse, ("read_array_frequency", "read_array_duty_cycle")
+    )
+
+    packed_response = deserialize(response.SerializeToString())
+
+    assert packed_response.read_array_frequency.tolist() == frequency.tolist()
+    assert packed_response.read_array_duty_cycle.tolist() == duty_cycle.tolist()
+    assert packed_response.samps_per_chan_read == 3
+
+
+def test___response_without_read_array___deserialize___read_array_empty():
+    response = grpc_types.ReadAnalogF64Response(status=-200284, samps_per_chan_read=0)
+    deserialize = _grpc_packed_arrays.create_response_deserializer(
+        grpc_types.ReadAnalogF64Response, ("read_array",)
+    )
+
+    packed_response = deserialize(response.SerializeToString())
+
+    assert packed_response.read_array.size == 0
+    assert packed_response.status == -200284
+
+
+def test___unpacked_read_array___deserialize___read_array_matches():
+    # Encode the read_array field (number 2) as individual fixed64 values, which protobuf parsers
+    # must accept for repeated double fields.
+    samples = [1.5, -2.5, 3.25]
+    data = grpc_types.ReadAnalogF64Response(samps_per_chan_read=3).SerializeToString()
+    for sample in samples:
+        data += bytes([2 << 3 | 1]) + numpy.array(sample, dtype="<f8").tobytes()
+    deserialize = _grpc_packed_arrays.create_response_deserializer(
+        grpc_types.ReadAnalogF64Response, ("read_array",)
+    )
+
+    packed_response = deserialize(data)
+
+    assert packed_response.read_array.tolist() == samples
+    assert packed_response.samps_per_chan_read == 3
+
+
+@pytest.mark.parametrize("sample_count", [0, 1, 20, 100_000])
+def test___packed_array_request___serialize___parses_as_same_request(sample_count: int):
+    samples = numpy.arange(sample_count, dtype=numpy.float64).reshape(-1, 1)
+    request = grpc_types.WriteAnalogF64Request(
+        num_samps_per_chan=sample_count, auto_start=True, timeout=10.0
+    )
+    packed_request = _grpc_packed_arrays.PackedArrayRequest(request, {"write_array": samples})
+
+    parsed_request = grpc_types.WriteAnalogF64Request.FromString(packed_request.SerializeToString())
+
+    expected_request = grpc_types.WriteAnalogF64Request(
+        num_samps_per_chan=sample_count, auto_start=True, timeout=10.0, write_array=samples.flat
+    )
+    assert parsed_request == expected_request
+
+
+def test___packed_arrays_option___select_interpreter___packed_array_stub_used(
+    mocker: MockerFixture,
+):
+    grpc_options = create_grpc_options(mocker)
+    grpc_options.packed_arrays = True
+
+    interpreter = _select_interpreter(grpc_options)
+
+    assert isinstance(interpreter, GrpcStubInterpreter)
+    assert isinstance(interpreter._client, _grpc_packed_arrays.PackedArrayStub)
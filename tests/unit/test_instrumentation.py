@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import warnings
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx import DaqError, DaqWarning, Task, instrumentation
+from nidaqmx._base_interpreter import BaseInterpreter
+from nidaqmx._instrumented_interpreter import InstrumentedInterpreter
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
+from nidaqmx.instrumentation import InterpreterCallRecord
+from nidaqmx.system import PhysicalChannel
+from nidaqmx.utils import _select_interpreter
+
+
+@pytest.fixture(autouse=True)
+def enable_instrumentation() -> Generator[None]:
+    """Enable instrumentation and discard the recorded statistics after each test."""
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+@pytest.fixture
+def inner_interpreter(mocker: MockerFixture) -> Mock:
+    """Create a mock interpreter to instrument."""
+    return mocker.create_autospec(BaseInterpreter)
+
+
+def test___instrumentation_enabled___select_interpreter___instrumented_interpreter_returned(
+    mocker: MockerFixture,
+):
+    library_interpreter = mocker.sentinel.library_interpreter
+    mocker.patch(
+        "nidaqmx._interpreter_pool.get_default_interpreter", return_value=library_interpreter
+    )
+
+    interpreter = _select_interpreter()
+
+    assert isinstance(interpreter, InstrumentedInterpreter)
+    assert interpreter.interpreter is library_interpreter
+
+
+def test___instrumentation_disabled___select_interpreter___interpreter_not_instrumented(
+    mocker: MockerFixture,
+):
+    library_interpreter = mocker.sentinel.library_interpreter
+    mocker.patch(
+        "nidaqmx._interpreter_pool.get_default_interpreter", return_value=library_interpreter
+    )
+    instrumentation.disable()
+
+    interpreter = _select_interpreter()
+
+    assert interpreter is library_interpreter
+
+
+def test___instrumented_interpreter___read_analog_f64___call_and_bytes_recorded(
+    inner_interpreter: Mock,
+):
+    data = numpy.zeros(10)
+    inner_interpreter.read_analog_f64.return_value = (data, 10)
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+
+    result = interpreter.read_analog_f64("MyTask", 10, 1.0, 0, data)
+
+    assert result == (data, 10)
+    inner_interpreter.read_analog_f64.assert_called_once_with("MyTask", 10, 1.0, 0, data)
+    statistics = instrumentation.get_snapshot().functions["read_analog_f64"]
+    assert statistics.call_count == 1
+    assert statistics.error_count == 0
+    assert statistics.bytes_transferred == 80
+    assert sum(statistics.histogram) == 1
+    assert statistics.min_time <= statistics.mean_time <= statistics.max_time
+
+
+def test___instrumented_interpreter___function_raises___error_recorded_and_raised(
+    inner_interpreter: Mock,
+):
+    inner_interpreter.start_task.side_effect = DaqError(
+        "Samples not available.", DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+    )
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+
+    with pytest.raises(DaqError):
+        interpreter.start_task("MyTask")
+
+    statistics = instrumentation.get_snapshot().functions["start_task"]
+    assert (statistics.call_count, statistics.error_count) == (1, 1)
+
+
+def test___instrumented_interpreter___function_warns___warning_recorded(
+    inner_interpreter: Mock,
+):
+    def warn(task):
+        warnings.warn(DaqWarning("Sample rate is near the limit.", DAQmxWarnings.UNKNOWN))
+
+    inner_interpreter.start_task.side_effect = warn
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        interpreter.start_task("MyTask")
+
+    assert instrumentation.get_snapshot().functions["start_task"].warning_count == 1
+
+
+def test___instrumentation_disabled___call_instrumented_interpreter___call_not_recorded(
+    inner_interpreter: Mock,
+):
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+    instrumentation.disable()
+
+    interpreter.start_task("MyTask")
+
+    inner_interpreter.start_task.assert_called_once_with("MyTask")
+    assert instrumentation.get_snapshot().functions == {}
+
+
+def test___call_listener___call_instrumented_interpreter___record_passed_to_listener(
+    inner_interpreter: Mock,
+):
+    records: list[InterpreterCallRecord] = []
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+    instrumentation.add_call_listener(records.append)
+    try:
+        interpreter.stop_task("MyTask")
+    finally:
+        instrumentation.remove_call_listener(records.append)
+
+    assert [(record.function_name, record.error) for record in records] == [("stop_task", None)]
+    assert records[0].duration_ns >= 0
+
+
+def test___instrumented_interpreter___read_analog_f64_stream___each_block_recorded(
+    inner_interpreter: Mock,
+):
+    inner_interpreter.read_analog_f64_stream.return_value = iter(
+        [(numpy.zeros(4), 4), (numpy.zeros(4), 2)]
+    )
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+
+    blocks = list(interpreter.read_analog_f64_stream("MyTask", 4, 1.0, 0, 4))
+
+    assert len(blocks) == 2
+    statistics = instrumentation.get_snapshot().functions["read_analog_f64_stream"]
+    assert statistics.call_count == 3
+    assert statistics.bytes_transferred == 64
+
+
+def test___instrumented_interpreter___wait_until_task_done_async___call_recorded(
+    inner_interpreter: Mock,
+):
+    interpreter = InstrumentedInterpreter(inner_interpreter)
+
+    asyncio.run(interpreter.wait_until_task_done_async("MyTask", 5.0))
+
+    inner_interpreter.wait_until_task_done_async.assert_awaited_once_with("MyTask", 5.0)
+    assert instrumentation.get_snapshot().functions["wait_until_task_done_async"].call_count == 1
+
+
+def test___simulated_task___read___statistics_recorded_for_task(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "true")
+
+    with Task("InstrumentedTask") as task:
+        task.ai_channels.add_ai_voltage_chan("SimDev1/ai0:1")
+        task.read(number_of_samples_per_channel=5)
+        task_statistics = instrumentation.get_snapshot().get_task_statistics(task)
+
+    assert task_statistics["read_analog_f64"].call_count == 1
+    assert task_statistics["read_analog_f64"].bytes_transferred == 80
+    assert "create_ai_voltage_chan" in task_statistics
+
+
+def test___instrumented_library_interpreter___set_legacy_property___c_function_called(
+    mocker: MockerFixture,
+):
+    library_interpreter = mocker.create_autospec(LibraryInterpreter, instance=True)
+    library_interpreter.check_for_error.return_value = None
+    lib_importer = mocker.patch("nidaqmx._lib.lib_importer")
+    c_func = lib_importer.windll.DAQmxSetPhysicalChanAIPowerControlEnable
+    c_func.return_value = 0
+    mocker.patch(
+        "nidaqmx._interpreter_pool.get_default_interpreter", return_value=library_interpreter
+    )
+    physical_channel = PhysicalChannel("Dev1/ai0")
+    assert isinstance(physical_channel._interpreter, InstrumentedInterpreter)
+
+    physical_channel.ai_power_control_enable = True
+
+    c_func.assert_called_once_with("Dev1/ai0", True)
+    library_interpreter.check_for_error.assert_called_once_with(0)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import gc
+import threading
+from collections.abc import Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx import _interpreter_pool
+from nidaqmx._simulated_interpreter import SimulatedInterpreter
+from nidaqmx.grpc_session_options import SessionInitializationBehavior
+from nidaqmx.utils import _select_interpreter
+from tests.unit._grpc_utils import create_grpc_options
+
+
+@pytest.fixture(autouse=True)
+def clear_interpreter_pool() -> Generator[None]:
+    """Clear the interpreter pool before and after each test."""
+    _interpreter_pool.clear()
+    yield
+    _interpreter_pool.clear()
+
+
+def test___no_grpc_options___select_interpreter_twice___same_library_interpreter_returned(
+    mocker: MockerFixture,
+):
+    library_interpreter_class = mocker.patch("nidaqmx._library_interpreter.LibraryInterpreter")
+
+    first = _select_interpreter()
+    second = _select_interpreter()
+
+    assert first is second
+    library_interpreter_class.assert_called_once_with()
+
+
+def test___no_grpc_options___select_interpreter_from_threads___library_interpreter_created_once(
+    mocker: MockerFixture,
+):
+    library_interpreter_class = mocker.patch("nidaqmx._library_interpreter.LibraryInterpreter")
+    interpreters = []
+
+    def select_interpreter() -> None:
+        interpreters.append(_select_interpreter())
+
+    threads = [threading.Thread(target=select_interpreter) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(interpreter is interpreters[0] for interpreter in interpreters)
+    library_interpreter_class.assert_called_once_with()
+
+
+def test___same_grpc_channel_and_different_session_names___select_interpreter___same_interpreter_returned(
+    mocker: MockerFixture,
+):
+    grpc_options = create_grpc_options(mocker, "Session1")
+    other_grpc_options = create_grpc_options(mocker, "Session2")
+    other_grpc_options.grpc_channel = grpc_options.grpc_channel
+
+    first = _select_interpreter(grpc_options)
+    second = _select_interpreter(other_grpc_options)
+
+    assert first is second
+
+
+def test___different_grpc_channels___select_interpreter___different_interpreters_returned(
+    mocker: MockerFixture,
+):
+    first = _select_interpreter(create_grpc_options(mocker))
+    second = _select_interpreter(create_grpc_options(mocker))
+
+    assert first is not second
+
+
+def test___different_initialization_behaviors___select_interpreter___different_interpreters_returned(
+    mocker: MockerFixture,
+):
+    grpc_options = create_grpc_options(mocker)
+    other_grpc_options = create_grpc_options(mocker)
+    other_grpc_options.grpc_channel = grpc_options.grpc_channel
+    other_grpc_options.initialization_behavior = (
+        SessionInitializationBehavior.ATTACH_TO_SERVER_SESSION
+    )
+
+    first = _select_interpreter(grpc_options)
+    second = _select_interpreter(other_grpc_options)
+
+    assert first is not second
+
+
+def test___different_packed_arrays_options___select_interpreter___different_interpreters_returned(
+    mocker: MockerFixture,
+):
+    grpc_options = create_grpc_options(mocker)
+    other_grpc_options = create_grpc_options(mocker)
+    other_grpc_options.grpc_channel = grpc_options.grpc_channel
+    other_grpc_options.packed_arrays = True
+
+    first = _select_interpreter(grpc_options)
+    second = _select_interpreter(other_grpc_options)
+
+    assert first is not second
+
+
+def test___grpc_interpreter_released___pool_entry_removed(mocker: MockerFixture):
+    interpreter = _select_interpreter(create_grpc_options(mocker))
+    assert len(_interpreter_pool._grpc_interpreters) == 1
+
+    del interpreter
+    gc.collect()
+
+    assert len(_interpreter_pool._grpc_interpreters) == 0
+
+
+def test___explicit_interpreter___select_interpreter___explicit_interpreter_returned(
+    mocker: MockerFixture,
+):
+    interpreter = mocker.sentinel.interpreter
+
+    assert _select_interpreter(interpreter=interpreter) is interpreter
+
+
+def test___grpc_interpreter___get_driver_version_twice___driver_version_queried_once(
+    mocker: MockerFixture,
+):
+    interpreter = _select_interpreter(create_grpc_options(mocker))
+    get_attribute = mocker.patch.object(
+        type(interpreter), "get_system_info_attribute_uint32", autospec=True, return_value=24
+    )
+
+    assert interpreter.driver_version == (24, 24, 24)
+    assert interpreter.driver_version == (24, 24, 24)
+    assert get_attribute.call_count == 3
+
+
+def test___grpc_interpreter_and_server_unavailable___get_driver_version___driver_version_not_memoized(
+    mocker: MockerFixture,
+):
+    interpreter = _select_interpreter(create_grpc_options(mocker))
+    get_attribute = mocker.patch.object(
+        type(interpreter),
+        "get_system_info_attribute_uint32",
+        autospec=True,
+        side_effect=[RuntimeError("unavailable"), 24, 5, 0],
+    )
+
+    assert interpreter.driver_version == (0, 0, 0)
+    assert interpreter.driver_version == (24, 5, 0)
+    assert get_attribute.call_count == 4
+
+
+def test___simulated_interpreter_enabled___select_interpreter___simulated_interpreter_returned(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+
+    first = _select_interpreter()
+    second = _select_interpreter()
+
+    assert isinstance(first, SimulatedInterpreter)
+    assert first is second
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import types
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx import _library_interpreter
+from nidaqmx._lib import DaqFunctionImporter, DaqLibImporter
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.errors import DaqFunctionNotSupportedError
+
+
+class _FakeCFunction:
+    def __init__(self) -> None:
+        self.argtypes: list[object] | None = None
+
+
+def test___function_bound___get_function___argtypes_applied():
+    c_func = _FakeCFunction()
+    importer = DaqFunctionImporter(types.SimpleNamespace(DAQmxStartTask=c_func))
+
+    importer.bind("DAQmxStartTask", [int])
+
+    assert importer.DAQmxStartTask is c_func
+    assert c_func.argtypes == [int]
+    assert hasattr(c_func, "arg_lock")
+
+
+def test___function_bound___get_function___getattr_bypassed(mocker: MockerFixture):
+    importer = DaqFunctionImporter(types.SimpleNamespace(DAQmxStartTask=_FakeCFunction()))
+    importer.bind("DAQmxStartTask", [int])
+    getattr_spy = mocker.spy(DaqFunctionImporter, "__getattr__")
+
+    importer.DAQmxStartTask
+
+    getattr_spy.assert_not_called()
+
+
+def test___argtypes_already_set___bind___argtypes_unchanged():
+    c_func = _FakeCFunction()
+    c_func.argtypes = [str]
+    importer = DaqFunctionImporter(types.SimpleNamespace(DAQmxStartTask=c_func))
+
+    importer.bind("DAQmxStartTask", [int])
+
+    assert c_func.argtypes == [str]
+
+
+def test___unsupported_function___bind___raises_on_lookup():
+    importer = DaqFunctionImporter(types.SimpleNamespace())
+
+    importer.bind("DAQmxStartTask", [int])
+
+    with pytest.raises(DaqFunctionNotSupportedError):
+        importer.DAQmxStartTask
+
+
+def test___bind_functions___functions_bound_with_calling_convention(mocker: MockerFixture):
+    windll_func = _FakeCFunction()
+    cdll_func = _FakeCFunction()
+    lib_importer = DaqLibImporter()
+    lib_importer._windll = DaqFunctionImporter(types.SimpleNamespace(DAQmxStartTask=windll_func))
+    lib_importer._cdll = DaqFunctionImporter(types.SimpleNamespace(DAQmxStopTask=cdll_func))
+
+    lib_importer.bind_functions(
+        [("DAQmxStartTask", "windll", [int]), ("DAQmxStopTask", "cdll", [float])]
+    )
+
+    assert lib_importer.windll.DAQmxStartTask.argtypes == [int]
+    assert lib_importer.cdll.DAQmxStopTask.argtypes == [float]
+
+
+@pytest.mark.parametrize("functions_bound", [False, True])
+def test___functions_bound___call_generated_method___argtypes_checked_only_if_not_bound(
+    mocker: MockerFixture, functions_bound: bool
+):
+    c_func = MagicMock(argtypes=None, return_value=0)
+    mocker.patch.object(_library_interpreter, "lib_importer").windll.DAQmxStartTask = c_func
+    mocker.patch.object(_library_interpreter, "_c_functions_bound", functions_bound)
+    interpreter = LibraryInterpreter.__new__(LibraryInterpreter)
+
+    interpreter.start_task(None)
+
+    assert (c_func.argtypes is None) == functions_bound
+    c_func.assert_called_once_with(None)
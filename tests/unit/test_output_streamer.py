@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Generator, Iterator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType, FillMode, RegenerationMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_writers import (
+    AnalogMultiChannelWriter,
+    AnalogSingleChannelWriter,
+    CounterWriter,
+    OutputStreamer,
+)
+
+_BUFFER_OUTPUT_BUF_SIZE = 0x186D
+_WRITE_REGEN_MODE = 0x1453
+
+
+@pytest.fixture
+def streaming_interpreter(interpreter: Mock) -> Mock:
+    """Configure the interpreter to write every block without waiting for the lead."""
+    interpreter.call_batch.side_effect = lambda calls: [
+        getattr(interpreter, name)(*args) for name, args in calls
+    ]
+    interpreter.get_buffer_attribute_uint32.return_value = 0
+    interpreter.get_timing_attribute_double.return_value = 1000.0
+    interpreter.get_write_attribute_uint32.return_value = 2
+    interpreter.get_write_attribute_uint64.return_value = 1000000
+    interpreter.written_blocks = []
+
+    def write(handle, num_samps_per_chan, auto_start, timeout, data_layout, write_array):
+        # The streamer reuses the buffer of a fill source, so record a copy of each block.
+        interpreter.written_blocks.append(write_array.copy())
+        return num_samps_per_chan
+
+    interpreter.write_analog_f64.side_effect = write
+    return interpreter
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a continuous analog output task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with Task() as task:
+        task.ao_channels.add_ao_voltage_chan("Dev1/ao0:1")
+        task.timing.cfg_samp_clk_timing(20000.0, sample_mode=AcquisitionType.CONTINUOUS)
+        yield task
+
+
+def test___array_source___stream___blocks_written_without_regeneration(
+    task: Task, streaming_interpreter: Mock
+):
+    source = numpy.arange(20.0).reshape(2, 10)
+
+    with OutputStreamer(AnalogMultiChannelWriter(task.out_stream), source, 4) as streamer:
+        streamer.wait_until_done(timeout=10.0)
+
+    blocks = streaming_interpreter.written_blocks
+    assert [block.tolist() for block in blocks] == [
+        source[:, 0:4].tolist(),
+        source[:, 4:8].tolist(),
+        source[:, 8:10].tolist(),
+    ]
+    assert all(
+        call.args[1:5] == (block.shape[1], False, 10.0, FillMode.GROUP_BY_CHANNEL.value)
+        for call, block in zip(streaming_interpreter.write_analog_f64.call_args_list, blocks)
+    )
+    streaming_interpreter.set_write_attribute_int32.assert_called_once_with(
+        task._handle, _WRITE_REGEN_MODE, RegenerationMode.DONT_ALLOW_REGENERATION.value
+    )
+    streaming_interpreter.set_buffer_attribute_uint32.assert_called_once_with(
+        task._handle, _BUFFER_OUTPUT_BUF_SIZE, 20
+    )
+    assert streamer.statistics.blocks_written == 3
+    assert streamer.statistics.samples_written == 10
+
+
+def test___fill_source___stream___buffer_reused_and_partial_block_written(
+    task: Task, streaming_interpreter: Mock
+):
+    buffers = []
+
+    def fill(buffer: numpy.typing.NDArray, first_sample_index: int) -> int:
+        buffers.append(buffer)
+        if first_sample_index >= 10:
+            return 0
+        buffer[:] = numpy.arange(first_sample_index, first_sample_index + 4)
+        return min(4, 10 - first_sample_index)
+
+    with OutputStreamer(AnalogSingleChannelWriter(task.out_stream), fill, 4) as streamer:
+        streamer.wait_until_done(timeout=10.0)
+
+    assert [block.tolist() for block in streaming_interpreter.written_blocks] == [
+        [0.0, 1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0, 7.0],
+        [8.0, 9.0],
+    ]
+    assert len(buffers) == 4
+    assert all(buffer is buffers[0] for buffer in buffers)
+
+
+def test___write_fails___stop___raises_error(task: Task, streaming_interpreter: Mock):
+    streaming_interpreter.write_analog_f64.side_effect = [
+        4,
+        DaqError("Underflow.", DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE),
+    ]
+    streamer = OutputStreamer(
+        AnalogSingleChannelWriter(task.out_stream), (numpy.zeros(4) for _ in range(10)), 4, lead=4
+    )
+    streamer.start()
+    streamer._thread.join(timeout=10.0)  # type: ignore[union-attr]
+
+    with pytest.raises(DaqError) as exc_info:
+        streamer.stop()
+
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+
+
+def test___simulated_task_not_started___start___only_lead_written(simulated_task: Task):
+    def generate_blocks() -> Iterator[numpy.typing.NDArray]:
+        while True:
+            yield numpy.zeros((2, 500))
+
+    streamer = OutputStreamer(
+        AnalogMultiChannelWriter(simulated_task.out_stream), generate_blocks(), 500, lead=1500
+    )
+
+    with streamer:
+        time.sleep(0.05)
+        blocks_written_before_start = streamer.statistics.blocks_written
+
+    assert blocks_written_before_start == 3
+    assert simulated_task.out_stream.regen_mode == RegenerationMode.DONT_ALLOW_REGENERATION
+    assert simulated_task.out_stream.output_buf_size == 2000
+
+
+def test___simulated_task___stream_generator___samples_generated_with_lead(simulated_task: Task):
+    blocks = (numpy.full((2, 500), float(i)) for i in range(10))
+
+    with OutputStreamer(
+        AnalogMultiChannelWriter(simulated_task.out_stream), blocks, 500, lead=2000
+    ) as streamer:
+        simulated_task.start()
+        streamer.wait_until_done(timeout=10.0)
+
+    statistics = streamer.statistics
+    assert (statistics.blocks_written, statistics.samples_written) == (10, 5000)
+    assert statistics.min_lead is not None and 0 < statistics.min_lead <= 2000
+    assert simulated_task.out_stream.total_samp_per_chan_generated >= 5000
+
+
+def test___counter_writer___construct___raises_type_error(task: Task):
+    with pytest.raises(TypeError):
+        OutputStreamer(CounterWriter(task.out_stream), numpy.zeros(4), 4)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogSingleChannelReader,
+    CounterReader,
+    PrefetchingReader,
+)
+
+
+def _fill_with_block_number(fail_after: int | None = None) -> Callable[..., tuple]:
+    block_numbers = iter(range(1000))
+
+    def read(handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        block_number = next(block_numbers)
+        if block_number == fail_after:
+            raise DaqError("The read failed.", DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE)
+        read_array[...] = block_number
+        return read_array, num_samps_per_chan
+
+    return read
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 10.0
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with Task() as task:
+        yield task
+
+
+def test___number_of_samples___iterate___blocks_match_synchronous_read(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:1")
+    simulated_task.timing.cfg_samp_clk_timing(
+        100000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=1050
+    )
+    blocks = []
+
+    with PrefetchingReader(
+        AnalogMultiChannelReader(simulated_task.in_stream), 100, number_of_samples_per_channel=1050
+    ) as prefetching_reader:
+        simulated_task.start()
+        for block in prefetching_reader:
+            with block:
+                blocks.append((block.first_sample_index, block.data.copy()))
+    simulated_task.stop()
+    expected = numpy.zeros((2, 1050))
+    AnalogMultiChannelReader(simulated_task.in_stream).read_many_sample(expected, 1050)
+
+    assert [first_sample_index for first_sample_index, _ in blocks] == list(range(0, 1100, 100))
+    assert blocks[-1][1].shape == (2, 50)
+    numpy.testing.assert_array_equal(
+        numpy.concatenate([data for _, data in blocks], axis=1), expected
+    )
+    assert prefetching_reader.statistics.samples_read == 1050
+    assert not prefetching_reader.is_running
+
+
+def test___all_buffers_held___release___overrun_counted_and_reading_resumes(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.read_analog_f64.side_effect = _fill_with_block_number()
+    prefetching_reader = PrefetchingReader(
+        AnalogMultiChannelReader(task.in_stream), 4, buffer_count=2
+    )
+
+    with prefetching_reader:
+        first = prefetching_reader.get(timeout=10.0)
+        second = prefetching_reader.get(timeout=10.0)
+        assert first is not None and second is not None
+        _wait_for(lambda: prefetching_reader.statistics.overrun_count == 1)
+        assert interpreter.read_analog_f64.call_count == 2
+        first.release()
+        first.release()
+        third = prefetching_reader.get(timeout=10.0)
+        assert third is not None
+
+    assert [block.data.tolist() for block in (second, third)] == [[[1.0] * 4] * 2, [[2.0] * 4] * 2]
+    assert third.first_sample_index == 8
+    assert prefetching_reader.statistics.reader_wait_time > 0.0
+
+
+def test___read_fails___get___blocks_returned_before_error(task: Task, interpreter: Mock):
+    interpreter.read_analog_f64.side_effect = _fill_with_block_number(fail_after=1)
+    prefetching_reader = PrefetchingReader(AnalogSingleChannelReader(task.in_stream), 4)
+
+    with prefetching_reader:
+        _wait_for(lambda: not prefetching_reader.is_running)
+        block = prefetching_reader.get(timeout=10.0)
+        with pytest.raises(DaqError) as exc_info:
+            prefetching_reader.get(timeout=10.0)
+        end = prefetching_reader.get(timeout=10.0)
+
+    assert block is not None
+    assert block.data.tolist() == [0.0] * 4
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+    assert end is None
+
+
+def test___no_block_read___get___raises_timeout_error(task: Task, interpreter: Mock):
+    interpreter.read_analog_f64.side_effect = lambda *args: time.sleep(1.0)
+    prefetching_reader = PrefetchingReader(AnalogSingleChannelReader(task.in_stream), 4)
+
+    with prefetching_reader:
+        with pytest.raises(TimeoutError):
+            prefetching_reader.get(timeout=0.01)
+        prefetching_reader.stop()
+
+    assert prefetching_reader.statistics.underrun_count == 1
+
+
+def test___counter_reader___construct___raises_type_error(task: Task):
+    with pytest.raises(TypeError):
+        PrefetchingReader(CounterReader(task.in_stream), 100)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+import nidaqmx
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType
+from nidaqmx.error_codes import DAQmxErrors
+
+try:
+    import grpc
+
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+    from session_pb2 import Session
+except ImportError:
+    grpc = None  # type: ignore
+
+_SAMP_QUANT_SAMP_MODE = 0x1300
+_SAMP_CLK_RATE = 0x1344
+_BATCH_SIZE = 4
+
+
+class _StandInServicer(nidaqmx_grpc.NiDAQmxServicer if grpc else object):  # type: ignore[misc]
+    """Stands in for the NI gRPC Device Server and records how many RPCs overlap."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._all_started = threading.Event()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self._sets_in_flight = 0
+        self.max_sets_in_flight = 0
+        self.attributes: dict[int, float] = {}
+        self.set_order: list[tuple[int, float]] = []
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            if self._in_flight == _BATCH_SIZE:
+                self._all_started.set()
+        # Hold each RPC until all the RPCs of the batch overlap, or until it is clear that they
+        # are not overlapping.
+        self._all_started.wait(timeout=1.0)
+        with self._lock:
+            self._in_flight -= 1
+
+    def GetTimingAttributeDouble(self, request, context):  # noqa: N802 - gRPC method name
+        self._enter()
+        return grpc_types.GetTimingAttributeDoubleResponse(
+            status=0, value=self.attributes.get(request.attribute_raw, 1000.0)
+        )
+
+    def SetTimingAttributeDouble(self, request, context):  # noqa: N802 - gRPC method name
+        with self._lock:
+            self._sets_in_flight += 1
+            self.max_sets_in_flight = max(self.max_sets_in_flight, self._sets_in_flight)
+        # Give set RPCs that were started together time to overlap and to complete out of order.
+        time.sleep(0.01 if request.attribute_raw % 2 == 0 else 0.0)
+        with self._lock:
+            self._sets_in_flight -= 1
+            self.attributes[request.attribute_raw] = request.value
+            self.set_order.append((request.attribute_raw, request.value))
+        return grpc_types.SetTimingAttributeDoubleResponse(status=0)
+
+
+@pytest.fixture
+def stand_in_servicer() -> _StandInServicer:
+    """Create the stand-in server's servicer."""
+    if grpc is None:
+        pytest.skip("The grpc module is not available.")
+    return _StandInServicer()
+
+
+@pytest.fixture
+def grpc_interpreter(stand_in_servicer: _StandInServicer) -> Generator[GrpcStubInterpreter]:
+    """Start the stand-in server and create an interpreter that connects to it."""
+    server = grpc.server(ThreadPoolExecutor(max_workers=_BATCH_SIZE * 2))
+    nidaqmx_grpc.add_NiDAQmxServicer_to_server(stand_in_servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel(f"localhost:{port}") as channel:
+        yield GrpcStubInterpreter(nidaqmx.GrpcSessionOptions(channel, ""))
+    server.stop(grace=None)
+
+
+def test___task___get_properties___one_batch_called_and_values_converted(
+    task: Task, interpreter: Mock
+):
+    interpreter.call_batch.return_value = [1000.0, AcquisitionType.CONTINUOUS.value]
+
+    rate, sample_mode = task.get_properties(
+        [(task.timing, "samp_clk_rate"), (task.timing, "samp_quant_samp_mode")]
+    )
+
+    assert rate == 1000.0
+    assert sample_mode == AcquisitionType.CONTINUOUS
+    interpreter.call_batch.assert_called_once_with(
+        [
+            ("get_timing_attribute_double", (task._handle, _SAMP_CLK_RATE)),
+            ("get_timing_attribute_int32", (task._handle, _SAMP_QUANT_SAMP_MODE)),
+        ]
+    )
+    interpreter.get_timing_attribute_double.assert_not_called()
+
+
+def test___task___set_properties___one_batch_called(task: Task, interpreter: Mock):
+    task.set_properties(
+        {
+            (task.timing, "samp_clk_rate"): 2000.0,
+            (task.timing, "samp_quant_samp_mode"): AcquisitionType.FINITE,
+        }
+    )
+
+    interpreter.call_batch.assert_called_once_with(
+        [
+            ("set_timing_attribute_double", (task._handle, _SAMP_CLK_RATE, 2000.0)),
+            (
+                "set_timing_attribute_int32",
+                (task._handle, _SAMP_QUANT_SAMP_MODE, AcquisitionType.FINITE.value),
+            ),
+        ]
+    )
+    interpreter.set_timing_attribute_double.assert_not_called()
+
+
+def test___not_a_property___get_properties___raises_attribute_error(task: Task, interpreter: Mock):
+    with pytest.raises(AttributeError, match="cfg_samp_clk_timing"):
+        task.get_properties([(task.timing, "cfg_samp_clk_timing")])
+
+    interpreter.call_batch.assert_not_called()
+
+
+def test___batch_raises___get_properties___error_raised(task: Task, interpreter: Mock):
+    interpreter.call_batch.side_effect = DaqError(
+        "Attribute not supported.", DAQmxErrors.ATTRIBUTE_NOT_SUPPORTED_IN_TASK_CONTEXT
+    )
+
+    with pytest.raises(DaqError):
+        task.get_properties([(task.timing, "samp_clk_rate")])
+
+
+def test___grpc_interpreter___call_batch___get_rpcs_overlap(
+    grpc_interpreter: GrpcStubInterpreter, stand_in_servicer: _StandInServicer
+):
+    task = Session(name="MyTask")
+
+    results = grpc_interpreter.call_batch(
+        [("set_timing_attribute_double", (task, _SAMP_CLK_RATE, 2000.0))]
+        + [("get_timing_attribute_double", (task, _SAMP_CLK_RATE))]
+        + [("get_timing_attribute_double", (task, attribute)) for attribute in range(3)]
+    )
+
+    assert results == [None, 2000.0, 1000.0, 1000.0, 1000.0]
+    assert stand_in_servicer.max_in_flight == _BATCH_SIZE
+
+
+def test___grpc_interpreter___call_batch_with_sets___sets_applied_one_at_a_time_in_order(
+    grpc_interpreter: GrpcStubInterpreter, stand_in_servicer: _StandInServicer
+):
+    task = Session(name="MyTask")
+    values = [(attribute, float(attribute)) for attribute in range(_BATCH_SIZE)]
+
+    results = grpc_interpreter.call_batch(
+        [("set_timing_attribute_double", (task, attribute, value)) for attribute, value in values]
+    )
+
+    assert results == [None] * _BATCH_SIZE
+    assert stand_in_servicer.set_order == values
+    assert stand_in_servicer.max_sets_in_flight == 1
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import time
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import AnalogUnscaledReader, RawDataLog, RawDataLogger
+
+
+def _create_task() -> Task:
+    task = Task()
+    task.ai_channels.add_ai_voltage_chan("Dev1/ai0:1", min_val=-10.0, max_val=10.0)
+    task.timing.cfg_samp_clk_timing(100000.0, sample_mode=AcquisitionType.CONTINUOUS)
+    return task
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a continuous analog input task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with _create_task() as task:
+        yield task
+
+
+def test___number_of_samples___log___files_rolled_over_and_samples_logged(
+    simulated_task: Task, tmp_path: pathlib.Path
+):
+    with RawDataLogger(
+        simulated_task.in_stream,
+        tmp_path / "run.json",
+        samples_per_read=100,
+        samples_per_file=400,
+        number_of_samples_per_channel=1000,
+    ) as logger:
+        simulated_task.start()
+        logger.wait_until_done(timeout=10.0)
+    with _create_task() as task:
+        expected = numpy.zeros((2, 1000), dtype=numpy.int16)
+        AnalogUnscaledReader(task.in_stream).read_int16(expected, 1000)
+
+    log = RawDataLog(tmp_path / "run.json")
+
+    assert logger.total_samples_logged == 1000
+    assert [file.name for file in logger.files] == ["run_0000.bin", "run_0001.bin", "run_0002.bin"]
+    assert [file.stat().st_size for file in logger.files] == [1600, 1600, 800]
+    assert (len(log), log.total_samples_per_channel) == (3, 1000)
+    assert log.channel_names == ["Dev1/ai0", "Dev1/ai1"]
+    assert (log.dtype, log.sample_mode, log.sample_rate) == (
+        numpy.int16,
+        AcquisitionType.CONTINUOUS,
+        100000.0,
+    )
+    assert log.scaling_coefficients == [[0.0, 10.0 / 32767]] * 2
+    samples = numpy.concatenate([log[index] for index in range(len(log))])
+    numpy.testing.assert_array_equal(samples.reshape(-1, 2).T, expected)
+
+
+def test___continuous_logging___stop___last_file_truncated_and_header_complete(
+    simulated_task: Task, tmp_path: pathlib.Path
+):
+    logger = RawDataLogger(
+        simulated_task.in_stream, tmp_path / "run.json", samples_per_read=64, samples_per_file=10000
+    )
+    logger.start()
+    simulated_task.start()
+    while logger.total_samples_logged < 640:
+        assert logger.is_running
+        time.sleep(0.001)
+
+    logger.stop(timeout=10.0)
+
+    header = json.loads((tmp_path / "run.json").read_text())
+    assert not logger.is_running
+    assert [file["samples_per_channel"] for file in header["files"]] == [
+        logger.total_samples_logged
+    ]
+    assert logger.files[0].stat().st_size == logger.total_samples_logged * 2 * 2
+    assert not (tmp_path / "run.json.tmp").exists()
+    assert RawDataLog(tmp_path / "run.json")[0].shape == (logger.total_samples_logged * 2,)
+
+
+def test___read_fails___stop___raises_error(
+    simulated_task: Task, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        type(simulated_task._interpreter),
+        "read_raw",
+        Mock(side_effect=DaqError("Samples not available.", DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE)),
+    )
+    logger = RawDataLogger(simulated_task.in_stream, tmp_path / "run.json")
+    logger.start()
+    logger._thread.join(timeout=10.0)  # type: ignore[union-attr]
+
+    with pytest.raises(DaqError) as exc_info:
+        logger.stop()
+
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+    assert logger.files[0].stat().st_size == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"samples_per_read": 0}, {"samples_per_file": 0}, {"number_of_samples_per_channel": 0}],
+)
+def test___invalid_size___construct___raises_value_error(
+    task: Task, tmp_path: pathlib.Path, kwargs: dict[str, int]
+):
+    with pytest.raises(ValueError):
+        RawDataLogger(task.in_stream, tmp_path / "run.json", **kwargs)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx import DaqReadError, Task
+from nidaqmx.constants import FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogSingleChannelReader,
+    AnalogUnscaledReader,
+)
+from nidaqmx.utils import _select_interpreter
+from tests.unit._grpc_utils import create_grpc_options
+
+try:
+    from google.protobuf import any_pb2
+
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import data_moniker_pb2
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from session_pb2 import Session
+except ImportError:
+    pass
+
+
+def _create_blocks(
+    blocks: list[tuple[numpy.typing.NDArray[numpy.float64], int]], closed: list[bool]
+) -> Iterator[tuple[numpy.typing.NDArray[numpy.float64], int]]:
+    try:
+        yield from blocks
+    finally:
+        closed.append(True)
+
+
+def test___analog_multi_channel_reader___read_many_sample_stream___blocks_reshaped(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.read_analog_f64_stream.return_value = _create_blocks(
+        [(numpy.arange(8.0), 4), (numpy.arange(8.0, 16.0), 3)], []
+    )
+    reader = AnalogMultiChannelReader(task.in_stream)
+
+    blocks = list(reader.read_many_sample_stream(4, timeout=5.0))
+
+    interpreter.read_analog_f64_stream.assert_called_once_with(
+        task._handle, 4, 5.0, FillMode.GROUP_BY_CHANNEL.value, 8
+    )
+    assert [block.tolist() for block in blocks] == [
+        [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0]],
+        [[8.0, 9.0, 10.0], [12.0, 13.0, 14.0]],
+    ]
+
+
+def test___analog_single_channel_reader___read_many_sample_stream___blocks_returned(
+    task: Task, interpreter: Mock
+):
+    interpreter.read_analog_f64_stream.return_value = _create_blocks(
+        [(numpy.arange(4.0), 4), (numpy.arange(4.0, 8.0), 2)], []
+    )
+    reader = AnalogSingleChannelReader(task.in_stream)
+
+    blocks = list(reader.read_many_sample_stream(4))
+
+    interpreter.read_analog_f64_stream.assert_called_once_with(
+        task._handle, 4, 10.0, FillMode.GROUP_BY_CHANNEL.value, 4
+    )
+    assert [block.tolist() for block in blocks] == [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0]]
+
+
+def test___analog_unscaled_reader___read_int16_stream___blocks_reshaped(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.read_binary_i16_stream.return_value = _create_blocks(
+        [(numpy.arange(4, dtype=numpy.int16), 2)], []
+    )
+    reader = AnalogUnscaledReader(task.in_stream)
+
+    blocks = list(reader.read_int16_stream(2))
+
+    assert blocks[0].dtype == numpy.int16
+    assert blocks[0].tolist() == [[0, 1], [2, 3]]
+
+
+def test___read_many_sample_stream___close_iterator___interpreter_stream_closed(
+    task: Task, interpreter: Mock
+):
+    closed: list[bool] = []
+    interpreter.read_analog_f64_stream.return_value = _create_blocks(
+        [(numpy.arange(4.0), 4), (numpy.arange(4.0), 4)], closed
+    )
+    reader = AnalogSingleChannelReader(task.in_stream)
+    stream = reader.read_many_sample_stream(4)
+
+    next(stream)
+    stream.close()
+
+    assert closed == [True]
+
+
+def test___read_many_sample_stream___not_iterated___interpreter_stream_started(
+    task: Task, interpreter: Mock
+):
+    reader = AnalogSingleChannelReader(task.in_stream)
+
+    reader.read_many_sample_stream(4)
+
+    interpreter.read_analog_f64_stream.assert_called_once()
+
+
+def test___zero_samples_per_channel___read_many_sample_stream___value_error_raised(
+    task: Task, interpreter: Mock
+):
+    reader = AnalogSingleChannelReader(task.in_stream)
+
+    with pytest.raises(ValueError):
+        reader.read_many_sample_stream(0)
+
+    interpreter.read_analog_f64_stream.assert_not_called()
+
+
+def _create_moniker_response(
+    read_response: grpc_types.MonikerReadAnalogF64Response,
+) -> data_moniker_pb2.MonikerReadResponse:
+    value = any_pb2.Any()
+    value.Pack(read_response)
+    return data_moniker_pb2.MonikerReadResponse(data=data_moniker_pb2.MonikerValues(values=[value]))
+
+
+def _create_grpc_interpreter(
+    mocker: MockerFixture, client: Mock, moniker_client: Mock
+) -> GrpcStubInterpreter:
+    interpreter = _select_interpreter(create_grpc_options(mocker))
+    assert isinstance(interpreter, GrpcStubInterpreter)
+    interpreter._client = client
+    interpreter._moniker_client = moniker_client
+    return interpreter
+
+
+def _create_moniker_stream(
+    mocker: MockerFixture, read_responses: list[grpc_types.MonikerReadAnalogF64Response]
+) -> Mock:
+    moniker_stream = mocker.MagicMock()
+    moniker_stream.__iter__.return_value = iter(
+        [_create_moniker_response(read_response) for read_response in read_responses]
+    )
+    return moniker_stream
+
+
+def test___grpc_interpreter___read_analog_f64_stream___moniker_stream_read(
+    mocker: MockerFixture,
+):
+    client = mocker.Mock()
+    client.BeginReadAnalogF64.return_value = grpc_types.BeginReadAnalogF64Response(
+        moniker=data_moniker_pb2.Moniker(data_instance=7)
+    )
+    moniker_client = mocker.Mock()
+    interpreter = _create_grpc_interpreter(mocker, client, moniker_client)
+    moniker_stream = _create_moniker_stream(
+        mocker,
+        [
+            grpc_types.MonikerReadAnalogF64Response(
+                read_array=[1.0, 2.0, 3.0, 4.0], samps_per_chan_read=2
+            ),
+            grpc_types.MonikerReadAnalogF64Response(read_array=[5.0, 6.0], samps_per_chan_read=1),
+        ],
+    )
+    moniker_client.StreamRead.return_value = moniker_stream
+
+    blocks = list(interpreter.read_analog_f64_stream(Session(name="MyTask"), 2, 10.0, 0, 4))
+
+    assert [(block.tolist(), samps_read) for block, samps_read in blocks] == [
+        ([1.0, 2.0, 3.0, 4.0], 2),
+        ([5.0, 6.0, 0.0, 0.0], 1),
+    ]
+    stream_request = moniker_client.StreamRead.call_args.args[0]
+    assert stream_request.read_monikers[0].data_instance == 7
+    moniker_stream.cancel.assert_called_once()
+
+
+def test___grpc_interpreter___read_analog_f64_stream_error___read_error_raised_and_stream_cancelled(
+    mocker: MockerFixture,
+):
+    client = mocker.Mock()
+    client.BeginReadAnalogF64.return_value = grpc_types.BeginReadAnalogF64Response()
+    moniker_client = mocker.Mock()
+    interpreter = _create_grpc_interpreter(mocker, client, moniker_client)
+    moniker_stream = _create_moniker_stream(
+        mocker,
+        [
+            grpc_types.MonikerReadAnalogF64Response(
+                status=DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE, samps_per_chan_read=0
+            )
+        ],
+    )
+    moniker_client.StreamRead.return_value = moniker_stream
+    blocks = interpreter.read_analog_f64_stream(Session(name="MyTask"), 2, 0.0, 0, 4)
+
+    with pytest.raises(DaqReadError) as exc_info:
+        next(blocks)
+
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+    moniker_stream.cancel.assert_called_once()
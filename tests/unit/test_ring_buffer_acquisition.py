@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqReadError, Task
+from nidaqmx.constants import EveryNSamplesEventType
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogSingleChannelReader,
+    AnalogUnscaledReader,
+    RingBufferAcquisition,
+)
+
+
+def _fill_with_block_number() -> Callable[..., tuple[numpy.typing.NDArray[numpy.float64], int]]:
+    block_numbers = iter(range(1, 1000))
+
+    def read(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[...] = next(block_numbers)
+        return read_array, num_samps_per_chan
+
+    return read
+
+
+def _get_callback(interpreter: Mock) -> Callable[..., int]:
+    return interpreter.register_every_n_samples_event.call_args.args[4]
+
+
+def _create_acquisition(
+    task: Task, interpreter: Mock, buffer_size_in_blocks: int = 4
+) -> RingBufferAcquisition:
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.read_analog_f64.side_effect = _fill_with_block_number()
+    reader = AnalogMultiChannelReader(task.in_stream)
+    return RingBufferAcquisition(reader, 3, buffer_size_in_blocks)
+
+
+def test___ring_buffer_acquisition___enter___event_registered(task: Task, interpreter: Mock):
+    acquisition = _create_acquisition(task, interpreter)
+
+    with acquisition:
+        pass
+
+    interpreter.register_every_n_samples_event.assert_called_once()
+    assert interpreter.register_every_n_samples_event.call_args.args[:3] == (
+        task._handle,
+        EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value,
+        3,
+    )
+    interpreter.unregister_every_n_samples_event.assert_called_once_with(
+        task._handle, EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value
+    )
+
+
+def test___events___get___blocks_returned_in_order(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter) as acquisition:
+        callback = _get_callback(interpreter)
+        for _ in range(2):
+            assert callback(task._handle, 1, 3, None) == 0
+
+        first = acquisition.get(timeout=0)
+        second = acquisition.get(timeout=0)
+
+    assert first is not None and second is not None
+    assert first.data.tolist() == [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]]
+    assert second.data.tolist() == [[2.0, 2.0, 2.0], [2.0, 2.0, 2.0]]
+    assert (first.first_sample_index, second.first_sample_index) == (0, 3)
+    assert first.timestamp <= second.timestamp
+    assert acquisition.total_samples_acquired == 6
+
+
+def test___more_events_than_blocks___get___oldest_blocks_overwritten(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter, buffer_size_in_blocks=2) as acquisition:
+        callback = _get_callback(interpreter)
+        for _ in range(3):
+            callback(task._handle, 1, 3, None)
+
+        blocks = [acquisition.get(timeout=0) for _ in range(2)]
+
+    assert acquisition.overflow_count == 1
+    assert [block.data[0, 0] for block in blocks if block is not None] == [2.0, 3.0]
+    assert [block.first_sample_index for block in blocks if block is not None] == [3, 6]
+
+
+def test___no_events___get___timeout_error_raised(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter) as acquisition:
+        with pytest.raises(TimeoutError):
+            acquisition.get(timeout=0)
+
+
+def test___closed_acquisition___iterate___remaining_blocks_returned(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter) as acquisition:
+        callback = _get_callback(interpreter)
+        for _ in range(2):
+            callback(task._handle, 1, 3, None)
+
+    blocks = list(acquisition)
+
+    assert [block.data[0, 0] for block in blocks] == [1.0, 2.0]
+
+
+def test___read_fails___get___error_raised(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter) as acquisition:
+        interpreter.read_analog_f64.side_effect = DaqReadError("Read failed.", -200279, 0)
+        _get_callback(interpreter)(task._handle, 1, 3, None)
+
+        with pytest.raises(DaqReadError):
+            acquisition.get(timeout=0)
+
+
+def test___events___get_latest_samples___latest_samples_returned(task: Task, interpreter: Mock):
+    with _create_acquisition(task, interpreter) as acquisition:
+        callback = _get_callback(interpreter)
+        for _ in range(5):
+            callback(task._handle, 1, 3, None)
+
+        samples = acquisition.get_latest_samples(4)
+
+    assert samples.tolist() == [[4.0, 5.0, 5.0, 5.0], [4.0, 5.0, 5.0, 5.0]]
+    assert acquisition.available_blocks == 4
+
+
+def test___analog_unscaled_reader___event___int16_samples_read(task: Task, interpreter: Mock):
+    interpreter.get_read_attribute_uint32.return_value = 1
+    interpreter.read_binary_i16.side_effect = _fill_with_block_number()
+    reader = AnalogUnscaledReader(task.in_stream)
+
+    with RingBufferAcquisition(reader, 2) as acquisition:
+        _get_callback(interpreter)(task._handle, 1, 2, None)
+        block = acquisition.get(timeout=0)
+
+    assert block is not None
+    assert block.data.dtype == numpy.int16
+    assert block.data.tolist() == [[1, 1]]
+
+
+def test___unsupported_reader___construct___type_error_raised(task: Task, interpreter: Mock):
+    reader = AnalogSingleChannelReader(task.in_stream)
+
+    with pytest.raises(TypeError):
+        RingBufferAcquisition(reader, 2)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, DaqReadError, Task
+from nidaqmx._simulated_interpreter import SimulatedInterpreter
+from nidaqmx.constants import AcquisitionType, LineGrouping
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqFunctionNotSupportedError
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+
+
+@pytest.fixture
+def simulated_task(monkeypatch: pytest.MonkeyPatch) -> Generator[Task]:
+    """Create a task that uses the simulated interpreter."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "1")
+    with Task() as task:
+        yield task
+
+
+def test___ai_voltage_channels___read___sine_waves_returned(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:1", min_val=-10.0, max_val=10.0)
+
+    data = numpy.array(simulated_task.read(100))
+
+    assert isinstance(simulated_task._interpreter, SimulatedInterpreter)
+    assert data.shape == (2, 100)
+    sample_indices = numpy.arange(100)
+    assert data[0] == pytest.approx(9.0 * numpy.sin(2 * numpy.pi * sample_indices / 100))
+    assert data[1] == pytest.approx(9.0 * numpy.sin(2 * numpy.pi * (sample_indices / 100 + 1 / 8)))
+
+
+def test___ai_voltage_channels___read_twice___samples_continue(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+
+    first = simulated_task.read(10)
+    second = simulated_task.read(10)
+    simulated_task.stop()
+    simulated_task.start()
+    restarted = simulated_task.read(10)
+
+    assert first[0] == pytest.approx(0.0)
+    assert second[0] == pytest.approx(4.5 * numpy.sin(2 * numpy.pi * 10 / 100))
+    assert restarted == pytest.approx(first)
+
+
+def test___task_attributes___get___channels_reported(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:3", "voltage")
+
+    assert simulated_task.channel_names == ["voltage0", "voltage1", "voltage2", "voltage3"]
+    assert simulated_task.number_of_channels == 4
+    assert simulated_task.ai_channels["voltage2"].physical_channel.name == "Dev1/ai2"
+    assert simulated_task.in_stream.num_chans == 4
+
+
+def test___finite_sample_clock_timing___read_all_available___waits_for_all_samples(
+    simulated_task: Task,
+):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+    simulated_task.timing.cfg_samp_clk_timing(10_000.0, samps_per_chan=500)
+
+    data = simulated_task.read(-1)
+
+    assert len(data) == 500
+    assert simulated_task.is_task_done()
+
+
+def test___continuous_sample_clock_timing___read_more_than_acquired___read_error_raised(
+    simulated_task: Task,
+):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+    simulated_task.timing.cfg_samp_clk_timing(100.0, sample_mode=AcquisitionType.CONTINUOUS)
+    simulated_task.start()
+
+    with pytest.raises(DaqReadError) as exc_info:
+        simulated_task.read(1000, timeout=0.05)
+
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+    assert exc_info.value.samps_per_chan_read < 1000
+
+
+def test___digital_port_channel___read___counter_pattern_returned(simulated_task: Task):
+    simulated_task.di_channels.add_di_chan(
+        "Dev1/port0", line_grouping=LineGrouping.CHAN_FOR_ALL_LINES
+    )
+
+    data = simulated_task.read(4)
+
+    assert data == [0, 1, 2, 3]
+    assert simulated_task.in_stream.di_num_booleans_per_chan == 8
+
+
+def test___count_edges_channel___read___counts_returned(simulated_task: Task):
+    simulated_task.ci_channels.add_ci_count_edges_chan("Dev1/ctr0", initial_count=10)
+
+    data = simulated_task.read(3)
+
+    assert data == [10.0, 11.0, 12.0]
+
+
+def test___sample_clock_timing___read_waveform___timing_and_properties_set(
+    simulated_task: Task,
+):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+    simulated_task.timing.cfg_samp_clk_timing(10_000.0, samps_per_chan=100)
+
+    waveform = simulated_task.read_waveform(100)
+
+    assert waveform.sample_count == 100
+    assert waveform.timing.sample_interval.total_seconds() == pytest.approx(1e-4)
+    assert waveform.extended_properties["NI_ChannelName"] == "Dev1/ai0"
+
+
+def test___finite_output_task___write_and_wait_until_done___done(simulated_task: Task):
+    simulated_task.ao_channels.add_ao_voltage_chan("Dev1/ao0")
+    simulated_task.timing.cfg_samp_clk_timing(100_000.0, samps_per_chan=1000)
+
+    samples_written = simulated_task.write(numpy.zeros(1000))
+    simulated_task.start()
+    simulated_task.wait_until_done(timeout=1.0)
+
+    assert samples_written == 1000
+    assert simulated_task.is_task_done()
+
+
+def test___every_n_samples_event___start___callbacks_invoked(simulated_task: Task):
+    simulated_task.ai_channels.add_ai_voltage_chan("Dev1/ai0:1")
+    simulated_task.timing.cfg_samp_clk_timing(10_000.0, sample_mode=AcquisitionType.CONTINUOUS)
+    reader = AnalogMultiChannelReader(simulated_task.in_stream)
+    data = numpy.zeros((2, 100))
+    blocks_read = threading.Semaphore(0)
+
+    def callback(task_handle, every_n_samples_event_type, number_of_samples, callback_data):
+        reader.read_many_sample(data, number_of_samples)
+        blocks_read.release()
+        return 0
+
+    simulated_task.register_every_n_samples_acquired_into_buffer_event(100, callback)
+    simulated_task.start()
+    assert all(blocks_read.acquire(timeout=5.0) for _ in range(3))
+    simulated_task.stop()
+
+    assert data[0, 0] == pytest.approx(0.0, abs=1e-9)
+
+
+def test___unsupported_function___call___function_not_supported_error_raised(
+    simulated_task: Task,
+):
+    with pytest.raises(DaqFunctionNotSupportedError):
+        simulated_task.save("MySavedTask")
+
+
+def test___no_input_channels___read___daq_error_raised(simulated_task: Task):
+    simulated_task.ao_channels.add_ao_voltage_chan("Dev1/ao0")
+
+    with pytest.raises(DaqError) as exc_info:
+        simulated_task.in_stream.channels_to_read
+
+    assert exc_info.value.error_code == DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType, ChannelType, UsageTypeAI
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task import SinglePointLoop
+
+_CHAN_TYPE = 0x187F
+_AI_MEAS_TYPE = 0x695
+
+
+def _expect_ai_voltage_chan(interpreter: Mock) -> None:
+    chan_attributes = {
+        _CHAN_TYPE: ChannelType.ANALOG_INPUT.value,
+        _AI_MEAS_TYPE: UsageTypeAI.VOLTAGE.value,
+    }
+    interpreter.get_read_attribute_string.return_value = "Dev1/ai0"
+    interpreter.get_chan_attribute_int32.side_effect = lambda handle, chan, attr: chan_attributes[
+        attr
+    ]
+
+
+@pytest.fixture
+def simulated_tasks(monkeypatch: pytest.MonkeyPatch) -> Generator[tuple[Task, Task]]:
+    """Create started hardware-timed single-point input and output tasks."""
+    monkeypatch.setenv("NIDAQMX_SIMULATED_INTERPRETER", "true")
+    with Task("LoopInput") as input_task, Task("LoopOutput") as output_task:
+        input_task.ai_channels.add_ai_voltage_chan("SimDev1/ai0")
+        output_task.ao_channels.add_ao_voltage_chan("SimDev1/ao0:1")
+        for task in (input_task, output_task):
+            task.timing.cfg_samp_clk_timing(1000, sample_mode=AcquisitionType.HW_TIMED_SINGLE_POINT)
+        output_task.start()
+        input_task.start()
+        yield input_task, output_task
+
+
+def test___task___wait_for_next_sample_clock___returns_is_late(task: Task, interpreter: Mock):
+    interpreter.wait_for_next_sample_clock.return_value = True
+
+    is_late = task.wait_for_next_sample_clock(timeout=2.0)
+
+    assert is_late
+    interpreter.wait_for_next_sample_clock.assert_called_once_with(task._handle, 2.0)
+
+
+def test___single_analog_channel___run___scalar_reads_and_late_cycles_counted(
+    task: Task, interpreter: Mock
+):
+    _expect_ai_voltage_chan(interpreter)
+    interpreter.wait_for_next_sample_clock.side_effect = [False, True, False]
+    interpreter.read_analog_scalar_f64.side_effect = [1.0, 2.0, 3.0]
+    values: list[float] = []
+    loop = SinglePointLoop(task, values.append)
+
+    cycle_count = loop.run(3)
+
+    assert cycle_count == 3
+    assert values == [1.0, 2.0, 3.0]
+    interpreter.read_analog_f64.assert_not_called()
+    statistics = loop.statistics
+    assert (statistics.cycle_count, statistics.late_cycle_count) == (3, 1)
+    assert not loop.is_late
+
+
+def test___missed_sample_clock_error___run___cycle_counted_as_late(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chan(interpreter)
+    interpreter.wait_for_next_sample_clock.side_effect = [
+        DaqError(
+            "Missed sample clock.", DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_DETECTED_MISSED_SAMP_CLK
+        ),
+        False,
+    ]
+    interpreter.read_analog_scalar_f64.return_value = 0.0
+    loop = SinglePointLoop(task, lambda value: None)
+
+    loop.run(2)
+
+    assert loop.statistics.late_cycle_count == 1
+
+
+def test___other_error___run___error_raised(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chan(interpreter)
+    interpreter.wait_for_next_sample_clock.side_effect = DaqError(
+        "Not supported.", DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_NOT_SUPPORTED
+    )
+    loop = SinglePointLoop(task, lambda value: None)
+
+    with pytest.raises(DaqError) as exc_info:
+        loop.run(1)
+
+    assert exc_info.value.error_type == DAQmxErrors.WAIT_FOR_NEXT_SAMP_CLK_NOT_SUPPORTED
+    assert loop.statistics.cycle_count == 0
+
+
+def test___simulated_tasks___run_until_stopped___periods_recorded(
+    simulated_tasks: tuple[Task, Task],
+):
+    input_task, output_task = simulated_tasks
+    loop: SinglePointLoop
+
+    def compute(value: float) -> numpy.typing.NDArray[numpy.float64]:
+        if loop.statistics.cycle_count == 19:
+            loop.stop()
+        return numpy.array([value, -value])
+
+    loop = SinglePointLoop(input_task, compute, output_task)
+
+    cycle_count = loop.run()
+
+    assert cycle_count == 20
+    statistics = loop.statistics
+    assert statistics.min_period <= statistics.mean_period <= statistics.max_period
+    # Each wait returns on a later sample clock than the previous wake, so the 19 periods span
+    # more than 18 sample clock periods.
+    assert statistics.mean_period >= 0.0009
+    assert statistics.period_jitter >= 0.0
+
+
+def test___simulated_tasks___compute_slower_than_period___late_cycles_counted(
+    simulated_tasks: tuple[Task, Task],
+):
+    input_task, output_task = simulated_tasks
+
+    def compute(value: float) -> list[float]:
+        time.sleep(0.0025)
+        return [value, value]
+
+    loop = SinglePointLoop(input_task, compute, output_task)
+
+    loop.run(5)
+
+    assert loop.statistics.late_cycle_count >= 3
+    assert loop.is_late
+    assert loop.statistics.max_cycle_time >= 0.0025
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import numpy
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx import DaqError, Task
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.constants import FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+from nidaqmx.stream_writers import AnalogMultiChannelWriter, AnalogSingleChannelWriter
+from nidaqmx.utils import _select_interpreter
+from tests.unit._grpc_utils import create_grpc_options
+
+try:
+    import grpc
+
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from session_pb2 import Session
+except ImportError:
+    pass
+
+
+def test___task___wait_until_done_async___interpreter_awaited(task: Task, interpreter: Mock):
+    asyncio.run(task.wait_until_done_async(timeout=5.0))
+
+    interpreter.wait_until_task_done_async.assert_awaited_once_with(task._handle, 5.0)
+
+
+def test___analog_multi_channel_reader___read_many_sample_async___interpreter_awaited(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.read_analog_f64_async.return_value = (None, 3)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((2, 4))
+
+    samps_per_chan_read = asyncio.run(reader.read_many_sample_async(data, 4, timeout=5.0))
+
+    assert samps_per_chan_read == 3
+    interpreter.read_analog_f64_async.assert_awaited_once_with(
+        task._handle, 4, 5.0, FillMode.GROUP_BY_CHANNEL.value, data
+    )
+
+
+def test___analog_single_channel_writer___write_many_sample_async___interpreter_awaited(
+    task: Task, interpreter: Mock
+):
+    interpreter.write_analog_f64_async.return_value = 4
+    writer = AnalogSingleChannelWriter(task.out_stream, auto_start=True)
+    data = numpy.zeros(4)
+
+    samps_per_chan_written = asyncio.run(writer.write_many_sample_async(data, timeout=5.0))
+
+    assert samps_per_chan_written == 4
+    interpreter.write_analog_f64_async.assert_awaited_once_with(
+        task._handle, 4, True, 5.0, FillMode.GROUP_BY_CHANNEL.value, data
+    )
+
+
+def test___read_all_available___read_many_sample_async___driver_queried_off_event_loop(
+    task: Task, interpreter: Mock
+):
+    threads = []
+    interpreter.driver_version = (24, 5, 0)
+
+    def get_read_attribute_uint32(handle, attribute):
+        threads.append(threading.current_thread())
+        return 2
+
+    interpreter.get_read_attribute_uint32.side_effect = get_read_attribute_uint32
+    interpreter.read_analog_f64_async.return_value = (None, 2)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((2, 2))
+
+    asyncio.run(reader.read_many_sample_async(data, timeout=5.0))
+
+    assert threads and all(thread is not threading.main_thread() for thread in threads)
+    interpreter.read_analog_f64_async.assert_awaited_once_with(
+        task._handle, 2, 5.0, FillMode.GROUP_BY_CHANNEL.value, data
+    )
+
+
+def test___verify_array_shape___write_many_sample_async___driver_queried_off_event_loop(
+    task: Task, interpreter: Mock
+):
+    threads = []
+
+    def get_write_attribute_uint32(handle, attribute):
+        threads.append(threading.current_thread())
+        return 2
+
+    interpreter.get_write_attribute_uint32.side_effect = get_write_attribute_uint32
+    interpreter.write_analog_f64_async.return_value = 4
+    writer = AnalogMultiChannelWriter(task.out_stream)
+
+    asyncio.run(writer.write_many_sample_async(numpy.zeros((2, 4)), timeout=5.0))
+
+    assert threads and all(thread is not threading.main_thread() for thread in threads)
+
+
+def test___verify_array_shape_false___write_many_sample_async___driver_not_queried(
+    task: Task, interpreter: Mock
+):
+    interpreter.write_analog_f64_async.return_value = 4
+    writer = AnalogSingleChannelWriter(task.out_stream)
+    writer.verify_array_shape = False
+
+    asyncio.run(writer.write_many_sample_async(numpy.zeros(4), timeout=5.0))
+
+    interpreter.get_write_attribute_uint32.assert_not_called()
+
+
+def test___library_interpreter___wait_until_task_done_async___blocking_method_run_in_executor(
+    mocker: MockerFixture,
+):
+    interpreter = LibraryInterpreter.__new__(LibraryInterpreter)
+    threads = []
+    wait_until_task_done = mocker.patch.object(
+        LibraryInterpreter,
+        "wait_until_task_done",
+        autospec=True,
+        side_effect=lambda *args: threads.append(threading.current_thread()),
+    )
+
+    asyncio.run(interpreter.wait_until_task_done_async(mocker.sentinel.task, 5.0))
+
+    wait_until_task_done.assert_called_once_with(interpreter, mocker.sentinel.task, 5.0)
+    assert threads[0] is not threading.main_thread()
+
+
+def _create_grpc_interpreter_with_aio_client(
+    mocker: MockerFixture, aio_client: Mock
+) -> GrpcStubInterpreter:
+    grpc_options = create_grpc_options(mocker)
+    grpc_options.grpc_aio_channel = mocker.Mock()
+    interpreter = _select_interpreter(grpc_options)
+    assert isinstance(interpreter, GrpcStubInterpreter)
+    interpreter._aio_client = aio_client
+    return interpreter
+
+
+def test___grpc_interpreter_with_aio_channel___read_analog_f64_async___aio_stub_awaited(
+    mocker: MockerFixture,
+):
+    aio_client = mocker.Mock()
+    aio_client.ReadAnalogF64 = mocker.AsyncMock(
+        return_value=grpc_types.ReadAnalogF64Response(
+            read_array=[1.0, 2.0, 3.0], samps_per_chan_read=3
+        )
+    )
+    interpreter = _create_grpc_interpreter_with_aio_client(mocker, aio_client)
+    data = numpy.zeros(3)
+
+    _, samps_per_chan_read = asyncio.run(
+        interpreter.read_analog_f64_async(Session(name="MyTask"), 3, 5.0, 0, data)
+    )
+
+    assert samps_per_chan_read == 3
+    assert data.tolist() == [1.0, 2.0, 3.0]
+    request = aio_client.ReadAnalogF64.await_args.args[0]
+    assert request.array_size_in_samps == 3
+
+
+def test___grpc_interpreter_with_aio_channel___wait_until_task_done_async_fails___daq_error_raised(
+    mocker: MockerFixture,
+):
+    rpc_error = grpc.aio.AioRpcError(
+        grpc.StatusCode.UNKNOWN,
+        grpc.aio.Metadata(),
+        grpc.aio.Metadata(("ni-error", str(DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE))),
+        details="Some or all of the samples requested have not yet been acquired.",
+        debug_error_string="",
+    )
+    aio_client = mocker.Mock()
+    aio_client.WaitUntilTaskDone = mocker.AsyncMock(side_effect=rpc_error)
+    interpreter = _create_grpc_interpreter_with_aio_client(mocker, aio_client)
+
+    with pytest.raises(DaqError) as exc_info:
+        asyncio.run(interpreter.wait_until_task_done_async(Session(name="MyTask"), 0.0))
+
+    assert exc_info.value.error_code == DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE
+
+
+def test___grpc_interpreter_without_aio_channel___wait_until_task_done_async___blocking_method_run(
+    mocker: MockerFixture,
+):
+    interpreter = _select_interpreter(create_grpc_options(mocker))
+    wait_until_task_done = mocker.patch.object(
+        type(interpreter), "wait_until_task_done", autospec=True
+    )
+
+    asyncio.run(interpreter.wait_until_task_done_async(mocker.sentinel.task, 5.0))
+
+    wait_until_task_done.assert_called_once_with(interpreter, mocker.sentinel.task, 5.0)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import ChannelType, TaskMode, UsageTypeAI, UsageTypeCI
+from nidaqmx.types import CTR_FREQ_DTYPE
+
+_CHAN_TYPE = 0x187F
+_AI_MEAS_TYPE = 0x695
+_CI_MEAS_TYPE = 0x18A0
+
+
+def _expect_ai_voltage_chans(interpreter: Mock, channel_names: str) -> None:
+    chan_attributes = {
+        _CHAN_TYPE: ChannelType.ANALOG_INPUT.value,
+        _AI_MEAS_TYPE: UsageTypeAI.VOLTAGE.value,
+    }
+    interpreter.get_read_attribute_string.return_value = channel_names
+    interpreter.get_chan_attribute_int32.side_effect = lambda handle, chan, attr: chan_attributes[
+        attr
+    ]
+
+
+def _expect_ci_freq_chan(interpreter: Mock) -> None:
+    chan_attributes = {
+        _CHAN_TYPE: ChannelType.COUNTER_INPUT.value,
+        _CI_MEAS_TYPE: UsageTypeCI.PULSE_FREQ.value,
+    }
+    interpreter.get_read_attribute_string.return_value = "Dev1/ctr0"
+    interpreter.get_chan_attribute_int32.side_effect = lambda handle, chan, attr: chan_attributes[
+        attr
+    ]
+
+
+def _expect_read_analog_f64(interpreter: Mock, value: float, samples_read: int = -1) -> None:
+    def read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array.fill(value)
+        return read_array, num_samps_per_chan if samples_read < 0 else samples_read
+
+    interpreter.read_analog_f64.side_effect = read_analog_f64
+
+
+def test___single_channel___read___returns_scalar(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 1.5)
+
+    data = task.read()
+
+    assert data == 1.5
+
+
+def test___multiple_channels___read_with_sample_count___returns_list_of_lists(
+    task: Task, interpreter: Mock
+):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    _expect_read_analog_f64(interpreter, 2.0)
+
+    data = task.read(3)
+
+    assert data == [[2.0, 2.0, 2.0], [2.0, 2.0, 2.0]]
+    read_array = interpreter.read_analog_f64.call_args.args[4]
+    assert read_array.shape == (2, 3)
+    assert read_array.dtype == numpy.float64
+
+
+@pytest.mark.parametrize("num_reads", [2, 10])
+def test___read_repeatedly___channel_metadata_queried_once(
+    task: Task, interpreter: Mock, num_reads: int
+):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 0.0)
+
+    task.read()
+    chan_attribute_call_count = interpreter.get_chan_attribute_int32.call_count
+
+    for _ in range(num_reads - 1):
+        task.read()
+
+    interpreter.get_read_attribute_string.assert_called_once()
+    assert interpreter.get_chan_attribute_int32.call_count == chan_attribute_call_count
+    assert interpreter.read_analog_f64.call_count == num_reads
+
+
+def test___read___set_channels_to_read___read_plan_rebuilt(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 0.0)
+    task.read()
+
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    task.in_stream.channels_to_read = task.ai_channels.all
+    data = task.read()
+
+    assert data == [0.0, 0.0]
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___read___reset_channels_to_read___read_plan_rebuilt(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 0.0)
+    task.read()
+
+    del task.in_stream.channels_to_read
+    task.read()
+
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___read___add_channel___read_plan_rebuilt(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 0.0)
+    interpreter.internal_get_last_created_chan.return_value = "Dev1/ai1"
+    ai_channels = task.ai_channels
+    task.read()
+
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    ai_channels.add_ai_voltage_chan("Dev1/ai1")
+    data = task.read()
+
+    assert data == [0.0, 0.0]
+
+
+def test___read___control___read_plan_rebuilt(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 0.0)
+    task.read()
+
+    task.control(TaskMode.TASK_UNRESERVE)
+    task.read()
+
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___single_channel___read_as_numpy___returns_numpy_scalar(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0")
+    _expect_read_analog_f64(interpreter, 1.5)
+
+    data = task.read(as_numpy=True)
+
+    assert isinstance(data, numpy.float64)
+    assert data == 1.5
+
+
+def test___multiple_channels___read_as_numpy___returns_2d_array(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    _expect_read_analog_f64(interpreter, 2.0)
+
+    data = task.read(3, as_numpy=True)
+
+    assert isinstance(data, numpy.ndarray)
+    assert data.shape == (2, 3)
+    assert data is interpreter.read_analog_f64.call_args.args[4]
+
+
+def test___multiple_channels___read_into_out___out_filled_and_returned(
+    task: Task, interpreter: Mock
+):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    _expect_read_analog_f64(interpreter, 3.0)
+    out = numpy.zeros((2, 3))
+
+    data = task.read(3, out=out)
+
+    assert data is out
+    assert out.tolist() == [[3.0, 3.0, 3.0], [3.0, 3.0, 3.0]]
+
+
+def test___short_read___read_into_out___returns_view_of_samples_read(task: Task, interpreter: Mock):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+    _expect_read_analog_f64(interpreter, 4.0, samples_read=2)
+    out = numpy.zeros((2, 3))
+
+    data = task.read(3, out=out)
+
+    assert data.shape == (2, 2)
+    assert numpy.shares_memory(data, out)
+
+
+@pytest.mark.parametrize("out", [numpy.zeros((3, 2)), numpy.zeros((2, 3), dtype=numpy.float32)])
+def test___mismatched_array___read_into_out___raises_error(
+    task: Task, interpreter: Mock, out: numpy.typing.NDArray
+):
+    _expect_ai_voltage_chans(interpreter, "Dev1/ai0:1")
+
+    with pytest.raises(DaqError) as exc_info:
+        task.read(3, out=out)
+
+    assert "(2, 3)" in exc_info.value.args[0]
+    interpreter.read_analog_f64.assert_not_called()
+
+
+def test___counter_frequency_channel___read_as_numpy___returns_structured_array(
+    task: Task, interpreter: Mock
+):
+    _expect_ci_freq_chan(interpreter)
+
+    def read_ctr_freq(task_handle, num_samps_per_chan, timeout, interleaved, freqs, duty_cycles):
+        freqs.fill(1000.0)
+        duty_cycles.fill(0.25)
+        return freqs, duty_cycles, num_samps_per_chan
+
+    interpreter.read_ctr_freq.side_effect = read_ctr_freq
+
+    data = task.read(4, as_numpy=True)
+
+    assert data.dtype == CTR_FREQ_DTYPE
+    assert data.shape == (4,)
+    assert data["freq"].tolist() == [1000.0] * 4
+    assert data["duty_cycle"].tolist() == [0.25] * 4
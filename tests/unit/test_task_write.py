@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import ChannelType, UsageTypeCO
+from nidaqmx.types import CTR_FREQ_DTYPE, CTR_TICK_DTYPE, CtrFreq, CtrTick, CtrTime
+
+_TASK_CHANNELS = 0x1273
+_TASK_NAME = 0x1276
+_CHAN_TYPE = 0x187F
+_CO_OUTPUT_TYPE = 0x18B5
+
+
+def _expect_chans(interpreter: Mock, channel_names: str, chan_attributes: dict[int, int]) -> None:
+    interpreter.get_task_attribute_string.side_effect = lambda handle, attr: {
+        _TASK_CHANNELS: channel_names,
+        _TASK_NAME: "MyTask",
+    }[attr]
+    interpreter.get_chan_attribute_int32.side_effect = lambda handle, chan, attr: chan_attributes[
+        attr
+    ]
+
+
+def _expect_co_chan(interpreter: Mock, output_type: UsageTypeCO) -> None:
+    _expect_chans(
+        interpreter,
+        "Dev1/ctr0",
+        {_CHAN_TYPE: ChannelType.COUNTER_OUTPUT.value, _CO_OUTPUT_TYPE: output_type.value},
+    )
+
+
+def _expect_do_port_chan(interpreter: Mock) -> None:
+    _expect_chans(interpreter, "Dev1/port0", {_CHAN_TYPE: ChannelType.DIGITAL_OUTPUT.value})
+    interpreter.get_write_attribute_uint32.return_value = 8
+
+
+def test___counter_frequency_channel___write_structured_array___fields_written(
+    task: Task, interpreter: Mock
+):
+    _expect_co_chan(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+    interpreter.write_ctr_freq.return_value = 3
+    data = numpy.zeros(3, dtype=CTR_FREQ_DTYPE)
+    data["freq"] = [1000.0, 2000.0, 3000.0]
+    data["duty_cycle"] = 0.5
+
+    samples_written = task.write(data)
+
+    assert samples_written == 3
+    args = interpreter.write_ctr_freq.call_args.args
+    assert args[1:3] == (3, False)
+    assert args[5].tolist() == [1000.0, 2000.0, 3000.0]
+    assert args[6].tolist() == [0.5, 0.5, 0.5]
+    assert args[5].flags.c_contiguous and args[6].flags.c_contiguous
+
+
+def test___counter_frequency_channel___write_list_of_samples___fields_written(
+    task: Task, interpreter: Mock
+):
+    _expect_co_chan(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+
+    task.write([CtrFreq(freq=100.0, duty_cycle=0.25), CtrFreq(freq=200.0, duty_cycle=0.75)])
+
+    args = interpreter.write_ctr_freq.call_args.args
+    assert args[5].tolist() == [100.0, 200.0]
+    assert args[6].tolist() == [0.25, 0.75]
+
+
+def test___counter_frequency_channel___write_list_of_wrong_samples___raises_type_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_chan(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(TypeError, match="CtrFreq"):
+        task.write([CtrTick(high_tick=10, low_tick=20), CtrTick(high_tick=30, low_tick=40)])
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [CtrFreq(freq=1000.0, duty_cycle=0.5), CtrTime(high_time=0.001, low_time=0.002)],
+        [CtrFreq(freq=1000.0, duty_cycle=0.5), 5.0],
+    ],
+)
+def test___counter_frequency_channel___write_mixed_list___raises_type_error(
+    task: Task, interpreter: Mock, data: list[object]
+):
+    _expect_co_chan(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(TypeError, match="CtrFreq"):
+        task.write(data)
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___counter_frequency_channel___write_structured_array_with_wrong_fields___raises_type_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_chan(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(TypeError, match="freq"):
+        task.write(numpy.zeros(3, dtype=CTR_TICK_DTYPE))
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___digital_port_channel___write_int64_array___written_as_uint32(
+    task: Task, interpreter: Mock
+):
+    _expect_do_port_chan(interpreter)
+
+    task.write(numpy.array([1, 2, 0xFFFFFFFF], dtype=numpy.int64))
+
+    write_array = interpreter.write_digital_u32.call_args.args[5]
+    assert write_array.dtype == numpy.uint32
+    assert write_array.tolist() == [1, 2, 0xFFFFFFFF]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        numpy.array([1.0, 2.0]),
+        numpy.array([1, -1], dtype=numpy.int64),
+        numpy.array([1, 0x100000000], dtype=numpy.int64),
+    ],
+)
+def test___digital_port_channel___write_invalid_array___raises_error(
+    task: Task, interpreter: Mock, data: numpy.typing.NDArray
+):
+    _expect_do_port_chan(interpreter)
+
+    with pytest.raises(DaqError, match="unsigned 32-bit integer"):
+        task.write(data)
+
+    interpreter.write_digital_u32.assert_not_called()
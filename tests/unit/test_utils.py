@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from nidaqmx import DaqError
+from nidaqmx.utils import (
+    _ChannelInfo,
+    _parse_channel_string,
+    flatten_channel_string,
+    unflatten_channel_string,
+)
+
+_PREFIXES = ["Dev1/ai", "Dev1/port0/line", "cDAQ1Mod2/ctr", "EV", "Dev1/AI", "voltage", "", "a b"]
+_NUMBER_OF_EXAMPLES = 200
+
+
+def _reference_unflatten(channel_names: str) -> list[str]:
+    """The original unflatten_channel_string implementation, which the parser must match."""
+    channel_list_to_return = []
+    for channel in [c for c in channel_names.strip().split(",") if c]:
+        channel = channel.strip()
+        colon_index = channel.find(":")
+        if colon_index == -1:
+            channel_list_to_return.append(channel)
+            continue
+        m_before = re.match("(.*?)([0-9]+)$", channel[:colon_index])
+        m_after = re.match("(.*?)([0-9]+)$", channel[colon_index + 1 :])
+        if not m_before or not m_after:
+            raise DaqError("Invalid range.", error_code=-200498)
+        if m_after.group(1) and (m_before.group(1).lower() != m_after.group(1).lower()):
+            raise DaqError("Invalid range.", error_code=-200498)
+        num_before_str = m_before.group(2)
+        num_before = int(num_before_str)
+        num_after = int(m_after.group(2))
+        num_min_width = 0
+        if num_before > 0 and len(num_before_str.lstrip("0")) < len(num_before_str):
+            num_min_width = len(num_before_str)
+        num_max = max([num_before, num_after])
+        num_min = min([num_before, num_after])
+        if num_max - num_min + 1 >= 15000:
+            raise DaqError("Invalid range.", error_code=-200498)
+        expanded = []
+        for current_number in range(num_min, num_max + 1):
+            if num_min_width > 0:
+                current_number_str = f"{{:0{num_min_width}d}}".format(current_number)
+            else:
+                current_number_str = str(current_number)
+            expanded.append(f"{m_before.group(1)}{current_number_str}")
+        if num_after < num_before:
+            expanded.reverse()
+        channel_list_to_return.extend(expanded)
+    return channel_list_to_return
+
+
+def _reference_flatten(channel_names: list[str]) -> str:
+    """The original flatten_channel_string implementation, which the parser must match."""
+    unflattened_channel_names = []
+    for channel_name in channel_names:
+        unflattened_channel_names.extend(_reference_unflatten(channel_name))
+    flattened_channel_list = []
+    previous = _ChannelInfo()
+    for channel_name in unflattened_channel_names:
+        m = re.search("(.*[^0-9])?([0-9]+)$", channel_name)
+        if not m:
+            flattened_channel_list.append(previous.to_flattened_name())
+            previous = _ChannelInfo(channel_name)
+            continue
+        current_base_name = m.group(1)
+        current_index_str = m.group(2)
+        current_index = int(current_index_str)
+        if current_base_name == previous.base_name and (
+            (current_index == previous.end_index + 1 and previous.end_index >= previous.start_index)
+            or (
+                current_index == previous.end_index - 1
+                and previous.end_index <= previous.start_index
+            )
+        ):
+            previous.end_index = current_index
+            previous.end_index_str = current_index_str
+        else:
+            flattened_channel_list.append(previous.to_flattened_name())
+            previous = _ChannelInfo(
+                current_base_name,
+                current_index,
+                current_index_str,
+                current_index,
+                current_index_str,
+            )
+    flattened_channel_list.append(previous.to_flattened_name())
+    return ",".join([_f for _f in flattened_channel_list if _f]).strip()
+
+
+def _random_number_str(rng: random.Random) -> str:
+    number_str = str(rng.randrange(0, 40))
+    if rng.random() < 0.3:
+        number_str = number_str.zfill(rng.randrange(1, 5))
+    return number_str
+
+
+def _random_element(rng: random.Random) -> str:
+    prefix = rng.choice(_PREFIXES)
+    kind = rng.randrange(6)
+    if kind == 0:
+        return prefix
+    if kind == 1:
+        return prefix + _random_number_str(rng)
+    after_prefix = rng.choice(["", prefix, prefix.lower(), "other"])
+    element = f"{prefix}{_random_number_str(rng)}:{after_prefix}{_random_number_str(rng)}"
+    if kind == 5:
+        # Usually invalid syntax.
+        element = element.replace(":", rng.choice([":x", "::", ":"]), 1)
+    return element
+
+
+def _random_channel_string(rng: random.Random) -> str:
+    elements = [_random_element(rng) for _ in range(rng.randrange(0, 6))]
+    separators = [rng.choice([",", ", ", " ,", ",,"]) for _ in elements]
+    return rng.choice(["", " "]) + "".join(
+        element + separator for element, separator in zip(elements, separators)
+    )
+
+
+def _random_channel_strings() -> list[str]:
+    rng = random.Random(20240601)
+    return [_random_channel_string(rng) for _ in range(_NUMBER_OF_EXAMPLES)]
+
+
+@pytest.mark.parametrize("channel_string", _random_channel_strings())
+def test___random_channel_string___unflatten___matches_reference(channel_string: str):
+    try:
+        expected = _reference_unflatten(channel_string)
+    except DaqError:
+        with pytest.raises(DaqError):
+            unflatten_channel_string(channel_string)
+        return
+
+    assert unflatten_channel_string(channel_string) == expected
+
+
+@pytest.mark.parametrize("channel_string", _random_channel_strings())
+def test___random_channel_string___parse___queries_match_expanded_list(channel_string: str):
+    try:
+        expected = _reference_unflatten(channel_string)
+    except DaqError:
+        return
+    parsed = _parse_channel_string(channel_string)
+    probes = expected + [name + "0" for name in expected] + ["Dev1/ai1", "EV001", ""]
+
+    assert len(parsed) == len(expected)
+    assert [parsed[i] for i in range(-len(expected), len(expected))] == expected + expected
+    for probe in probes:
+        assert (probe in parsed) == (probe in expected)
+        if probe in expected:
+            assert parsed.index(probe) == expected.index(probe)
+        else:
+            with pytest.raises(ValueError):
+                parsed.index(probe)
+
+
+@pytest.mark.parametrize("channel_string", _random_channel_strings())
+def test___random_channel_names___flatten___matches_reference(channel_string: str):
+    channel_names = [name.strip() for name in channel_string.split(",")]
+    try:
+        expected = _reference_flatten(channel_names)
+    except DaqError:
+        with pytest.raises(DaqError):
+            flatten_channel_string(channel_names)
+        return
+
+    assert flatten_channel_string(channel_names) == expected
+
+
+@pytest.mark.parametrize(
+    "channel_names",
+    [
+        ["Dev1/ai0", "Dev1/ai1", "Dev1/ai2", "Dev1/ai4", "Dev2/ai0"],
+        ["Dev1/port0/line7", "Dev1/port0/line6", "Dev1/port0/line5"],
+        ["EV01", "EV02", "EV03"],
+        [f"Dev1/port0/line{i}" for i in range(10000)],
+    ],
+)
+def test___channel_names___flatten_and_unflatten___round_trips(channel_names: list[str]):
+    assert unflatten_channel_string(flatten_channel_string(channel_names)) == channel_names
+
+
+def test___unflatten___modify_result___cached_result_unchanged():
+    names = unflatten_channel_string("Dev1/ai0:3")
+
+    names.reverse()
+
+    assert unflatten_channel_string("Dev1/ai0:3") == [
+        "Dev1/ai0",
+        "Dev1/ai1",
+        "Dev1/ai2",
+        "Dev1/ai3",
+    ]
+
+
+def test___large_range___parse___names_not_expanded_for_queries():
+    parsed = _parse_channel_string("Dev2/port0/line0:9999")
+
+    assert len(parsed) == 10000
+    assert parsed[-1] == "Dev2/port0/line9999"
+    assert parsed.index("Dev2/port0/line5000") == 5000
+    assert "Dev2/port0/line10000" not in parsed
+    assert "Dev2/port0/line0500" not in parsed
+    assert parsed._names is None
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import ctypes
+from unittest.mock import Mock
+
+import numpy
+import pytest
+from hightime import timedelta as ht_timedelta
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, ExtendedPropertyDictionary
+from pytest_mock import MockerFixture
+
+from nidaqmx import Task
+from nidaqmx._lib import TaskHandle, lib_importer
+from nidaqmx._library_interpreter import LibraryInterpreter, WfmAttrType
+from nidaqmx._waveform_read_context import WaveformReadContext
+from nidaqmx.constants import TaskMode, WaveformAttributeMode
+from nidaqmx.stream_readers import AnalogMultiChannelReader, DigitalMultiChannelReader
+
+
+@pytest.fixture
+def library_interpreter() -> LibraryInterpreter:
+    """Create a library interpreter without loading the NI-DAQmx library."""
+    return LibraryInterpreter.__new__(LibraryInterpreter)
+
+
+def test___same_channel_count___get_timing_arrays___arrays_reused():
+    read_context = WaveformReadContext()
+
+    t0_array, dt_array = read_context.get_timing_arrays(4)
+
+    assert read_context.get_timing_arrays(4) == (t0_array, dt_array)
+    assert t0_array.shape == dt_array.shape == (4,)
+    assert t0_array.dtype == dt_array.dtype == numpy.int64
+
+
+def test___different_channel_count___get_timing_arrays___arrays_reallocated():
+    read_context = WaveformReadContext()
+    t0_array, dt_array = read_context.get_timing_arrays(4)
+
+    new_t0_array, new_dt_array = read_context.get_timing_arrays(2)
+
+    assert new_t0_array is not t0_array and new_dt_array is not dt_array
+    assert new_t0_array.shape == new_dt_array.shape == (2,)
+
+
+def test___same_dt___get_sample_interval___sample_interval_reused():
+    read_context = WaveformReadContext()
+    sample_interval = read_context.get_sample_interval(1, 1000, 100e-9)
+
+    assert read_context.get_sample_interval(1, 1000, 100e-9) is sample_interval
+    assert sample_interval == ht_timedelta(seconds=1000 * 100e-9)
+
+
+def test___different_dt___get_sample_interval___sample_interval_recomputed():
+    read_context = WaveformReadContext()
+    read_context.get_sample_interval(0, 1000, 100e-9)
+
+    sample_interval = read_context.get_sample_interval(0, 2000, 100e-9)
+
+    assert sample_interval == ht_timedelta(seconds=2000 * 100e-9)
+
+
+def test___read_context___set_waveform_timings___timing_matches_no_read_context(
+    library_interpreter: LibraryInterpreter,
+):
+    t0_array = numpy.array([638000000000000000, 638000000000001000], dtype=numpy.int64)
+    dt_array = numpy.array([1000, 400], dtype=numpy.int64)
+    waveforms = [AnalogWaveform(10), AnalogWaveform(10)]
+    expected_waveforms = [AnalogWaveform(10), AnalogWaveform(10)]
+
+    library_interpreter._set_waveform_timings(waveforms, t0_array, dt_array, WaveformReadContext())
+    library_interpreter._set_waveform_timings(expected_waveforms, t0_array, dt_array)
+
+    assert [waveform.timing for waveform in waveforms] == [
+        waveform.timing for waveform in expected_waveforms
+    ]
+
+
+def test___read_context___get_wfm_attr_callback_twice___callback_reused_with_new_properties(
+    library_interpreter: LibraryInterpreter, mocker: MockerFixture
+):
+    mocker.patch.object(lib_importer, "_encoding", "utf-8")
+    read_context = WaveformReadContext()
+    first_properties = [ExtendedPropertyDictionary()]
+    second_properties = [ExtendedPropertyDictionary()]
+    value = ctypes.c_double(1.5)
+
+    get_wfm_attr_callback = library_interpreter._get_wfm_attr_callback
+    callback_ptr = get_wfm_attr_callback(first_properties, read_context)
+    assert get_wfm_attr_callback(second_properties, read_context) is callback_ptr
+    callback_ptr(0, b"NI_Gain", WfmAttrType.FLOAT64.value, ctypes.addressof(value), 8, None)
+
+    assert "NI_Gain" not in first_properties[0]
+    assert second_properties[0]["NI_Gain"] == 1.5
+
+
+def test___analog_multi_channel_reader___read_waveforms_twice___same_read_context_passed(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.get_read_attribute_int32.return_value = 0
+    interpreter.read_analog_waveforms.return_value = 5
+    reader = AnalogMultiChannelReader(task.in_stream)
+    waveforms = [AnalogWaveform(5), AnalogWaveform(5)]
+
+    reader.read_waveforms(waveforms, 5)
+    reader.read_waveforms(waveforms, 5)
+
+    first_call, second_call = interpreter.read_analog_waveforms.call_args_list
+    assert isinstance(first_call.args[5], WaveformReadContext)
+    assert second_call.args[5] is first_call.args[5]
+
+
+def _capture_extended_properties(
+    read_context: WaveformReadContext, waveforms: list[AnalogWaveform[numpy.float64]]
+) -> None:
+    properties = read_context.get_properties_to_read(waveforms)
+    assert properties is not None
+    for i, channel_properties in enumerate(properties):
+        channel_properties["NI_ChannelName"] = f"Dev1/ai{i}"
+    read_context.apply_extended_properties(waveforms)
+
+
+def test___cache_extended_properties___read_twice___cached_properties_applied():
+    read_context = WaveformReadContext()
+    read_context.cache_extended_properties = True
+    _capture_extended_properties(read_context, [AnalogWaveform(5), AnalogWaveform(5)])
+    waveforms = [AnalogWaveform(5), AnalogWaveform(5)]
+
+    properties = read_context.get_properties_to_read(waveforms)
+    read_context.apply_extended_properties(waveforms)
+
+    assert properties is None
+    assert [waveform.extended_properties["NI_ChannelName"] for waveform in waveforms] == [
+        "Dev1/ai0",
+        "Dev1/ai1",
+    ]
+
+
+def test___cache_extended_properties___read_not_applied___properties_captured_again():
+    read_context = WaveformReadContext()
+    read_context.cache_extended_properties = True
+    waveforms = [AnalogWaveform(5)]
+    read_context.get_properties_to_read(waveforms)
+
+    assert read_context.get_properties_to_read(waveforms) is not None
+
+
+def test___cache_extended_properties___task_configuration_changed___properties_captured_again():
+    read_context = WaveformReadContext()
+    read_context.cache_extended_properties = True
+    read_context.set_task_configuration_generation(0)
+    waveforms = [AnalogWaveform(5)]
+    _capture_extended_properties(read_context, waveforms)
+
+    read_context.set_task_configuration_generation(1)
+
+    assert read_context.get_properties_to_read(waveforms) is not None
+
+
+def test___no_cache_extended_properties___get_properties_to_read___waveform_properties_returned():
+    read_context = WaveformReadContext()
+    waveforms = [AnalogWaveform(5), AnalogWaveform(5)]
+
+    properties = read_context.get_properties_to_read(waveforms)
+
+    assert properties is not None
+    assert all(
+        channel_properties is waveform.extended_properties
+        for channel_properties, waveform in zip(properties, waveforms)
+    )
+
+
+def test___analog_multi_channel_reader___control_task___cached_properties_discarded(
+    task: Task, interpreter: Mock
+):
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.cache_extended_properties = True
+    waveforms = [AnalogWaveform(5)]
+    read_context = reader._get_waveform_read_context()
+    _capture_extended_properties(read_context, waveforms)
+    assert reader._get_waveform_read_context().get_properties_to_read(waveforms) is None
+
+    task.control(TaskMode.TASK_COMMIT)
+
+    assert reader._get_waveform_read_context().get_properties_to_read(waveforms) is not None
+
+
+def test___same_shape___get_digital_read_arrays___arrays_reused():
+    read_context = WaveformReadContext()
+    read_array, bytes_per_chan_array = read_context.get_digital_read_arrays(10, 2, 8)
+
+    new_read_array, new_bytes_per_chan_array = read_context.get_digital_read_arrays(10, 2, 8)
+
+    assert numpy.shares_memory(new_read_array, read_array)
+    assert new_bytes_per_chan_array is bytes_per_chan_array
+    assert new_read_array.shape == (10, 2, 8)
+
+
+def test___fewer_samples___get_digital_read_arrays___contiguous_view_returned():
+    read_context = WaveformReadContext()
+    read_array, _ = read_context.get_digital_read_arrays(10, 2, 8)
+
+    new_read_array, _ = read_context.get_digital_read_arrays(4, 2, 8)
+
+    assert numpy.shares_memory(new_read_array, read_array)
+    assert new_read_array.shape == (4, 2, 8)
+    assert new_read_array.flags.c_contiguous
+
+
+@pytest.mark.parametrize(
+    "shape", [(20, 2, 8), (10, 3, 8), (10, 2, 4)], ids=["more_samples", "channels", "signals"]
+)
+def test___different_shape___get_digital_read_arrays___arrays_reallocated(
+    shape: tuple[int, int, int],
+):
+    read_context = WaveformReadContext()
+    read_array, _ = read_context.get_digital_read_arrays(10, 2, 8)
+
+    new_read_array, new_bytes_per_chan_array = read_context.get_digital_read_arrays(*shape)
+
+    assert not numpy.shares_memory(new_read_array, read_array)
+    assert new_read_array.shape == shape
+    assert new_bytes_per_chan_array.shape == (shape[1],)
+
+
+def _expect_internal_read_digital_waveform(mocker: MockerFixture, signal_counts: list[int]) -> Mock:
+    def internal_read_digital_waveform(
+        self,
+        task_handle,
+        number_of_samples_per_channel,
+        timeout,
+        fill_mode,
+        read_array,
+        properties,
+        t0_array,
+        dt_array,
+        bytes_per_chan_array,
+        read_context,
+    ):
+        for i, signal_count in enumerate(signal_counts):
+            read_array[:, i, :signal_count] = i + 1
+            bytes_per_chan_array[i] = signal_count
+        return 0, number_of_samples_per_channel
+
+    return mocker.patch.object(
+        LibraryInterpreter,
+        "_internal_read_digital_waveform",
+        autospec=True,
+        side_effect=internal_read_digital_waveform,
+    )
+
+
+def test___read_context___read_digital_waveforms_twice___read_array_reused(
+    library_interpreter: LibraryInterpreter, mocker: MockerFixture
+):
+    internal_read = _expect_internal_read_digital_waveform(mocker, [2, 2])
+    read_context = WaveformReadContext()
+    waveforms = [DigitalWaveform(3, 2), DigitalWaveform(3, 2)]
+
+    for _ in range(2):
+        library_interpreter.read_digital_waveforms(
+            TaskHandle(), 2, 3, 2, 10.0, waveforms, WaveformAttributeMode.NONE, read_context
+        )
+
+    first_call, second_call = internal_read.call_args_list
+    assert numpy.shares_memory(first_call.args[5], second_call.args[5])
+    assert waveforms[0].data.tolist() == [[1, 1]] * 3
+    assert waveforms[1].data.tolist() == [[2, 2]] * 3
+
+
+def test___read_context___read_new_digital_waveforms___waveforms_are_views(
+    library_interpreter: LibraryInterpreter, mocker: MockerFixture
+):
+    _expect_internal_read_digital_waveform(mocker, [1, 2])
+    read_context = WaveformReadContext()
+
+    waveforms = library_interpreter.read_new_digital_waveforms(
+        TaskHandle(), 2, 3, 2, 10.0, WaveformAttributeMode.NONE, read_context
+    )
+
+    read_array, _ = read_context.get_digital_read_arrays(3, 2, 2)
+    assert all(numpy.shares_memory(waveform.data, read_array) for waveform in waveforms)
+    assert waveforms[0].data.tolist() == [[1]] * 3
+    assert waveforms[1].data.tolist() == [[2, 2]] * 3
+
+
+def test___digital_multi_channel_reader___read_waveform_views___read_context_passed(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_uint32.return_value = 2
+    interpreter.get_read_attribute_int32.return_value = 0
+    reader = DigitalMultiChannelReader(task.in_stream)
+
+    reader.read_waveform_views(5)
+
+    read_context = interpreter.read_new_digital_waveforms.call_args.args[6]
+    assert read_context is reader._get_waveform_read_context()